@@ -51,6 +51,8 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'fuzzy.middleware.ReplicaRoutingMiddleware',  # Baca dari replica untuk seleksi/dashboard/API
+    'fuzzy.middleware.AdmisiSeleksiMiddleware',  # 429 jika slot seleksi penuh
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -95,6 +97,41 @@ else:
     }
 
 
+# Database regional tambahan untuk seleksi lintas database
+# Format: "alias=url,alias=url", contoh:
+#   FUZZY_REGIONAL_DATABASES="jabar=sqlite:///db_jabar.sqlite3,jatim=postgres://..."
+if os.environ.get('FUZZY_REGIONAL_DATABASES'):
+    import dj_database_url
+    for item in os.environ['FUZZY_REGIONAL_DATABASES'].split(','):
+        alias, url = item.strip().split('=', 1)
+        DATABASES[alias] = dj_database_url.parse(url)
+
+# Alias database yang dapat dipilih di halaman seleksi dan api_seleksi
+FUZZY_SELEKSI_DATABASES = list(DATABASES)
+
+# Read replica untuk seleksi, dashboard dan API
+# Format: "url,url", contoh: DATABASE_REPLICA_URLS="postgres://replica1/db,postgres://replica2/db"
+FUZZY_REPLICA_DATABASES = []
+if os.environ.get('DATABASE_REPLICA_URLS'):
+    import dj_database_url
+    for i, url in enumerate(os.environ['DATABASE_REPLICA_URLS'].split(','), start=1):
+        alias = f'replica_{i}'
+        DATABASES[alias] = dj_database_url.parse(url.strip())
+        DATABASES[alias]['TEST'] = {'MIRROR': 'default'}
+        FUZZY_REPLICA_DATABASES.append(alias)
+
+DATABASE_ROUTERS = ['fuzzy.routers.ReplicaRouter']
+
+# Replica dengan lag (detik) di atas batas ini tidak dipakai
+FUZZY_REPLICA_MAX_LAG = float(os.environ.get('FUZZY_REPLICA_MAX_LAG', '10'))
+
+# Interval (detik) pengukuran ulang lag replica
+FUZZY_REPLICA_LAG_INTERVAL = float(os.environ.get('FUZZY_REPLICA_LAG_INTERVAL', '5'))
+
+# Setelah menyimpan data, session yang sama membaca dari primary selama N detik
+FUZZY_REPLICA_STICKY_SECONDS = int(os.environ.get('FUZZY_REPLICA_STICKY_SECONDS', '30'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -142,6 +179,92 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
+# =============================================================================
+# CACHE
+# =============================================================================
+
+# Cache hasil seleksi. Default local-memory (LRU, per proses); untuk beberapa
+# worker gunakan backend bersama seperti Redis.
+FUZZY_CACHE_TIMEOUT = int(os.environ.get('FUZZY_CACHE_TIMEOUT', '300'))
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'fuzzy-tahani',
+        'TIMEOUT': FUZZY_CACHE_TIMEOUT,
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('FUZZY_CACHE_MAX_ENTRIES', '500')),
+        },
+    }
+}
+
+# Cache bersama antar worker/deploy (butuh package redis). Wajib agar
+# warm_fuzzy_caches di tahap release bermanfaat bagi worker web.
+if os.environ.get('REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ['REDIS_URL'],
+        'TIMEOUT': FUZZY_CACHE_TIMEOUT,
+    }
+
+# Single-flight antar worker: request seleksi identik di worker lain menunggu
+# hasil lewat lock di cache (aktifkan jika memakai cache bersama, misal Redis)
+FUZZY_SINGLEFLIGHT_LINTAS_WORKER = os.environ.get('FUZZY_SINGLEFLIGHT_LINTAS_WORKER', 'False').lower() == 'true'
+FUZZY_SINGLEFLIGHT_TUNGGU_MAKS = float(os.environ.get('FUZZY_SINGLEFLIGHT_TUNGGU_MAKS', '30'))
+
+# Perbarui hasil terhitung (pasangan kriteria dan query populer) di
+# background setiap kali data kelompok atau parameter berubah
+FUZZY_REFRESH_OTOMATIS = os.environ.get('FUZZY_REFRESH_OTOMATIS', 'True').lower() == 'true'
+
+# Jeda sebelum refresh background dimulai (detik); perubahan selama jeda
+# digabung menjadi satu refresh
+FUZZY_REFRESH_JEDA = float(os.environ.get('FUZZY_REFRESH_JEDA', '5'))
+
+# Jumlah query populer yang disimpan oleh command materialize_hot_queries
+FUZZY_MATERIALISASI_TOP = int(os.environ.get('FUZZY_MATERIALISASI_TOP', '20'))
+
+# Interval menulis statistik query seleksi ke LogQuery, dalam detik
+# (0 = setiap request langsung ditulis)
+FUZZY_LOG_QUERY_INTERVAL = float(os.environ.get('FUZZY_LOG_QUERY_INTERVAL', '60'))
+
+
+# =============================================================================
+# SELEKSI FUZZY
+# =============================================================================
+
+# Seleksi paralel: jumlah proses worker (0 = nonaktif, seleksi in-process)
+FUZZY_PARALEL_WORKERS = int(os.environ.get('FUZZY_PARALEL_WORKERS', '0'))
+
+# Di bawah jumlah baris ini seleksi tetap in-process (tanpa biaya startup pool)
+FUZZY_PARALEL_MIN_BARIS = int(os.environ.get('FUZZY_PARALEL_MIN_BARIS', '50000'))
+
+# View seleksi dan API versi async (fuzzy/views_async.py); aktifkan jika
+# dijalankan dengan server ASGI (config.asgi)
+FUZZY_ASYNC_VIEWS = os.environ.get('FUZZY_ASYNC_VIEWS', 'False').lower() == 'true'
+
+# Jumlah thread executor evaluasi view async (jika seleksi paralel nonaktif)
+FUZZY_ASYNC_WORKERS = int(os.environ.get('FUZZY_ASYNC_WORKERS', '4'))
+
+# Jumlah thread yang menjalankan seleksi background (api_seleksi async=true)
+# di proses web; 0 = job hanya dijalankan oleh command run_seleksi_jobs
+FUZZY_JOB_WORKERS = int(os.environ.get('FUZZY_JOB_WORKERS', '2'))
+
+# Job antri/berjalan lebih dari N menit dianggap macet (workernya mati)
+FUZZY_JOB_MACET_MENIT = int(os.environ.get('FUZZY_JOB_MACET_MENIT', '60'))
+
+# Admission control seleksi (fuzzy/admisi.py): jumlah seleksi bersamaan per
+# proses (0 = tidak dibatasi), panjang antrian tunggu dan waktu tunggu
+# maksimum (detik) sebelum request dijawab 429
+FUZZY_SELEKSI_SLOT = int(os.environ.get('FUZZY_SELEKSI_SLOT', '2'))
+FUZZY_SELEKSI_ANTRIAN = int(os.environ.get('FUZZY_SELEKSI_ANTRIAN', '4'))
+FUZZY_SELEKSI_TUNGGU_MAKS = float(os.environ.get('FUZZY_SELEKSI_TUNGGU_MAKS', '5'))
+
+# Token bucket antar worker di cache bersama (0 = nonaktif): laju seleksi
+# per detik dan jumlah burst maksimum
+FUZZY_SELEKSI_TOKEN_PER_DETIK = float(os.environ.get('FUZZY_SELEKSI_TOKEN_PER_DETIK', '0'))
+FUZZY_SELEKSI_TOKEN_BURST = int(os.environ.get('FUZZY_SELEKSI_TOKEN_BURST', '10'))
+
+
 # =============================================================================
 # LOGGING CONFIGURATION
 # =============================================================================
@@ -5,7 +5,7 @@ File ini mengkonfigurasi tampilan model di Django Admin.
 """
 
 from django.contrib import admin
-from .models import Kelompok, FuzzyParameter
+from .models import Kelompok, KelompokArsip, FuzzyParameter, LogQuery, SeleksiJob
 
 
 @admin.register(Kelompok)
@@ -28,6 +28,7 @@ class KelompokAdmin(admin.ModelAdmin):
         'sdm',
         'unit_usaha',
         'kas',
+        'aktif',
         'created_at',
     ]
     
@@ -36,6 +37,7 @@ class KelompokAdmin(admin.ModelAdmin):
     
     # Filter di sidebar
     list_filter = [
+        'aktif',
         'tanggal_berdiri',
         'frekuensi_bantuan',
         'sdm',
@@ -57,6 +59,9 @@ class KelompokAdmin(admin.ModelAdmin):
         ('Skor Penilaian', {
             'fields': ('sdm', 'unit_usaha', 'kas')
         }),
+        ('Status', {
+            'fields': ('aktif',)
+        }),
         ('Metadata', {
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
@@ -70,6 +75,36 @@ class KelompokAdmin(admin.ModelAdmin):
     get_usia.admin_order_field = 'tanggal_berdiri'
 
 
+@admin.register(KelompokArsip)
+class KelompokArsipAdmin(admin.ModelAdmin):
+    """
+    Konfigurasi Admin untuk Model KelompokArsip
+    
+    Data arsip hanya untuk dilihat; pemindahan dilakukan oleh
+    command archive_kelompok.
+    """
+    
+    list_display = [
+        'nama',
+        'tanggal_berdiri',
+        'aktif',
+        'updated_at',
+        'diarsipkan_at',
+    ]
+    
+    search_fields = ['nama']
+    
+    list_filter = ['aktif']
+    
+    ordering = ['nama']
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(FuzzyParameter)
 class FuzzyParameterAdmin(admin.ModelAdmin):
     """
@@ -128,3 +163,60 @@ class FuzzyParameterAdmin(admin.ModelAdmin):
         return str(obj)
     get_parameter_name.short_description = 'Parameter'
 
+
+
+
+@admin.register(LogQuery)
+class LogQueryAdmin(admin.ModelAdmin):
+    """
+    Konfigurasi Admin untuk Model LogQuery
+    
+    Menampilkan query seleksi yang paling sering dijalankan. Hanya untuk
+    dilihat; data dicatat otomatis oleh halaman seleksi dan API.
+    """
+    
+    list_display = [
+        '__str__',
+        'jumlah',
+        'rata_rata_ms',
+        'durasi_maks_ms',
+        'terakhir_dijalankan',
+    ]
+    
+    list_filter = ['operator', 'include_arsip']
+    
+    ordering = ['-jumlah']
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(SeleksiJob)
+class SeleksiJobAdmin(admin.ModelAdmin):
+    """
+    Konfigurasi Admin untuk Model SeleksiJob
+    
+    Menampilkan seleksi background dari api_seleksi (async=true). Hanya
+    untuk dilihat dan dihapus; job dibuat dan dijalankan oleh API.
+    """
+    
+    list_display = [
+        '__str__',
+        'status',
+        'diproses',
+        'jumlah_baris',
+        'total',
+        'created_at',
+        'selesai_at',
+    ]
+    
+    list_filter = ['status', 'operator']
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,358 @@
+"""
+Admission Control Seleksi untuk SPK Fuzzy Database Model Tahani
+
+Seleksi atas tabel penuh memakan CPU dan koneksi database. Agar lonjakan
+request api_seleksi tidak menghabiskan semua worker (halaman CRUD tetap
+responsif), setiap perhitungan seleksi (cache miss) harus mendapat izin:
+
+- PembatasSeleksi: semaphore per proses dengan FUZZY_SELEKSI_SLOT slot.
+  Request yang tidak kebagian slot menunggu di antrian pendek
+  (FUZZY_SELEKSI_ANTRIAN) paling lama FUZZY_SELEKSI_TUNGGU_MAKS detik.
+- Token bucket di cache bersama (opsional, FUZZY_SELEKSI_TOKEN_PER_DETIK):
+  membatasi laju seleksi dari semua worker sekaligus.
+
+Jika antrian penuh, waktu tunggu habis, atau token habis, SeleksiPenuh
+dilempar dan diubah menjadi response 429 dengan header Retry-After oleh
+AdmisiSeleksiMiddleware. Statistik antrian dan penolakan per proses
+tersedia di /api/admisi/.
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+KUNCI_TOKEN = 'fuzzy:admisi:token'
+
+# Bobot durasi terbaru pada rata-rata bergerak durasi seleksi
+BOBOT_DURASI = 0.2
+
+# Jeda antar percobaan mengambil slot pada view async (detik)
+INTERVAL_ASYNC = 0.01
+
+
+class SeleksiPenuh(Exception):
+    """
+    Seleksi ditolak karena server sedang penuh
+
+    Attributes:
+        retry_after (int): Perkiraan detik sampai request bisa dicoba lagi
+        alasan (str): 'antrian_penuh', 'timeout' atau 'token'
+    """
+
+    def __init__(self, retry_after, alasan):
+        super().__init__(f'Seleksi ditolak ({alasan}), coba lagi dalam {retry_after} detik')
+        self.retry_after = retry_after
+        self.alasan = alasan
+
+
+class PembatasSeleksi:
+    """
+    Semaphore seleksi per proses dengan antrian tunggu terbatas
+
+    Args:
+        slot (int): Jumlah seleksi yang boleh berjalan bersamaan
+                    (0 = tidak dibatasi, hanya mencatat statistik)
+        antrian_maks (int): Jumlah request maksimum yang menunggu slot
+        tunggu_maks (float): Waktu tunggu maksimum di antrian (detik)
+    """
+
+    def __init__(self, slot, antrian_maks, tunggu_maks):
+        self.slot = slot
+        self.antrian_maks = antrian_maks
+        self.tunggu_maks = tunggu_maks
+        self._semaphore = threading.BoundedSemaphore(slot) if slot > 0 else None
+        self._lock = threading.Lock()
+
+        self.berjalan = 0
+        self.menunggu = 0
+        self.menunggu_puncak = 0
+        self.diterima = 0
+        self.ditolak = {'antrian_penuh': 0, 'timeout': 0, 'token': 0}
+        self._total_tunggu = 0.0
+        self._durasi_rata = None
+
+    def perkiraan_tunggu(self):
+        """Perkiraan detik sampai slot kosong (untuk header Retry-After)"""
+        durasi = self._durasi_rata or 1.0
+        return max(1, math.ceil(durasi * (self.menunggu + 1) / max(self.slot, 1)))
+
+    def tolak(self, alasan, retry_after=None):
+        """Mencatat penolakan dan membuat SeleksiPenuh"""
+        with self._lock:
+            self.ditolak[alasan] += 1
+        return SeleksiPenuh(retry_after or self.perkiraan_tunggu(), alasan)
+
+    def _antri(self):
+        with self._lock:
+            if self.menunggu >= self.antrian_maks:
+                self.ditolak['antrian_penuh'] += 1
+                raise SeleksiPenuh(self.perkiraan_tunggu(), 'antrian_penuh')
+            self.menunggu += 1
+            self.menunggu_puncak = max(self.menunggu_puncak, self.menunggu)
+
+    def _mulai(self, mulai_tunggu):
+        # Dipanggil dengan self._lock terkunci
+        self.berjalan += 1
+        self.diterima += 1
+        sekarang = time.monotonic()
+        self._total_tunggu += sekarang - mulai_tunggu
+        return sekarang
+
+    def _batal_antri(self):
+        with self._lock:
+            self.menunggu -= 1
+
+    def _selesai_antri(self, dapat, mulai_tunggu):
+        with self._lock:
+            self.menunggu -= 1
+            if not dapat:
+                self.ditolak['timeout'] += 1
+                raise SeleksiPenuh(self.perkiraan_tunggu(), 'timeout')
+            return self._mulai(mulai_tunggu)
+
+    def masuk(self):
+        """
+        Mengambil slot seleksi (menunggu di antrian jika perlu)
+
+        Returns:
+            float: Waktu mulai, diberikan ke keluar()
+
+        Raises:
+            SeleksiPenuh: Antrian penuh atau waktu tunggu habis
+        """
+        mulai_tunggu = time.monotonic()
+        if self._semaphore is None or self._semaphore.acquire(blocking=False):
+            with self._lock:
+                return self._mulai(mulai_tunggu)
+
+        self._antri()
+        try:
+            dapat = self._semaphore.acquire(timeout=self.tunggu_maks)
+        except BaseException:
+            self._batal_antri()
+            raise
+        return self._selesai_antri(dapat, mulai_tunggu)
+
+    async def masuk_async(self):
+        """masuk() untuk view async, menunggu tanpa memblokir event loop"""
+        mulai_tunggu = time.monotonic()
+        if self._semaphore is None or self._semaphore.acquire(blocking=False):
+            with self._lock:
+                return self._mulai(mulai_tunggu)
+
+        self._antri()
+        dapat = False
+        batas = mulai_tunggu + self.tunggu_maks
+        try:
+            while not dapat and time.monotonic() < batas:
+                await asyncio.sleep(INTERVAL_ASYNC)
+                dapat = self._semaphore.acquire(blocking=False)
+        except BaseException:
+            # Request dibatalkan (client terputus) saat menunggu
+            self._batal_antri()
+            raise
+        return self._selesai_antri(dapat, mulai_tunggu)
+
+    def keluar(self, mulai):
+        """
+        Melepas slot yang diambil dengan masuk()
+
+        Args:
+            mulai (float): Nilai kembalian masuk()
+        """
+        durasi = time.monotonic() - mulai
+        with self._lock:
+            self.berjalan -= 1
+            if self._durasi_rata is None:
+                self._durasi_rata = durasi
+            else:
+                self._durasi_rata += BOBOT_DURASI * (durasi - self._durasi_rata)
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    def statistik(self):
+        """
+        Statistik antrian dan penolakan proses ini
+
+        Returns:
+            dict: Konfigurasi, jumlah berjalan/menunggu, jumlah diterima dan
+                  ditolak per alasan, rata-rata waktu tunggu dan durasi
+        """
+        with self._lock:
+            return {
+                'pid': os.getpid(),
+                'slot': self.slot,
+                'antrian_maks': self.antrian_maks,
+                'tunggu_maks': self.tunggu_maks,
+                'berjalan': self.berjalan,
+                'menunggu': self.menunggu,
+                'menunggu_puncak': self.menunggu_puncak,
+                'diterima': self.diterima,
+                'ditolak': dict(self.ditolak),
+                'tunggu_rata_ms': round(1000 * self._total_tunggu / self.diterima, 2) if self.diterima else 0.0,
+                'durasi_rata_ms': round(1000 * self._durasi_rata, 2) if self._durasi_rata is not None else None,
+            }
+
+
+# =============================================================================
+# TOKEN BUCKET (ANTAR WORKER)
+# =============================================================================
+
+def ambil_token(cache, laju, kapasitas, kunci=KUNCI_TOKEN, tunggu_lock=0.05):
+    """
+    Mengambil satu token dari token bucket di cache bersama
+
+    Isi bucket (token, waktu) dibaca dan ditulis di bawah lock cache.add.
+    Jika lock tidak didapat dalam `tunggu_lock` detik, request diizinkan
+    (pembatas tidak boleh menjadi titik gagal).
+
+    Args:
+        cache: Cache Django (sebaiknya backend bersama seperti Redis)
+        laju (float): Token yang ditambahkan per detik
+        kapasitas (int): Jumlah token maksimum (burst)
+        kunci (str): Kunci cache bucket
+        tunggu_lock (float): Waktu tunggu maksimum lock (detik)
+
+    Returns:
+        float: 0 jika token didapat, selain itu detik sampai token berikutnya
+    """
+    kunci_lock = f'{kunci}:lock'
+    batas = time.monotonic() + tunggu_lock
+    while not cache.add(kunci_lock, 1, 1):
+        if time.monotonic() > batas:
+            return 0.0
+        time.sleep(0.002)
+
+    try:
+        sekarang = time.time()
+        token, waktu = cache.get(kunci) or (kapasitas, sekarang)
+        token = min(kapasitas, token + (sekarang - waktu) * laju)
+        # Bucket yang tidak dipakai lebih lama dari waktu isi penuh boleh hilang
+        timeout = math.ceil(kapasitas / laju) + 60
+        if token < 1:
+            cache.set(kunci, (token, sekarang), timeout)
+            return (1 - token) / laju
+        cache.set(kunci, (token - 1, sekarang), timeout)
+        return 0.0
+    finally:
+        cache.delete(kunci_lock)
+
+
+# =============================================================================
+# IZIN SELEKSI
+# =============================================================================
+
+_pembatas = None
+_pembatas_lock = threading.Lock()
+
+
+def get_pembatas():
+    """PembatasSeleksi proses ini (dibuat sekali dari settings)"""
+    global _pembatas
+
+    with _pembatas_lock:
+        if _pembatas is None:
+            _pembatas = PembatasSeleksi(
+                getattr(settings, 'FUZZY_SELEKSI_SLOT', 2),
+                getattr(settings, 'FUZZY_SELEKSI_ANTRIAN', 4),
+                getattr(settings, 'FUZZY_SELEKSI_TUNGGU_MAKS', 5),
+            )
+        return _pembatas
+
+
+def _cek_token(pembatas):
+    """Mengambil token bucket jika FUZZY_SELEKSI_TOKEN_PER_DETIK diisi"""
+    laju = getattr(settings, 'FUZZY_SELEKSI_TOKEN_PER_DETIK', 0)
+    if laju <= 0:
+        return
+
+    from .cache import get_cache
+
+    tunggu = ambil_token(get_cache(), laju, getattr(settings, 'FUZZY_SELEKSI_TOKEN_BURST', 10))
+    if tunggu > 0:
+        raise pembatas.tolak('token', max(1, math.ceil(tunggu)))
+
+
+def masuk_seleksi():
+    """
+    Meminta izin menjalankan satu seleksi
+
+    Returns:
+        float: Waktu mulai, diberikan ke keluar_seleksi()
+
+    Raises:
+        SeleksiPenuh: Token habis, antrian penuh atau waktu tunggu habis
+    """
+    pembatas = get_pembatas()
+    _cek_token(pembatas)
+    return pembatas.masuk()
+
+
+def keluar_seleksi(mulai):
+    """Melepas izin dari masuk_seleksi()"""
+    get_pembatas().keluar(mulai)
+
+
+@contextmanager
+def izin_seleksi():
+    """
+    Context manager izin seleksi
+
+    Example:
+        >>> with izin_seleksi():
+        ...     hasil = seleksi_fuzzy_lingkup(kriteria)
+    """
+    mulai = masuk_seleksi()
+    try:
+        yield
+    finally:
+        keluar_seleksi(mulai)
+
+
+@asynccontextmanager
+async def izin_seleksi_async():
+    """izin_seleksi() untuk view async"""
+    pembatas = get_pembatas()
+    if getattr(settings, 'FUZZY_SELEKSI_TOKEN_PER_DETIK', 0) > 0:
+        await sync_to_async(_cek_token)(pembatas)
+    mulai = await pembatas.masuk_async()
+    try:
+        yield
+    finally:
+        pembatas.keluar(mulai)
+
+
+class IterasiDenganIzin:
+    """
+    Isi StreamingHttpResponse yang memegang izin seleksi selama streaming
+
+    Izin dilepas saat response ditutup (Django memanggil close() isi
+    response), termasuk jika client terputus sebelum iterasi dimulai.
+    """
+
+    def __init__(self, iterable, mulai):
+        self._iterator = iter(iterable)
+        self._mulai = mulai
+        self._dilepas = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._iterator)
+
+    def close(self):
+        if self._dilepas:
+            return
+        self._dilepas = True
+        try:
+            if hasattr(self._iterator, 'close'):
+                self._iterator.close()
+        finally:
+            keluar_seleksi(self._mulai)
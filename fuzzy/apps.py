@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class FuzzyConfig(AppConfig):
     name = 'fuzzy'
+
+    def ready(self):
+        # Daftarkan signal handler
+        from . import signals  # noqa: F401
@@ -0,0 +1,239 @@
+"""
+Format Biner Hasil Seleksi dan Fuzzifikasi untuk SPK Fuzzy Database Model Tahani
+
+Untuk client mesin (pipeline) yang menarik ranking lengkap ratusan ribu
+kelompok, api_seleksi dan api_fuzzifikasi_bulk dapat mengirim response
+`application/octet-stream` (kirim header `Accept: application/octet-stream`).
+
+Layout (semua little-endian):
+
+    header  32 byte  struct '<4sBBHQQI4x':
+                     magic b'FZTB', versi format, jenis (1 = seleksi,
+                     2 = fuzzifikasi), k (jumlah kolom keanggotaan),
+                     n (jumlah baris), total (kelompok yang dievaluasi),
+                     panjang nama kolom (byte)
+    nama    JSON list nama kolom keanggotaan ('usia_baru', ...), UTF-8,
+            diberi padding b'\\0' hingga kelipatan 8 byte
+    ids     int64[n]
+    fs      float32[n]       (hanya jenis seleksi)
+    mu      k x float32[n]   satu kolom utuh per kategori, urut sesuai nama
+
+Setiap kolom bersebelahan di memori sehingga client dapat memetakannya
+tanpa salinan, misalnya numpy.frombuffer(data, '<i8', n, offset).
+"""
+
+import json
+import struct
+import sys
+from array import array
+from datetime import date
+
+MAGIC = b'FZTB'
+VERSI_FORMAT = 1
+JENIS_SELEKSI = 1
+JENIS_FUZZIFIKASI = 2
+
+CONTENT_TYPE = 'application/octet-stream'
+
+HEADER = struct.Struct('<4sBBHQQI4x')
+
+# Kolom crisp Kelompok yang dibaca untuk fuzzifikasi biner
+KOLOM_CRISP = (
+    'id',
+    'tanggal_berdiri',
+    'jumlah_anggota',
+    'luas_lahan',
+    'frekuensi_bantuan',
+    'sdm',
+    'unit_usaha',
+    'kas',
+)
+
+
+class FormatBinerTidakValid(ValueError):
+    """Buffer bukan response biner yang valid"""
+
+
+def _little_endian(kolom):
+    """array dalam urutan byte little-endian (array memakai urutan byte mesin)"""
+    if sys.byteorder == 'big':
+        kolom = array(kolom.typecode, kolom)
+        kolom.byteswap()
+    return kolom
+
+
+def kemas(jenis, ids, kolom_mu, fire_strength=None, total=None):
+    """
+    Menyusun response biner dari kolom-kolom hasil
+
+    Args:
+        jenis (int): JENIS_SELEKSI atau JENIS_FUZZIFIKASI
+        ids (array): array('q') id kelompok
+        kolom_mu (dict): {nama_kolom: array('f')}, urutan dipertahankan
+        fire_strength (array): array('f'), wajib untuk JENIS_SELEKSI
+        total (int): Jumlah kelompok yang dievaluasi (default: len(ids))
+
+    Returns:
+        bytes: Response biner
+    """
+    nama = json.dumps(list(kolom_mu), separators=(',', ':')).encode('utf-8')
+    nama += b'\0' * (-len(nama) % 8)
+
+    bagian = [
+        HEADER.pack(
+            MAGIC, VERSI_FORMAT, jenis, len(kolom_mu), len(ids),
+            len(ids) if total is None else total, len(nama)
+        ),
+        nama,
+        memoryview(_little_endian(ids)),
+    ]
+    if jenis == JENIS_SELEKSI:
+        bagian.append(memoryview(_little_endian(fire_strength)))
+    bagian.extend(memoryview(_little_endian(kolom)) for kolom in kolom_mu.values())
+    return b''.join(bagian)
+
+
+def baca(buffer):
+    """
+    Membaca response biner dari kemas() tanpa menyalin kolom
+
+    Kolom dikembalikan sebagai memoryview ke buffer asli (cast hanya
+    tanpa salinan di mesin little-endian, seperti x86 dan ARM).
+
+    Args:
+        buffer: bytes/bytearray/memoryview response
+
+    Returns:
+        dict: {'jenis', 'total', 'ids', 'fire_strength' (None untuk
+              fuzzifikasi), 'mu': {nama_kolom: memoryview}}
+
+    Raises:
+        FormatBinerTidakValid: Magic atau versi format tidak dikenal
+    """
+    buffer = memoryview(buffer).cast('B')
+    if len(buffer) < HEADER.size:
+        raise FormatBinerTidakValid('Response biner terlalu pendek')
+
+    magic, versi, jenis, k, n, total, panjang_nama = HEADER.unpack_from(buffer)
+    if magic != MAGIC or versi != VERSI_FORMAT:
+        raise FormatBinerTidakValid('Magic atau versi format biner tidak dikenal')
+
+    posisi = HEADER.size
+    nama_list = json.loads(bytes(buffer[posisi:posisi + panjang_nama]).rstrip(b'\0'))
+    posisi += panjang_nama
+
+    def ambil(typecode, ukuran):
+        nonlocal posisi
+        kolom = buffer[posisi:posisi + n * ukuran].cast(typecode)
+        posisi += n * ukuran
+        return kolom
+
+    ids = ambil('q', 8)
+    fire_strength = ambil('f', 4) if jenis == JENIS_SELEKSI else None
+    mu = {nama: ambil('f', 4) for nama in nama_list}
+    return {'jenis': jenis, 'total': total, 'ids': ids, 'fire_strength': fire_strength, 'mu': mu}
+
+
+# =============================================================================
+# HASIL SELEKSI
+# =============================================================================
+
+def kemas_ranking_seleksi(ranking, kriteria):
+    """
+    Response biner untuk seleksi_fuzzy_ranking() (urutan ranking dipertahankan)
+
+    Kolom disusun langsung dari tuple ranking ringkas tanpa object
+    Kelompok maupun dict keanggotaan per baris.
+
+    Args:
+        ranking (RankingSeleksi): Ranking ringkas (boleh dihitung dengan
+                                  urutan kriteria yang berbeda)
+        kriteria (list): Kriteria request, menentukan urutan kolom keanggotaan
+
+    Returns:
+        bytes: Response biner jenis JENIS_SELEKSI
+    """
+    # Posisi nilai keanggotaan di tuple ranking untuk setiap kolom
+    posisi = {}
+    for i, (variabel, kategori) in enumerate(ranking.kriteria):
+        posisi.setdefault(f"{variabel}_{kategori}", i)
+    kunci_mu = dict.fromkeys(f"{variabel}_{kategori}" for variabel, kategori in kriteria)
+
+    return kemas(
+        JENIS_SELEKSI,
+        array('q', [pk for pk, _, _ in ranking]),
+        {
+            kunci: array('f', [round(membership_values[posisi[kunci]], 4) for _, membership_values, _ in ranking])
+            for kunci in kunci_mu
+        },
+        fire_strength=array('f', [fire_strength for _, _, fire_strength in ranking]),
+        total=ranking.total,
+    )
+
+
+# =============================================================================
+# FUZZIFIKASI BULK
+# =============================================================================
+
+def kemas_fuzzifikasi_bulk(queryset, batch=None):
+    """
+    Response biner untuk fuzzifikasi lengkap (27 kategori) banyak kelompok
+
+    Sama seperti fuzzifikasi_bulk(): satu snapshot parameter dan baris
+    dibaca per batch id, tetapi nilai langsung ditambahkan ke kolom
+    array tanpa membuat dict per kelompok.
+
+    Args:
+        queryset: QuerySet Kelompok (boleh sudah difilter)
+        batch (int): Jumlah baris per query (default: BATCH_BARIS_SHARD)
+
+    Returns:
+        bytes: Response biner jenis JENIS_FUZZIFIKASI, urut berdasarkan id
+    """
+    from .models import hitung_usia
+    from .utils import (
+        BATCH_BARIS_SHARD,
+        KATEGORI_VARIABEL,
+        VARIABEL_LIST,
+        buat_fungsi_keanggotaan,
+        get_parameter_snapshot,
+    )
+
+    batch = batch or BATCH_BARIS_SHARD
+    snapshot = get_parameter_snapshot()
+    today = date.today()
+
+    # (posisi kolom crisp, fungsi keanggotaan, kolom hasil) per kategori;
+    # posisi None untuk usia yang dihitung dari tanggal_berdiri
+    indeks_variabel = {kolom: i for i, kolom in enumerate(KOLOM_CRISP)}
+    indeks_variabel['usia'] = None
+    ids = array('q')
+    kolom_mu = {}
+    evaluator = []
+    for variabel, _ in VARIABEL_LIST:
+        for kategori, _ in KATEGORI_VARIABEL[variabel]:
+            kolom = kolom_mu[f'{variabel}_{kategori}'] = array('f')
+            evaluator.append((
+                indeks_variabel[variabel],
+                buat_fungsi_keanggotaan(variabel, kategori, snapshot),
+                kolom.append,
+            ))
+
+    terakhir = None
+    while True:
+        batch_qs = queryset.order_by('id')
+        if terakhir is not None:
+            batch_qs = batch_qs.filter(id__gt=terakhir)
+        baris_list = list(batch_qs.values_list(*KOLOM_CRISP)[:batch])
+
+        for baris in baris_list:
+            ids.append(baris[0])
+            usia = hitung_usia(baris[1], today)
+            for indeks, fungsi, tambah in evaluator:
+                tambah(fungsi(usia if indeks is None else baris[indeks]))
+
+        if len(baris_list) < batch:
+            break
+        terakhir = baris_list[-1][0]
+
+    return kemas(JENIS_FUZZIFIKASI, ids, kolom_mu)
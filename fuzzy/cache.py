@@ -0,0 +1,426 @@
+"""
+Cache Hasil Seleksi untuk SPK Fuzzy Database Model Tahani
+
+Hasil seleksi disimpan di cache Django dengan kunci yang terdiri dari:
+- hash kanonik query (kriteria terurut, operator, alpha, limit, lingkup)
+- versi data Kelompok
+- versi FuzzyParameter
+- tanggal hari ini, jika kriteria memakai usia
+
+Versi dibaca dari database default, sehingga hasil yang disimpan juga
+selalu dihitung dari database default (bukan replica yang bisa tertinggal).
+
+Versi dinaikkan oleh signal (save/delete) dan oleh operasi massal
+VersiQuerySet, sehingga cache lama otomatis tidak terpakai lagi tanpa
+perlu dihapus satu per satu. Entri lama dibuang oleh LRU/TTL cache.
+"""
+
+import contextvars
+import hashlib
+import json
+from contextlib import contextmanager
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F
+
+from .routers import baca_dari_primary
+from .singleflight import SingleFlight, SingleFlightAsync, hitung_dengan_lock_cache
+
+
+VERSI_KELOMPOK = 'kelompok'
+VERSI_PARAMETER = 'parameter'
+
+# Model -> nama versi yang dinaikkan saat model tersebut berubah
+VERSI_MODEL = {
+    'fuzzy.kelompok': VERSI_KELOMPOK,
+    'fuzzy.kelompokarsip': VERSI_KELOMPOK,
+    'fuzzy.fuzzyparameter': VERSI_PARAMETER,
+}
+
+# Model yang versinya juga dilacak per variabel fuzzy (untuk pasangan
+# terhitung, lihat fuzzy/pasangan.py): 'kelompok:kas', 'parameter:usia', ...
+# Versi '<nama>:*' dinaikkan jika variabel yang berubah tidak diketahui
+# (misalnya kelompok baru/dihapus atau update massal parameter).
+VERSI_PER_VARIABEL = {
+    'fuzzy.kelompok': VERSI_KELOMPOK,
+    'fuzzy.fuzzyparameter': VERSI_PARAMETER,
+}
+SEMUA_VARIABEL = '*'
+
+# Versi '<nama>:massal' hanya dinaikkan oleh operasi massal (update(),
+# bulk_create()) yang tidak mengirim signal per baris, sehingga ranking
+# query tersimpan (fuzzy/query_tersimpan.py) perlu dihitung ulang penuh.
+VERSI_MASSAL = 'massal'
+
+# Field Kelompok -> variabel fuzzy yang nilainya bergantung pada field tersebut
+FIELD_VARIABEL = {
+    'tanggal_berdiri': 'usia',
+    'frekuensi_bantuan': 'frekuensi_bantuan',
+    'luas_lahan': 'luas_lahan',
+    'jumlah_anggota': 'jumlah_anggota',
+    'sdm': 'sdm',
+    'unit_usaha': 'unit_usaha',
+    'kas': 'kas',
+}
+
+# Set nama versi yang menunggu dinaikkan (None = langsung dinaikkan)
+_versi_tertunda = contextvars.ContextVar('versi_tertunda', default=None)
+
+# Koordinasi request seleksi identik yang berjalan bersamaan (per proses)
+_single_flight = SingleFlight()
+_single_flight_async = SingleFlightAsync()
+
+
+def get_cache():
+    """Cache Django yang dipakai untuk hasil seleksi"""
+    return caches[getattr(settings, 'FUZZY_CACHE_ALIAS', 'default')]
+
+
+# =============================================================================
+# VERSI DATA
+# =============================================================================
+
+def get_versi():
+    """
+    Mengambil semua nomor versi data (satu query)
+
+    Returns:
+        dict: {nama_versi: nilai}
+    """
+    from .models import VersiData
+
+    return dict(VersiData.objects.values_list('nama', 'nilai'))
+
+
+async def aget_versi():
+    """Versi async dari get_versi() (async ORM, satu query)"""
+    from .models import VersiData
+
+    return {nama: nilai async for nama, nilai in VersiData.objects.values_list('nama', 'nilai')}
+
+
+def naikkan_versi(*nama_list):
+    """
+    Menaikkan nomor versi data
+
+    Jika dipanggil di dalam tunda_naik_versi(), versi baru dinaikkan
+    sekali saat blok tersebut selesai.
+
+    Args:
+        *nama_list: Nama versi yang dinaikkan
+    """
+    from .models import VersiData
+
+    tertunda = _versi_tertunda.get()
+    if tertunda is not None:
+        tertunda.update(nama_list)
+        return
+
+    for nama in nama_list:
+        diperbarui = VersiData.objects.filter(nama=nama).update(nilai=F('nilai') + 1)
+        if not diperbarui:
+            VersiData.objects.get_or_create(nama=nama, defaults={'nilai': 1})
+
+    if nama_list:
+        # Perbarui hasil terhitung (pasangan, query populer) di background
+        from .refresh import jadwalkan_refresh
+        jadwalkan_refresh()
+
+
+def versi_variabel(nama, variabel):
+    """
+    Nama versi per variabel, misalnya versi_variabel('kelompok', 'kas')
+
+    Returns:
+        str: 'kelompok:kas'
+    """
+    return f'{nama}:{variabel}'
+
+
+def variabel_dari_field(model, fields):
+    """
+    Variabel fuzzy yang terpengaruh oleh perubahan beberapa field
+
+    Args:
+        model: Class model
+        fields (iterable): Nama field yang berubah
+
+    Returns:
+        set: Nama variabel, atau None jika tidak dapat ditentukan
+             (misalnya update massal FuzzyParameter)
+    """
+    if model._meta.label_lower != 'fuzzy.kelompok':
+        return None
+    return {FIELD_VARIABEL[field] for field in fields if field in FIELD_VARIABEL}
+
+
+def naikkan_versi_model(model, variabel=None, massal=False):
+    """
+    Menaikkan versi yang terkait dengan sebuah model
+
+    Args:
+        model: Class model (Kelompok, KelompokArsip, FuzzyParameter)
+        variabel (iterable): Variabel fuzzy yang berubah. None berarti
+                             semua variabel mungkin berubah; kosong berarti
+                             tidak ada nilai variabel yang berubah
+                             (misalnya hanya nama kelompok).
+        massal (bool): True untuk operasi massal tanpa signal per baris
+    """
+    label = model._meta.label_lower
+    nama = VERSI_MODEL.get(label)
+    if not nama:
+        return
+
+    nama_list = [nama]
+    if label in VERSI_PER_VARIABEL:
+        if variabel is None:
+            variabel = [SEMUA_VARIABEL]
+        nama_list.extend(versi_variabel(nama, var) for var in sorted(variabel))
+        if massal:
+            nama_list.append(versi_variabel(nama, VERSI_MASSAL))
+    naikkan_versi(*nama_list)
+
+
+@contextmanager
+def tunda_naik_versi():
+    """
+    Menggabungkan kenaikan versi di dalam blok menjadi satu kali
+
+    Dipakai untuk operasi massal (delete queryset, import, arsip) agar
+    signal per baris tidak menaikkan versi ribuan kali.
+
+    Example:
+        >>> with tunda_naik_versi():
+        ...     Kelompok.objects.filter(aktif=False).delete()
+    """
+    if _versi_tertunda.get() is not None:
+        # Sudah di dalam blok tunda_naik_versi() lain
+        yield
+        return
+
+    tertunda = set()
+    token = _versi_tertunda.set(tertunda)
+    try:
+        yield
+    finally:
+        _versi_tertunda.reset(token)
+        if tertunda:
+            naikkan_versi(*sorted(tertunda))
+
+
+# =============================================================================
+# CACHE STATISTIK DASHBOARD
+# =============================================================================
+
+def get_statistik_dashboard():
+    """
+    Statistik dashboard dari cache, dihitung ulang jika versi Kelompok berubah
+
+    Versi Kelompok dinaikkan oleh setiap penulisan (signal maupun operasi
+    massal), sehingga entri lama tidak pernah dipakai lagi. Kunci berversi
+    (bukan cache.delete) tetap benar walaupun setiap worker memakai
+    LocMemCache sendiri. Karena kuncinya memakai versi dari primary,
+    statistik juga dihitung dari primary, bukan dari replica yang mungkin
+    belum menerima penulisan terakhir.
+
+    Returns:
+        dict: Hasil hitung_statistik_dashboard()
+    """
+    from .utils import hitung_statistik_dashboard
+
+    cache = get_cache()
+    kunci = 'fuzzy:dashboard:{}'.format(get_versi().get(VERSI_KELOMPOK, 0))
+
+    statistik = cache.get(kunci)
+    if statistik is None:
+        with baca_dari_primary():
+            statistik = hitung_statistik_dashboard()
+        cache.set(kunci, statistik, getattr(settings, 'FUZZY_CACHE_TIMEOUT', 300))
+    return statistik
+
+
+# =============================================================================
+# CACHE HASIL SELEKSI
+# =============================================================================
+
+def kunci_query(kriteria, operator='AND', alpha=0.0, limit=None, **lingkup):
+    """
+    Hash kanonik sebuah query seleksi
+
+    Urutan dan duplikasi kriteria tidak mempengaruhi hasil (MIN/MAX
+    bersifat komutatif), sehingga kriteria diurutkan terlebih dahulu.
+
+    Args:
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        alpha (float): Batas minimum fire strength
+        limit (int): Jumlah maksimum hasil
+        **lingkup: Parameter lain yang mempengaruhi hasil
+                   (misalnya databases, include_arsip)
+
+    Returns:
+        str: Hash SHA-1 dari query
+    """
+    kanonik = {
+        'kriteria': sorted({(variabel, kategori) for variabel, kategori in kriteria}),
+        'operator': operator.upper(),
+        'alpha': round(float(alpha or 0), 4),
+        'limit': limit,
+    }
+    for nama, nilai in lingkup.items():
+        if isinstance(nilai, (list, tuple, set)):
+            nilai = sorted(nilai)
+        kanonik[nama] = nilai
+
+    teks = json.dumps(kanonik, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(teks.encode('utf-8')).hexdigest()
+
+
+def buat_etag(*bagian):
+    """
+    Membuat ETag dari beberapa komponen (versi data, hash query, dll)
+
+    Returns:
+        str: Hash SHA-1 dari semua komponen
+    """
+    teks = ':'.join(str(b) for b in bagian)
+    return hashlib.sha1(teks.encode('utf-8')).hexdigest()
+
+
+def _kunci_cache(kunci, versi, kriteria):
+    kunci_cache = 'fuzzy:seleksi:{}:{}:{}'.format(
+        kunci, versi.get(VERSI_KELOMPOK, 0), versi.get(VERSI_PARAMETER, 0)
+    )
+    # Usia bergantung pada tanggal hari ini
+    if any(variabel == 'usia' for variabel, _ in kriteria):
+        kunci_cache += ':' + date.today().isoformat()
+    return kunci_cache
+
+
+def _hitung_dari_primary(hitung):
+    """Membungkus hitung() agar membaca dari database default"""
+    def hitung_primary():
+        with baca_dari_primary():
+            return hitung()
+    return hitung_primary
+
+
+def _urutkan_membership(hasil, kriteria):
+    """
+    Menyusun ulang membership_values sesuai urutan kriteria request
+
+    Query dengan kriteria sama tetapi urutan berbeda memakai entri cache
+    yang sama; tampilan kolom tetap mengikuti urutan yang diminta.
+    Hasil asli tidak diubah karena bisa dipakai bersama oleh beberapa
+    request (single-flight).
+    """
+    from .utils import HasilSeleksi
+
+    if not isinstance(hasil, HasilSeleksi):
+        # Ranking ringkas (RankingSeleksi) menyimpan urutan kriterianya
+        # sendiri; kolom disusun ulang saat dikemas
+        return hasil
+
+    urutan = [f"{variabel}_{kategori}" for variabel, kategori in kriteria]
+    items = []
+    for item in hasil:
+        detail = item['membership_values']
+        if list(detail) != urutan:
+            item = dict(item, membership_values={key: detail[key] for key in urutan if key in detail})
+        items.append(item)
+    return HasilSeleksi(items, hasil.total, hasil.statistik_db)
+
+
+def seleksi_dengan_cache(hitung, kriteria, operator='AND', alpha=0.0, limit=None, **lingkup):
+    """
+    Menjalankan seleksi dengan cache hasil
+
+    Cache hit tidak melakukan fuzzifikasi maupun scan database (hanya
+    satu query untuk membaca nomor versi). Cache miss dihitung dari
+    database default karena kunci memakai versi data primary. Request
+    identik yang datang bersamaan menunggu satu perhitungan yang sama
+    (single-flight); jika FUZZY_SINGLEFLIGHT_LINTAS_WORKER aktif,
+    koordinasi juga dilakukan antar worker lewat lock di cache.
+
+    Args:
+        hitung (callable): Fungsi tanpa argumen yang menghitung hasil seleksi
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        alpha (float): Batas minimum fire strength
+        limit (int): Jumlah maksimum hasil
+        **lingkup: Parameter lain yang mempengaruhi hasil
+
+    Returns:
+        HasilSeleksi: Hasil seleksi (dari cache atau hasil perhitungan)
+    """
+    cache = get_cache()
+    kunci = _kunci_cache(kunci_query(kriteria, operator, alpha, limit, **lingkup), get_versi(), kriteria)
+    hitung = _hitung_dari_primary(hitung)
+
+    timeout = getattr(settings, 'FUZZY_CACHE_TIMEOUT', 300)
+
+    hasil = cache.get(kunci)
+    if hasil is not None:
+        return _urutkan_membership(hasil, kriteria)
+
+    def hitung_dan_simpan():
+        # Pemimpin sebelumnya mungkin baru saja menyimpan hasil
+        hasil = cache.get(kunci)
+        if hasil is not None:
+            return hasil
+
+        if getattr(settings, 'FUZZY_SINGLEFLIGHT_LINTAS_WORKER', False):
+            return hitung_dengan_lock_cache(
+                cache, kunci, hitung, timeout,
+                tunggu_maks=getattr(settings, 'FUZZY_SINGLEFLIGHT_TUNGGU_MAKS', 30)
+            )
+
+        hasil = hitung()
+        cache.set(kunci, hasil, timeout)
+        return hasil
+
+    hasil = _single_flight.do(kunci, hitung_dan_simpan)
+    return _urutkan_membership(hasil, kriteria)
+
+
+async def seleksi_dengan_cache_async(hitung, kriteria, operator='AND', alpha=0.0, limit=None, **lingkup):
+    """
+    Versi async dari seleksi_dengan_cache() untuk view async
+
+    Kunci cache sama dengan versi sync sehingga hasil dipakai bersama.
+    Request identik yang datang bersamaan di event loop yang sama
+    menunggu satu perhitungan (SingleFlightAsync). Lock cache lintas
+    worker tidak dipakai karena menunggunya memblokir.
+
+    Args:
+        hitung (callable): Fungsi tanpa argumen yang mengembalikan coroutine
+                           hasil seleksi
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        alpha (float): Batas minimum fire strength
+        limit (int): Jumlah maksimum hasil
+        **lingkup: Parameter lain yang mempengaruhi hasil
+
+    Returns:
+        HasilSeleksi: Hasil seleksi (dari cache atau hasil perhitungan)
+    """
+    cache = get_cache()
+    kunci = _kunci_cache(kunci_query(kriteria, operator, alpha, limit, **lingkup), await aget_versi(), kriteria)
+
+    hasil = await cache.aget(kunci)
+    if hasil is not None:
+        return _urutkan_membership(hasil, kriteria)
+
+    async def hitung_dan_simpan():
+        hasil = await cache.aget(kunci)
+        if hasil is not None:
+            return hasil
+        with baca_dari_primary():
+            hasil = await hitung()
+        await cache.aset(kunci, hasil, getattr(settings, 'FUZZY_CACHE_TIMEOUT', 300))
+        return hasil
+
+    hasil = await _single_flight_async.do(kunci, hitung_dan_simpan)
+    return _urutkan_membership(hasil, kriteria)
@@ -8,7 +8,7 @@ File ini berisi form-form Django untuk:
 """
 
 from django import forms
-from .models import Kelompok, FuzzyParameter
+from .models import Kelompok, FuzzyParameter, QueryTersimpan
 from .utils import VARIABEL_LIST, KATEGORI_VARIABEL
 
 
@@ -30,7 +30,8 @@ class KelompokForm(forms.ModelForm):
             'frekuensi_bantuan',
             'sdm',
             'unit_usaha',
-            'kas'
+            'kas',
+            'aktif'
         ]
         widgets = {
             'nama': forms.TextInput(attrs={
@@ -75,6 +76,9 @@ class KelompokForm(forms.ModelForm):
                 'min': '1',
                 'max': '10'
             }),
+            'aktif': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
         }
         labels = {
             'nama': 'Nama Kelompok',
@@ -85,6 +89,7 @@ class KelompokForm(forms.ModelForm):
             'sdm': 'Kualitas SDM',
             'unit_usaha': 'Unit Usaha',
             'kas': 'Kas',
+            'aktif': 'Masih Aktif',
         }
     
     def clean_sdm(self):
@@ -285,3 +290,52 @@ class FuzzyParameterForm(forms.ModelForm):
                 )
         
         return cleaned_data
+
+
+class QueryTersimpanForm(forms.ModelForm):
+    """
+    Form untuk menyimpan query seleksi multi-kriteria
+    
+    Kriteria dikirim dengan format yang sama seperti halaman seleksi
+    multi-kriteria: "variabel|kategori".
+    """
+    
+    KRITERIA_CHOICES = [
+        (f"{var}|{kat}", f"{var_label} = {kat_label}")
+        for var, var_label in VARIABEL_LIST
+        for kat, kat_label in KATEGORI_VARIABEL[var]
+    ]
+    
+    kriteria = forms.MultipleChoiceField(
+        choices=KRITERIA_CHOICES,
+        label='Kriteria'
+    )
+    
+    class Meta:
+        model = QueryTersimpan
+        fields = ['nama', 'operator', 'alpha']
+        widgets = {
+            'nama': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Contoh: Kelompok lama dengan kas baik'
+            }),
+        }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['alpha'].required = False
+    
+    def clean_kriteria(self):
+        """Ubah "variabel|kategori" menjadi [[variabel, kategori], ...]"""
+        return [k.split('|', 1) for k in self.cleaned_data['kriteria']]
+    
+    def clean_alpha(self):
+        """Validasi: alpha antara 0 dan 1"""
+        alpha = self.cleaned_data.get('alpha') or 0
+        if not 0 <= alpha <= 1:
+            raise forms.ValidationError('Alpha harus antara 0 dan 1')
+        return alpha
+    
+    def save(self, commit=True):
+        self.instance.kriteria = self.cleaned_data['kriteria']
+        return super().save(commit)
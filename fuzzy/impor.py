@@ -0,0 +1,273 @@
+"""
+Import Kelompok dari File CSV/JSON untuk SPK Fuzzy Database Model Tahani
+
+Dipakai oleh command import_kelompok untuk memuat puluhan ribu kelompok
+sekaligus (misalnya saat onboarding satu provinsi):
+- Baris dibaca dan divalidasi satu per satu (generator) dengan aturan
+  yang sama seperti KelompokForm, sehingga file CSV/JSON Lines tidak
+  dimuat seluruhnya ke memori.
+- Baris valid disimpan per batch dengan bulk_create (update_conflicts),
+  atau di PostgreSQL dengan COPY FROM STDIN ke tabel sementara lalu
+  INSERT ... ON CONFLICT. Kelompok yang namanya sudah ada diperbarui.
+
+Operasi massal tidak mengirim signal per baris; versi data dinaikkan
+per batch (VersiQuerySet), dan command menggabungkannya menjadi satu
+kenaikan di akhir import dengan tunda_naik_versi(), sehingga cache
+seleksi, pasangan terhitung dan query tersimpan dihitung ulang sekali.
+"""
+
+import csv
+import io
+import json
+import os
+from datetime import datetime
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+from .forms import KelompokForm
+from .models import Kelompok
+
+# Kolom file import, sama dengan field KelompokForm
+KOLOM_IMPOR = (
+    'nama',
+    'tanggal_berdiri',
+    'jumlah_anggota',
+    'luas_lahan',
+    'frekuensi_bantuan',
+    'sdm',
+    'unit_usaha',
+    'kas',
+    'aktif',
+)
+
+# Field yang diperbarui jika nama kelompok sudah ada
+FIELD_UPDATE = KOLOM_IMPOR[1:] + ('updated_at',)
+
+BATCH_DEFAULT = 1000
+
+FORMAT_EKSTENSI = {
+    '.csv': 'csv',
+    '.json': 'json',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+}
+
+NILAI_TIDAK_AKTIF = {'0', 'false', 'tidak', 'no', 'n'}
+
+TABEL_SEMENTARA = 'impor_kelompok_sementara'
+
+
+class FormImpor(KelompokForm):
+    """
+    KelompokForm tanpa pengecekan nama unik
+
+    Nama yang sudah ada diperbarui (upsert), bukan ditolak, dan tidak
+    perlu satu query per baris untuk memeriksanya. Widget HTML tidak
+    dipakai; widget default membuat form per baris lebih murah dibuat.
+    """
+
+    class Meta(KelompokForm.Meta):
+        widgets = {}
+
+    def validate_unique(self):
+        pass
+
+
+# =============================================================================
+# MEMBACA FILE
+# =============================================================================
+
+def format_file(path):
+    """
+    Format file berdasarkan ekstensinya
+
+    Returns:
+        str: 'csv', 'json' atau 'jsonl'
+
+    Raises:
+        ValueError: Ekstensi tidak dikenal
+    """
+    ekstensi = os.path.splitext(path)[1].lower()
+    if ekstensi not in FORMAT_EKSTENSI:
+        raise ValueError(f"Format file '{ekstensi}' tidak dikenal, pilih dengan --format")
+    return FORMAT_EKSTENSI[ekstensi]
+
+
+def baca_file(path, format_file):
+    """
+    Membaca baris file import
+
+    CSV dan JSON Lines dibaca baris per baris. JSON (array of objects)
+    dibaca utuh; gunakan JSON Lines untuk file yang sangat besar.
+
+    Args:
+        path (str): Path file
+        format_file (str): 'csv', 'json' atau 'jsonl'
+
+    Yields:
+        tuple: (nomor baris, dict kolom), dict None jika baris tidak
+               dapat dibaca
+    """
+    if format_file == 'csv':
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            # Baris 1 adalah header
+            yield from enumerate(csv.DictReader(f), start=2)
+        return
+
+    with open(path, encoding='utf-8') as f:
+        if format_file == 'json':
+            data = json.load(f)
+            if not isinstance(data, list):
+                raise ValueError('File JSON harus berisi array of objects')
+            yield from enumerate(data, start=1)
+            return
+
+        for nomor, teks in enumerate(f, start=1):
+            if not teks.strip():
+                continue
+            try:
+                yield nomor, json.loads(teks)
+            except ValueError:
+                yield nomor, None
+
+
+def _data_form(baris):
+    """Kolom file -> data KelompokForm"""
+    data = {kolom: baris.get(kolom) for kolom in KOLOM_IMPOR if baris.get(kolom) is not None}
+
+    # Tanggal ISO (format paling umum di file ekspor) langsung diubah ke
+    # date; DateField mencoba semua DATE_INPUT_FORMATS dengan ISO terakhir
+    tanggal = data.get('tanggal_berdiri')
+    if isinstance(tanggal, str):
+        try:
+            data['tanggal_berdiri'] = datetime.strptime(tanggal.strip(), '%Y-%m-%d').date()
+        except ValueError:
+            pass
+
+    # Checkbox: kolom kosong/tidak ada berarti False di form HTML,
+    # sedangkan untuk import default-nya aktif
+    aktif = baris.get('aktif')
+    if isinstance(aktif, str):
+        aktif = aktif.strip()
+        aktif = aktif.lower() not in NILAI_TIDAK_AKTIF if aktif else True
+    data['aktif'] = True if aktif is None else bool(aktif)
+    return data
+
+
+def validasi_baris(baris_iter):
+    """
+    Memvalidasi baris import dengan aturan KelompokForm
+
+    Args:
+        baris_iter: Hasil baca_file()
+
+    Yields:
+        tuple: (nomor baris, data, error). data berisi cleaned_data jika
+               valid; error berisi {field: [pesan, ...]} jika tidak
+    """
+    for nomor, baris in baris_iter:
+        if not isinstance(baris, dict):
+            yield nomor, None, {'baris': ['Baris harus berupa object dengan kolom kelompok']}
+            continue
+
+        form = FormImpor(data=_data_form(baris))
+        if form.is_valid():
+            yield nomor, form.cleaned_data, None
+        else:
+            yield nomor, None, {field: list(pesan) for field, pesan in form.errors.items()}
+
+
+# =============================================================================
+# MENYIMPAN BATCH
+# =============================================================================
+
+def bisa_copy(using=DEFAULT_DB_ALIAS):
+    """Cek apakah database mendukung COPY FROM STDIN (PostgreSQL)"""
+    return connections[using].vendor == 'postgresql'
+
+
+def simpan_batch(data_list, using=DEFAULT_DB_ALIAS, copy=False):
+    """
+    Menyimpan satu batch kelompok, memperbarui kelompok yang namanya sudah ada
+
+    Nama di dalam satu batch harus unik (satu baris tidak boleh
+    diperbarui dua kali oleh satu INSERT ... ON CONFLICT).
+
+    Args:
+        data_list (list): cleaned_data dari validasi_baris()
+        using (str): Alias database
+        copy (bool): Pakai COPY FROM STDIN (hanya PostgreSQL)
+
+    Returns:
+        int: Jumlah kelompok yang disimpan
+    """
+    if not data_list:
+        return 0
+    if copy:
+        return _simpan_copy(data_list, using)
+
+    Kelompok.objects.using(using).bulk_create(
+        [Kelompok(**{kolom: data[kolom] for kolom in KOLOM_IMPOR}) for data in data_list],
+        update_conflicts=True,
+        unique_fields=['nama'],
+        update_fields=FIELD_UPDATE,
+    )
+    return len(data_list)
+
+
+def _simpan_copy(data_list, using):
+    """
+    COPY ke tabel sementara, lalu INSERT ... ON CONFLICT ke tabel Kelompok
+
+    COPY tidak dapat melakukan upsert langsung, tetapi tetap jauh lebih
+    cepat dari INSERT banyak baris karena data dikirim sebagai satu stream.
+    """
+    from .cache import naikkan_versi_model
+    from .perubahan import catat_massal
+
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    fields = [Kelompok._meta.get_field(kolom) for kolom in KOLOM_IMPOR]
+    kolom = ', '.join(qn(field.column) for field in fields)
+    diperbarui = ', '.join(
+        f'{qn(nama)} = EXCLUDED.{qn(nama)}'
+        for nama in (Kelompok._meta.get_field(field).column for field in FIELD_UPDATE)
+    )
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for data in data_list:
+        writer.writerow([data[field.name] for field in fields])
+
+    sekarang = timezone.now()
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        # Masih ada jika import berjalan di dalam transaksi yang lebih luar
+        cursor.execute(f'DROP TABLE IF EXISTS {qn(TABEL_SEMENTARA)}')
+        cursor.execute(
+            f'CREATE TEMPORARY TABLE {qn(TABEL_SEMENTARA)} ('
+            + ', '.join(f'{qn(field.column)} {field.db_type(connection)}' for field in fields)
+            + ') ON COMMIT DROP'
+        )
+        _copy(cursor, f'COPY {qn(TABEL_SEMENTARA)} ({kolom}) FROM STDIN WITH (FORMAT csv)', buffer)
+        cursor.execute(
+            f'INSERT INTO {qn(Kelompok._meta.db_table)} ({kolom}, {qn("created_at")}, {qn("updated_at")}) '
+            f'SELECT {kolom}, %s, %s FROM {qn(TABEL_SEMENTARA)} '
+            f'ON CONFLICT ({qn("nama")}) DO UPDATE SET {diperbarui}',
+            [sekarang, sekarang],
+        )
+
+    # SQL langsung tidak melewati VersiQuerySet
+    naikkan_versi_model(Kelompok, massal=True)
+    catat_massal(Kelompok, using)
+    return len(data_list)
+
+
+def _copy(cursor, sql, buffer):
+    """COPY FROM STDIN dengan psycopg2 (copy_expert) atau psycopg 3 (copy)"""
+    buffer.seek(0)
+    if hasattr(cursor, 'copy_expert'):
+        cursor.copy_expert(sql, buffer)
+        return
+    with cursor.copy(sql) as copy:
+        copy.write(buffer.getvalue())
@@ -0,0 +1,423 @@
+"""
+Seleksi Background (Job) untuk SPK Fuzzy Database Model Tahani
+
+Seleksi multi-kriteria atas seluruh tabel bisa lebih lama dari timeout
+HTTP. Dengan `async=true`, api_seleksi hanya mendaftarkan SeleksiJob dan
+langsung mengembalikan id job; perhitungan dijalankan oleh worker lokal
+tanpa broker eksternal:
+- thread pool di proses web (FUZZY_JOB_WORKERS thread, default 2)
+- command run_seleksi_jobs (FUZZY_JOB_WORKERS=0 agar hanya command yang
+  mengerjakan job)
+
+Progres disimpan di job selama evaluasi, dan hasil yang selesai disimpan
+per baris di HasilSeleksiJob sehingga dapat diunduh per halaman berulang
+kali tanpa dihitung ulang. Query yang sama dengan data yang belum berubah
+memakai job yang sudah ada.
+
+Job yang antri/berjalan lebih dari FUZZY_JOB_MACET_MENIT menit dianggap
+macet (prosesnya mati, misalnya worker gunicorn di-recycle): buat_job
+tidak memakainya lagi, dan thread pool yang baru dibuat mengambil ulang
+job yang macet atau masih antri dari proses sebelumnya.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+from .cache import VERSI_KELOMPOK, VERSI_PARAMETER, get_versi
+from .materialisasi import _definisi_query
+
+logger = logging.getLogger(__name__)
+
+# Jumlah baris hasil per bulk_create
+BATCH_SIMPAN = 1000
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def menit_macet():
+    """Batas umur job antri/berjalan sebelum dianggap macet (menit)"""
+    return getattr(settings, 'FUZZY_JOB_MACET_MENIT', 60)
+
+
+def _masih_aktif(job, batas):
+    """Cek apakah job antri/berjalan masih mungkin dikerjakan worker"""
+    return (job.mulai_at or job.created_at) >= batas
+
+
+def _versi_job(versi):
+    return {
+        VERSI_KELOMPOK: versi.get(VERSI_KELOMPOK, 0),
+        VERSI_PARAMETER: versi.get(VERSI_PARAMETER, 0),
+    }
+
+
+def _masih_berlaku(job, versi, today):
+    """Cek apakah hasil job yang selesai masih sesuai dengan data saat ini"""
+    if job.versi != _versi_job(versi):
+        return False
+    # Usia bergantung pada tanggal hari ini
+    if any(variabel == 'usia' for variabel, _ in job.kriteria) and job.tanggal != today:
+        return False
+    return True
+
+
+# =============================================================================
+# ANTRIAN
+# =============================================================================
+
+def buat_job(kriteria, operator='AND', databases=None, include_arsip=False, alpha=0.0, limit=None):
+    """
+    Mendaftarkan seleksi untuk dijalankan di background
+
+    Jika query yang sama sudah selesai dengan data yang masih berlaku,
+    atau sedang antri/berjalan belum lebih dari menit_macet() menit, job
+    tersebut yang dikembalikan. Job yang macet ditandai gagal dan diganti
+    job baru.
+
+    Args:
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        databases (list): Alias database yang dipilih
+        include_arsip (bool): Ikut mencari di arsip kelompok
+        alpha (float): Batas minimum fire strength (alpha-cut)
+        limit (int): Jumlah maksimum hasil
+
+    Returns:
+        SeleksiJob: Job baru atau job yang dipakai ulang
+
+    Raises:
+        ValueError: Jika ada kriteria yang tidak valid
+    """
+    from .models import SeleksiJob
+    from .utils import buat_fungsi_keanggotaan, get_parameter_snapshot
+
+    if not kriteria:
+        raise ValueError('Kriteria tidak boleh kosong')
+    # Validasi sekarang agar kesalahan request tidak baru terlihat di job
+    snapshot = get_parameter_snapshot()
+    for variabel, kategori in kriteria:
+        buat_fungsi_keanggotaan(variabel, kategori, snapshot)
+
+    definisi = _definisi_query(kriteria, operator, databases, include_arsip, alpha, limit)
+    versi = get_versi()
+    today = date.today()
+    batas = timezone.now() - timedelta(minutes=menit_macet())
+
+    for job in SeleksiJob.objects.filter(kunci=definisi['kunci']).exclude(status=SeleksiJob.STATUS_GAGAL):
+        if job.status == SeleksiJob.STATUS_SELESAI:
+            if _masih_berlaku(job, versi, today):
+                return job
+        elif _masih_aktif(job, batas):
+            return job
+        else:
+            _tandai_macet(job)
+
+    job = SeleksiJob.objects.create(**definisi)
+    jadwalkan_job(job.pk)
+    return job
+
+
+def get_executor():
+    """Thread pool job di proses ini (None jika FUZZY_JOB_WORKERS=0)"""
+    global _executor
+
+    workers = getattr(settings, 'FUZZY_JOB_WORKERS', 2)
+    if workers <= 0:
+        return None
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='seleksi-job')
+            # Job dari proses sebelumnya tidak lagi dikerjakan siapa pun
+            _executor.submit(_pulihkan_di_thread)
+        return _executor
+
+
+def jadwalkan_job(pk):
+    """
+    Menjalankan job di thread pool setelah transaksi saat ini commit
+
+    Jika FUZZY_JOB_WORKERS=0, job dibiarkan antri untuk command
+    run_seleksi_jobs.
+    """
+    if get_executor() is None:
+        return
+    transaction.on_commit(lambda: _kirim_job(pk))
+
+
+def _kirim_job(pk):
+    connection = connections[DEFAULT_DB_ALIAS]
+    if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+        # Database in-memory tidak terlihat dari thread lain
+        jalankan_job(pk)
+        return
+
+    get_executor().submit(_jalankan_di_thread, pk)
+
+
+def _jalankan_di_thread(pk):
+    try:
+        jalankan_job(pk)
+    finally:
+        # Koneksi Django bersifat per-thread, tutup agar tidak bocor
+        connections.close_all()
+
+
+def _pulihkan_di_thread():
+    connection = connections[DEFAULT_DB_ALIAS]
+    if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+        return
+    try:
+        pulihkan_job()
+    except Exception:
+        logger.exception('Gagal memulihkan seleksi job')
+    finally:
+        connections.close_all()
+
+
+# =============================================================================
+# EKSEKUSI
+# =============================================================================
+
+def jalankan_job(pk):
+    """
+    Menjalankan satu job yang masih antri
+
+    Job diambil secara atomik (status antri -> berjalan) sehingga aman
+    jika beberapa worker mencoba menjalankan job yang sama.
+
+    Args:
+        pk (int): Id SeleksiJob
+
+    Returns:
+        bool: True jika job dijalankan oleh pemanggil ini
+    """
+    from .models import SeleksiJob
+
+    diambil = SeleksiJob.objects.filter(pk=pk, status=SeleksiJob.STATUS_ANTRI).update(
+        status=SeleksiJob.STATUS_BERJALAN, mulai_at=timezone.now(), diproses=0, error=''
+    )
+    if not diambil:
+        return False
+
+    job = SeleksiJob.objects.get(pk=pk)
+    try:
+        if job.databases or job.include_arsip:
+            _hitung_lingkup(job)
+        else:
+            _hitung_kelompok(job)
+    except Exception as e:
+        logger.exception('Seleksi job %s gagal', pk)
+        SeleksiJob.objects.filter(pk=pk).update(
+            status=SeleksiJob.STATUS_GAGAL, error=str(e), selesai_at=timezone.now()
+        )
+    return True
+
+
+def _hitung_kelompok(job):
+    """
+    Seleksi tabel Kelompok per potongan dengan progres tersimpan
+
+    Urutan hasil sama dengan seleksi_fuzzy().
+    """
+    from .models import HasilSeleksiJob, Kelompok, SeleksiJob
+    from .utils import (
+        BATCH_BARIS_SHARD,
+        KOLOM_KELOMPOK,
+        buat_item_hasil,
+        data_dari_baris,
+        evaluasi_potongan,
+        get_parameter_snapshot,
+    )
+
+    # Versi dibaca sebelum data agar perubahan selama perhitungan
+    # membuat hasil job ini dianggap basi
+    versi = get_versi()
+    today = date.today()
+    kriteria = job.get_kriteria()
+    snapshot = get_parameter_snapshot()
+
+    SeleksiJob.objects.filter(pk=job.pk).update(jumlah_baris=Kelompok.objects.count())
+
+    ranking = []
+    potongan = []
+    diproses = 0
+    baris_list = Kelompok.objects.order_by('nama', 'id').values_list(*KOLOM_KELOMPOK)
+    for baris in baris_list.iterator(chunk_size=BATCH_BARIS_SHARD):
+        potongan.append(baris)
+        if len(potongan) == BATCH_BARIS_SHARD:
+            ranking.extend(evaluasi_potongan(potongan, kriteria, job.operator, snapshot, job.alpha))
+            diproses += len(potongan)
+            potongan = []
+            SeleksiJob.objects.filter(pk=job.pk).update(diproses=diproses)
+    ranking.extend(evaluasi_potongan(potongan, kriteria, job.operator, snapshot, job.alpha))
+    diproses += len(potongan)
+
+    ranking.sort(key=lambda entri: entri[2], reverse=True)
+    total = len(ranking)
+    if job.limit is not None:
+        ranking = ranking[:job.limit]
+
+    def baris_hasil():
+        peringkat = 0
+        for awal in range(0, len(ranking), BATCH_BARIS_SHARD):
+            bagian = ranking[awal:awal + BATCH_BARIS_SHARD]
+            baris_map = {
+                baris[0]: baris
+                for baris in Kelompok.objects.filter(id__in=[pk for pk, _, _ in bagian]).values_list(*KOLOM_KELOMPOK)
+            }
+            for pk, membership_values, fire_strength in bagian:
+                # Kelompok yang dihapus selama perhitungan dilewati
+                if pk not in baris_map:
+                    continue
+                data = data_dari_baris(baris_map[pk], today)
+                item = buat_item_hasil(None, data, kriteria, membership_values, fire_strength)
+                peringkat += 1
+                yield HasilSeleksiJob(
+                    job=job,
+                    peringkat=peringkat,
+                    kelompok_id=pk,
+                    nama=data['nama'],
+                    membership=item['membership_values'],
+                    fire_strength=fire_strength,
+                )
+
+    _simpan_hasil(job, baris_hasil(), total, [], versi, today, diproses=diproses)
+
+
+def _hitung_lingkup(job):
+    """Seleksi lintas database dan/atau arsip dengan seleksi_fuzzy_lingkup()"""
+    from .models import HasilSeleksiJob
+    from .utils import seleksi_fuzzy_lingkup
+
+    versi = get_versi()
+    today = date.today()
+
+    hasil = seleksi_fuzzy_lingkup(
+        job.get_kriteria(), job.operator, job.databases, job.include_arsip, job.alpha, job.limit
+    )
+    baris_hasil = (
+        HasilSeleksiJob(
+            job=job,
+            peringkat=peringkat,
+            kelompok_id=item['kelompok'].pk,
+            nama=item['kelompok'].nama,
+            db_alias=item.get('db_alias'),
+            arsip=item['kelompok'].is_arsip,
+            membership=item['membership_values'],
+            fire_strength=item['fire_strength'],
+        )
+        for peringkat, item in enumerate(hasil, start=1)
+    )
+    # Jumlah baris yang dievaluasi di setiap sumber tidak diketahui
+    _simpan_hasil(job, baris_hasil, hasil.total, hasil.statistik_db, versi, today, diproses=0)
+
+
+def _simpan_hasil(job, baris_hasil, total, statistik_db, versi, today, diproses):
+    """Menyimpan hasil job dan menandainya selesai dalam satu transaksi"""
+    from .models import HasilSeleksiJob, SeleksiJob
+
+    with transaction.atomic():
+        HasilSeleksiJob.objects.filter(job=job).delete()
+        potongan = []
+        for baris in baris_hasil:
+            potongan.append(baris)
+            if len(potongan) == BATCH_SIMPAN:
+                HasilSeleksiJob.objects.bulk_create(potongan)
+                potongan = []
+        HasilSeleksiJob.objects.bulk_create(potongan)
+
+        SeleksiJob.objects.filter(pk=job.pk).update(
+            status=SeleksiJob.STATUS_SELESAI,
+            total=total,
+            statistik_db=statistik_db or [],
+            versi=_versi_job(versi),
+            tanggal=today,
+            diproses=diproses,
+            selesai_at=timezone.now(),
+        )
+
+
+# =============================================================================
+# PEMELIHARAAN
+# =============================================================================
+
+def antrikan_ulang_macet(menit):
+    """
+    Mengembalikan job yang berjalan lebih dari N menit ke antrian
+
+    Untuk job yang workernya berhenti di tengah jalan (proses dimatikan).
+
+    Returns:
+        int: Jumlah job yang diantrikan ulang
+    """
+    from .models import SeleksiJob
+
+    batas = timezone.now() - timedelta(minutes=menit)
+    return SeleksiJob.objects.filter(
+        status=SeleksiJob.STATUS_BERJALAN, mulai_at__lt=batas
+    ).update(status=SeleksiJob.STATUS_ANTRI, diproses=0)
+
+
+def _tandai_macet(job):
+    """Menandai job antri/berjalan yang macet sebagai gagal"""
+    from .models import SeleksiJob
+
+    SeleksiJob.objects.filter(
+        pk=job.pk, status__in=[SeleksiJob.STATUS_ANTRI, SeleksiJob.STATUS_BERJALAN]
+    ).update(
+        status=SeleksiJob.STATUS_GAGAL,
+        error=f'Job macet lebih dari {menit_macet()} menit, diganti job baru',
+        selesai_at=timezone.now(),
+    )
+
+
+def pulihkan_job():
+    """
+    Mengambil alih job dari proses sebelumnya
+
+    Dipanggil sekali saat thread pool job dibuat di proses web: job yang
+    macet diantrikan ulang, lalu semua job yang antri dikirim ke thread
+    pool (setiap job tetap hanya dijalankan oleh satu worker).
+
+    Returns:
+        int: Jumlah job antri yang dikirim ke thread pool
+    """
+    from .models import SeleksiJob
+
+    executor = get_executor()
+    if executor is None:
+        return 0
+
+    antrikan_ulang_macet(menit_macet())
+    antri = list(
+        SeleksiJob.objects.filter(status=SeleksiJob.STATUS_ANTRI)
+        .order_by('created_at')
+        .values_list('pk', flat=True)
+    )
+    for pk in antri:
+        executor.submit(_jalankan_di_thread, pk)
+    return len(antri)
+
+
+def hapus_job_lama(hari):
+    """
+    Menghapus job (beserta hasilnya) yang selesai/gagal lebih dari N hari lalu
+
+    Returns:
+        int: Jumlah job yang dihapus
+    """
+    from .models import SeleksiJob
+
+    batas = timezone.now() - timedelta(days=hari)
+    jumlah, per_model = SeleksiJob.objects.filter(
+        status__in=[SeleksiJob.STATUS_SELESAI, SeleksiJob.STATUS_GAGAL], selesai_at__lt=batas
+    ).delete()
+    return per_model.get(SeleksiJob._meta.label, 0)
@@ -0,0 +1,77 @@
+"""
+Management Command untuk Mengarsipkan Kelompok Tidak Aktif
+
+Memindahkan kelompok yang sudah bubar (aktif=False) atau tidak
+diperbarui selama beberapa tahun dari tabel Kelompok ke tabel
+KelompokArsip secara bertahap (per batch), sehingga seleksi fuzzy
+hanya memindai data yang masih relevan.
+
+Penggunaan:
+    python manage.py archive_kelompok
+    python manage.py archive_kelompok --tahun 5 --batch-size 500
+    python manage.py archive_kelompok --dry-run
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from fuzzy.models import Kelompok, KelompokArsip
+
+
+class Command(BaseCommand):
+    help = 'Pindahkan kelompok tidak aktif ke tabel arsip'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tahun',
+            type=int,
+            default=3,
+            help='Arsipkan kelompok yang tidak diperbarui selama N tahun (default: 3)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Jumlah kelompok yang dipindahkan per transaksi (default: 1000)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Hanya tampilkan jumlah kelompok yang akan diarsipkan'
+        )
+
+    def handle(self, *args, **options):
+        batas = timezone.now() - timedelta(days=int(options['tahun'] * 365.25))
+        batch_size = options['batch_size']
+
+        kandidat = Kelompok.objects.filter(Q(aktif=False) | Q(updated_at__lt=batas))
+        ids = list(kandidat.order_by('pk').values_list('pk', flat=True))
+
+        if options['dry_run']:
+            self.stdout.write(f'{len(ids)} kelompok akan diarsipkan.')
+            return
+
+        dipindahkan = 0
+        for i in range(0, len(ids), batch_size):
+            with transaction.atomic():
+                # Cek ulang kriteria: data bisa saja diperbarui sejak daftar id dibuat
+                batch = list(kandidat.filter(pk__in=ids[i:i + batch_size]))
+                KelompokArsip.objects.bulk_create(
+                    [KelompokArsip.dari_kelompok(kelompok) for kelompok in batch]
+                )
+                Kelompok.objects.filter(pk__in=[kelompok.pk for kelompok in batch]).delete()
+
+            dipindahkan += len(batch)
+            self.stdout.write(f'  Diarsipkan: {dipindahkan}/{len(ids)}')
+
+        self.stdout.write(
+            self.style.SUCCESS(f'\nBerhasil mengarsipkan {dipindahkan} kelompok!')
+        )
+        self.stdout.write(
+            f'Kelompok aktif: {Kelompok.objects.count()}, '
+            f'arsip: {KelompokArsip.objects.count()}'
+        )
@@ -0,0 +1,156 @@
+"""
+Management Command untuk Import Kelompok dari File CSV/JSON
+
+Memuat banyak kelompok sekaligus dari file dengan kolom nama,
+tanggal_berdiri, jumlah_anggota, luas_lahan, frekuensi_bantuan, sdm,
+unit_usaha, kas dan aktif (opsional, default aktif). Setiap baris
+divalidasi dengan aturan KelompokForm; baris yang tidak valid dilaporkan
+dan dilewati. Kelompok yang namanya sudah ada diperbarui.
+
+Format dipilih dari ekstensi file: .csv, .json (array of objects) atau
+.jsonl/.ndjson (satu object per baris).
+
+Penggunaan:
+    python manage.py import_kelompok kelompok_jabar.csv
+    python manage.py import_kelompok kelompok.jsonl --batch-size 5000
+    python manage.py import_kelompok kelompok.csv --dry-run
+"""
+
+import csv
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from fuzzy.cache import tunda_naik_versi
+from fuzzy.impor import (
+    BATCH_DEFAULT,
+    FORMAT_EKSTENSI,
+    baca_file,
+    bisa_copy,
+    format_file,
+    simpan_batch,
+    validasi_baris,
+)
+from fuzzy.models import Kelompok
+
+
+class Command(BaseCommand):
+    help = 'Import kelompok dari file CSV/JSON (kelompok dengan nama yang sama diperbarui)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', help='Path file CSV, JSON atau JSON Lines')
+        parser.add_argument(
+            '--format',
+            choices=sorted(set(FORMAT_EKSTENSI.values())),
+            help='Format file (default: dari ekstensi file)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_DEFAULT,
+            help=f'Jumlah kelompok per batch (default: {BATCH_DEFAULT})'
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help='Alias database tujuan (default: default)'
+        )
+        parser.add_argument(
+            '--tanpa-copy',
+            action='store_true',
+            help='Di PostgreSQL, pakai bulk_create alih-alih COPY FROM STDIN'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Hanya validasi file, tanpa menyimpan'
+        )
+        parser.add_argument(
+            '--maks-error',
+            type=int,
+            default=20,
+            help='Jumlah baris tidak valid yang ditampilkan (default: 20)'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            format_import = options['format'] or format_file(options['file'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        using = options['database']
+        copy = bisa_copy(using) and not options['tanpa_copy']
+        self.dry_run = options['dry_run']
+        self.maks_error = options['maks_error']
+        self.dibaca = self.valid = self.disimpan = self.error = 0
+        self.mulai = time.perf_counter()
+
+        if not self.dry_run:
+            self.stdout.write(f"Import ke database '{using}' dengan {'COPY' if copy else 'bulk_create'}")
+
+        baris_valid = self._baris_valid(validasi_baris(baca_file(options['file'], format_import)))
+        try:
+            # Versi data (dan refresh cache turunan) dinaikkan sekali di akhir
+            with tunda_naik_versi():
+                for batch in self._per_batch(baris_valid, options['batch_size']):
+                    if not self.dry_run:
+                        self.disimpan += simpan_batch(batch, using, copy)
+                    self._laporkan_progres()
+        except (OSError, ValueError, csv.Error) as e:
+            raise CommandError(f'Import gagal setelah {self.dibaca} baris: {e}')
+
+        durasi = time.perf_counter() - self.mulai
+        if self.dry_run:
+            self.stdout.write(self.style.SUCCESS(
+                f'\n{self.valid} dari {self.dibaca} baris valid, {self.error} tidak valid '
+                f'({durasi:.2f} detik).'
+            ))
+            return
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\nBerhasil mengimport {self.disimpan} kelompok dalam {durasi:.2f} detik '
+            f'({self.disimpan / max(durasi, 1e-9):,.0f} kelompok/detik).'
+        ))
+        if self.error:
+            self.stdout.write(self.style.WARNING(f'{self.error} baris tidak valid dilewati.'))
+        self.stdout.write(f'Total kelompok: {Kelompok.objects.using(using).count()}')
+
+    def _baris_valid(self, hasil_validasi):
+        """Menghitung baris dan melaporkan error, hanya meneruskan data yang valid"""
+        for nomor, data, error in hasil_validasi:
+            self.dibaca += 1
+            if error is None:
+                self.valid += 1
+                yield data
+                continue
+
+            self.error += 1
+            if self.error <= self.maks_error:
+                pesan = '; '.join(f'{field}: {" ".join(daftar)}' for field, daftar in error.items())
+                self.stdout.write(self.style.WARNING(f'  Baris {nomor}: {pesan}'))
+            elif self.error == self.maks_error + 1:
+                self.stdout.write(self.style.WARNING('  ... (baris tidak valid berikutnya tidak ditampilkan)'))
+
+    def _per_batch(self, baris_valid, ukuran):
+        """
+        Mengelompokkan data per batch dengan nama unik
+
+        Jika nama yang sama muncul lebih dari sekali dalam satu batch,
+        baris terakhir yang dipakai (sama seperti pada batch berbeda).
+        """
+        batch = {}
+        for data in baris_valid:
+            batch[data['nama']] = data
+            if len(batch) >= ukuran:
+                yield list(batch.values())
+                batch = {}
+        if batch:
+            yield list(batch.values())
+
+    def _laporkan_progres(self):
+        durasi = time.perf_counter() - self.mulai
+        self.stdout.write(
+            f'  Dibaca: {self.dibaca}, valid: {self.valid}, disimpan: {self.disimpan}, '
+            f'tidak valid: {self.error} ({self.dibaca / max(durasi, 1e-9):,.0f} baris/detik)'
+        )
@@ -0,0 +1,59 @@
+"""
+Management Command untuk Materialisasi Query Populer
+
+Menyimpan hasil N query seleksi dengan biaya (jumlah eksekusi x latensi)
+atau frekuensi terbesar, dan membuang hasil query yang sudah tidak
+termasuk N teratas. Jalankan berkala (misalnya lewat cron).
+
+Penggunaan:
+    python manage.py materialize_hot_queries
+    python manage.py materialize_hot_queries --top 50 --hari 30
+    python manage.py materialize_hot_queries --urut frekuensi
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from fuzzy.materialisasi import URUTAN_POPULER, materialisasi_query_populer
+
+
+class Command(BaseCommand):
+    help = 'Simpan hasil query seleksi yang paling sering/mahal dijalankan'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=getattr(settings, 'FUZZY_MATERIALISASI_TOP', 20),
+            help='Jumlah query yang dimaterialisasi (default: 20)'
+        )
+        parser.add_argument(
+            '--hari',
+            type=int,
+            default=7,
+            help='Hanya query yang dijalankan dalam N hari terakhir (default: 7)'
+        )
+        parser.add_argument(
+            '--urut',
+            choices=URUTAN_POPULER,
+            default='biaya',
+            help='Urutkan berdasarkan biaya (jumlah x latensi) atau frekuensi'
+        )
+
+    def handle(self, *args, **options):
+        populer, dihitung, dibuang = materialisasi_query_populer(
+            options['top'], options['hari'], options['urut']
+        )
+
+        for query in populer:
+            self.stdout.write(
+                f'  {query} (dijalankan {query.jumlah}x, '
+                f'rata-rata {query.rata_rata_ms:.1f} ms)'
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'\n{len(populer)} query populer: {dihitung} dihitung ulang, '
+                f'{dibuang} hasil lama dibuang.'
+            )
+        )
@@ -0,0 +1,48 @@
+"""
+Management Command untuk Menghitung Pasangan Kriteria
+
+Menghitung ranking seleksi AND/OR untuk semua 351 pasangan kriteria
+dan menyimpannya di tabel PasanganTerhitung. Setelah command ini
+dijalankan sekali, perubahan data/parameter memperbarui pasangan yang
+terpengaruh secara otomatis di background.
+
+Penggunaan:
+    python manage.py precompute_pasangan
+    python manage.py precompute_pasangan --hanya-basi
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from fuzzy.models import PasanganTerhitung
+from fuzzy.pasangan import refresh_pasangan
+
+
+class Command(BaseCommand):
+    help = 'Hitung ranking seleksi untuk semua pasangan 2 kriteria'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hanya-basi',
+            action='store_true',
+            help='Hanya hitung pasangan yang belum ada atau sudah basi'
+        )
+
+    def handle(self, *args, **options):
+        mulai = time.perf_counter()
+
+        if options['hanya_basi'] and not PasanganTerhitung.objects.exists():
+            # Tabel masih kosong: semua pasangan belum ada
+            options['hanya_basi'] = False
+
+        jumlah = refresh_pasangan(semua=not options['hanya_basi'])
+        durasi = time.perf_counter() - mulai
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Berhasil menghitung {jumlah} pasangan x 2 operator '
+                f'dalam {durasi:.2f} detik.'
+            )
+        )
+        self.stdout.write(f'Total entri: {PasanganTerhitung.objects.count()}')
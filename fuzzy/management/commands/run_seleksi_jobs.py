@@ -0,0 +1,89 @@
+"""
+Management Command Worker Seleksi Background
+
+Menjalankan SeleksiJob yang antri (api_seleksi dengan async=true) tanpa
+broker eksternal: antrian dibaca langsung dari tabel SeleksiJob. Pakai
+bersama FUZZY_JOB_WORKERS=0 agar proses web hanya mengantrikan job.
+Beberapa worker boleh berjalan bersamaan; setiap job hanya diambil oleh
+satu worker.
+
+Penggunaan:
+    python manage.py run_seleksi_jobs
+    python manage.py run_seleksi_jobs --sekali
+    python manage.py run_seleksi_jobs --interval 5 --hapus-hari 7
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from fuzzy.jobs import antrikan_ulang_macet, hapus_job_lama, jalankan_job, menit_macet
+from fuzzy.models import SeleksiJob
+
+
+class Command(BaseCommand):
+    help = 'Jalankan seleksi background (SeleksiJob) yang antri'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sekali',
+            action='store_true',
+            help='Jalankan semua job yang antri lalu berhenti'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2,
+            help='Jeda memeriksa antrian jika kosong, dalam detik (default: 2)'
+        )
+        parser.add_argument(
+            '--macet',
+            type=int,
+            default=None,
+            help='Antrikan ulang job yang berjalan lebih dari N menit (default: FUZZY_JOB_MACET_MENIT)'
+        )
+        parser.add_argument(
+            '--hapus-hari',
+            type=int,
+            default=None,
+            help='Hapus job selesai/gagal yang lebih lama dari N hari'
+        )
+
+    def handle(self, *args, **options):
+        dijalankan = 0
+        macet = options['macet'] if options['macet'] is not None else menit_macet()
+        while True:
+            close_old_connections()
+
+            diantrikan = antrikan_ulang_macet(macet)
+            if diantrikan:
+                self.stdout.write(self.style.WARNING(f'{diantrikan} job macet diantrikan ulang'))
+            if options['hapus_hari'] is not None:
+                dihapus = hapus_job_lama(options['hapus_hari'])
+                if dihapus:
+                    self.stdout.write(f'{dihapus} job lama dihapus')
+
+            antri = list(
+                SeleksiJob.objects.filter(status=SeleksiJob.STATUS_ANTRI)
+                .order_by('created_at')
+                .values_list('pk', flat=True)
+            )
+            for pk in antri:
+                mulai = time.perf_counter()
+                if not jalankan_job(pk):
+                    # Sudah diambil worker lain
+                    continue
+                dijalankan += 1
+                job = SeleksiJob.objects.get(pk=pk)
+                self.stdout.write(
+                    f'  Job {pk} ({job}): {job.status}, '
+                    f'{(time.perf_counter() - mulai):.1f} detik'
+                )
+
+            if options['sekali']:
+                break
+            if not antri:
+                time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'\n{dijalankan} job dijalankan.'))
@@ -0,0 +1,138 @@
+"""
+Management Command untuk Menghangatkan Cache setelah Deploy
+
+Dijalankan di tahap `release` (lihat Procfile) agar request pertama
+setelah deploy tidak menanggung seluruh biaya perhitungan:
+- snapshot parameter dan 27 fungsi keanggotaan (sekaligus validasi
+  parameter di database)
+- pasangan kriteria terhitung (lookup seleksi 2 kriteria)
+- query populer yang dimaterialisasi dan ranking query tersimpan
+- statistik dashboard
+- hasil seleksi untuk query yang paling sering dijalankan (LogQuery)
+
+Statistik dashboard dan hasil seleksi disimpan di cache Django. Agar
+terpakai oleh worker web, cache harus bersama (REDIS_URL); dengan
+LocMemCache cache hanya hidup di proses command ini.
+
+Penggunaan:
+    python manage.py warm_fuzzy_caches
+    python manage.py warm_fuzzy_caches --top 50 --hari 30
+    python manage.py warm_fuzzy_caches --lewati pasangan
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand
+
+from fuzzy.cache import get_cache, get_statistik_dashboard, seleksi_dengan_cache
+from fuzzy.materialisasi import get_query_populer, refresh_materialisasi
+from fuzzy.models import PasanganTerhitung, QueryTermaterialisasi
+from fuzzy.pasangan import daftar_kriteria, refresh_pasangan
+from fuzzy.query_tersimpan import refresh_query_tersimpan
+from fuzzy.utils import buat_fungsi_keanggotaan, get_parameter_snapshot, seleksi_fuzzy_lingkup
+
+TAHAP = ('parameter', 'pasangan', 'materialisasi', 'query_tersimpan', 'dashboard', 'seleksi')
+
+
+class Command(BaseCommand):
+    help = 'Hangatkan cache dan hasil terhitung fuzzy (jalankan setelah deploy)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=getattr(settings, 'FUZZY_MATERIALISASI_TOP', 20),
+            help='Jumlah query populer yang hasilnya di-cache (default: 20)'
+        )
+        parser.add_argument(
+            '--hari',
+            type=int,
+            default=7,
+            help='Hanya query yang dijalankan dalam N hari terakhir (default: 7)'
+        )
+        parser.add_argument(
+            '--lewati',
+            action='append',
+            choices=TAHAP,
+            default=[],
+            help='Tahap yang dilewati (bisa diulang)'
+        )
+
+    def handle(self, *args, **options):
+        if isinstance(get_cache(), LocMemCache):
+            self.stdout.write(self.style.WARNING(
+                'Cache memakai LocMemCache: statistik dan hasil seleksi hanya '
+                'tersimpan di proses ini. Set REDIS_URL untuk cache bersama.'
+            ))
+
+        tahap_list = [
+            ('parameter', self.hangatkan_parameter, ()),
+            ('pasangan', self.hangatkan_pasangan, ()),
+            ('materialisasi', self.hangatkan_materialisasi, ()),
+            ('query_tersimpan', self.hangatkan_query_tersimpan, ()),
+            ('dashboard', self.hangatkan_dashboard, ()),
+            ('seleksi', self.hangatkan_seleksi, (options['top'], options['hari'])),
+        ]
+
+        mulai_total = time.perf_counter()
+        for nama, fungsi, argumen in tahap_list:
+            if nama in options['lewati']:
+                self.stdout.write(f'  {nama}: dilewati')
+                continue
+            mulai = time.perf_counter()
+            keterangan = fungsi(*argumen)
+            durasi_ms = (time.perf_counter() - mulai) * 1000
+            self.stdout.write(f'  {nama}: {keterangan} ({durasi_ms:.1f} ms)')
+
+        durasi_total = time.perf_counter() - mulai_total
+        self.stdout.write(self.style.SUCCESS(f'\nCache dihangatkan dalam {durasi_total:.2f} detik.'))
+
+    def hangatkan_parameter(self):
+        # Gagal di sini (parameter tidak valid) menggagalkan release,
+        # bukan request pertama user
+        snapshot = get_parameter_snapshot()
+        for variabel, kategori in daftar_kriteria():
+            buat_fungsi_keanggotaan(variabel, kategori, snapshot)(0)
+        return f'{len(daftar_kriteria())} fungsi keanggotaan'
+
+    def hangatkan_pasangan(self):
+        dihitung = refresh_pasangan(semua=not PasanganTerhitung.objects.exists())
+        return f'{dihitung} pasangan dihitung ulang'
+
+    def hangatkan_materialisasi(self):
+        return f'{refresh_materialisasi()} query dihitung ulang'
+
+    def hangatkan_query_tersimpan(self):
+        return f'{refresh_query_tersimpan()} query dihitung ulang'
+
+    def hangatkan_dashboard(self):
+        statistik = get_statistik_dashboard()
+        return f"statistik {statistik['total']} kelompok"
+
+    def hangatkan_seleksi(self, top, hari):
+        termaterialisasi = set(QueryTermaterialisasi.objects.values_list('kunci', flat=True))
+
+        dihangatkan = 0
+        for query in get_query_populer(top, hari, urut='frekuensi'):
+            kriteria = query.get_kriteria()
+            # Sudah dijawab dari pasangan terhitung atau hasil termaterialisasi
+            if query.kunci in termaterialisasi:
+                continue
+            if len(kriteria) == 2 and not query.databases and not query.include_arsip:
+                continue
+
+            def hitung(query=query, kriteria=kriteria):
+                return seleksi_fuzzy_lingkup(
+                    kriteria, query.operator, query.databases, query.include_arsip,
+                    query.alpha, query.limit
+                )
+
+            seleksi_dengan_cache(
+                hitung, kriteria, query.operator, query.alpha, query.limit,
+                databases=query.databases, include_arsip=query.include_arsip
+            )
+            dihangatkan += 1
+
+        return f'{dihangatkan} hasil query populer di-cache'
@@ -0,0 +1,394 @@
+"""
+Materialisasi Query Populer untuk SPK Fuzzy Database Model Tahani
+
+Setiap query dari halaman seleksi multi-kriteria dan api_seleksi dicatat
+dalam bentuk kanonik (LogQuery) beserta jumlah eksekusi dan latensinya.
+Catatan dikumpulkan di memori proses dan ditulis ke LogQuery paling
+sering setiap FUZZY_LOG_QUERY_INTERVAL detik, sehingga request seleksi
+(termasuk cache hit) tidak selalu menulis ke database.
+Command materialize_hot_queries menyimpan hasil N query dengan biaya
+terbesar di QueryTermaterialisasi, sehingga query yang sering dipakai
+selalu dijawab dari hasil tersimpan. Query yang keluar dari N teratas
+dihapus. Hanya query pada database utama yang dimaterialisasi, karena
+versi data hanya dilacak untuk database utama (arsip termasuk).
+
+Hasil tersimpan dihitung ulang di background (lihat fuzzy/refresh.py)
+setiap kali versi data Kelompok atau FuzzyParameter berubah.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import ExpressionWrapper, F, FloatField, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .cache import VERSI_KELOMPOK, VERSI_PARAMETER, get_versi, kunci_query
+from .refresh import jadwalkan_refresh
+
+logger = logging.getLogger(__name__)
+
+URUTAN_POPULER = ('biaya', 'frekuensi')
+
+# Catatan query yang belum ditulis ke LogQuery: {kunci: dict}
+_log_tertunda = {}
+_log_lock = threading.Lock()
+_log_ditulis_at = time.monotonic()
+
+
+def _definisi_query(kriteria, operator, databases, include_arsip, alpha, limit):
+    """
+    Bentuk kanonik query untuk disimpan di LogQuery/QueryTermaterialisasi
+
+    Returns:
+        dict: Nilai field QuerySeleksiBase
+    """
+    databases = sorted(databases or [])
+    return {
+        'kunci': kunci_query(
+            kriteria, operator, alpha, limit,
+            databases=databases, include_arsip=include_arsip
+        ),
+        'kriteria': [list(k) for k in sorted({tuple(k) for k in kriteria})],
+        'operator': operator.upper(),
+        'alpha': float(alpha or 0),
+        'limit': limit,
+        'databases': databases,
+        'include_arsip': bool(include_arsip),
+    }
+
+
+def _versi_materialisasi(versi):
+    return {
+        VERSI_KELOMPOK: versi.get(VERSI_KELOMPOK, 0),
+        VERSI_PARAMETER: versi.get(VERSI_PARAMETER, 0),
+    }
+
+
+def _masih_berlaku(entri, versi, today):
+    """Cek apakah hasil tersimpan masih sesuai dengan data saat ini"""
+    if entri.versi != _versi_materialisasi(versi):
+        return False
+    # Usia bergantung pada tanggal hari ini
+    if any(variabel == 'usia' for variabel, _ in entri.kriteria) and entri.tanggal != today:
+        return False
+    return True
+
+
+# =============================================================================
+# LOG QUERY
+# =============================================================================
+
+def catat_query(kriteria, operator, databases, include_arsip, alpha, limit, durasi_ms):
+    """
+    Mencatat satu eksekusi query seleksi
+
+    Eksekusi query yang sama digabung di memori; semua catatan ditulis
+    ke LogQuery oleh tulis_log_query() jika sudah lebih dari
+    FUZZY_LOG_QUERY_INTERVAL detik sejak penulisan terakhir (0 = langsung).
+
+    Args:
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        databases (list): Alias database yang dipilih
+        include_arsip (bool): Ikut mencari di arsip kelompok
+        alpha (float): Batas minimum fire strength
+        limit (int): Jumlah maksimum hasil
+        durasi_ms (float): Latensi eksekusi dalam milidetik
+    """
+    definisi = _definisi_query(kriteria, operator, databases, include_arsip, alpha, limit)
+    interval = getattr(settings, 'FUZZY_LOG_QUERY_INTERVAL', 60)
+
+    with _log_lock:
+        catatan = _log_tertunda.get(definisi['kunci'])
+        if catatan is None:
+            catatan = _log_tertunda[definisi['kunci']] = {
+                'definisi': definisi, 'jumlah': 0, 'total_durasi_ms': 0.0, 'durasi_maks_ms': 0.0,
+            }
+        catatan['jumlah'] += 1
+        catatan['total_durasi_ms'] += durasi_ms
+        catatan['durasi_maks_ms'] = max(catatan['durasi_maks_ms'], float(durasi_ms))
+        catatan['terakhir_dijalankan'] = timezone.now()
+        perlu_ditulis = time.monotonic() - _log_ditulis_at >= interval
+
+    if perlu_ditulis:
+        tulis_log_query()
+
+
+def tulis_log_query():
+    """
+    Menulis catatan query yang tertunda ke LogQuery
+
+    Returns:
+        int: Jumlah query (kunci berbeda) yang ditulis
+    """
+    global _log_ditulis_at
+
+    with _log_lock:
+        tertunda = list(_log_tertunda.values())
+        _log_tertunda.clear()
+        _log_ditulis_at = time.monotonic()
+
+    for catatan in tertunda:
+        _tulis_catatan(catatan)
+    return len(tertunda)
+
+
+def _tulis_catatan(catatan):
+    """Menambahkan satu catatan gabungan ke baris LogQuery-nya"""
+    from .models import LogQuery
+
+    definisi = catatan['definisi']
+
+    def perbarui():
+        return LogQuery.objects.filter(kunci=definisi['kunci']).update(
+            jumlah=F('jumlah') + catatan['jumlah'],
+            total_durasi_ms=F('total_durasi_ms') + catatan['total_durasi_ms'],
+            durasi_maks_ms=Greatest('durasi_maks_ms', Value(catatan['durasi_maks_ms'])),
+            terakhir_dijalankan=catatan['terakhir_dijalankan'],
+        )
+
+    if perbarui():
+        return
+
+    try:
+        with transaction.atomic():
+            LogQuery.objects.create(
+                **definisi,
+                jumlah=catatan['jumlah'],
+                total_durasi_ms=catatan['total_durasi_ms'],
+                durasi_maks_ms=catatan['durasi_maks_ms'],
+                terakhir_dijalankan=catatan['terakhir_dijalankan'],
+            )
+    except IntegrityError:
+        # Query yang sama baru saja dicatat oleh proses lain
+        perbarui()
+
+
+@atexit.register
+def _tulis_log_saat_keluar():
+    try:
+        tulis_log_query()
+    except Exception:
+        logger.exception('Gagal menulis log query saat proses berhenti')
+
+
+# =============================================================================
+# MATERIALISASI
+# =============================================================================
+
+def simpan_materialisasi(query):
+    """
+    Menghitung dan menyimpan hasil sebuah query
+
+    Args:
+        query: LogQuery atau QueryTermaterialisasi
+
+    Returns:
+        QueryTermaterialisasi: Entri yang disimpan
+    """
+    from .models import QueryTermaterialisasi
+    from .utils import seleksi_fuzzy_lingkup
+
+    # Versi dibaca sebelum data agar perubahan selama perhitungan
+    # membuat entri ini dianggap basi
+    versi = get_versi()
+    today = date.today()
+    kriteria = query.get_kriteria()
+
+    hasil = seleksi_fuzzy_lingkup(
+        kriteria, query.operator, query.databases, query.include_arsip, query.alpha, query.limit
+    )
+
+    kunci_membership = [f"{variabel}_{kategori}" for variabel, kategori in kriteria]
+    baris_list = [
+        [
+            item.get('db_alias'),
+            item['kelompok'].is_arsip,
+            item['kelompok'].pk,
+            [item['membership_values'][kunci]['membership'] for kunci in kunci_membership],
+            item['fire_strength'],
+        ]
+        for item in hasil
+    ]
+
+    entri, _ = QueryTermaterialisasi.objects.update_or_create(
+        kunci=query.kunci,
+        defaults={
+            'kriteria': query.kriteria,
+            'operator': query.operator,
+            'alpha': query.alpha,
+            'limit': query.limit,
+            'databases': query.databases,
+            'include_arsip': query.include_arsip,
+            'hasil': baris_list,
+            'total': hasil.total,
+            'statistik_db': hasil.statistik_db,
+            'versi': _versi_materialisasi(versi),
+            'tanggal': today,
+        },
+    )
+    return entri
+
+
+def refresh_materialisasi():
+    """
+    Menghitung ulang hasil tersimpan yang sudah basi
+
+    Returns:
+        int: Jumlah query yang dihitung ulang
+    """
+    from .models import QueryTermaterialisasi
+
+    versi = get_versi()
+    today = date.today()
+
+    basi = [
+        entri for entri in QueryTermaterialisasi.objects.filter(databases=[]).defer('hasil')
+        if not _masih_berlaku(entri, versi, today)
+    ]
+    for entri in basi:
+        simpan_materialisasi(entri)
+    return len(basi)
+
+
+def get_query_populer(top=20, hari=7, urut='biaya', database_utama=False):
+    """
+    Query dengan biaya atau frekuensi terbesar
+
+    Biaya = jumlah eksekusi x latensi terbesar (perkiraan waktu hitung
+    jika query tidak disimpan).
+
+    Args:
+        top (int): Jumlah query
+        hari (int): Hanya query yang dijalankan dalam N hari terakhir
+        urut (str): 'biaya' atau 'frekuensi'
+        database_utama (bool): Hanya query tanpa pilihan databases
+
+    Returns:
+        list: Object LogQuery dengan atribut tambahan `skor`
+    """
+    from .models import LogQuery
+
+    if urut not in URUTAN_POPULER:
+        raise ValueError(f"Urutan '{urut}' tidak valid")
+
+    if urut == 'biaya':
+        skor = ExpressionWrapper(F('jumlah') * F('durasi_maks_ms'), output_field=FloatField())
+    else:
+        skor = F('jumlah')
+
+    batas = timezone.now() - timedelta(days=hari)
+    queryset = LogQuery.objects.filter(terakhir_dijalankan__gte=batas)
+    if database_utama:
+        queryset = queryset.filter(databases=[])
+    return list(queryset.annotate(skor=skor).order_by('-skor', '-terakhir_dijalankan')[:top])
+
+
+def materialisasi_query_populer(top=20, hari=7, urut='biaya'):
+    """
+    Menyimpan hasil query populer dan membuang query yang tidak populer lagi
+
+    Query dengan pilihan databases tidak dimaterialisasi: versi data
+    database lain tidak dilacak, sehingga hasilnya tidak pernah basi.
+
+    Args:
+        top (int): Jumlah query yang dimaterialisasi
+        hari (int): Hanya query yang dijalankan dalam N hari terakhir
+        urut (str): 'biaya' atau 'frekuensi'
+
+    Returns:
+        tuple: (list LogQuery populer, jumlah dihitung, jumlah dibuang)
+    """
+    from .models import QueryTermaterialisasi
+
+    tulis_log_query()
+    populer = get_query_populer(top, hari, urut, database_utama=True)
+
+    dibuang, _ = QueryTermaterialisasi.objects.exclude(
+        kunci__in=[query.kunci for query in populer]
+    ).delete()
+
+    versi = get_versi()
+    today = date.today()
+    tersimpan = {entri.kunci: entri for entri in QueryTermaterialisasi.objects.defer('hasil')}
+
+    dihitung = 0
+    for query in populer:
+        entri = tersimpan.get(query.kunci)
+        if entri is None or not _masih_berlaku(entri, versi, today):
+            simpan_materialisasi(query)
+            dihitung += 1
+
+    return populer, dihitung, dibuang
+
+
+# =============================================================================
+# LOOKUP
+# =============================================================================
+
+def cari_materialisasi(kriteria, operator='AND', databases=None, include_arsip=False, alpha=0.0, limit=None):
+    """
+    Mengambil hasil seleksi dari query yang dimaterialisasi
+
+    Args:
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        databases (list): Alias database yang dipilih
+        include_arsip (bool): Ikut mencari di arsip kelompok
+        alpha (float): Batas minimum fire strength
+        limit (int): Jumlah maksimum hasil
+
+    Returns:
+        HasilSeleksi: Hasil dengan format seleksi_fuzzy(), atau None jika
+                      query tidak dimaterialisasi atau hasilnya basi
+    """
+    from .models import Kelompok, KelompokArsip, QueryTermaterialisasi
+    from .utils import HasilSeleksi, buat_item_hasil
+
+    if databases:
+        # Tidak dimaterialisasi (lihat materialisasi_query_populer)
+        return None
+
+    definisi = _definisi_query(kriteria, operator, databases, include_arsip, alpha, limit)
+    entri = QueryTermaterialisasi.objects.filter(kunci=definisi['kunci']).first()
+    if entri is None:
+        return None
+    if not _masih_berlaku(entri, get_versi(), date.today()):
+        jadwalkan_refresh()
+        return None
+
+    # Ambil object kelompok per (database, tabel)
+    ids_per_sumber = defaultdict(list)
+    for db_alias, arsip, pk, _, _ in entri.hasil:
+        ids_per_sumber[(db_alias, arsip)].append(pk)
+
+    kelompok_map = {}
+    for (db_alias, arsip), ids in ids_per_sumber.items():
+        model = KelompokArsip if arsip else Kelompok
+        manager = model.objects.using(db_alias) if db_alias else model.objects
+        for pk, kelompok in manager.in_bulk(ids).items():
+            kelompok_map[(db_alias, arsip, pk)] = kelompok
+
+    kriteria_tersimpan = entri.get_kriteria()
+    hasil = []
+    for db_alias, arsip, pk, membership_list, fire_strength in entri.hasil:
+        kelompok = kelompok_map.get((db_alias, arsip, pk))
+        if kelompok is None:
+            continue
+        membership_map = dict(zip(kriteria_tersimpan, membership_list))
+        item = buat_item_hasil(
+            kelompok, kelompok.get_data_dict(), kriteria,
+            [membership_map[tuple(k)] for k in kriteria], fire_strength
+        )
+        if db_alias is not None:
+            item['db_alias'] = db_alias
+        hasil.append(item)
+
+    return HasilSeleksi(hasil, entri.total, entri.statistik_db)
@@ -0,0 +1,111 @@
+"""
+Middleware untuk SPK Fuzzy Database Model Tahani
+"""
+
+import time
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+
+from .admisi import SeleksiPenuh
+from .routers import baca_dari_replica, get_replica_databases
+
+
+# Session key: sampai kapan request user ini harus membaca dari primary
+SESSION_KEY_PRIMARY = 'fuzzy_baca_primary_sampai'
+
+# View read-only yang boleh membaca dari replica (selain api_*)
+VIEW_BACA = {
+    'dashboard',
+    'kelompok_list',
+    'seleksi_and',
+    'seleksi_or',
+    'seleksi_multi',
+}
+
+# View yang menulis data; setelah POST ke view ini user membaca dari primary
+VIEW_TULIS = {
+    'kelompok_add',
+    'kelompok_edit',
+    'kelompok_delete',
+    'parameter_edit',
+    'parameter_reset',
+    'parameter_initialize',
+}
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Menandai request yang boleh membaca dari database replica
+
+    Halaman seleksi, dashboard dan endpoint api_* membaca dari replica.
+    Setelah user menyimpan perubahan (misal kelompok_edit atau
+    parameter_edit), request berikutnya dari session yang sama membaca
+    dari primary selama FUZZY_REPLICA_STICKY_SECONDS detik
+    (read-your-writes).
+
+    Harus dipasang setelah SessionMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        token = getattr(request, '_fuzzy_replica_token', None)
+        if token is not None:
+            baca_dari_replica.reset(token)
+
+        match = request.resolver_match
+        if (get_replica_databases() and match and request.method == 'POST'
+                and match.url_name in VIEW_TULIS):
+            durasi = getattr(settings, 'FUZZY_REPLICA_STICKY_SECONDS', 30)
+            request.session[SESSION_KEY_PRIMARY] = time.time() + durasi
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not get_replica_databases():
+            return None
+
+        url_name = request.resolver_match.url_name or ''
+        if url_name not in VIEW_BACA and not url_name.startswith('api_'):
+            return None
+
+        if request.session.get(SESSION_KEY_PRIMARY, 0) > time.time():
+            return None
+
+        request._fuzzy_replica_token = baca_dari_replica.set(True)
+        return None
+
+
+class AdmisiSeleksiMiddleware:
+    """
+    Mengubah SeleksiPenuh (lihat fuzzy/admisi.py) menjadi response 429
+
+    Header Retry-After berisi perkiraan detik sampai slot seleksi kosong.
+    Endpoint api_* mendapat body JSON, halaman lain teks biasa.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, SeleksiPenuh):
+            return None
+
+        pesan = 'Server sedang sibuk menjalankan seleksi lain, silakan coba lagi.'
+        match = request.resolver_match
+        if match and (match.url_name or '').startswith('api_'):
+            response = JsonResponse(
+                {'error': pesan, 'alasan': exception.alasan, 'retry_after': exception.retry_after},
+                status=429
+            )
+        else:
+            response = HttpResponse(pesan, status=429, content_type='text/plain; charset=utf-8')
+        response['Retry-After'] = str(exception.retry_after)
+        return response
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fuzzy', '0002_fuzzyparameter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KelompokArsip',
+            fields=[
+                ('nama', models.CharField(help_text='Masukkan nama kelompok', max_length=200, verbose_name='Nama Kelompok')),
+                ('tanggal_berdiri', models.DateField(help_text='Tanggal kelompok didirikan', verbose_name='Tanggal Berdiri')),
+                ('jumlah_anggota', models.IntegerField(help_text='Jumlah anggota dalam kelompok', verbose_name='Jumlah Anggota')),
+                ('luas_lahan', models.FloatField(help_text='Luas lahan yang dimiliki dalam hektar', verbose_name='Luas Lahan (Ha)')),
+                ('frekuensi_bantuan', models.IntegerField(help_text='Jumlah bantuan yang pernah diterima', verbose_name='Frekuensi Bantuan')),
+                ('sdm', models.IntegerField(help_text='Skor kualitas SDM (1-10)', verbose_name='Kualitas SDM')),
+                ('unit_usaha', models.IntegerField(help_text='Skor unit usaha (1-10)', verbose_name='Unit Usaha')),
+                ('kas', models.IntegerField(help_text='Skor kas kelompok (1-10)', verbose_name='Kas')),
+                ('aktif', models.BooleanField(default=True, help_text='Kosongkan jika kelompok sudah bubar', verbose_name='Masih Aktif')),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False, verbose_name='ID Kelompok')),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('diarsipkan_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Arsip Kelompok',
+                'verbose_name_plural': 'Arsip Kelompok',
+                'ordering': ['nama'],
+            },
+        ),
+        migrations.AddField(
+            model_name='kelompok',
+            name='aktif',
+            field=models.BooleanField(default=True, help_text='Kosongkan jika kelompok sudah bubar', verbose_name='Masih Aktif'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fuzzy', '0003_kelompok_arsip'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VersiData',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nama', models.CharField(max_length=100, unique=True)),
+                ('nilai', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Versi Data',
+                'verbose_name_plural': 'Versi Data',
+            },
+        ),
+    ]
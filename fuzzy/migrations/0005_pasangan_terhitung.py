@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fuzzy', '0004_versi_data'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PasanganTerhitung',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('variabel_1', models.CharField(max_length=50)),
+                ('kategori_1', models.CharField(max_length=50)),
+                ('variabel_2', models.CharField(max_length=50)),
+                ('kategori_2', models.CharField(max_length=50)),
+                ('operator', models.CharField(max_length=3)),
+                ('hasil', models.JSONField(default=list)),
+                ('total', models.IntegerField(default=0)),
+                ('versi', models.JSONField(default=dict)),
+                ('tanggal', models.DateField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Pasangan Terhitung',
+                'verbose_name_plural': 'Pasangan Terhitung',
+                'unique_together': {('variabel_1', 'kategori_1', 'variabel_2', 'kategori_2', 'operator')},
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:45
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fuzzy', '0005_pasangan_terhitung'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LogQuery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kunci', models.CharField(max_length=40, unique=True)),
+                ('kriteria', models.JSONField(default=list)),
+                ('operator', models.CharField(max_length=3)),
+                ('alpha', models.FloatField(default=0)),
+                ('limit', models.IntegerField(blank=True, null=True)),
+                ('databases', models.JSONField(blank=True, default=list)),
+                ('include_arsip', models.BooleanField(default=False)),
+                ('jumlah', models.IntegerField(default=0)),
+                ('total_durasi_ms', models.FloatField(default=0)),
+                ('durasi_maks_ms', models.FloatField(default=0)),
+                ('terakhir_dijalankan', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Log Query',
+                'verbose_name_plural': 'Log Query',
+                'ordering': ['-terakhir_dijalankan'],
+            },
+        ),
+        migrations.CreateModel(
+            name='QueryTermaterialisasi',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kunci', models.CharField(max_length=40, unique=True)),
+                ('kriteria', models.JSONField(default=list)),
+                ('operator', models.CharField(max_length=3)),
+                ('alpha', models.FloatField(default=0)),
+                ('limit', models.IntegerField(blank=True, null=True)),
+                ('databases', models.JSONField(blank=True, default=list)),
+                ('include_arsip', models.BooleanField(default=False)),
+                ('hasil', models.JSONField(default=list)),
+                ('total', models.IntegerField(default=0)),
+                ('statistik_db', models.JSONField(blank=True, default=list)),
+                ('versi', models.JSONField(default=dict)),
+                ('tanggal', models.DateField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Query Termaterialisasi',
+                'verbose_name_plural': 'Query Termaterialisasi',
+            },
+        ),
+    ]
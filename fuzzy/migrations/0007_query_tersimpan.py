@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fuzzy', '0006_query_populer'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QueryTersimpan',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nama', models.CharField(max_length=200, verbose_name='Nama Query')),
+                ('kriteria', models.JSONField(default=list)),
+                ('operator', models.CharField(choices=[('AND', 'AND (Minimum)'), ('OR', 'OR (Maximum)')], default='AND', max_length=3)),
+                ('alpha', models.FloatField(default=0)),
+                ('versi', models.JSONField(blank=True, default=dict)),
+                ('tanggal', models.DateField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Query Tersimpan',
+                'verbose_name_plural': 'Query Tersimpan',
+                'ordering': ['nama'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PeringkatTersimpan',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fire_strength', models.FloatField()),
+                ('membership', models.JSONField(default=list)),
+                ('kelompok', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='fuzzy.kelompok')),
+                ('query', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='peringkat', to='fuzzy.querytersimpan')),
+            ],
+            options={
+                'verbose_name': 'Peringkat Tersimpan',
+                'verbose_name_plural': 'Peringkat Tersimpan',
+                'indexes': [models.Index(fields=['query', '-fire_strength'], name='peringkat_query_fs_idx')],
+                'unique_together': {('query', 'kelompok')},
+            },
+        ),
+    ]
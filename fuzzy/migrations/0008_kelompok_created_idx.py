@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fuzzy', '0007_query_tersimpan'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='kelompok',
+            index=models.Index(fields=['-created_at'], name='kelompok_created_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fuzzy', '0008_kelompok_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='kelompok',
+            index=models.Index(fields=['nama', 'id'], name='kelompok_nama_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kelompok',
+            index=models.Index(fields=['tanggal_berdiri', 'id'], name='kelompok_tanggal_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kelompok',
+            index=models.Index(fields=['jumlah_anggota', 'id'], name='kelompok_anggota_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kelompok',
+            index=models.Index(fields=['luas_lahan', 'id'], name='kelompok_lahan_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kelompok',
+            index=models.Index(fields=['frekuensi_bantuan', 'id'], name='kelompok_frekuensi_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kelompok',
+            index=models.Index(fields=['sdm', 'id'], name='kelompok_sdm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kelompok',
+            index=models.Index(fields=['unit_usaha', 'id'], name='kelompok_unit_usaha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kelompok',
+            index=models.Index(fields=['kas', 'id'], name='kelompok_kas_idx'),
+        ),
+    ]
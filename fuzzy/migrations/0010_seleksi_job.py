@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fuzzy', '0009_kelompok_keyset_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeleksiJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kriteria', models.JSONField(default=list)),
+                ('operator', models.CharField(max_length=3)),
+                ('alpha', models.FloatField(default=0)),
+                ('limit', models.IntegerField(blank=True, null=True)),
+                ('databases', models.JSONField(blank=True, default=list)),
+                ('include_arsip', models.BooleanField(default=False)),
+                ('kunci', models.CharField(db_index=True, max_length=40)),
+                ('status', models.CharField(choices=[('antri', 'Antri'), ('berjalan', 'Berjalan'), ('selesai', 'Selesai'), ('gagal', 'Gagal')], db_index=True, default='antri', max_length=10)),
+                ('jumlah_baris', models.IntegerField(default=0)),
+                ('diproses', models.IntegerField(default=0)),
+                ('total', models.IntegerField(default=0)),
+                ('statistik_db', models.JSONField(blank=True, default=list)),
+                ('versi', models.JSONField(blank=True, default=dict)),
+                ('tanggal', models.DateField(blank=True, null=True)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('mulai_at', models.DateTimeField(blank=True, null=True)),
+                ('selesai_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Seleksi Job',
+                'verbose_name_plural': 'Seleksi Job',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='HasilSeleksiJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('peringkat', models.IntegerField()),
+                ('kelompok_id', models.BigIntegerField()),
+                ('nama', models.CharField(max_length=200)),
+                ('db_alias', models.CharField(blank=True, max_length=100, null=True)),
+                ('arsip', models.BooleanField(default=False)),
+                ('membership', models.JSONField(default=list)),
+                ('fire_strength', models.FloatField()),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hasil', to='fuzzy.seleksijob')),
+            ],
+            options={
+                'verbose_name': 'Hasil Seleksi Job',
+                'verbose_name_plural': 'Hasil Seleksi Job',
+                'unique_together': {('job', 'peringkat')},
+            },
+        ),
+    ]
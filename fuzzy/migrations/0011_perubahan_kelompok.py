@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fuzzy', '0010_seleksi_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PerubahanKelompok',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('urutan', models.BigIntegerField(unique=True)),
+                ('jenis', models.CharField(choices=[('simpan', 'Simpan'), ('hapus', 'Hapus'), ('resync', 'Resync')], max_length=10)),
+                ('kelompok_id', models.BigIntegerField(blank=True, db_index=True, null=True)),
+                ('updated_at', models.DateTimeField()),
+                ('alasan', models.CharField(blank=True, max_length=50)),
+            ],
+            options={
+                'verbose_name': 'Perubahan Kelompok',
+                'verbose_name_plural': 'Perubahan Kelompok',
+                'ordering': ['urutan'],
+                'indexes': [models.Index(fields=['jenis', 'urutan'], name='perubahan_jenis_urutan_idx')],
+            },
+        ),
+    ]
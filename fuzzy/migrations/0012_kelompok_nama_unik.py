@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:23
+
+import logging
+
+from django.db import migrations, models
+from django.db.models import Count
+
+logger = logging.getLogger(__name__)
+
+
+def _nama_bebas(Kelompok, db_alias, nama, pk):
+    """Nama dengan akhiran ' #<id>' (atau ' #<id>-<n>') yang belum dipakai"""
+    akhiran = f' #{pk}'
+    n = 1
+    while True:
+        baru = nama[:200 - len(akhiran)] + akhiran
+        if not Kelompok.objects.using(db_alias).filter(nama=baru).exists():
+            return baru
+        n += 1
+        akhiran = f' #{pk}-{n}'
+
+
+def bedakan_nama_ganda(apps, schema_editor):
+    """
+    Nama ganda diberi akhiran id agar constraint unik dapat dibuat
+
+    Setiap penggantian nama dicatat (logger warning) agar dapat
+    dicocokkan dengan data asal.
+    """
+    Kelompok = apps.get_model('fuzzy', 'Kelompok')
+    db_alias = schema_editor.connection.alias
+
+    ganda = (
+        Kelompok.objects.using(db_alias)
+        .values('nama')
+        .annotate(jumlah=Count('id'))
+        .filter(jumlah__gt=1)
+        .values_list('nama', flat=True)
+    )
+    for nama in list(ganda):
+        # Kelompok pertama (id terkecil) mempertahankan namanya
+        for kelompok in Kelompok.objects.using(db_alias).filter(nama=nama).order_by('id')[1:]:
+            kelompok.nama = _nama_bebas(Kelompok, db_alias, nama, kelompok.pk)
+            kelompok.save(update_fields=['nama'])
+            logger.warning('Kelompok id=%s: nama ganda %r diganti menjadi %r', kelompok.pk, nama, kelompok.nama)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fuzzy', '0011_perubahan_kelompok'),
+    ]
+
+    operations = [
+        migrations.RunPython(bedakan_nama_ganda, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='kelompok',
+            name='nama',
+            field=models.CharField(error_messages={'unique': 'Kelompok dengan nama ini sudah ada.'}, help_text='Masukkan nama kelompok', max_length=200, unique=True, verbose_name='Nama Kelompok'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fuzzy', '0012_kelompok_nama_unik'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pasanganterhitung',
+            name='urutan_perubahan',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -14,12 +14,116 @@ from django.utils import timezone
 from datetime import date
 
 
-class Kelompok(models.Model):
+def hitung_usia(tanggal_berdiri, today=None):
     """
-    Model Kelompok
+    Menghitung usia (dalam tahun) dari tanggal berdiri
     
-    Menyimpan data kelompok/organisasi yang akan dievaluasi
-    untuk mendapatkan bantuan sosial.
+    Dipakai oleh properti Kelompok.usia dan oleh proses seleksi
+    yang membaca baris mentah (values_list) tanpa membuat object.
+    
+    Args:
+        tanggal_berdiri (date): Tanggal berdirinya kelompok
+        today (date): Tanggal acuan (default: hari ini)
+    
+    Returns:
+        int: Usia kelompok dalam tahun
+    """
+    if today is None:
+        today = date.today()
+    delta = today - tanggal_berdiri
+    # Konversi ke tahun (365.25 untuk memperhitungkan tahun kabisat)
+    return int(delta.days / 365.25)
+
+
+class VersiQuerySet(models.QuerySet):
+    """
+    QuerySet yang menaikkan versi data untuk operasi massal
+    
+    update(), bulk_create(), bulk_update() tidak mengirim signal
+    post_save, sehingga versi data (lihat fuzzy/cache.py) dinaikkan
+    di sini. delete() mengirim post_delete per baris; versi cukup
+    dinaikkan sekali untuk seluruh operasi.
+    
+    update() juga mengisi field updated_at (auto_now), agar ETag per
+    baris (lihat api_fuzzifikasi) ikut berubah pada update massal.
+    
+    Baris yang berubah tidak diketahui, sehingga update() dan
+    bulk_create() dicatat sebagai resync di change feed (fuzzy/perubahan.py).
+    """
+    
+    def update(self, **kwargs):
+        from .cache import naikkan_versi_model, variabel_dari_field
+        from .perubahan import catat_massal
+        field_names = {field.name: field for field in self.model._meta.concrete_fields}
+        updated_at = field_names.get('updated_at')
+        if updated_at is not None and updated_at.auto_now and 'updated_at' not in kwargs:
+            kwargs['updated_at'] = timezone.now()
+        jumlah = super().update(**kwargs)
+        if jumlah:
+            naikkan_versi_model(self.model, variabel_dari_field(self.model, kwargs), massal=True)
+            catat_massal(self.model, self.db)
+        return jumlah
+    
+    def bulk_create(self, objs, *args, **kwargs):
+        from .cache import naikkan_versi_model
+        from .perubahan import catat_massal
+        hasil = super().bulk_create(objs, *args, **kwargs)
+        if hasil:
+            naikkan_versi_model(self.model, massal=True)
+            catat_massal(self.model, self.db)
+        return hasil
+    
+    def bulk_update(self, objs, *args, **kwargs):
+        from .cache import tunda_naik_versi
+        # bulk_update memanggil update() per batch; versi cukup naik sekali
+        with tunda_naik_versi():
+            return super().bulk_update(objs, *args, **kwargs)
+    
+    def delete(self):
+        from .cache import tunda_naik_versi
+        with tunda_naik_versi():
+            return super().delete()
+
+
+class LacakPerubahanMixin:
+    """
+    Menyimpan nilai field saat object dibaca dari database
+    
+    Dipakai signal handler untuk mengetahui variabel fuzzy mana yang
+    berubah ketika object disimpan, sehingga hanya pasangan terhitung
+    yang memakai variabel tersebut yang dihitung ulang.
+    """
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._nilai_awal = dict(zip(field_names, values))
+        return instance
+    
+    def field_berubah(self):
+        """
+        Field yang nilainya berbeda dari saat dibaca dari database
+        
+        Returns:
+            set: Nama field (attname), atau None jika object tidak
+                 dibaca dari database (object baru)
+        """
+        nilai_awal = getattr(self, '_nilai_awal', None)
+        if nilai_awal is None:
+            return None
+        return {nama for nama, nilai in nilai_awal.items() if getattr(self, nama) != nilai}
+    
+    def simpan_nilai_awal(self):
+        """Tandai nilai field saat ini sebagai nilai tersimpan"""
+        self._nilai_awal = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+        }
+
+
+class KelompokBase(LacakPerubahanMixin, models.Model):
+    """
+    Field dan perilaku bersama Kelompok dan KelompokArsip
     
     Attributes:
         nama (str): Nama kelompok
@@ -30,8 +134,14 @@ class Kelompok(models.Model):
         sdm (int): Skor kualitas SDM (1-10)
         unit_usaha (int): Skor unit usaha (1-10)
         kas (int): Skor kas kelompok (1-10)
+        aktif (bool): False jika kelompok sudah bubar
     """
     
+    # True untuk data yang sudah dipindahkan ke tabel arsip
+    is_arsip = False
+    
+    objects = VersiQuerySet.as_manager()
+    
     nama = models.CharField(
         max_length=200, 
         verbose_name="Nama Kelompok",
@@ -73,14 +183,14 @@ class Kelompok(models.Model):
         help_text="Skor kas kelompok (1-10)"
     )
     
-    # Metadata
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    aktif = models.BooleanField(
+        default=True,
+        verbose_name="Masih Aktif",
+        help_text="Kosongkan jika kelompok sudah bubar"
+    )
     
     class Meta:
-        verbose_name = "Kelompok"
-        verbose_name_plural = "Kelompok"
-        ordering = ['nama']
+        abstract = True
     
     def __str__(self):
         return self.nama
@@ -95,10 +205,7 @@ class Kelompok(models.Model):
         Returns:
             int: Usia kelompok dalam tahun
         """
-        today = date.today()
-        delta = today - self.tanggal_berdiri
-        # Konversi ke tahun (365.25 untuk memperhitungkan tahun kabisat)
-        return int(delta.days / 365.25)
+        return hitung_usia(self.tanggal_berdiri)
     
     @property
     def usia_bulan(self):
@@ -134,7 +241,102 @@ class Kelompok(models.Model):
         }
 
 
-class FuzzyParameter(models.Model):
+class Kelompok(KelompokBase):
+    """
+    Model Kelompok
+    
+    Menyimpan data kelompok/organisasi yang akan dievaluasi
+    untuk mendapatkan bantuan sosial. Tabel ini hanya berisi data
+    "hot"; kelompok yang tidak aktif dipindahkan ke KelompokArsip
+    oleh command archive_kelompok.
+    """
+    
+    # Nama unik agar import dapat memperbarui kelompok berdasarkan nama
+    # (lihat fuzzy/impor.py); arsip boleh berisi nama yang sama
+    nama = models.CharField(
+        max_length=200,
+        unique=True,
+        verbose_name="Nama Kelompok",
+        help_text="Masukkan nama kelompok",
+        error_messages={'unique': 'Kelompok dengan nama ini sudah ada.'}
+    )
+    
+    # Metadata
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "Kelompok"
+        verbose_name_plural = "Kelompok"
+        ordering = ['nama']
+        indexes = [
+            # Daftar "kelompok terbaru" di dashboard
+            models.Index(fields=['-created_at'], name='kelompok_created_idx'),
+            # Keyset pagination daftar kelompok (lihat fuzzy/paginasi.py):
+            # satu index (kolom urutan, id) per urutan yang bisa dipilih
+            models.Index(fields=['nama', 'id'], name='kelompok_nama_idx'),
+            models.Index(fields=['tanggal_berdiri', 'id'], name='kelompok_tanggal_idx'),
+            models.Index(fields=['jumlah_anggota', 'id'], name='kelompok_anggota_idx'),
+            models.Index(fields=['luas_lahan', 'id'], name='kelompok_lahan_idx'),
+            models.Index(fields=['frekuensi_bantuan', 'id'], name='kelompok_frekuensi_idx'),
+            models.Index(fields=['sdm', 'id'], name='kelompok_sdm_idx'),
+            models.Index(fields=['unit_usaha', 'id'], name='kelompok_unit_usaha_idx'),
+            models.Index(fields=['kas', 'id'], name='kelompok_kas_idx'),
+        ]
+
+
+class KelompokArsip(KelompokBase):
+    """
+    Arsip kelompok yang sudah tidak aktif
+    
+    Berisi kelompok yang sudah bubar atau lama tidak diperbarui.
+    Primary key sama dengan id Kelompok asalnya, dan timestamp asli
+    tetap disimpan. Seleksi hanya mencari di tabel ini jika user
+    memilih "sertakan arsip".
+    """
+    
+    is_arsip = True
+    
+    id = models.BigIntegerField(primary_key=True, verbose_name="ID Kelompok")
+    
+    # Metadata (disalin dari Kelompok asal)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    diarsipkan_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        verbose_name = "Arsip Kelompok"
+        verbose_name_plural = "Arsip Kelompok"
+        ordering = ['nama']
+    
+    @classmethod
+    def dari_kelompok(cls, kelompok):
+        """
+        Membuat object arsip dari object Kelompok
+        
+        Args:
+            kelompok (Kelompok): Kelompok yang akan diarsipkan
+        
+        Returns:
+            KelompokArsip: Object arsip (belum disimpan)
+        """
+        return cls(
+            id=kelompok.id,
+            nama=kelompok.nama,
+            tanggal_berdiri=kelompok.tanggal_berdiri,
+            jumlah_anggota=kelompok.jumlah_anggota,
+            luas_lahan=kelompok.luas_lahan,
+            frekuensi_bantuan=kelompok.frekuensi_bantuan,
+            sdm=kelompok.sdm,
+            unit_usaha=kelompok.unit_usaha,
+            kas=kelompok.kas,
+            aktif=kelompok.aktif,
+            created_at=kelompok.created_at,
+            updated_at=kelompok.updated_at,
+        )
+
+
+class FuzzyParameter(LacakPerubahanMixin, models.Model):
     """
     Model untuk menyimpan parameter-parameter membership function
     
@@ -212,6 +414,8 @@ class FuzzyParameter(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = VersiQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "Parameter Fuzzy"
         verbose_name_plural = "Parameter Fuzzy"
@@ -235,3 +439,396 @@ class FuzzyParameter(models.Model):
         if self.param_c is not None:
             params['c'] = self.param_c
         return params
+
+
+class VersiData(models.Model):
+    """
+    Nomor versi data untuk invalidasi cache
+    
+    Setiap perubahan Kelompok atau FuzzyParameter menaikkan nilai
+    versi terkait (lihat fuzzy/signals.py). Versi disimpan di database
+    agar konsisten antar proses/worker.
+    
+    Attributes:
+        nama (str): Nama versi, misalnya 'kelompok' atau 'parameter'
+        nilai (int): Nomor versi saat ini
+    """
+    
+    nama = models.CharField(max_length=100, unique=True)
+    nilai = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "Versi Data"
+        verbose_name_plural = "Versi Data"
+    
+    def __str__(self):
+        return f"{self.nama} v{self.nilai}"
+
+
+class PasanganTerhitung(models.Model):
+    """
+    Hasil seleksi yang sudah dihitung untuk satu pasangan kriteria
+    
+    Halaman seleksi AND/OR selalu memakai tepat 2 kriteria, sehingga
+    hanya ada 351 pasangan x 2 operator. Hasil setiap pasangan dihitung
+    di background (lihat fuzzy/pasangan.py) dan halaman seleksi cukup
+    membaca ranking yang tersimpan.
+    
+    Pasangan disimpan dalam urutan kanonik ((variabel_1, kategori_1) <
+    (variabel_2, kategori_2)).
+    
+    Attributes:
+        operator (str): 'AND' atau 'OR'
+        hasil (list): [[id_kelompok, mu_1, mu_2], ...] urut fire strength
+        total (int): Jumlah kelompok dengan fire strength > 0
+        versi (dict): Versi data per variabel saat hasil dihitung
+        tanggal (date): Tanggal acuan perhitungan usia
+        urutan_perubahan (int): Nomor urut change feed (PerubahanKelompok)
+            saat hasil dihitung, untuk pembaruan inkremental
+    """
+    
+    variabel_1 = models.CharField(max_length=50)
+    kategori_1 = models.CharField(max_length=50)
+    variabel_2 = models.CharField(max_length=50)
+    kategori_2 = models.CharField(max_length=50)
+    operator = models.CharField(max_length=3)
+    
+    hasil = models.JSONField(default=list)
+    total = models.IntegerField(default=0)
+    versi = models.JSONField(default=dict)
+    tanggal = models.DateField()
+    urutan_perubahan = models.BigIntegerField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "Pasangan Terhitung"
+        verbose_name_plural = "Pasangan Terhitung"
+        unique_together = ['variabel_1', 'kategori_1', 'variabel_2', 'kategori_2', 'operator']
+    
+    def __str__(self):
+        return (
+            f"{self.variabel_1}={self.kategori_1} {self.operator} "
+            f"{self.variabel_2}={self.kategori_2}"
+        )
+    
+    @property
+    def kriteria(self):
+        """Pasangan kriteria dalam format [(variabel, kategori), ...]"""
+        return [(self.variabel_1, self.kategori_1), (self.variabel_2, self.kategori_2)]
+
+
+class QuerySeleksiBase(models.Model):
+    """
+    Bentuk kanonik sebuah query seleksi
+    
+    Dipakai bersama oleh LogQuery dan QueryTermaterialisasi. `kunci`
+    adalah hash kanonik query (lihat fuzzy/cache.py kunci_query), sama
+    untuk kriteria yang sama walaupun urutannya berbeda.
+    
+    Attributes:
+        kunci (str): Hash kanonik query
+        kriteria (list): [[variabel, kategori], ...] terurut
+        operator (str): 'AND' atau 'OR'
+        alpha (float): Batas minimum fire strength
+        limit (int): Jumlah maksimum hasil (kosong = semua)
+        databases (list): Alias database (kosong = database default)
+        include_arsip (bool): Ikut mencari di arsip kelompok
+    """
+    
+    kunci = models.CharField(max_length=40, unique=True)
+    kriteria = models.JSONField(default=list)
+    operator = models.CharField(max_length=3)
+    alpha = models.FloatField(default=0)
+    limit = models.IntegerField(null=True, blank=True)
+    databases = models.JSONField(default=list, blank=True)
+    include_arsip = models.BooleanField(default=False)
+    
+    class Meta:
+        abstract = True
+    
+    def __str__(self):
+        kriteria = f" {self.operator} ".join(f"{var}={kat}" for var, kat in self.kriteria)
+        return kriteria or self.kunci
+    
+    def get_kriteria(self):
+        """Kriteria dalam format [(variabel, kategori), ...]"""
+        return [tuple(kriteria) for kriteria in self.kriteria]
+
+
+class LogQuery(QuerySeleksiBase):
+    """
+    Statistik query seleksi yang dijalankan user
+    
+    Dicatat oleh halaman seleksi multi-kriteria dan api_seleksi. Query
+    dengan biaya terbesar (jumlah x latensi) dimaterialisasi oleh
+    command materialize_hot_queries.
+    
+    Attributes:
+        jumlah (int): Berapa kali query dijalankan
+        total_durasi_ms (float): Total latensi seluruh eksekusi
+        durasi_maks_ms (float): Latensi terbesar (perkiraan biaya hitung)
+        terakhir_dijalankan (datetime): Waktu eksekusi terakhir
+    """
+    
+    jumlah = models.IntegerField(default=0)
+    total_durasi_ms = models.FloatField(default=0)
+    durasi_maks_ms = models.FloatField(default=0)
+    terakhir_dijalankan = models.DateTimeField(default=timezone.now, db_index=True)
+    
+    class Meta:
+        verbose_name = "Log Query"
+        verbose_name_plural = "Log Query"
+        ordering = ['-terakhir_dijalankan']
+    
+    @property
+    def rata_rata_ms(self):
+        """Latensi rata-rata per eksekusi"""
+        return self.total_durasi_ms / self.jumlah if self.jumlah else 0
+
+
+class QueryTermaterialisasi(QuerySeleksiBase):
+    """
+    Hasil seleksi yang disimpan untuk query populer
+    
+    Attributes:
+        hasil (list): [[db_alias, arsip, id, [mu...], fire_strength], ...]
+                      dengan mu sesuai urutan `kriteria`
+        total (int): Jumlah hasil sebelum limit
+        statistik_db (list): Statistik per database (seleksi lintas database)
+        versi (dict): Versi data saat hasil dihitung
+        tanggal (date): Tanggal acuan perhitungan usia
+    """
+    
+    hasil = models.JSONField(default=list)
+    total = models.IntegerField(default=0)
+    statistik_db = models.JSONField(default=list, blank=True)
+    versi = models.JSONField(default=dict)
+    tanggal = models.DateField()
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "Query Termaterialisasi"
+        verbose_name_plural = "Query Termaterialisasi"
+
+
+class QueryTersimpan(models.Model):
+    """
+    Query seleksi multi-kriteria yang disimpan user
+    
+    Ranking hasilnya disimpan di PeringkatTersimpan dan dipelihara secara
+    inkremental: saat sebuah Kelompok disimpan, hanya baris tersebut yang
+    dievaluasi ulang (lihat fuzzy/query_tersimpan.py). Ranking dihitung
+    ulang penuh hanya jika parameter fuzzy berubah atau ada operasi massal.
+    
+    Attributes:
+        nama (str): Nama query
+        kriteria (list): [[variabel, kategori], ...]
+        operator (str): 'AND' atau 'OR'
+        alpha (float): Batas minimum fire strength
+        versi (dict): Versi parameter/operasi massal saat ranking dihitung
+        tanggal (date): Tanggal acuan perhitungan usia
+    """
+    
+    OPERATOR_CHOICES = [
+        ('AND', 'AND (Minimum)'),
+        ('OR', 'OR (Maximum)'),
+    ]
+    
+    nama = models.CharField(max_length=200, verbose_name="Nama Query")
+    kriteria = models.JSONField(default=list)
+    operator = models.CharField(max_length=3, choices=OPERATOR_CHOICES, default='AND')
+    alpha = models.FloatField(default=0)
+    
+    versi = models.JSONField(default=dict, blank=True)
+    tanggal = models.DateField(null=True, blank=True)
+    
+    # Metadata
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "Query Tersimpan"
+        verbose_name_plural = "Query Tersimpan"
+        ordering = ['nama']
+    
+    def __str__(self):
+        return self.nama
+    
+    def get_kriteria(self):
+        """Kriteria dalam format [(variabel, kategori), ...]"""
+        return [tuple(kriteria) for kriteria in self.kriteria]
+
+
+class PeringkatTersimpan(models.Model):
+    """
+    Satu baris ranking sebuah QueryTersimpan
+    
+    Attributes:
+        query (QueryTersimpan): Query pemilik ranking
+        kelompok (Kelompok): Kelompok yang memenuhi query
+        fire_strength (float): Fire strength (dibulatkan 4 desimal)
+        membership (list): Nilai keanggotaan sesuai urutan kriteria query
+    """
+    
+    query = models.ForeignKey(QueryTersimpan, on_delete=models.CASCADE, related_name='peringkat')
+    kelompok = models.ForeignKey(Kelompok, on_delete=models.CASCADE, related_name='+')
+    fire_strength = models.FloatField()
+    membership = models.JSONField(default=list)
+    
+    class Meta:
+        verbose_name = "Peringkat Tersimpan"
+        verbose_name_plural = "Peringkat Tersimpan"
+        unique_together = ['query', 'kelompok']
+        indexes = [
+            models.Index(fields=['query', '-fire_strength'], name='peringkat_query_fs_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.query} - {self.kelompok} ({self.fire_strength})"
+
+
+class SeleksiJob(QuerySeleksiBase):
+    """
+    Seleksi besar yang dijalankan di background (api_seleksi dengan async=true)
+    
+    Job dikerjakan oleh thread pool di proses web atau oleh command
+    run_seleksi_jobs (lihat fuzzy/jobs.py). Hasil job yang selesai
+    disimpan di HasilSeleksiJob sehingga dapat diunduh berulang kali
+    (per halaman) tanpa dihitung ulang.
+    
+    Attributes:
+        status (str): antri, berjalan, selesai atau gagal
+        jumlah_baris (int): Jumlah kelompok yang dievaluasi (0 jika tidak
+                            diketahui, yaitu seleksi lintas database/arsip)
+        diproses (int): Jumlah kelompok yang sudah dievaluasi
+        total (int): Jumlah hasil sebelum limit
+        statistik_db (list): Statistik per database (seleksi lintas database)
+        versi (dict): Versi data saat job mulai dihitung
+        tanggal (date): Tanggal acuan perhitungan usia
+        error (str): Pesan error jika job gagal
+    """
+    
+    STATUS_ANTRI = 'antri'
+    STATUS_BERJALAN = 'berjalan'
+    STATUS_SELESAI = 'selesai'
+    STATUS_GAGAL = 'gagal'
+    STATUS_CHOICES = [
+        (STATUS_ANTRI, 'Antri'),
+        (STATUS_BERJALAN, 'Berjalan'),
+        (STATUS_SELESAI, 'Selesai'),
+        (STATUS_GAGAL, 'Gagal'),
+    ]
+    
+    # Query yang sama boleh punya beberapa job (data bisa berubah di antaranya)
+    kunci = models.CharField(max_length=40, db_index=True)
+    
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_ANTRI, db_index=True)
+    jumlah_baris = models.IntegerField(default=0)
+    diproses = models.IntegerField(default=0)
+    total = models.IntegerField(default=0)
+    statistik_db = models.JSONField(default=list, blank=True)
+    versi = models.JSONField(default=dict, blank=True)
+    tanggal = models.DateField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    mulai_at = models.DateTimeField(null=True, blank=True)
+    selesai_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        verbose_name = "Seleksi Job"
+        verbose_name_plural = "Seleksi Job"
+        ordering = ['-created_at']
+    
+    @property
+    def progres(self):
+        """Progres evaluasi (0-1)"""
+        if self.status == self.STATUS_SELESAI:
+            return 1.0
+        if not self.jumlah_baris:
+            return 0.0
+        return min(self.diproses / self.jumlah_baris, 1.0)
+
+
+class HasilSeleksiJob(models.Model):
+    """
+    Satu baris hasil SeleksiJob, urut berdasarkan peringkat (1, 2, ...)
+    
+    Nama dan id kelompok disalin saat job selesai sehingga hasil tetap
+    utuh walaupun kelompok diubah/dihapus atau berasal dari database lain.
+    
+    Attributes:
+        job (SeleksiJob): Job pemilik hasil
+        peringkat (int): Peringkat (mulai dari 1)
+        kelompok_id (int): Id kelompok di database/tabel asalnya
+        nama (str): Nama kelompok
+        db_alias (str): Database asal (seleksi lintas database)
+        arsip (bool): Kelompok berasal dari arsip
+        membership (list): Nilai keanggotaan sesuai urutan kriteria job
+        fire_strength (float): Fire strength (dibulatkan 4 desimal)
+    """
+    
+    job = models.ForeignKey(SeleksiJob, on_delete=models.CASCADE, related_name='hasil')
+    peringkat = models.IntegerField()
+    kelompok_id = models.BigIntegerField()
+    nama = models.CharField(max_length=200)
+    db_alias = models.CharField(max_length=100, null=True, blank=True)
+    arsip = models.BooleanField(default=False)
+    membership = models.JSONField(default=list)
+    fire_strength = models.FloatField()
+    
+    class Meta:
+        verbose_name = "Hasil Seleksi Job"
+        verbose_name_plural = "Hasil Seleksi Job"
+        unique_together = ['job', 'peringkat']
+    
+    def __str__(self):
+        return f"{self.job_id} #{self.peringkat} {self.nama} ({self.fire_strength})"
+
+
+class PerubahanKelompok(models.Model):
+    """
+    Satu entri change feed Kelompok (lihat fuzzy/perubahan.py)
+    
+    Setiap kelompok hanya punya satu entri, yaitu perubahan terakhirnya:
+    entri lama dihapus saat kelompok berubah lagi. Entri resync menandai
+    perubahan yang mempengaruhi semua kelompok (FuzzyParameter berubah
+    atau operasi massal tanpa signal); entri sebelumnya tidak lagi
+    diperlukan dan ikut dihapus.
+    
+    Attributes:
+        urutan (int): Nomor urut perubahan, naik sesuai urutan commit
+        jenis (str): simpan, hapus atau resync
+        kelompok_id (int): Id kelompok (kosong untuk resync)
+        updated_at (datetime): updated_at kelompok, atau waktu hapus/resync
+        alasan (str): Penyebab resync, misalnya 'parameter' atau 'massal'
+    """
+    
+    JENIS_SIMPAN = 'simpan'
+    JENIS_HAPUS = 'hapus'
+    JENIS_RESYNC = 'resync'
+    JENIS_CHOICES = [
+        (JENIS_SIMPAN, 'Simpan'),
+        (JENIS_HAPUS, 'Hapus'),
+        (JENIS_RESYNC, 'Resync'),
+    ]
+    
+    urutan = models.BigIntegerField(unique=True)
+    jenis = models.CharField(max_length=10, choices=JENIS_CHOICES)
+    kelompok_id = models.BigIntegerField(null=True, blank=True, db_index=True)
+    updated_at = models.DateTimeField()
+    alasan = models.CharField(max_length=50, blank=True)
+    
+    class Meta:
+        verbose_name = "Perubahan Kelompok"
+        verbose_name_plural = "Perubahan Kelompok"
+        ordering = ['urutan']
+        indexes = [
+            models.Index(fields=['jenis', 'urutan'], name='perubahan_jenis_urutan_idx'),
+        ]
+    
+    def __str__(self):
+        if self.jenis == self.JENIS_RESYNC:
+            return f"#{self.urutan} resync ({self.alasan})"
+        return f"#{self.urutan} {self.jenis} kelompok {self.kelompok_id}"
@@ -0,0 +1,288 @@
+"""
+Keyset Pagination Daftar Kelompok untuk SPK Fuzzy Database Model Tahani
+
+Daftar kelompok dibaca per halaman dengan keyset (seek) pagination:
+halaman berikutnya dimulai dari nilai kolom urutan + id baris terakhir
+halaman sebelumnya, bukan dari OFFSET. Setiap kolom urutan memiliki index
+(kolom, id) sehingga biaya satu halaman tetap kecil walaupun tabel
+berisi ratusan ribu baris.
+
+Cursor dikirim ke client dalam bentuk string base64 yang berisi arah,
+nilai kolom dan id baris batas.
+"""
+
+import base64
+import binascii
+import json
+import math
+from datetime import date, timedelta
+
+from django.db.models import Q
+
+from .models import Kelompok, hitung_usia
+
+# Urutan yang bisa dipilih -> (kolom database, dibalik)
+# Usia naik = tanggal berdiri turun
+URUTAN = {
+    'nama': ('nama', False),
+    'usia': ('tanggal_berdiri', True),
+    'jumlah_anggota': ('jumlah_anggota', False),
+    'luas_lahan': ('luas_lahan', False),
+    'frekuensi_bantuan': ('frekuensi_bantuan', False),
+    'sdm': ('sdm', False),
+    'unit_usaha': ('unit_usaha', False),
+    'kas': ('kas', False),
+}
+URUTAN_DEFAULT = 'nama'
+
+# Kriteria yang bisa difilter dengan rentang <kriteria>_min / <kriteria>_max
+FILTER_RENTANG = (
+    'usia',
+    'jumlah_anggota',
+    'luas_lahan',
+    'frekuensi_bantuan',
+    'sdm',
+    'unit_usaha',
+    'kas',
+)
+
+PER_HALAMAN_DEFAULT = 50
+PER_HALAMAN_MAKS = 500
+
+KOLOM_DAFTAR = (
+    'pk',
+    'nama',
+    'tanggal_berdiri',
+    'jumlah_anggota',
+    'luas_lahan',
+    'frekuensi_bantuan',
+    'sdm',
+    'unit_usaha',
+    'kas',
+)
+
+
+class CursorTidakValid(ValueError):
+    """Cursor atau parameter daftar kelompok tidak valid"""
+
+
+# =============================================================================
+# CURSOR
+# =============================================================================
+
+def buat_cursor(arah, urut, nilai, pk):
+    """
+    Membuat cursor untuk baris batas sebuah halaman
+
+    Args:
+        arah (str): 'n' (halaman berikutnya) atau 'p' (halaman sebelumnya)
+        urut (str): Urutan yang dipakai (misal '-kas'); cursor hanya
+                    berlaku untuk urutan yang sama
+        nilai: Nilai kolom urutan pada baris batas
+        pk (int): Id baris batas
+
+    Returns:
+        str: Cursor base64 (URL-safe)
+    """
+    if isinstance(nilai, date):
+        nilai = nilai.isoformat()
+    teks = json.dumps([arah, urut, nilai, pk], separators=(',', ':'))
+    return base64.urlsafe_b64encode(teks.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def baca_cursor(cursor, urut):
+    """
+    Membaca cursor dari buat_cursor()
+
+    Returns:
+        tuple: (arah, nilai, pk)
+
+    Raises:
+        CursorTidakValid: Cursor rusak atau dibuat untuk urutan lain
+    """
+    try:
+        teks = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('utf-8')
+        arah, urut_cursor, nilai, pk = json.loads(teks)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise CursorTidakValid('Cursor tidak valid')
+
+    if arah not in ('n', 'p') or urut_cursor != urut or not isinstance(pk, int):
+        raise CursorTidakValid('Cursor tidak valid untuk urutan ini')
+
+    kolom, _ = URUTAN[urut.lstrip('-')]
+    if kolom == 'tanggal_berdiri':
+        try:
+            nilai = date.fromisoformat(nilai)
+        except (TypeError, ValueError):
+            raise CursorTidakValid('Cursor tidak valid')
+    return arah, nilai, pk
+
+
+# =============================================================================
+# FILTER & URUTAN
+# =============================================================================
+
+def get_urutan(urut):
+    """
+    Kolom dan arah urutan untuk parameter ?urut=
+
+    Args:
+        urut (str): Nama urutan, awalan '-' untuk urutan menurun
+
+    Returns:
+        tuple: (urut kanonik, kolom database, menurun)
+    """
+    urut = urut or URUTAN_DEFAULT
+    if urut.lstrip('-') not in URUTAN:
+        raise CursorTidakValid(f"Urutan '{urut}' tidak valid")
+
+    kolom, dibalik = URUTAN[urut.lstrip('-')]
+    menurun = urut.startswith('-') != dibalik
+    return urut, kolom, menurun
+
+
+def _batas_tanggal_usia(usia_min, usia_max, today):
+    """
+    Rentang tanggal_berdiri untuk rentang usia (sesuai hitung_usia())
+
+    usia >= n  <=>  tanggal_berdiri <= today - ceil(n * 365.25) hari
+    usia <= n  <=>  tanggal_berdiri >= today - (ceil((n + 1) * 365.25) - 1) hari
+    """
+    filter_tanggal = {}
+    if usia_min is not None:
+        filter_tanggal['tanggal_berdiri__lte'] = today - timedelta(days=math.ceil(usia_min * 365.25))
+    if usia_max is not None:
+        filter_tanggal['tanggal_berdiri__gte'] = today - timedelta(days=math.ceil((usia_max + 1) * 365.25) - 1)
+    return filter_tanggal
+
+
+def get_filter(params):
+    """
+    Filter rentang kriteria dari parameter request
+
+    Args:
+        params: request.GET
+
+    Returns:
+        dict: {nama_filter: {'min': x, 'max': y}} untuk kriteria yang diisi
+
+    Raises:
+        CursorTidakValid: Nilai filter bukan angka
+    """
+    filter_aktif = {}
+    for kriteria in FILTER_RENTANG:
+        rentang = {}
+        for batas in ('min', 'max'):
+            nilai = params.get(f'{kriteria}_{batas}', '').strip()
+            if not nilai:
+                continue
+            try:
+                rentang[batas] = int(nilai) if kriteria == 'usia' else float(nilai)
+            except ValueError:
+                raise CursorTidakValid(f"Filter {kriteria}_{batas} harus berupa angka")
+        if rentang:
+            filter_aktif[kriteria] = rentang
+    return filter_aktif
+
+
+def terapkan_filter(queryset, filter_aktif, today=None):
+    """
+    Menerapkan filter rentang dari get_filter() ke queryset Kelompok
+    """
+    if today is None:
+        today = date.today()
+
+    for kriteria, rentang in filter_aktif.items():
+        if kriteria == 'usia':
+            queryset = queryset.filter(**_batas_tanggal_usia(rentang.get('min'), rentang.get('max'), today))
+            continue
+        if 'min' in rentang:
+            queryset = queryset.filter(**{f'{kriteria}__gte': rentang['min']})
+        if 'max' in rentang:
+            queryset = queryset.filter(**{f'{kriteria}__lte': rentang['max']})
+    return queryset
+
+
+# =============================================================================
+# HALAMAN
+# =============================================================================
+
+def _setelah(kolom, nilai, pk, menurun):
+    """Kondisi keyset: baris sesudah (nilai, pk) pada urutan yang dipakai"""
+    operator = 'lt' if menurun else 'gt'
+    return Q(**{f'{kolom}__{operator}': nilai}) | Q(**{kolom: nilai, f'pk__{operator}': pk})
+
+
+def ambil_halaman(params):
+    """
+    Mengambil satu halaman daftar kelompok
+
+    Args:
+        params: request.GET dengan parameter opsional urut, cursor,
+                per_halaman dan filter <kriteria>_min / <kriteria>_max
+
+    Returns:
+        dict: {'baris': [dict kelompok + usia], 'next': cursor atau None,
+              'previous': cursor atau None, 'urut': str, 'per_halaman': int,
+              'filter': dict}
+
+    Raises:
+        CursorTidakValid: Parameter atau cursor tidak valid
+    """
+    today = date.today()
+    urut, kolom, menurun = get_urutan(params.get('urut'))
+    filter_aktif = get_filter(params)
+
+    try:
+        per_halaman = int(params.get('per_halaman') or PER_HALAMAN_DEFAULT)
+    except ValueError:
+        raise CursorTidakValid('per_halaman harus berupa angka')
+    per_halaman = max(1, min(per_halaman, PER_HALAMAN_MAKS))
+
+    queryset = terapkan_filter(Kelompok.objects.all(), filter_aktif, today)
+
+    arah, batas = 'n', None
+    if params.get('cursor'):
+        arah, nilai, pk = baca_cursor(params['cursor'], urut)
+        batas = (nilai, pk)
+
+    # Halaman sebelumnya dibaca dengan urutan terbalik lalu dibalik lagi
+    mundur = arah == 'p'
+    menurun_query = menurun != mundur
+    if batas is not None:
+        queryset = queryset.filter(_setelah(kolom, batas[0], batas[1], menurun_query))
+
+    awalan = '-' if menurun_query else ''
+    baris_list = list(
+        queryset.order_by(f'{awalan}{kolom}', f'{awalan}pk')
+        .values(*KOLOM_DAFTAR)[:per_halaman + 1]
+    )
+    ada_lagi = len(baris_list) > per_halaman
+    baris_list = baris_list[:per_halaman]
+    if mundur:
+        baris_list.reverse()
+
+    for baris in baris_list:
+        baris['usia'] = hitung_usia(baris['tanggal_berdiri'], today)
+
+    if mundur:
+        ada_sebelum, ada_sesudah = ada_lagi, True
+    else:
+        ada_sebelum, ada_sesudah = batas is not None, ada_lagi
+
+    next_cursor = previous_cursor = None
+    if baris_list and ada_sesudah:
+        terakhir = baris_list[-1]
+        next_cursor = buat_cursor('n', urut, terakhir[kolom], terakhir['pk'])
+    if baris_list and ada_sebelum:
+        pertama = baris_list[0]
+        previous_cursor = buat_cursor('p', urut, pertama[kolom], pertama['pk'])
+
+    return {
+        'baris': baris_list,
+        'next': next_cursor,
+        'previous': previous_cursor,
+        'urut': urut,
+        'per_halaman': per_halaman,
+        'filter': filter_aktif,
+    }
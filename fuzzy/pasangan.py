@@ -0,0 +1,460 @@
+"""
+Pasangan Terhitung untuk SPK Fuzzy Database Model Tahani
+
+Halaman seleksi AND/OR selalu memakai tepat 2 kriteria dari 27 kategori,
+sehingga hanya ada 351 pasangan x 2 operator. Ranking setiap pasangan
+dihitung sekali di background dan disimpan di model PasanganTerhitung,
+sehingga seleksi 2 kriteria cukup membaca ranking yang tersimpan.
+
+Setiap entri menyimpan versi data per variabel (lihat fuzzy/cache.py).
+Perubahan kas sebuah kelompok hanya membuat pasangan yang memakai
+variabel kas menjadi basi, dan hanya pasangan tersebut yang dihitung
+ulang oleh refresh_pasangan().
+
+Kelompok yang ditambah, diubah atau dihapus lewat signal tercatat di
+change feed (fuzzy/perubahan.py). Selama parameter tidak berubah dan
+tidak ada operasi massal, refresh_pasangan() hanya mengevaluasi kelompok
+yang tercatat sejak entri dihitung dan menyisipkan/membuangnya dari
+ranking tersimpan, tanpa membaca ulang seluruh tabel.
+"""
+
+from bisect import bisect_right
+from datetime import date
+from itertools import combinations
+
+from django.db import transaction
+from django.utils import timezone
+
+from .cache import (
+    SEMUA_VARIABEL,
+    VERSI_KELOMPOK,
+    VERSI_PARAMETER,
+    get_versi,
+    versi_variabel,
+)
+from .perubahan import urutan_terakhir
+from .refresh import jadwalkan_refresh
+
+OPERATOR_PASANGAN = ('AND', 'OR')
+
+# Jumlah baris yang dibaca per round-trip saat membangun matriks keanggotaan
+BATCH_BARIS = 2000
+
+# Jika lebih banyak kelompok yang berubah sejak pasangan dihitung,
+# pasangan dihitung ulang penuh
+MAKS_PERUBAHAN_INKREMENTAL = 1000
+
+
+def daftar_kriteria():
+    """
+    Semua kriteria (variabel, kategori) yang bisa dipilih
+
+    Returns:
+        list: 27 tuple (variabel, kategori) dalam urutan kanonik
+    """
+    from .utils import KATEGORI_VARIABEL, VARIABEL_LIST
+
+    return sorted(
+        (variabel, kategori)
+        for variabel, _ in VARIABEL_LIST
+        for kategori, _ in KATEGORI_VARIABEL[variabel]
+    )
+
+
+def daftar_pasangan():
+    """
+    Semua pasangan kriteria dalam urutan kanonik
+
+    Returns:
+        list: 351 tuple ((variabel_1, kategori_1), (variabel_2, kategori_2))
+    """
+    return list(combinations(daftar_kriteria(), 2))
+
+
+def versi_pasangan(pasangan, versi):
+    """
+    Versi data yang menentukan hasil sebuah pasangan
+
+    Args:
+        pasangan (tuple): Pasangan kriteria
+        versi (dict): Hasil get_versi()
+
+    Returns:
+        dict: {nama_versi: nilai} untuk kedua variabel pasangan
+    """
+    variabel_list = [SEMUA_VARIABEL] + sorted({variabel for variabel, _ in pasangan})
+    return {
+        versi_variabel(nama, variabel): versi.get(versi_variabel(nama, variabel), 0)
+        for nama in (VERSI_KELOMPOK, VERSI_PARAMETER)
+        for variabel in variabel_list
+    }
+
+
+def _kunci_entri(pasangan, operator):
+    (variabel_1, kategori_1), (variabel_2, kategori_2) = pasangan
+    return (variabel_1, kategori_1, variabel_2, kategori_2, operator)
+
+
+def _masih_berlaku(entri, versi, today):
+    """Cek apakah entri PasanganTerhitung masih sesuai dengan data saat ini"""
+    pasangan = entri.kriteria
+    if entri.versi != versi_pasangan(pasangan, versi):
+        return False
+    # Usia bergantung pada tanggal hari ini
+    if any(variabel == 'usia' for variabel, _ in pasangan) and entri.tanggal != today:
+        return False
+    return True
+
+
+def _bisa_inkremental(entri, versi, today):
+    """
+    Cek apakah entri basi hanya karena data kelompok berubah
+
+    Perubahan kelompok lewat signal tercatat di change feed; perubahan
+    parameter atau tanggal acuan usia mengubah nilai semua kelompok.
+    """
+    if entri.urutan_perubahan is None:
+        return False
+    if any(variabel == 'usia' for variabel, _ in entri.kriteria) and entri.tanggal != today:
+        return False
+    versi_baru = versi_pasangan(entri.kriteria, versi)
+    return all(
+        versi_baru.get(nama) == nilai
+        for nama, nilai in entri.versi.items()
+        if nama.startswith(f'{VERSI_PARAMETER}:')
+    )
+
+
+# =============================================================================
+# PERHITUNGAN
+# =============================================================================
+
+def hitung_pasangan(pasangan_list, versi=None, today=None, urutan=None):
+    """
+    Menghitung ranking untuk beberapa pasangan kriteria
+
+    Tabel Kelompok dibaca sekali; nilai keanggotaan setiap kriteria
+    dihitung sekali per baris (matriks keanggotaan), lalu dipakai oleh
+    semua pasangan dan kedua operator.
+
+    Args:
+        pasangan_list (list): Pasangan kriteria (urutan kanonik)
+        versi (dict): Versi data sebelum data dibaca (default: get_versi())
+        today (date): Tanggal acuan perhitungan usia
+        urutan (int): Nomor urut change feed sebelum data dibaca
+                      (default: urutan_terakhir())
+
+    Returns:
+        list: Object PasanganTerhitung (belum disimpan)
+    """
+    from .models import Kelompok, PasanganTerhitung
+    from .utils import (
+        KOLOM_KELOMPOK,
+        buat_fungsi_keanggotaan,
+        data_dari_baris,
+        get_parameter_snapshot,
+    )
+
+    if versi is None:
+        versi = get_versi()
+    if urutan is None:
+        urutan = urutan_terakhir()
+    if today is None:
+        today = date.today()
+
+    snapshot = get_parameter_snapshot()
+    evaluator = {
+        kriteria: buat_fungsi_keanggotaan(kriteria[0], kriteria[1], snapshot)
+        for kriteria in sorted({kriteria for pasangan in pasangan_list for kriteria in pasangan})
+    }
+
+    ids = []
+    matriks = {kriteria: [] for kriteria in evaluator}
+    baris_list = (
+        Kelompok.objects.order_by('nama', 'id')
+        .values_list(*KOLOM_KELOMPOK)
+        .iterator(chunk_size=BATCH_BARIS)
+    )
+    for baris in baris_list:
+        data = data_dari_baris(baris, today)
+        ids.append(data['id'])
+        for (variabel, kategori), fungsi in evaluator.items():
+            matriks[(variabel, kategori)].append(fungsi(data.get(variabel, 0)))
+
+    entri_list = []
+    for pasangan in pasangan_list:
+        mu_1_list, mu_2_list = matriks[pasangan[0]], matriks[pasangan[1]]
+        for operator, gabung in (('AND', min), ('OR', max)):
+            hasil = [
+                [id_kelompok, mu_1, mu_2]
+                for id_kelompok, mu_1, mu_2 in zip(ids, mu_1_list, mu_2_list)
+                if gabung(mu_1, mu_2) > 0
+            ]
+            # Urutan sama dengan seleksi_fuzzy(): fire strength, lalu nama
+            hasil.sort(key=lambda baris: round(gabung(baris[1], baris[2]), 4), reverse=True)
+
+            (variabel_1, kategori_1), (variabel_2, kategori_2) = pasangan
+            entri_list.append(PasanganTerhitung(
+                variabel_1=variabel_1,
+                kategori_1=kategori_1,
+                variabel_2=variabel_2,
+                kategori_2=kategori_2,
+                operator=operator,
+                hasil=hasil,
+                total=len(hasil),
+                versi=versi_pasangan(pasangan, versi),
+                tanggal=today,
+                urutan_perubahan=urutan,
+            ))
+
+    return entri_list
+
+
+def _kelompok_berubah(urutan_awal, urutan):
+    """
+    Id kelompok yang tercatat di change feed di antara dua nomor urut
+
+    Returns:
+        set: Id kelompok, atau None jika ada resync (operasi massal atau
+             parameter berubah) atau perubahannya terlalu banyak
+    """
+    from .models import PerubahanKelompok
+
+    perubahan = PerubahanKelompok.objects.filter(urutan__gt=urutan_awal, urutan__lte=urutan)
+    if perubahan.filter(jenis=PerubahanKelompok.JENIS_RESYNC).exists():
+        return None
+    ids = set(perubahan.values_list('kelompok_id', flat=True)[:MAKS_PERUBAHAN_INKREMENTAL + 1])
+    if len(ids) > MAKS_PERUBAHAN_INKREMENTAL:
+        return None
+    return ids
+
+
+def perbarui_inkremental(entri_list, ids, versi, urutan, today=None):
+    """
+    Memperbarui ranking tersimpan untuk kelompok yang berubah saja
+
+    Kelompok yang berubah dibuang dari ranking; kelompok yang masih ada
+    dievaluasi ulang dan disisipkan di akhir kelompok fire strength yang
+    sama (cari_pasangan() mengurutkan ulang berdasarkan nama).
+
+    Args:
+        entri_list (list): Object PasanganTerhitung yang diperbarui
+        ids (set): Id kelompok yang berubah sejak entri dihitung
+        versi (dict): Versi data sebelum data dibaca
+        urutan (int): Nomor urut change feed sebelum data dibaca
+        today (date): Tanggal acuan perhitungan usia
+
+    Returns:
+        list: entri_list yang sudah diperbarui (belum disimpan)
+    """
+    from .models import Kelompok
+    from .utils import (
+        KOLOM_KELOMPOK,
+        buat_fungsi_keanggotaan,
+        data_dari_baris,
+        get_parameter_snapshot,
+    )
+
+    if today is None:
+        today = date.today()
+
+    snapshot = get_parameter_snapshot()
+    evaluator = {
+        kriteria: buat_fungsi_keanggotaan(kriteria[0], kriteria[1], snapshot)
+        for kriteria in sorted({kriteria for entri in entri_list for kriteria in entri.kriteria})
+    }
+
+    # Nilai keanggotaan kelompok yang masih ada: {id: {kriteria: mu}}
+    nilai_kelompok = {}
+    for baris in Kelompok.objects.filter(id__in=ids).order_by('nama', 'id').values_list(*KOLOM_KELOMPOK):
+        data = data_dari_baris(baris, today)
+        nilai_kelompok[data['id']] = {
+            kriteria: fungsi(data.get(kriteria[0], 0)) for kriteria, fungsi in evaluator.items()
+        }
+
+    for entri in entri_list:
+        kriteria_1, kriteria_2 = entri.kriteria
+        gabung = min if entri.operator == 'AND' else max
+        hasil = [baris for baris in entri.hasil if baris[0] not in ids]
+        # Ranking urut turun; bisect memakai kunci negatif
+        kunci = [-round(gabung(baris[1], baris[2]), 4) for baris in hasil]
+        for id_kelompok, nilai in nilai_kelompok.items():
+            mu_1, mu_2 = nilai[kriteria_1], nilai[kriteria_2]
+            if gabung(mu_1, mu_2) <= 0:
+                continue
+            posisi = bisect_right(kunci, -round(gabung(mu_1, mu_2), 4))
+            hasil.insert(posisi, [id_kelompok, mu_1, mu_2])
+            kunci.insert(posisi, -round(gabung(mu_1, mu_2), 4))
+
+        entri.hasil = hasil
+        entri.total = len(hasil)
+        entri.versi = versi_pasangan(entri.kriteria, versi)
+        entri.tanggal = today
+        entri.urutan_perubahan = urutan
+
+    return entri_list
+
+
+def refresh_pasangan(semua=False):
+    """
+    Menghitung ulang pasangan yang sudah basi
+
+    Hanya pasangan yang versinya berubah (atau yang memakai usia dan
+    dihitung sebelum hari ini) yang dihitung ulang. Pasangan yang basi
+    hanya karena beberapa kelompok berubah diperbarui secara inkremental
+    (perbarui_inkremental()). Jika tabel PasanganTerhitung masih kosong,
+    tidak ada yang dihitung kecuali semua=True (lihat command
+    precompute_pasangan).
+
+    Args:
+        semua (bool): Hitung ulang semua pasangan
+
+    Returns:
+        int: Jumlah pasangan yang dihitung ulang
+    """
+    from .models import PasanganTerhitung
+
+    versi = get_versi()
+    urutan = urutan_terakhir()
+    today = date.today()
+
+    tersimpan = {
+        (entri.variabel_1, entri.kategori_1, entri.variabel_2, entri.kategori_2, entri.operator): entri
+        for entri in PasanganTerhitung.objects.defer('hasil')
+    }
+    if not tersimpan and not semua:
+        return 0
+
+    basi = [
+        pasangan for pasangan in daftar_pasangan()
+        if semua or any(
+            _kunci_entri(pasangan, operator) not in tersimpan
+            or not _masih_berlaku(tersimpan[_kunci_entri(pasangan, operator)], versi, today)
+            for operator in OPERATOR_PASANGAN
+        )
+    ]
+    if not basi:
+        return 0
+
+    # Entri yang dapat diperbarui inkremental, per nomor urut change feed
+    inkremental = {}
+    penuh = []
+    for pasangan in basi:
+        entri_pasangan = [tersimpan.get(_kunci_entri(pasangan, operator)) for operator in OPERATOR_PASANGAN]
+        if semua or not all(entri is not None and _bisa_inkremental(entri, versi, today) for entri in entri_pasangan):
+            penuh.append(pasangan)
+            continue
+        for entri in entri_pasangan:
+            inkremental.setdefault(entri.urutan_perubahan, []).append(entri)
+
+    entri_list = []
+    for urutan_awal, entri_awal in inkremental.items():
+        ids = _kelompok_berubah(urutan_awal, urutan)
+        if ids is None:
+            penuh.extend(tuple(entri.kriteria) for entri in entri_awal if entri.operator == OPERATOR_PASANGAN[0])
+            continue
+        # Entri sudah dimuat dengan defer('hasil')
+        hasil_map = dict(
+            PasanganTerhitung.objects.filter(pk__in=[entri.pk for entri in entri_awal]).values_list('pk', 'hasil')
+        )
+        for entri in entri_awal:
+            entri.hasil = hasil_map[entri.pk]
+        entri_list.extend(perbarui_inkremental(entri_awal, ids, versi, urutan, today))
+
+    if penuh:
+        entri_list.extend(hitung_pasangan(penuh, versi=versi, today=today, urutan=urutan))
+
+    sekarang = timezone.now()
+    diperbarui, baru = [], []
+    for entri in entri_list:
+        lama = tersimpan.get(_kunci_entri(entri.kriteria, entri.operator))
+        if lama is None:
+            baru.append(entri)
+        else:
+            entri.pk = lama.pk
+            entri.updated_at = sekarang
+            diperbarui.append(entri)
+
+    with transaction.atomic():
+        PasanganTerhitung.objects.bulk_update(
+            diperbarui, ['hasil', 'total', 'versi', 'tanggal', 'urutan_perubahan', 'updated_at'], batch_size=50
+        )
+        PasanganTerhitung.objects.bulk_create(baru, batch_size=50, ignore_conflicts=True)
+
+    return len(basi)
+
+
+# =============================================================================
+# LOOKUP
+# =============================================================================
+
+def cari_pasangan(kriteria, operator='AND', alpha=0.0, limit=None):
+    """
+    Mengambil hasil seleksi 2 kriteria dari pasangan terhitung
+
+    Args:
+        kriteria (list): Tepat 2 tuple [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        alpha (float): Batas minimum fire strength (alpha-cut)
+        limit (int): Jumlah maksimum hasil
+
+    Returns:
+        HasilSeleksi: Hasil dengan format seleksi_fuzzy(), atau None jika
+                      pasangan belum dihitung atau sudah basi (refresh
+                      dijadwalkan dan pemanggil menghitung seperti biasa)
+    """
+    from .models import Kelompok, PasanganTerhitung
+    from .utils import HasilSeleksi, buat_item_hasil, fire_strength_and, fire_strength_or
+
+    operator = operator.upper()
+    if len(kriteria) != 2 or operator not in OPERATOR_PASANGAN:
+        return None
+
+    kriteria_1, kriteria_2 = tuple(kriteria[0]), tuple(kriteria[1])
+    if kriteria_1 == kriteria_2:
+        return None
+    dibalik = kriteria_2 < kriteria_1
+    pasangan = (kriteria_2, kriteria_1) if dibalik else (kriteria_1, kriteria_2)
+
+    entri = PasanganTerhitung.objects.filter(
+        variabel_1=pasangan[0][0],
+        kategori_1=pasangan[0][1],
+        variabel_2=pasangan[1][0],
+        kategori_2=pasangan[1][1],
+        operator=operator,
+    ).first()
+    if entri is None:
+        return None
+    if not _masih_berlaku(entri, get_versi(), date.today()):
+        jadwalkan_refresh()
+        return None
+
+    gabung = fire_strength_and if operator == 'AND' else fire_strength_or
+    baris_list = []
+    for id_kelompok, mu_1, mu_2 in entri.hasil:
+        membership_values = [mu_2, mu_1] if dibalik else [mu_1, mu_2]
+        fire_strength = gabung(*membership_values)
+        if fire_strength >= alpha:
+            baris_list.append((id_kelompok, membership_values, fire_strength, round(fire_strength, 4)))
+
+    total = len(baris_list)
+    if limit is not None and limit < total:
+        # Ikutkan baris dengan fire strength sama di batas limit agar
+        # urutan berdasarkan nama tetap sama dengan seleksi_fuzzy()
+        batas = baris_list[limit - 1][3]
+        baris_list = [baris for i, baris in enumerate(baris_list) if i < limit or baris[3] == batas]
+
+    kelompok_map = Kelompok.objects.in_bulk([baris[0] for baris in baris_list])
+    hasil = []
+    for id_kelompok, membership_values, fire_strength, _ in baris_list:
+        kelompok = kelompok_map.get(id_kelompok)
+        if kelompok is not None:
+            hasil.append(buat_item_hasil(
+                kelompok, kelompok.get_data_dict(), kriteria, membership_values, fire_strength
+            ))
+
+    hasil.sort(key=lambda item: (-item['fire_strength'], item['kelompok'].nama))
+    if limit is not None:
+        hasil = hasil[:limit]
+
+    return HasilSeleksi(hasil, total)
@@ -0,0 +1,344 @@
+"""
+Change Feed Kelompok untuk SPK Fuzzy Database Model Tahani
+
+Client yang menyimpan salinan kelompok beserta fuzzifikasinya (misalnya
+layanan laporan) tidak perlu mengunduh ulang seluruh tabel: cukup meminta
+perubahan sejak cursor terakhirnya di /api/kelompok/perubahan/.
+
+- Setiap simpan/hapus Kelompok (signal, fuzzy/signals.py) mencatat satu
+  PerubahanKelompok dengan nomor urut yang naik sesuai urutan commit.
+  Kelompok yang dihapus dikirim sebagai tombstone.
+- Nilai keanggotaan dihitung ulang saat feed dibaca, dengan parameter
+  fuzzy saat itu.
+- FuzzyParameter berubah, atau operasi massal tanpa signal (update(),
+  bulk_create()), mencatat entri resync: client dengan cursor sebelum
+  entri tersebut diminta mengunduh ulang semua kelompok
+  (/api/fuzzifikasi/bulk/?semua=1) lalu melanjutkan dari cursor baru.
+- Usia dihitung dari tanggal hari ini. Jika tanggal cursor sudah lewat,
+  feed lebih dulu mengirim kelompok yang usianya berubah sejak tanggal
+  tersebut.
+
+Cursor berisi nomor urut perubahan terakhir yang sudah diterima client
+dan tanggal acuan usia salinan client.
+"""
+
+import base64
+import binascii
+import json
+import math
+from datetime import date, timedelta
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import F, Min, Q
+from django.utils import timezone
+
+from .paginasi import CursorTidakValid
+
+# Nama baris VersiData yang menjadi penghitung nomor urut perubahan
+NAMA_URUTAN = 'perubahan'
+
+LIMIT_DEFAULT = 500
+LIMIT_MAKS = 1000
+
+# Jika tanggal cursor lebih lama dari ini, usia semua kelompok mungkin
+# berubah: client diminta resync
+HARI_USIA_MAKS = 365
+
+
+# =============================================================================
+# PENCATATAN
+# =============================================================================
+
+def _urutan_berikutnya():
+    """
+    Nomor urut perubahan berikutnya
+
+    Harus dipanggil di dalam transaksi. Baris penghitung terkunci sampai
+    transaksi commit, sehingga nomor urut mengikuti urutan commit: client
+    tidak pernah melewatkan perubahan yang commit setelah perubahan
+    bernomor lebih besar.
+    """
+    from .models import VersiData
+
+    penghitung = VersiData.objects.filter(nama=NAMA_URUTAN)
+    if not penghitung.update(nilai=F('nilai') + 1):
+        VersiData.objects.get_or_create(nama=NAMA_URUTAN)
+        penghitung.update(nilai=F('nilai') + 1)
+    return penghitung.values_list('nilai', flat=True).get()
+
+
+def urutan_terakhir():
+    """Nomor urut perubahan terakhir (0 jika belum ada perubahan)"""
+    from .models import VersiData
+
+    return VersiData.objects.filter(nama=NAMA_URUTAN).values_list('nilai', flat=True).first() or 0
+
+
+def _catat(jenis, kelompok_id=None, updated_at=None, alasan=''):
+    from .models import PerubahanKelompok
+
+    with transaction.atomic():
+        urutan = _urutan_berikutnya()
+        if jenis == PerubahanKelompok.JENIS_RESYNC:
+            # Client dengan cursor sebelum resync mengunduh ulang semua
+            # kelompok, sehingga entri yang lebih lama tidak diperlukan
+            PerubahanKelompok.objects.filter(urutan__lt=urutan).delete()
+        else:
+            # Hanya perubahan terakhir per kelompok yang disimpan
+            PerubahanKelompok.objects.filter(kelompok_id=kelompok_id).delete()
+        PerubahanKelompok.objects.create(
+            urutan=urutan,
+            jenis=jenis,
+            kelompok_id=kelompok_id,
+            updated_at=updated_at or timezone.now(),
+            alasan=alasan,
+        )
+
+
+def catat_simpan(kelompok):
+    """Mencatat kelompok yang dibuat atau diubah"""
+    from .models import PerubahanKelompok
+
+    _catat(PerubahanKelompok.JENIS_SIMPAN, kelompok.pk, kelompok.updated_at)
+
+
+def catat_hapus(pk):
+    """Mencatat tombstone untuk kelompok yang dihapus"""
+    from .models import PerubahanKelompok
+
+    _catat(PerubahanKelompok.JENIS_HAPUS, pk)
+
+
+def catat_resync(alasan):
+    """
+    Mencatat perubahan yang mempengaruhi semua kelompok
+
+    Args:
+        alasan (str): Misalnya 'parameter' atau 'massal'
+    """
+    from .models import PerubahanKelompok
+
+    _catat(PerubahanKelompok.JENIS_RESYNC, alasan=alasan)
+
+
+def catat_massal(model, using):
+    """
+    Operasi massal tanpa signal per baris (lihat VersiQuerySet)
+
+    Baris yang berubah tidak diketahui, sehingga untuk Kelompok dan
+    FuzzyParameter di database utama dicatat sebagai resync.
+    """
+    from .models import FuzzyParameter, Kelompok
+
+    if using == DEFAULT_DB_ALIAS and model in (Kelompok, FuzzyParameter):
+        catat_resync('massal')
+
+
+# =============================================================================
+# CURSOR
+# =============================================================================
+
+def buat_cursor(urutan, tanggal, usia=None):
+    """
+    Membuat cursor change feed
+
+    Args:
+        urutan (int): Nomor urut perubahan terakhir yang sudah dikirim
+        tanggal (date): Tanggal acuan usia salinan client
+        usia (tuple): (tanggal tujuan, id terakhir) jika pengiriman
+                      kelompok yang usianya berubah belum selesai
+
+    Returns:
+        str: Cursor base64 (URL-safe)
+    """
+    isi = [urutan, tanggal.isoformat()]
+    if usia is not None:
+        isi.extend([usia[0].isoformat(), usia[1]])
+    teks = json.dumps(isi, separators=(',', ':'))
+    return base64.urlsafe_b64encode(teks.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def baca_cursor(cursor):
+    """
+    Membaca cursor dari buat_cursor()
+
+    Returns:
+        tuple: (urutan, tanggal, usia)
+
+    Raises:
+        CursorTidakValid: Cursor rusak
+    """
+    try:
+        teks = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('utf-8')
+        isi = json.loads(teks)
+        urutan, tanggal = isi[0], date.fromisoformat(isi[1])
+        usia = None
+        if len(isi) == 4:
+            usia = (date.fromisoformat(isi[2]), isi[3])
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, IndexError, KeyError):
+        raise CursorTidakValid('Cursor tidak valid')
+
+    if not isinstance(urutan, int) or len(isi) not in (2, 4) or (usia and not isinstance(usia[1], int)):
+        raise CursorTidakValid('Cursor tidak valid')
+    return urutan, tanggal, usia
+
+
+# =============================================================================
+# FEED
+# =============================================================================
+
+def _filter_usia_berubah(dari, sampai):
+    """
+    Filter kelompok yang usianya (hitung_usia) berbeda pada dua tanggal
+
+    usia >= n pada tanggal d  <=>  tanggal_berdiri <= d - ceil(n * 365.25)
+    hari (lihat paginasi._batas_tanggal_usia), sehingga usia naik menjadi n
+    di antara `dari` dan `sampai` jika tanggal_berdiri berada di rentang
+    (dari - ceil(n * 365.25), sampai - ceil(n * 365.25)].
+
+    Returns:
+        Q: Filter tanggal_berdiri, atau None jika tidak ada yang berubah
+    """
+    from .models import Kelompok
+
+    terlama = Kelompok.objects.aggregate(terlama=Min('tanggal_berdiri'))['terlama']
+    if terlama is None:
+        return None
+
+    filter_usia = Q()
+    n = 1
+    while True:
+        hari = timedelta(days=math.ceil(n * 365.25))
+        if sampai - hari < terlama:
+            break
+        filter_usia |= Q(tanggal_berdiri__gt=dari - hari, tanggal_berdiri__lte=sampai - hari)
+        n += 1
+    return filter_usia or None
+
+
+def _item_simpan(baris, updated_at, urutan, evaluator, today):
+    from .utils import data_dari_baris, membership_lengkap
+
+    data = data_dari_baris(baris, today)
+    return {
+        'urutan': urutan,
+        'jenis': 'simpan',
+        'id': data['id'],
+        'updated_at': updated_at.isoformat(),
+        'data': data,
+        'memberships': membership_lengkap(data, evaluator),
+    }
+
+
+def _response(urutan, tanggal, perubahan=(), ada_lagi=False, resync=False, usia=None):
+    return {
+        'resync': resync,
+        'tanggal': tanggal.isoformat(),
+        'perubahan': list(perubahan),
+        'cursor': buat_cursor(urutan, tanggal, usia),
+        'ada_lagi': ada_lagi,
+    }
+
+
+def _perubahan_usia(urutan, tanggal, usia, today, limit, evaluator):
+    """Satu halaman kelompok yang usianya berubah sejak tanggal cursor"""
+    from .models import Kelompok
+    from .utils import KOLOM_KELOMPOK
+
+    tujuan, id_terakhir = usia or (today, 0)
+    filter_usia = _filter_usia_berubah(tanggal, tujuan)
+
+    baris_list = []
+    if filter_usia is not None:
+        baris_list = list(
+            Kelompok.objects.filter(filter_usia, id__gt=id_terakhir)
+            .order_by('id')
+            .values_list(*KOLOM_KELOMPOK, 'updated_at')[:limit + 1]
+        )
+
+    perubahan = [
+        _item_simpan(baris[:-1], baris[-1], None, evaluator, today)
+        for baris in baris_list[:limit]
+    ]
+    if len(baris_list) > limit:
+        return _response(urutan, tanggal, perubahan, True, usia=(tujuan, baris_list[limit - 1][0]))
+    # Selesai; perubahan bernomor urut dikirim pada request berikutnya
+    return _response(urutan, tujuan, perubahan, True)
+
+
+def ambil_perubahan(cursor=None, limit=LIMIT_DEFAULT):
+    """
+    Perubahan kelompok sejak cursor
+
+    Args:
+        cursor (str): Cursor dari response sebelumnya (None untuk mulai)
+        limit (int): Jumlah perubahan maksimum
+
+    Returns:
+        dict: {
+            'resync': True jika client harus mengunduh ulang semua kelompok,
+            'tanggal': tanggal acuan usia,
+            'perubahan': [{'urutan', 'jenis', 'id', 'updated_at',
+                           'data', 'memberships'}, ...],
+            'cursor': cursor untuk request berikutnya,
+            'ada_lagi': True jika masih ada perubahan,
+        }
+
+        Entri hapus tidak berisi data dan memberships. Entri perubahan
+        usia tidak punya nomor urut (urutan None).
+
+    Raises:
+        CursorTidakValid: Cursor rusak
+    """
+    from .models import Kelompok, PerubahanKelompok
+    from .utils import KOLOM_KELOMPOK, evaluator_lengkap, get_parameter_snapshot
+
+    today = date.today()
+    # Dibaca sebelum perubahan agar perubahan selama client mengunduh
+    # ulang tetap dikirim setelah resync
+    terakhir = urutan_terakhir()
+    if cursor is None:
+        return _response(terakhir, today, resync=True)
+
+    urutan, tanggal, usia = baca_cursor(cursor)
+    if urutan > terakhir or not 0 <= (today - tanggal).days <= HARI_USIA_MAKS:
+        # Penghitung direset atau salinan client terlalu lama
+        return _response(terakhir, today, resync=True)
+
+    evaluator = evaluator_lengkap(get_parameter_snapshot())
+    if tanggal != today:
+        return _perubahan_usia(urutan, tanggal, usia, today, limit, evaluator)
+
+    entri_list = list(PerubahanKelompok.objects.filter(urutan__gt=urutan).order_by('urutan')[:limit + 1])
+    # Resync menghapus entri yang lebih lama, sehingga resync setelah
+    # cursor selalu menjadi entri pertama
+    if any(entri.jenis == PerubahanKelompok.JENIS_RESYNC for entri in entri_list):
+        return _response(terakhir, today, resync=True)
+
+    ada_lagi = len(entri_list) > limit
+    entri_list = entri_list[:limit]
+    baris_map = {
+        baris[0]: baris
+        for baris in Kelompok.objects.filter(
+            id__in=[entri.kelompok_id for entri in entri_list if entri.jenis == PerubahanKelompok.JENIS_SIMPAN]
+        ).values_list(*KOLOM_KELOMPOK)
+    }
+
+    perubahan = []
+    for entri in entri_list:
+        baris = baris_map.get(entri.kelompok_id)
+        if entri.jenis == PerubahanKelompok.JENIS_SIMPAN and baris is not None:
+            perubahan.append(_item_simpan(baris, entri.updated_at, entri.urutan, evaluator, today))
+            continue
+        # Kelompok yang sudah tidak ada (misalnya dihapus tanpa signal)
+        # juga dikirim sebagai tombstone
+        perubahan.append({
+            'urutan': entri.urutan,
+            'jenis': 'hapus',
+            'id': entri.kelompok_id,
+            'updated_at': entri.updated_at.isoformat(),
+        })
+
+    if entri_list:
+        urutan = entri_list[-1].urutan
+    return _response(urutan, today, perubahan, ada_lagi)
@@ -0,0 +1,201 @@
+"""
+Query Tersimpan untuk SPK Fuzzy Database Model Tahani
+
+User dapat menyimpan query seleksi multi-kriteria (QueryTersimpan).
+Ranking hasilnya disimpan di PeringkatTersimpan dan dipelihara secara
+inkremental:
+- Kelompok disimpan: hanya baris tersebut yang dievaluasi ulang terhadap
+  setiap query tersimpan, lalu disisipkan/dipindah/dihapus dari ranking
+- Kelompok dihapus: baris ranking ikut terhapus (ForeignKey CASCADE)
+- FuzzyParameter berubah atau operasi massal (update(), bulk_create())
+  yang tidak mengirim signal: ranking dihitung ulang penuh
+
+Membuka query tersimpan cukup membaca ranking lewat index
+(query, -fire_strength).
+"""
+
+from datetime import date
+
+from django.db import transaction
+
+from .cache import (
+    SEMUA_VARIABEL,
+    VERSI_KELOMPOK,
+    VERSI_MASSAL,
+    VERSI_PARAMETER,
+    get_versi,
+    versi_variabel,
+)
+
+
+def versi_query(query, versi):
+    """
+    Versi data yang membuat ranking sebuah query harus dihitung ulang penuh
+
+    Args:
+        query (QueryTersimpan): Query tersimpan
+        versi (dict): Hasil get_versi()
+
+    Returns:
+        dict: Versi parameter variabel query dan versi operasi massal Kelompok
+    """
+    variabel_list = [SEMUA_VARIABEL] + sorted({variabel for variabel, _ in query.get_kriteria()})
+    nama_list = [versi_variabel(VERSI_PARAMETER, variabel) for variabel in variabel_list]
+    nama_list.append(versi_variabel(VERSI_KELOMPOK, VERSI_MASSAL))
+    return {nama: versi.get(nama, 0) for nama in nama_list}
+
+
+def _masih_berlaku(query, versi, today):
+    """Cek apakah ranking tersimpan masih bisa dipelihara secara inkremental"""
+    if query.versi != versi_query(query, versi):
+        return False
+    # Usia bergantung pada tanggal hari ini
+    if any(variabel == 'usia' for variabel, _ in query.get_kriteria()) and query.tanggal != today:
+        return False
+    return True
+
+
+def hitung_ulang_peringkat(query):
+    """
+    Menghitung ulang seluruh ranking sebuah query tersimpan
+
+    Args:
+        query (QueryTersimpan): Query tersimpan
+
+    Returns:
+        int: Jumlah kelompok dalam ranking
+    """
+    from .models import Kelompok, PeringkatTersimpan
+    from .utils import KOLOM_KELOMPOK, evaluasi_baris
+
+    # Versi dibaca sebelum data agar perubahan selama perhitungan
+    # membuat ranking ini dianggap basi
+    versi = get_versi()
+    today = date.today()
+
+    baris_list = Kelompok.objects.values_list(*KOLOM_KELOMPOK).iterator(chunk_size=2000)
+    peringkat = [
+        PeringkatTersimpan(
+            query=query,
+            kelompok_id=data['id'],
+            fire_strength=round(fire_strength, 4),
+            membership=membership_values,
+        )
+        for data, membership_values, fire_strength in evaluasi_baris(
+            baris_list, query.get_kriteria(), query.operator, alpha=query.alpha
+        )
+    ]
+
+    with transaction.atomic():
+        PeringkatTersimpan.objects.filter(query=query).delete()
+        PeringkatTersimpan.objects.bulk_create(peringkat, batch_size=1000)
+        query.versi = versi_query(query, versi)
+        query.tanggal = today
+        query.save(update_fields=['versi', 'tanggal', 'updated_at'])
+
+    return len(peringkat)
+
+
+def perbarui_peringkat_kelompok(kelompok, variabel=None):
+    """
+    Mengevaluasi ulang satu kelompok terhadap setiap query tersimpan
+
+    Dipanggil oleh signal post_save Kelompok. Kelompok disisipkan,
+    dipindah (fire strength baru) atau dihapus dari setiap ranking.
+
+    Args:
+        kelompok (Kelompok): Kelompok yang baru disimpan
+        variabel (set): Variabel yang berubah (None = kelompok baru/semua);
+                        query yang tidak memakai variabel tersebut dilewati
+    """
+    from .models import PeringkatTersimpan, QueryTersimpan
+    from .utils import (
+        buat_fungsi_keanggotaan,
+        fire_strength_and,
+        fire_strength_or,
+        get_parameter_snapshot,
+    )
+
+    query_list = list(QueryTersimpan.objects.all())
+    if variabel is not None:
+        query_list = [
+            query for query in query_list
+            if any(var in variabel for var, _ in query.get_kriteria())
+        ]
+    if not query_list:
+        return
+
+    snapshot = get_parameter_snapshot()
+    data = kelompok.get_data_dict()
+
+    for query in query_list:
+        membership_values = [
+            buat_fungsi_keanggotaan(var, kat, snapshot)(data.get(var, 0))
+            for var, kat in query.get_kriteria()
+        ]
+        gabung = fire_strength_and if query.operator == 'AND' else fire_strength_or
+        fire_strength = gabung(*membership_values)
+
+        if fire_strength > 0 and fire_strength >= query.alpha:
+            PeringkatTersimpan.objects.update_or_create(
+                query=query,
+                kelompok=kelompok,
+                defaults={
+                    'fire_strength': round(fire_strength, 4),
+                    'membership': membership_values,
+                },
+            )
+        else:
+            PeringkatTersimpan.objects.filter(query=query, kelompok=kelompok).delete()
+
+
+def refresh_query_tersimpan():
+    """
+    Menghitung ulang ranking query tersimpan yang basi
+
+    Returns:
+        int: Jumlah query yang dihitung ulang
+    """
+    from .models import QueryTersimpan
+
+    versi = get_versi()
+    today = date.today()
+
+    basi = [query for query in QueryTersimpan.objects.all() if not _masih_berlaku(query, versi, today)]
+    for query in basi:
+        hitung_ulang_peringkat(query)
+    return len(basi)
+
+
+def ambil_peringkat(query):
+    """
+    Membaca ranking sebuah query tersimpan
+
+    Jika ranking basi (parameter berubah, operasi massal, atau tanggal
+    berganti untuk kriteria usia), ranking dihitung ulang terlebih dahulu.
+
+    Args:
+        query (QueryTersimpan): Query tersimpan
+
+    Returns:
+        HasilSeleksi: Hasil dengan format seleksi_fuzzy()
+    """
+    from .models import PeringkatTersimpan
+    from .utils import HasilSeleksi, buat_item_hasil
+
+    if not _masih_berlaku(query, get_versi(), date.today()):
+        hitung_ulang_peringkat(query)
+
+    kriteria = query.get_kriteria()
+    peringkat = (
+        PeringkatTersimpan.objects.filter(query=query)
+        .select_related('kelompok')
+        .order_by('-fire_strength', 'kelompok__nama')
+    )
+    return HasilSeleksi([
+        buat_item_hasil(
+            baris.kelompok, baris.kelompok.get_data_dict(), kriteria,
+            baris.membership, baris.fire_strength
+        )
+        for baris in peringkat
+    ])
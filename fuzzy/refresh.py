@@ -0,0 +1,100 @@
+"""
+Refresh Hasil Terhitung di Background
+
+Setiap kali versi data dinaikkan (lihat fuzzy/cache.py), hasil yang sudah
+dihitung sebelumnya bisa menjadi basi:
+- pasangan 2 kriteria (fuzzy/pasangan.py)
+- query populer yang dimaterialisasi (fuzzy/materialisasi.py)
+- ranking query tersimpan (fuzzy/query_tersimpan.py)
+
+Modul ini menjalankan fungsi refresh masing-masing di satu thread
+background. Refresh dimulai FUZZY_REFRESH_JEDA detik setelah permintaan
+pertama, sehingga rentetan perubahan (misalnya banyak kelompok ditambah
+berturut-turut) digabung menjadi satu putaran. Permintaan yang datang
+saat refresh sedang berjalan digabung menjadi satu putaran berikutnya.
+
+Untuk menjalankan refresh di luar proses web, matikan
+FUZZY_REFRESH_OTOMATIS dan jalankan command warm_fuzzy_caches secara
+berkala.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Fungsi refresh yang dijalankan (masing-masing hanya menghitung entri basi)
+TUGAS_REFRESH = [
+    'fuzzy.pasangan.refresh_pasangan',
+    'fuzzy.materialisasi.refresh_materialisasi',
+    'fuzzy.query_tersimpan.refresh_query_tersimpan',
+]
+
+_refresh_lock = threading.Lock()
+_refresh_berjalan = False
+_refresh_lagi = False
+
+
+def jalankan_tugas_refresh():
+    """Menjalankan semua fungsi di TUGAS_REFRESH (error dicatat di log)"""
+    for path in TUGAS_REFRESH:
+        try:
+            import_string(path)()
+        except Exception:
+            logger.exception('Gagal menjalankan %s', path)
+
+
+def jadwalkan_refresh():
+    """
+    Menjadwalkan refresh hasil terhitung di thread background
+
+    Refresh dimulai setelah transaksi saat ini commit. Dapat dimatikan
+    dengan FUZZY_REFRESH_OTOMATIS=False.
+    """
+    if not getattr(settings, 'FUZZY_REFRESH_OTOMATIS', True):
+        return
+    transaction.on_commit(_mulai_refresh)
+
+
+def _mulai_refresh():
+    global _refresh_berjalan, _refresh_lagi
+
+    connection = connections[DEFAULT_DB_ALIAS]
+    if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+        # Database in-memory tidak terlihat dari thread lain
+        jalankan_tugas_refresh()
+        return
+
+    with _refresh_lock:
+        if _refresh_berjalan:
+            _refresh_lagi = True
+            return
+        _refresh_berjalan = True
+
+    threading.Thread(target=_jalankan_refresh, name='refresh-fuzzy', daemon=True).start()
+
+
+def _jalankan_refresh():
+    global _refresh_berjalan, _refresh_lagi
+
+    try:
+        while True:
+            # Permintaan selama jeda ikut dikerjakan di putaran ini
+            time.sleep(getattr(settings, 'FUZZY_REFRESH_JEDA', 5))
+            with _refresh_lock:
+                _refresh_lagi = False
+
+            jalankan_tugas_refresh()
+
+            with _refresh_lock:
+                if not _refresh_lagi:
+                    _refresh_berjalan = False
+                    return
+                _refresh_lagi = False
+    finally:
+        connections.close_all()
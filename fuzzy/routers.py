@@ -0,0 +1,161 @@
+"""
+Database Router untuk SPK Fuzzy Database Model Tahani
+
+Router ini mengarahkan query baca Kelompok, KelompokArsip dan
+FuzzyParameter dari halaman seleksi, dashboard dan endpoint API ke
+database replica.
+Semua query tulis tetap ke database default (primary).
+
+Routing ke replica hanya aktif di dalam request yang ditandai oleh
+ReplicaRoutingMiddleware, sehingga halaman CRUD selalu membaca dari
+primary.
+"""
+
+import contextvars
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connections
+
+
+# Penanda apakah request saat ini boleh membaca dari replica
+baca_dari_replica = contextvars.ContextVar('baca_dari_replica', default=False)
+
+# Model yang query bacanya boleh diarahkan ke replica
+MODEL_REPLICA = {'kelompok', 'kelompokarsip', 'fuzzyparameter'}
+
+_round_robin = itertools.count()
+_lag_cache = {}
+_lag_lock = threading.Lock()
+
+
+@contextmanager
+def baca_dari_primary():
+    """
+    Memaksa query baca di dalam blok ke database default
+
+    Untuk hasil yang disimpan bersama versi data primary (cache hasil
+    seleksi), agar tidak berisi data dari replica yang tertinggal.
+    """
+    token = baca_dari_replica.set(False)
+    try:
+        yield
+    finally:
+        baca_dari_replica.reset(token)
+
+
+def get_replica_databases():
+    """
+    Daftar alias database replica
+
+    Returns:
+        list: Alias dari settings.FUZZY_REPLICA_DATABASES
+    """
+    return list(getattr(settings, 'FUZZY_REPLICA_DATABASES', []))
+
+
+def _ukur_lag(alias):
+    """
+    Mengukur lag replikasi sebuah replica (dalam detik)
+
+    Untuk PostgreSQL, lag dihitung dari timestamp transaksi terakhir yang
+    sudah di-replay. Replica yang tidak dapat dihubungi dianggap lag tak
+    hingga sehingga tidak dipilih.
+    """
+    connection = connections[alias]
+    try:
+        if connection.vendor != 'postgresql':
+            return 0.0
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT CASE "
+                "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+                "END"
+            )
+            return float(cursor.fetchone()[0] or 0)
+    except Exception:
+        return float('inf')
+
+
+def get_lag_replica(alias):
+    """
+    Lag replica dengan cache singkat
+
+    Lag hanya diukur ulang setiap FUZZY_REPLICA_LAG_INTERVAL detik agar
+    pengecekan tidak menambah query di setiap request.
+
+    Args:
+        alias (str): Alias database replica
+
+    Returns:
+        float: Lag dalam detik
+    """
+    interval = getattr(settings, 'FUZZY_REPLICA_LAG_INTERVAL', 5)
+    sekarang = time.monotonic()
+
+    with _lag_lock:
+        tercatat = _lag_cache.get(alias)
+        if tercatat and sekarang - tercatat[0] < interval:
+            return tercatat[1]
+
+    lag = _ukur_lag(alias)
+    with _lag_lock:
+        _lag_cache[alias] = (sekarang, lag)
+    return lag
+
+
+def pilih_replica():
+    """
+    Memilih replica secara round-robin dengan fallback berdasarkan lag
+
+    Replica dengan lag di atas FUZZY_REPLICA_MAX_LAG dilewati. Jika semua
+    replica tertinggal, query dibaca dari primary.
+
+    Returns:
+        str: Alias replica, atau None untuk memakai database default
+    """
+    replicas = get_replica_databases()
+    if not replicas:
+        return None
+
+    max_lag = getattr(settings, 'FUZZY_REPLICA_MAX_LAG', 10)
+    mulai = next(_round_robin)
+
+    for i in range(len(replicas)):
+        alias = replicas[(mulai + i) % len(replicas)]
+        if get_lag_replica(alias) <= max_lag:
+            return alias
+
+    return None
+
+
+class ReplicaRouter:
+    """
+    Router baca/tulis untuk Kelompok dan FuzzyParameter
+
+    - Baca: ke replica jika request ditandai boleh membaca dari replica
+    - Tulis: selalu ke database default
+    - Migrasi: tidak dijalankan di replica
+    """
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label != 'fuzzy' or model._meta.model_name not in MODEL_REPLICA:
+            return None
+        if not baca_dari_replica.get():
+            return None
+        return pilih_replica()
+
+    def db_for_write(self, model, **hints):
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in get_replica_databases():
+            return False
+        return None
@@ -0,0 +1,134 @@
+"""
+Seleksi Fuzzy Async untuk SPK Fuzzy Database Model Tahani
+
+Dipakai oleh view async (fuzzy/views_async.py) di server ASGI. Baris
+Kelompok dibaca dengan async ORM (aiterator) sehingga event loop tetap
+melayani request lain selama scan tabel, dan evaluasi fungsi keanggotaan
+(CPU) dijalankan per potongan di executor terbatas:
+- FUZZY_PARALEL_WORKERS > 0: process pool seleksi paralel (fuzzy/utils.py)
+- selain itu: thread pool dengan FUZZY_ASYNC_WORKERS thread
+
+Setiap request hanya punya satu potongan yang sedang dievaluasi sambil
+membaca potongan berikutnya, sehingga antrean executor tidak tumbuh
+melebihi jumlah request yang berjalan.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .utils import (
+    BATCH_BARIS_SHARD,
+    KOLOM_KELOMPOK,
+    HasilSeleksi,
+    _get_process_pool,
+    buat_fungsi_keanggotaan,
+    buat_item_hasil,
+    evaluasi_potongan,
+    get_parameter_snapshot,
+)
+
+_thread_pool = None
+_thread_pool_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Executor untuk evaluasi potongan baris
+
+    Returns:
+        Executor: Process pool seleksi paralel jika aktif, selain itu
+                  thread pool bersama (dibuat sekali per proses)
+    """
+    global _thread_pool
+
+    workers = getattr(settings, 'FUZZY_PARALEL_WORKERS', 0)
+    if workers > 0:
+        return _get_process_pool(workers)
+
+    with _thread_pool_lock:
+        if _thread_pool is None:
+            _thread_pool = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'FUZZY_ASYNC_WORKERS', 4),
+                thread_name_prefix='fuzzy-async',
+            )
+        return _thread_pool
+
+
+async def seleksi_fuzzy_async(kriteria, operator='AND', alpha=0.0, limit=None, queryset=None, batch=BATCH_BARIS_SHARD):
+    """
+    Seleksi fuzzy atas tabel Kelompok tanpa memblokir event loop
+
+    Hasil dan urutannya sama dengan seleksi_fuzzy().
+
+    Args:
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        alpha (float): Batas minimum fire strength (alpha-cut)
+        limit (int): Jumlah maksimum hasil
+        queryset: QuerySet Kelompok (default: semua kelompok)
+        batch (int): Jumlah baris per potongan evaluasi
+
+    Returns:
+        HasilSeleksi: Hasil seleksi
+
+    Raises:
+        ValueError: Jika ada kriteria yang tidak valid
+    """
+    from .models import Kelompok
+
+    if queryset is None:
+        queryset = Kelompok.objects.all()
+
+    snapshot = await sync_to_async(get_parameter_snapshot)()
+    # Validasi kriteria sebelum membaca tabel
+    for variabel, kategori in kriteria:
+        buat_fungsi_keanggotaan(variabel, kategori, snapshot)
+
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+
+    def evaluasi(potongan):
+        return loop.run_in_executor(
+            executor, evaluasi_potongan, potongan, kriteria, operator, snapshot, alpha
+        )
+
+    ranking = []
+    tertunda = None
+    potongan = []
+    # values() (bukan values_list()): aiterator() values_list menjalankan
+    # query secara sync di event loop (SynchronousOnlyOperation)
+    ke_tuple = itemgetter(*KOLOM_KELOMPOK)
+    baris_list = queryset.order_by('nama', 'id').values(*KOLOM_KELOMPOK)
+    async for baris in baris_list.aiterator(chunk_size=batch):
+        potongan.append(ke_tuple(baris))
+        if len(potongan) < batch:
+            continue
+        if tertunda is not None:
+            ranking.extend(await tertunda)
+        tertunda = evaluasi(potongan)
+        potongan = []
+
+    if tertunda is not None:
+        ranking.extend(await tertunda)
+    if potongan:
+        ranking.extend(await evaluasi(potongan))
+
+    ranking.sort(key=lambda entri: entri[2], reverse=True)
+    total = len(ranking)
+    if limit is not None:
+        ranking = ranking[:limit]
+
+    objek = await queryset.ain_bulk([pk for pk, _, _ in ranking])
+    hasil = []
+    for pk, membership_values, fire_strength in ranking:
+        kelompok = objek.get(pk)
+        if kelompok is not None:
+            hasil.append(buat_item_hasil(
+                kelompok, kelompok.get_data_dict(), kriteria, membership_values, fire_strength
+            ))
+    return HasilSeleksi(hasil, total)
@@ -0,0 +1,71 @@
+"""
+Signal handler untuk SPK Fuzzy Database Model Tahani
+
+Menaikkan versi data setiap kali Kelompok, KelompokArsip atau
+FuzzyParameter disimpan/dihapus, sehingga cache hasil seleksi
+(fuzzy/cache.py) tidak lagi memakai data lama. Untuk Kelompok dan
+FuzzyParameter versi juga dinaikkan per variabel yang berubah, agar
+pasangan terhitung (fuzzy/pasangan.py) diperbarui seperlunya saja.
+
+Kelompok yang disimpan juga dievaluasi ulang terhadap setiap query
+tersimpan (fuzzy/query_tersimpan.py), dan perubahan Kelompok serta
+FuzzyParameter dicatat untuk change feed (fuzzy/perubahan.py).
+"""
+
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import naikkan_versi_model, variabel_dari_field
+from .models import FuzzyParameter, Kelompok, KelompokArsip
+from .perubahan import catat_hapus, catat_resync, catat_simpan
+from .query_tersimpan import perbarui_peringkat_kelompok
+
+
+@receiver(post_save, sender=KelompokArsip)
+@receiver(post_delete, sender=KelompokArsip)
+def naikkan_versi_data(sender, **kwargs):
+    """Naikkan versi data saat model yang mempengaruhi seleksi berubah"""
+    naikkan_versi_model(sender)
+
+
+@receiver(post_save, sender=Kelompok)
+def kelompok_disimpan(sender, instance, created, using, **kwargs):
+    """
+    Naikkan versi kelompok hanya untuk variabel yang nilainya berubah,
+    lalu perbarui ranking query tersimpan dan change feed untuk kelompok ini
+    """
+    fields = None if created else instance.field_berubah()
+    variabel = None if fields is None else variabel_dari_field(sender, fields)
+    naikkan_versi_model(sender, variabel)
+    if using == DEFAULT_DB_ALIAS:
+        perbarui_peringkat_kelompok(instance, variabel)
+        catat_simpan(instance)
+    instance.simpan_nilai_awal()
+
+
+@receiver(post_delete, sender=Kelompok)
+def naikkan_versi_kelompok_dihapus(sender, instance, using, **kwargs):
+    """Kelompok dihapus: ranking semua pasangan bisa berubah"""
+    naikkan_versi_model(sender)
+    if using == DEFAULT_DB_ALIAS:
+        catat_hapus(instance.pk)
+
+
+@receiver(post_save, sender=FuzzyParameter)
+@receiver(post_delete, sender=FuzzyParameter)
+def naikkan_versi_parameter(sender, instance, using, **kwargs):
+    """
+    Naikkan versi parameter untuk variabel milik parameter tersebut
+
+    Nilai keanggotaan semua kelompok bisa berubah, sehingga client change
+    feed diminta resync.
+    """
+    variabel = {instance.variabel}
+    nilai_awal = getattr(instance, '_nilai_awal', None)
+    if nilai_awal:
+        variabel.add(nilai_awal['variabel'])
+    naikkan_versi_model(sender, variabel)
+    if using == DEFAULT_DB_ALIAS:
+        catat_resync('parameter')
+    instance.simpan_nilai_awal()
@@ -0,0 +1,195 @@
+"""
+Single-flight untuk SPK Fuzzy Database Model Tahani
+
+Jika banyak request dengan query seleksi yang sama datang bersamaan,
+hanya satu yang benar-benar menjalankan seleksi. Request lain menunggu
+dan memakai hasil yang sama.
+
+- SingleFlight: koordinasi antar thread dalam satu proses
+- SingleFlightAsync: koordinasi antar coroutine dalam satu event loop
+  (view async di server ASGI)
+- hitung_dengan_lock_cache: koordinasi antar worker/proses memakai
+  lock di cache bersama (opsional)
+"""
+
+import asyncio
+import threading
+import time
+
+
+class _Panggilan:
+    """Status satu perhitungan yang sedang berjalan"""
+
+    def __init__(self):
+        self.selesai = threading.Event()
+        self.hasil = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Menggabungkan pemanggilan bersamaan dengan kunci yang sama
+
+    Pemanggil pertama (pemimpin) menjalankan fungsi; pemanggil lain
+    dengan kunci yang sama menunggu dan menerima hasil (atau exception)
+    yang sama.
+
+    Example:
+        >>> sf = SingleFlight()
+        >>> hasil = sf.do('kunci', lambda: hitung_seleksi())
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._panggilan = {}
+
+    def do(self, kunci, fungsi):
+        """
+        Menjalankan fungsi sekali untuk semua pemanggil bersamaan
+
+        Args:
+            kunci (str): Kunci kanonik query
+            fungsi (callable): Fungsi tanpa argumen yang menghitung hasil
+
+        Returns:
+            Hasil fungsi
+        """
+        with self._lock:
+            panggilan = self._panggilan.get(kunci)
+            pemimpin = panggilan is None
+            if pemimpin:
+                panggilan = _Panggilan()
+                self._panggilan[kunci] = panggilan
+
+        if not pemimpin:
+            panggilan.selesai.wait()
+            if panggilan.error is not None:
+                raise panggilan.error
+            return panggilan.hasil
+
+        try:
+            panggilan.hasil = fungsi()
+            return panggilan.hasil
+        except BaseException as e:
+            panggilan.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._panggilan[kunci]
+            panggilan.selesai.set()
+
+    def jumlah_berjalan(self):
+        """Jumlah perhitungan yang sedang berjalan"""
+        with self._lock:
+            return len(self._panggilan)
+
+
+class SingleFlightAsync:
+    """
+    SingleFlight untuk coroutine
+
+    Pemanggil dengan kunci yang sama di event loop yang sama menunggu
+    satu coroutine pemimpin tanpa memblokir event loop. Pemanggil di
+    event loop lain (misalnya view async di bawah WSGI, satu event loop
+    per request) menghitung sendiri.
+
+    Example:
+        >>> sf = SingleFlightAsync()
+        >>> hasil = await sf.do('kunci', lambda: hitung_seleksi_async())
+    """
+
+    def __init__(self):
+        self._panggilan = {}
+
+    async def do(self, kunci, fungsi):
+        """
+        Menjalankan coroutine sekali untuk semua pemanggil bersamaan
+
+        Args:
+            kunci (str): Kunci kanonik query
+            fungsi (callable): Fungsi tanpa argumen yang mengembalikan coroutine
+
+        Returns:
+            Hasil coroutine
+        """
+        loop = asyncio.get_running_loop()
+        kunci_loop = (id(loop), kunci)
+
+        future = self._panggilan.get(kunci_loop)
+        if future is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Pemimpin dibatalkan (client terputus): hitung sendiri
+                if not future.cancelled():
+                    raise
+                return await self.do(kunci, fungsi)
+
+        future = loop.create_future()
+        self._panggilan[kunci_loop] = future
+        try:
+            hasil = await fungsi()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Tandai sudah dibaca agar tidak dilaporkan jika tidak ada penunggu
+            future.exception()
+            raise
+        else:
+            future.set_result(hasil)
+            return hasil
+        finally:
+            del self._panggilan[kunci_loop]
+
+    def jumlah_berjalan(self):
+        """Jumlah perhitungan yang sedang berjalan"""
+        return len(self._panggilan)
+
+
+def hitung_dengan_lock_cache(cache, kunci, hitung, timeout=300, tunggu_maks=30, interval=0.05):
+    """
+    Single-flight antar worker memakai lock di cache bersama
+
+    Worker yang berhasil mengambil lock (cache.add) menghitung hasil dan
+    menyimpannya di `kunci`. Worker lain menunggu sampai hasil tersedia.
+    Jika lock tidak dilepas dalam `tunggu_maks` detik (misalnya worker
+    pemegang lock mati), worker menghitung sendiri.
+
+    Args:
+        cache: Cache Django (sebaiknya backend bersama seperti Redis)
+        kunci (str): Kunci cache hasil
+        hitung (callable): Fungsi tanpa argumen yang menghitung hasil
+        timeout (int): TTL hasil di cache (detik)
+        tunggu_maks (float): Waktu tunggu maksimum (detik)
+        interval (float): Jeda antar pengecekan hasil (detik)
+
+    Returns:
+        Hasil perhitungan (dari worker lain atau dihitung sendiri)
+    """
+    kunci_lock = f'{kunci}:lock'
+    batas = time.monotonic() + tunggu_maks
+    punya_lock = cache.add(kunci_lock, 1, tunggu_maks)
+
+    while not punya_lock:
+        hasil = cache.get(kunci)
+        if hasil is not None:
+            return hasil
+        if time.monotonic() > batas:
+            break
+        time.sleep(interval)
+        punya_lock = cache.add(kunci_lock, 1, tunggu_maks)
+
+    try:
+        if punya_lock:
+            # Worker lain mungkin baru saja selesai sebelum lock diambil
+            hasil = cache.get(kunci)
+            if hasil is not None:
+                return hasil
+        hasil = hitung()
+        cache.set(kunci, hasil, timeout)
+        return hasil
+    finally:
+        if punya_lock:
+            cache.delete(kunci_lock)
@@ -31,9 +31,13 @@ def get_item(dictionary, key):
     if isinstance(dictionary, dict):
         return dictionary.get(key)
     
-    # Jika dictionary adalah list of tuples, convert ke dict dulu
+    # Jika dictionary adalah list of tuples, cari pasangan (key, value)
+    # tanpa membuat dict baru di setiap pemanggilan
     if isinstance(dictionary, (list, tuple)):
-        return dict(dictionary).get(key)
+        for k, v in dictionary:
+            if k == key:
+                return v
+        return None
     
     return None
 
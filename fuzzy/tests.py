@@ -1,3 +1,1706 @@
-from django.test import TestCase
+import asyncio
+import csv
+import json
+import os
+import tempfile
+import threading
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import AsyncRequestFactory, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from . import biner, materialisasi, perubahan, views, views_async
+from .admisi import IterasiDenganIzin, PembatasSeleksi, SeleksiPenuh, ambil_token
+from .cache import get_cache, get_statistik_dashboard, get_versi, kunci_query, seleksi_dengan_cache, tunda_naik_versi
+from .models import (
+    FuzzyParameter,
+    Kelompok,
+    KelompokArsip,
+    LogQuery,
+    PasanganTerhitung,
+    PeringkatTersimpan,
+    PerubahanKelompok,
+    QueryTermaterialisasi,
+    QueryTersimpan,
+    SeleksiJob,
+)
+from .impor import KOLOM_IMPOR, baca_file, format_file, validasi_baris
+from .jobs import antrikan_ulang_macet, buat_job, jalankan_job
+from .models import hitung_usia
+from .paginasi import CursorTidakValid, ambil_halaman, buat_cursor
+from .pasangan import cari_pasangan, refresh_pasangan
+from .query_tersimpan import ambil_peringkat, hitung_ulang_peringkat
+from .seleksi_async import seleksi_fuzzy_async
+from .routers import ReplicaRouter, baca_dari_primary, baca_dari_replica, pilih_replica
+from .singleflight import SingleFlight, SingleFlightAsync, hitung_dengan_lock_cache
+from .utils import (
+    HasilSeleksi,
+    fuzzifikasi_bulk,
+    gabung_hasil_seleksi,
+    hitung_fuzzifikasi_lengkap,
+    seleksi_fuzzy,
+    seleksi_fuzzy_batch,
+    seleksi_fuzzy_lingkup,
+    seleksi_fuzzy_multi_database,
+    seleksi_fuzzy_paralel,
+    seleksi_fuzzy_progres,
+)
+
+
+def buat_kelompok(jumlah=24, awalan='Kelompok', today=None):
+    """Membuat kelompok contoh dengan nilai yang tersebar di semua kategori"""
+    today = today or date.today()
+    return [
+        Kelompok.objects.create(
+            nama=f'{awalan} {i:02d}',
+            tanggal_berdiri=today - timedelta(days=int(365.25 * (i % 10)) + 30),
+            jumlah_anggota=5 + (i * 7) % 36,
+            luas_lahan=round(0.3 + (i * 0.37) % 3.7, 2),
+            frekuensi_bantuan=i % 8,
+            sdm=1 + (i * 3) % 10,
+            unit_usaha=1 + (i * 7) % 10,
+            kas=1 + (i * 5) % 10,
+        )
+        for i in range(jumlah)
+    ]
+
+
+def ringkas(hasil):
+    """(id, fire strength) setiap item hasil seleksi, sesuai urutan"""
+    return [(item['kelompok'].pk, item['fire_strength']) for item in hasil]
+
+
+class FuzzyTestCase(TestCase):
+    """Cache hasil dibersihkan agar tidak terbawa dari test sebelumnya"""
+
+    def setUp(self):
+        get_cache().clear()
+
+
+# =============================================================================
+# user-026: SELEKSI PARALEL PER SHARD
+# =============================================================================
+
+class SeleksiParalelTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        buat_kelompok()
+        self.kriteria = [('sdm', 'baik'), ('kas', 'cukup')]
+
+    def test_hasil_sama_dengan_seleksi_berurutan(self):
+        queryset = Kelompok.objects.order_by('nama', 'id')
+        berurutan = seleksi_fuzzy(list(queryset), self.kriteria, 'OR', paralel=False)
+        paralel = seleksi_fuzzy_paralel(queryset, self.kriteria, 'OR', workers=2, min_baris=0)
+
+        self.assertTrue(berurutan)
+        self.assertEqual(ringkas(paralel), ringkas(berurutan))
+        self.assertEqual(paralel.total, berurutan.total)
+
+    def test_limit_menghitung_total_sebelum_limit(self):
+        queryset = Kelompok.objects.order_by('nama', 'id')
+        semua = seleksi_fuzzy(list(queryset), self.kriteria, 'OR', paralel=False)
+        paralel = seleksi_fuzzy(queryset, self.kriteria, 'OR', paralel=True, limit=3)
+
+        self.assertEqual(ringkas(paralel), ringkas(semua)[:3])
+        self.assertEqual(paralel.total, len(semua))
+
+    def test_kriteria_tidak_valid_ditolak_sebelum_dikirim_ke_worker(self):
+        with self.assertRaises(ValueError):
+            seleksi_fuzzy_paralel(Kelompok.objects.all(), [('kas', 'tidak_ada')], workers=2)
+
+
+# =============================================================================
+# user-027: SELEKSI LINTAS DATABASE
+# =============================================================================
+
+class GabungHasilSeleksiTest(TestCase):
+
+    def test_urut_fire_strength_lalu_nama_dengan_total_semua_sumber(self):
+        def item(nama, fire_strength):
+            return {'kelompok': Kelompok(nama=nama), 'fire_strength': fire_strength}
+
+        hasil = gabung_hasil_seleksi(
+            [
+                HasilSeleksi([item('Beta', 0.9), item('Delta', 0.2)], total=5),
+                HasilSeleksi([item('Alfa', 0.9), item('Gamma', 0.5)], total=3),
+            ],
+            limit=3,
+        )
+
+        self.assertEqual([item['kelompok'].nama for item in hasil], ['Alfa', 'Beta', 'Gamma'])
+        self.assertEqual(hasil.total, 8)
+
+
+class SeleksiMultiDatabaseTest(TransactionTestCase):
+    """Setiap database dibaca di thread sendiri, sehingga data harus sudah commit"""
+
+    def setUp(self):
+        get_cache().clear()
+        buat_kelompok()
+        self.kriteria = [('jumlah_anggota', 'banyak'), ('luas_lahan', 'luas')]
+
+    def test_item_diberi_asal_database_dan_statistik_per_database(self):
+        hasil = seleksi_fuzzy_multi_database(['default'], self.kriteria, 'OR')
+        lokal = seleksi_fuzzy(list(Kelompok.objects.order_by('nama', 'id')), self.kriteria, 'OR')
+
+        self.assertEqual(sorted(ringkas(hasil)), sorted(ringkas(lokal)))
+        self.assertEqual({item['db_alias'] for item in hasil}, {'default'})
+        self.assertEqual(len(hasil.statistik_db), 1)
+        self.assertEqual(hasil.statistik_db[0]['alias'], 'default')
+        self.assertEqual(hasil.statistik_db[0]['total'], lokal.total)
+
+    def test_alias_yang_tidak_dapat_dipilih_ditolak(self):
+        with override_settings(FUZZY_SELEKSI_DATABASES=['default']):
+            with self.assertRaises(ValueError):
+                seleksi_fuzzy_multi_database(['jabar'], self.kriteria)
+
+
+# =============================================================================
+# user-028: ROUTER READ REPLICA
+# =============================================================================
+
+@override_settings(FUZZY_REPLICA_DATABASES=['replica_1', 'replica_2'], FUZZY_REPLICA_MAX_LAG=10)
+class ReplicaRouterTest(TestCase):
+
+    def setUp(self):
+        self.router = ReplicaRouter()
+        self.token = baca_dari_replica.set(True)
+        self.addCleanup(baca_dari_replica.reset, self.token)
+
+    @mock.patch('fuzzy.routers.get_lag_replica', return_value=0.0)
+    def test_baca_bergantian_ke_replica_hanya_jika_request_ditandai(self, _):
+        dipilih = {self.router.db_for_read(Kelompok) for _ in range(4)}
+        self.assertEqual(dipilih, {'replica_1', 'replica_2'})
+
+        baca_dari_replica.set(False)
+        self.assertIsNone(self.router.db_for_read(Kelompok))
+
+    @mock.patch('fuzzy.routers.get_lag_replica', return_value=0.0)
+    def test_model_lain_dan_penulisan_tetap_ke_primary(self, _):
+        self.assertIsNone(self.router.db_for_read(LogQuery))
+        self.assertIsNone(self.router.db_for_write(Kelompok))
+        self.assertIs(self.router.allow_migrate('replica_1', 'fuzzy'), False)
+        self.assertIsNone(self.router.allow_migrate('default', 'fuzzy'))
+
+    def test_replica_tertinggal_dilewati(self):
+        lag = {'replica_1': 60.0, 'replica_2': 1.0}
+        with mock.patch('fuzzy.routers.get_lag_replica', side_effect=lag.get):
+            self.assertEqual({pilih_replica() for _ in range(4)}, {'replica_2'})
+
+        with mock.patch('fuzzy.routers.get_lag_replica', return_value=60.0):
+            self.assertIsNone(pilih_replica())
+
+    @mock.patch('fuzzy.routers.get_lag_replica', return_value=0.0)
+    def test_baca_dari_primary_di_dalam_blok(self, _):
+        with baca_dari_primary():
+            self.assertIsNone(self.router.db_for_read(FuzzyParameter))
+        self.assertIsNotNone(self.router.db_for_read(FuzzyParameter))
+
+
+# =============================================================================
+# user-029: ARSIP KELOMPOK TIDAK AKTIF
+# =============================================================================
+
+class ArsipKelompokTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.kelompok = buat_kelompok(10)
+        self.bubar = self.kelompok[:3]
+        Kelompok.objects.filter(pk__in=[kelompok.pk for kelompok in self.bubar]).update(aktif=False)
+
+    def test_command_memindahkan_kelompok_tidak_aktif_dengan_id_sama(self):
+        call_command('archive_kelompok', batch_size=2, stdout=StringIO())
+
+        ids_bubar = {kelompok.pk for kelompok in self.bubar}
+        self.assertEqual(set(KelompokArsip.objects.values_list('pk', flat=True)), ids_bubar)
+        self.assertFalse(Kelompok.objects.filter(pk__in=ids_bubar).exists())
+        self.assertEqual(Kelompok.objects.count(), 7)
+
+    def test_dry_run_tidak_memindahkan(self):
+        keluaran = StringIO()
+        call_command('archive_kelompok', dry_run=True, stdout=keluaran)
+
+        self.assertIn('3 kelompok akan diarsipkan', keluaran.getvalue())
+        self.assertFalse(KelompokArsip.objects.exists())
+
+    def test_arsip_hanya_dicari_jika_diminta(self):
+        call_command('archive_kelompok', stdout=StringIO())
+        kriteria = [('sdm', 'buruk'), ('sdm', 'sangat_baik')]
+
+        aktif = seleksi_fuzzy_lingkup(kriteria, 'OR')
+        dengan_arsip = seleksi_fuzzy_lingkup(kriteria, 'OR', include_arsip=True)
+
+        self.assertFalse(any(item['kelompok'].is_arsip for item in aktif))
+        arsip = [item['kelompok'].pk for item in dengan_arsip if item['kelompok'].is_arsip]
+        self.assertTrue(arsip)
+        self.assertTrue(set(arsip) <= {kelompok.pk for kelompok in self.bubar})
+        self.assertEqual(dengan_arsip.total, aktif.total + len(arsip))
+
+
+# =============================================================================
+# user-030: CACHE HASIL SELEKSI BERVERSI
+# =============================================================================
+
+class CacheSeleksiTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.kelompok = buat_kelompok(6)
+        self.kriteria = [('kas', 'baik'), ('sdm', 'cukup')]
+        self.dihitung = 0
+
+    def hitung(self):
+        self.dihitung += 1
+        return seleksi_fuzzy(list(Kelompok.objects.order_by('nama', 'id')), self.kriteria, 'OR')
+
+    def seleksi(self, kriteria=None):
+        return seleksi_dengan_cache(self.hitung, kriteria or self.kriteria, 'OR')
+
+    def test_kunci_tidak_bergantung_urutan_kriteria(self):
+        self.assertEqual(
+            kunci_query([('kas', 'baik'), ('sdm', 'cukup')], 'or'),
+            kunci_query([('sdm', 'cukup'), ('kas', 'baik')], 'OR'),
+        )
+        self.assertNotEqual(kunci_query(self.kriteria, 'OR'), kunci_query(self.kriteria, 'AND'))
+
+    def test_cache_hit_tidak_menghitung_ulang(self):
+        pertama = self.seleksi()
+        kedua = self.seleksi(list(reversed(self.kriteria)))
+
+        self.assertEqual(self.dihitung, 1)
+        self.assertEqual(ringkas(kedua), ringkas(pertama))
+        self.assertEqual(list(kedua[0]['membership_values']), ['sdm_cukup', 'kas_baik'])
+
+    def test_simpan_kelompok_menaikkan_versi_dan_membatalkan_cache(self):
+        self.seleksi()
+        versi = get_versi()
+
+        kelompok = self.kelompok[0]
+        kelompok.kas = 10
+        kelompok.save()
+
+        versi_baru = get_versi()
+        self.assertEqual(versi_baru['kelompok'], versi['kelompok'] + 1)
+        self.assertEqual(versi_baru['kelompok:kas'], versi.get('kelompok:kas', 0) + 1)
+        self.assertEqual(versi_baru.get('kelompok:sdm'), versi.get('kelompok:sdm'))
+        self.seleksi()
+        self.assertEqual(self.dihitung, 2)
+
+    def test_update_massal_menaikkan_versi_massal(self):
+        versi = get_versi()
+        Kelompok.objects.filter(pk=self.kelompok[0].pk).update(sdm=2)
+
+        versi_baru = get_versi()
+        self.assertEqual(versi_baru['kelompok:massal'], versi.get('kelompok:massal', 0) + 1)
+        self.assertEqual(versi_baru['kelompok:sdm'], versi.get('kelompok:sdm', 0) + 1)
+
+    def test_tunda_naik_versi_menggabungkan_kenaikan(self):
+        versi = get_versi()
+        with tunda_naik_versi():
+            for kelompok in self.kelompok:
+                kelompok.delete()
+            self.assertEqual(get_versi()['kelompok'], versi['kelompok'])
+        self.assertEqual(get_versi()['kelompok'], versi['kelompok'] + 1)
+
+    def test_kunci_kriteria_usia_berganti_setiap_hari(self):
+        kriteria = [('usia', 'lama')]
+        seleksi_dengan_cache(self.hitung, kriteria)
+        with mock.patch('fuzzy.cache.date') as tanggal:
+            tanggal.today.return_value = date.today() + timedelta(days=1)
+            seleksi_dengan_cache(self.hitung, kriteria)
+        self.assertEqual(self.dihitung, 2)
+
+    def test_cache_miss_dihitung_dari_primary(self):
+        dibaca = []
+
+        def hitung():
+            dibaca.append(baca_dari_replica.get())
+            return self.hitung()
+
+        token = baca_dari_replica.set(True)
+        try:
+            seleksi_dengan_cache(hitung, self.kriteria)
+        finally:
+            baca_dari_replica.reset(token)
+        self.assertEqual(dibaca, [False])
+
+
+# =============================================================================
+# user-031: SINGLE-FLIGHT
+# =============================================================================
+
+class SingleFlightTest(TestCase):
+
+    def jalankan_bersamaan(self, single_flight, fungsi, jumlah=5):
+        """Menjalankan single_flight.do() dari beberapa thread sekaligus"""
+        hasil = [None] * jumlah
+
+        def panggil(i):
+            try:
+                hasil[i] = single_flight.do('kunci', fungsi)
+            except Exception as e:
+                hasil[i] = e
+
+        threads = [threading.Thread(target=panggil, args=(i,)) for i in range(jumlah)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        return hasil
+
+    def fungsi_tertahan(self, lepas, hasil):
+        """Fungsi yang baru selesai setelah semua thread sempat menunggu"""
+        dipanggil = []
+
+        def fungsi():
+            dipanggil.append(1)
+            lepas.wait(5)
+            if isinstance(hasil, Exception):
+                raise hasil
+            return hasil
+
+        return fungsi, dipanggil
+
+    def test_pemanggil_bersamaan_berbagi_satu_perhitungan(self):
+        single_flight = SingleFlight()
+        lepas = threading.Event()
+        fungsi, dipanggil = self.fungsi_tertahan(lepas, ['hasil'])
+        threading.Timer(0.2, lepas.set).start()
+
+        hasil = self.jalankan_bersamaan(single_flight, fungsi)
+
+        self.assertEqual(len(dipanggil), 1)
+        self.assertTrue(all(h is hasil[0] for h in hasil))
+        self.assertEqual(single_flight.jumlah_berjalan(), 0)
+
+    def test_exception_diteruskan_ke_semua_penunggu(self):
+        single_flight = SingleFlight()
+        lepas = threading.Event()
+        fungsi, dipanggil = self.fungsi_tertahan(lepas, ValueError('gagal'))
+        threading.Timer(0.2, lepas.set).start()
+
+        hasil = self.jalankan_bersamaan(single_flight, fungsi)
+
+        self.assertEqual(len(dipanggil), 1)
+        self.assertTrue(all(isinstance(h, ValueError) for h in hasil))
+        # Kunci dilepas sehingga panggilan berikutnya menghitung ulang
+        self.assertEqual(single_flight.do('kunci', lambda: 'baru'), 'baru')
+
+    def test_async_coroutine_bersamaan_berbagi_satu_perhitungan(self):
+        single_flight = SingleFlightAsync()
+        dipanggil = []
+
+        async def fungsi():
+            dipanggil.append(1)
+            await asyncio.sleep(0.05)
+            return 'hasil'
+
+        async def jalankan():
+            return await asyncio.gather(*(single_flight.do('kunci', fungsi) for _ in range(4)))
+
+        self.assertEqual(asyncio.run(jalankan()), ['hasil'] * 4)
+        self.assertEqual(len(dipanggil), 1)
+        self.assertEqual(single_flight.jumlah_berjalan(), 0)
+
+    def test_lock_cache_menunggu_hasil_worker_lain(self):
+        cache = get_cache()
+        cache.clear()
+        cache.add('fuzzy:uji:lock', 1, 5)
+        threading.Timer(0.1, cache.set, args=('fuzzy:uji', 'dari worker lain')).start()
+
+        hasil = hitung_dengan_lock_cache(cache, 'fuzzy:uji', lambda: 'dihitung', tunggu_maks=5, interval=0.01)
+
+        self.assertEqual(hasil, 'dari worker lain')
+
+    def test_lock_cache_menghitung_sendiri_jika_menunggu_terlalu_lama(self):
+        cache = get_cache()
+        cache.clear()
+        cache.add('fuzzy:uji:lock', 1, 5)
+
+        hasil = hitung_dengan_lock_cache(cache, 'fuzzy:uji', lambda: 'dihitung', tunggu_maks=0.05, interval=0.01)
+
+        self.assertEqual(hasil, 'dihitung')
+        self.assertEqual(cache.get('fuzzy:uji'), 'dihitung')
+
+
+# =============================================================================
+# user-032: PASANGAN KRITERIA TERHITUNG
+# =============================================================================
+
+class PasanganTerhitungTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.kelompok = buat_kelompok()
+        refresh_pasangan(semua=True)
+
+    def assertSamaDenganSeleksi(self, kriteria, operator, **kwargs):
+        hasil = cari_pasangan(kriteria, operator, **kwargs)
+        seleksi = seleksi_fuzzy(list(Kelompok.objects.all()), kriteria, operator, **kwargs)
+
+        self.assertIsNotNone(hasil)
+        self.assertEqual(ringkas(hasil), ringkas(seleksi))
+        self.assertEqual(hasil.total, seleksi.total)
+        self.assertEqual(
+            [item['membership_values'] for item in hasil],
+            [item['membership_values'] for item in seleksi],
+        )
+
+    def test_semua_pasangan_dan_operator_disimpan(self):
+        self.assertEqual(PasanganTerhitung.objects.count(), 351 * 2)
+
+    def test_hasil_sama_dengan_seleksi(self):
+        self.assertSamaDenganSeleksi([('kas', 'baik'), ('sdm', 'cukup')], 'AND')
+        self.assertSamaDenganSeleksi([('sdm', 'cukup'), ('kas', 'baik')], 'OR')
+        self.assertSamaDenganSeleksi([('usia', 'lama'), ('luas_lahan', 'luas')], 'OR', alpha=0.3, limit=5)
+
+    def test_selain_dua_kriteria_tidak_dilayani(self):
+        self.assertIsNone(cari_pasangan([('kas', 'baik')], 'AND'))
+        self.assertIsNone(cari_pasangan([('kas', 'baik'), ('kas', 'baik')], 'AND'))
+
+    def test_pasangan_basi_tidak_dipakai_sampai_direfresh(self):
+        kelompok = self.kelompok[0]
+        kelompok.kas = 10
+        kelompok.save()
+
+        self.assertIsNone(cari_pasangan([('kas', 'sangat_baik'), ('sdm', 'buruk')], 'OR'))
+        # Pasangan tanpa variabel kas tidak terpengaruh
+        self.assertIsNotNone(cari_pasangan([('sdm', 'buruk'), ('unit_usaha', 'baik')], 'OR'))
+
+    def test_refresh_inkremental_sama_dengan_hitung_ulang_penuh(self):
+        self.kelompok[0].kas = 10
+        self.kelompok[0].save()
+        self.kelompok[1].delete()
+        Kelompok.objects.create(
+            nama='Kelompok Baru', tanggal_berdiri=date.today() - timedelta(days=800),
+            jumlah_anggota=30, luas_lahan=2.5, frekuensi_bantuan=1, sdm=9, unit_usaha=8, kas=9,
+        )
+
+        with mock.patch('fuzzy.pasangan.hitung_pasangan') as hitung_penuh:
+            self.assertEqual(refresh_pasangan(), 351)
+        hitung_penuh.assert_not_called()
+
+        self.assertSamaDenganSeleksi([('kas', 'sangat_baik'), ('sdm', 'sangat_baik')], 'OR')
+        self.assertSamaDenganSeleksi([('jumlah_anggota', 'banyak'), ('kas', 'baik')], 'AND')
+
+    def test_operasi_massal_dihitung_ulang_penuh(self):
+        Kelompok.objects.filter(pk=self.kelompok[0].pk).update(kas=10)
+
+        with mock.patch('fuzzy.pasangan.hitung_pasangan', return_value=[]) as hitung_penuh:
+            refresh_pasangan()
+        hitung_penuh.assert_called_once()
+
+
+# =============================================================================
+# user-033: LOG DAN MATERIALISASI QUERY POPULER
+# =============================================================================
+
+class MaterialisasiQueryTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        materialisasi._log_tertunda.clear()
+        self.kelompok = buat_kelompok(12)
+        self.kriteria = [('kas', 'baik'), ('sdm', 'cukup'), ('unit_usaha', 'baik')]
+
+    def catat(self, kriteria=None, databases=None, durasi_ms=10.0):
+        materialisasi.catat_query(kriteria or self.kriteria, 'OR', databases, False, 0.0, None, durasi_ms)
+
+    @override_settings(FUZZY_LOG_QUERY_INTERVAL=3600)
+    def test_catatan_digabung_di_memori_sampai_ditulis(self):
+        self.catat(durasi_ms=10.0)
+        self.catat(list(reversed(self.kriteria)), durasi_ms=30.0)
+        self.assertFalse(LogQuery.objects.exists())
+
+        self.assertEqual(materialisasi.tulis_log_query(), 1)
+        log = LogQuery.objects.get()
+        self.assertEqual(log.jumlah, 2)
+        self.assertEqual(log.total_durasi_ms, 40.0)
+        self.assertEqual(log.durasi_maks_ms, 30.0)
+
+        self.catat(durasi_ms=5.0)
+        materialisasi.tulis_log_query()
+        log.refresh_from_db()
+        self.assertEqual(log.jumlah, 3)
+        self.assertEqual(log.durasi_maks_ms, 30.0)
+
+    @override_settings(FUZZY_LOG_QUERY_INTERVAL=0)
+    def test_interval_nol_langsung_ditulis(self):
+        self.catat()
+        self.assertEqual(LogQuery.objects.get().jumlah, 1)
+
+    @override_settings(FUZZY_LOG_QUERY_INTERVAL=0)
+    def test_hanya_query_database_utama_dimaterialisasi(self):
+        self.catat()
+        self.catat(databases=['default'], durasi_ms=100.0)
+
+        populer, dihitung, _ = materialisasi.materialisasi_query_populer(top=5)
+
+        self.assertEqual(len(populer), 1)
+        self.assertEqual(dihitung, 1)
+        self.assertEqual(QueryTermaterialisasi.objects.get().databases, [])
+        self.assertIsNone(materialisasi.cari_materialisasi(self.kriteria, 'OR', databases=['default']))
+
+    @override_settings(FUZZY_LOG_QUERY_INTERVAL=0)
+    def test_hasil_tersimpan_sama_dengan_seleksi_dan_dihitung_ulang_jika_basi(self):
+        self.catat()
+        materialisasi.materialisasi_query_populer(top=5)
+
+        hasil = materialisasi.cari_materialisasi(self.kriteria, 'OR')
+        seleksi = seleksi_fuzzy(list(Kelompok.objects.all()), self.kriteria, 'OR')
+        self.assertEqual(ringkas(hasil), ringkas(seleksi))
+
+        kelompok = self.kelompok[0]
+        kelompok.kas = 10
+        kelompok.save()
+        self.assertIsNone(materialisasi.cari_materialisasi(self.kriteria, 'OR'))
+
+        self.assertEqual(materialisasi.refresh_materialisasi(), 1)
+        hasil = materialisasi.cari_materialisasi(self.kriteria, 'OR')
+        seleksi = seleksi_fuzzy(list(Kelompok.objects.all()), self.kriteria, 'OR')
+        self.assertEqual(ringkas(hasil), ringkas(seleksi))
+
+
+# =============================================================================
+# user-034: ETAG PADA API GET
+# =============================================================================
+
+class EtagApiTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.kelompok = buat_kelompok(8)
+        self.url_seleksi = reverse('fuzzy:api_seleksi') + '?kriteria=kas|baik&kriteria=sdm|cukup&operator=OR'
+
+    def test_api_seleksi_304_sampai_data_berubah(self):
+        response = self.client.get(self.url_seleksi)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        response = self.client.get(self.url_seleksi, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        kelompok = self.kelompok[0]
+        kelompok.kas = 10
+        kelompok.save()
+        response = self.client.get(self.url_seleksi, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_etag_seleksi_berbeda_per_format(self):
+        baris = self.client.get(self.url_seleksi)
+        kolom = self.client.get(self.url_seleksi + '&format=kolom')
+        self.assertNotEqual(baris['ETag'], kolom['ETag'])
+
+    def test_api_kategori_dan_fuzzifikasi(self):
+        url = reverse('fuzzy:api_kategori', args=['kas'])
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        url = reverse('fuzzy:api_fuzzifikasi', args=[self.kelompok[0].pk])
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        # Update massal juga mengubah updated_at, sehingga ETag baris berubah
+        Kelompok.objects.filter(pk=self.kelompok[0].pk).update(kas=10)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+# =============================================================================
+# user-035: QUERY TERSIMPAN
+# =============================================================================
+
+class QueryTersimpanTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.kelompok = buat_kelompok()
+        self.query = QueryTersimpan.objects.create(
+            nama='Kas baik atau SDM cukup',
+            kriteria=[['kas', 'baik'], ['sdm', 'cukup']],
+            operator='OR',
+            alpha=0.2,
+        )
+        hitung_ulang_peringkat(self.query)
+
+    def assertSamaDenganSeleksi(self):
+        hasil = ambil_peringkat(self.query)
+        seleksi = seleksi_fuzzy(
+            list(Kelompok.objects.all()), self.query.get_kriteria(), self.query.operator, alpha=self.query.alpha
+        )
+        self.assertEqual(
+            [(pk, round(fire_strength, 4)) for pk, fire_strength in ringkas(hasil)],
+            [(pk, round(fire_strength, 4)) for pk, fire_strength in ringkas(seleksi)],
+        )
+
+    def test_ranking_sama_dengan_seleksi(self):
+        self.assertTrue(PeringkatTersimpan.objects.filter(query=self.query).exists())
+        self.assertSamaDenganSeleksi()
+
+    def test_simpan_kelompok_memperbarui_ranking_tanpa_hitung_ulang(self):
+        keluar, masuk = self.kelompok[0], self.kelompok[1]
+        keluar.kas, keluar.sdm = 1, 1
+        keluar.save()
+        masuk.kas = 8
+        masuk.save()
+
+        with mock.patch('fuzzy.query_tersimpan.hitung_ulang_peringkat') as hitung_ulang:
+            self.assertSamaDenganSeleksi()
+        hitung_ulang.assert_not_called()
+
+    def test_kelompok_dihapus_ikut_keluar_dari_ranking(self):
+        pk = PeringkatTersimpan.objects.filter(query=self.query).values_list('kelompok_id', flat=True).first()
+        Kelompok.objects.get(pk=pk).delete()
+
+        self.assertNotIn(pk, [item['kelompok'].pk for item in ambil_peringkat(self.query)])
+
+    def test_operasi_massal_membuat_ranking_dihitung_ulang(self):
+        Kelompok.objects.update(kas=8)
+
+        self.assertSamaDenganSeleksi()
+
+    def test_view_simpan_query_menghitung_ranking(self):
+        response = self.client.post(reverse('fuzzy:query_tersimpan_add'), {
+            'nama': 'Lahan luas',
+            'kriteria': ['luas_lahan|luas', 'jumlah_anggota|banyak'],
+            'operator': 'AND',
+        })
+
+        query = QueryTersimpan.objects.get(nama='Lahan luas')
+        self.assertRedirects(response, reverse('fuzzy:query_tersimpan_detail', args=[query.pk]))
+        self.assertEqual(query.get_kriteria(), [('luas_lahan', 'luas'), ('jumlah_anggota', 'banyak')])
+        self.assertIsNotNone(query.tanggal)
+
+
+# =============================================================================
+# user-036: MENGHANGATKAN CACHE SETELAH DEPLOY
+# =============================================================================
+
+@override_settings(FUZZY_LOG_QUERY_INTERVAL=0)
+class WarmFuzzyCachesTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        materialisasi._log_tertunda.clear()
+        buat_kelompok(10)
+        self.kriteria = [('kas', 'baik'), ('sdm', 'cukup'), ('usia', 'lama')]
+        materialisasi.catat_query(self.kriteria, 'AND', None, False, 0.0, None, 50.0)
+        materialisasi.catat_query([('kas', 'baik'), ('sdm', 'cukup')], 'AND', None, False, 0.0, None, 50.0)
+
+    def test_semua_tahap_dihangatkan(self):
+        keluaran = StringIO()
+        call_command('warm_fuzzy_caches', stdout=keluaran)
+
+        self.assertIn('LocMemCache', keluaran.getvalue())
+        self.assertIn('1 hasil query populer di-cache', keluaran.getvalue())
+        self.assertEqual(PasanganTerhitung.objects.count(), 351 * 2)
+
+        hitung = mock.Mock()
+        seleksi_dengan_cache(hitung, self.kriteria, 'AND', databases=[], include_arsip=False)
+        hitung.assert_not_called()
+
+    def test_tahap_dapat_dilewati(self):
+        keluaran = StringIO()
+        call_command('warm_fuzzy_caches', lewati=['pasangan', 'seleksi'], stdout=keluaran)
+
+        self.assertIn('pasangan: dilewati', keluaran.getvalue())
+        self.assertFalse(PasanganTerhitung.objects.exists())
+
+
+# =============================================================================
+# user-037: CACHE FRAGMENT TABEL HASIL
+# =============================================================================
+
+class FragmenSeleksiTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.kelompok = buat_kelompok(10)
+        self.kriteria = [('kas', 'baik'), ('sdm', 'cukup')]
+
+    def kunci(self, kriteria):
+        return views._konteks_fragmen_seleksi(kriteria, 'OR', [], False)['fragmen_kunci']
+
+    def test_kunci_memuat_urutan_kriteria_dan_versi_data(self):
+        kunci = self.kunci(self.kriteria)
+        self.assertEqual(self.kunci(self.kriteria), kunci)
+        self.assertNotEqual(self.kunci(list(reversed(self.kriteria))), kunci)
+
+        kelompok = self.kelompok[0]
+        kelompok.nama = 'Kelompok Diganti'
+        kelompok.save()
+        self.assertNotEqual(self.kunci(self.kriteria), kunci)
+
+    def test_kolom_tabel_mengikuti_urutan_request(self):
+        url = reverse('fuzzy:seleksi_multi')
+        for kriteria in (self.kriteria, list(reversed(self.kriteria))):
+            response = self.client.post(url, {
+                'kriteria': [f'{variabel}|{kategori}' for variabel, kategori in kriteria],
+                'operator': 'OR',
+            })
+            konten = response.content.decode()
+            posisi = [konten.find(f'{variabel} {kategori}') for variabel, kategori in kriteria]
+            self.assertTrue(all(p >= 0 for p in posisi))
+            self.assertEqual(posisi, sorted(posisi))
+
+
+# =============================================================================
+# user-038: STATISTIK DASHBOARD
+# =============================================================================
+
+class StatistikDashboardTest(FuzzyTestCase):
+
+    def test_database_kosong(self):
+        statistik = get_statistik_dashboard()
+        self.assertEqual(statistik['total'], 0)
+        self.assertEqual(statistik['avg_kas'], 0)
+        self.assertEqual(statistik['terbaru'], [])
+
+    def test_rata_rata_dan_kelompok_terbaru(self):
+        kelompok = buat_kelompok(8)
+        statistik = get_statistik_dashboard()
+
+        self.assertEqual(statistik['total'], 8)
+        self.assertAlmostEqual(statistik['avg_sdm'], sum(k.sdm for k in kelompok) / 8)
+        self.assertAlmostEqual(statistik['avg_lahan'], sum(k.luas_lahan for k in kelompok) / 8)
+        self.assertEqual(len(statistik['terbaru']), 5)
+
+    def test_cache_dipakai_sampai_data_berubah(self):
+        kelompok = buat_kelompok(3)
+        get_statistik_dashboard()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(get_statistik_dashboard()['total'], 3)
+
+        kelompok[0].delete()
+        self.assertEqual(get_statistik_dashboard()['total'], 2)
+
+    def test_halaman_dashboard(self):
+        buat_kelompok(3)
+        response = self.client.get(reverse('fuzzy:dashboard'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['statistik']['total'], 3)
+
+    @override_settings(FUZZY_REPLICA_DATABASES=['replica_1'])
+    @mock.patch('fuzzy.routers.get_lag_replica', return_value=0.0)
+    def test_dihitung_dari_primary_walaupun_request_ke_replica(self, _):
+        router = ReplicaRouter()
+        dibaca_dari = []
+
+        def hitung():
+            dibaca_dari.append(router.db_for_read(Kelompok))
+            return {'total': 0}
+
+        token = baca_dari_replica.set(True)
+        self.addCleanup(baca_dari_replica.reset, token)
+        self.assertEqual(router.db_for_read(Kelompok), 'replica_1')
+        with mock.patch('fuzzy.utils.hitung_statistik_dashboard', side_effect=hitung):
+            get_statistik_dashboard()
+
+        # Versi di kunci cache dibaca dari primary, statistiknya juga
+        self.assertEqual(dibaca_dari, [None])
+
+
+# =============================================================================
+# user-039: KEYSET PAGINATION DAFTAR KELOMPOK
+# =============================================================================
+
+class KeysetPaginationTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        buat_kelompok(23)
+
+    def semua_halaman(self, **params):
+        """Mengikuti cursor next sampai halaman terakhir"""
+        halaman_list = [ambil_halaman(dict(params))]
+        while halaman_list[-1]['next']:
+            halaman_list.append(ambil_halaman(dict(params, cursor=halaman_list[-1]['next'])))
+        return halaman_list
+
+    def test_cursor_next_melewati_semua_baris_tanpa_duplikat(self):
+        # kas hanya 10 nilai berbeda, sehingga banyak baris bernilai sama
+        halaman_list = self.semua_halaman(urut='-kas', per_halaman=5)
+        ids = [baris['pk'] for halaman in halaman_list for baris in halaman['baris']]
+
+        self.assertEqual(ids, list(Kelompok.objects.order_by('-kas', '-pk').values_list('pk', flat=True)))
+        self.assertEqual(len(halaman_list), 5)
+        self.assertIsNone(halaman_list[0]['previous'])
+
+    def test_cursor_previous_kembali_ke_halaman_sebelumnya(self):
+        halaman_list = self.semua_halaman(urut='usia', per_halaman=4)
+        sebelumnya = ambil_halaman({'urut': 'usia', 'per_halaman': 4, 'cursor': halaman_list[2]['previous']})
+
+        self.assertEqual(sebelumnya['baris'], halaman_list[1]['baris'])
+        self.assertEqual(sebelumnya['next'], halaman_list[1]['next'])
+
+    def test_filter_rentang(self):
+        halaman = ambil_halaman({'usia_min': '2', 'usia_max': '4', 'sdm_min': '3', 'per_halaman': 100})
+
+        self.assertTrue(halaman['baris'])
+        for baris in halaman['baris']:
+            self.assertTrue(2 <= hitung_usia(baris['tanggal_berdiri']) <= 4)
+            self.assertGreaterEqual(baris['sdm'], 3)
+        self.assertEqual(
+            len(halaman['baris']),
+            sum(1 for k in Kelompok.objects.all() if 2 <= k.usia <= 4 and k.sdm >= 3),
+        )
+
+    def test_cursor_tidak_valid(self):
+        with self.assertRaises(CursorTidakValid):
+            ambil_halaman({'cursor': 'bukan-cursor'})
+        with self.assertRaises(CursorTidakValid):
+            ambil_halaman({'urut': 'kas', 'cursor': buat_cursor('n', 'nama', 'Kelompok 01', 1)})
+        with self.assertRaises(CursorTidakValid):
+            ambil_halaman({'urut': 'tidak_ada'})
+
+    def test_api_kelompok(self):
+        response = self.client.get(reverse('fuzzy:api_kelompok'), {'per_halaman': 10})
+        data = response.json()
+        self.assertEqual(len(data['results']), 10)
+        self.assertIsNotNone(data['next'])
+
+        response = self.client.get(reverse('fuzzy:api_kelompok'), {'cursor': 'rusak'})
+        self.assertEqual(response.status_code, 400)
+
+
+# =============================================================================
+# user-040: FORMAT KOLOM API SELEKSI
+# =============================================================================
+
+class FormatKolomApiTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        buat_kelompok(12)
+        self.kriteria = [['kas', 'baik'], ['sdm', 'cukup']]
+
+    def post(self, **data):
+        return self.client.post(
+            reverse('fuzzy:api_seleksi'),
+            json.dumps(dict({'kriteria': self.kriteria, 'operator': 'OR'}, **data)),
+            content_type='application/json',
+        )
+
+    def test_kolom_berisi_nilai_yang_sama_dengan_format_baris(self):
+        baris = self.post().json()
+        kolom = self.post(format='kolom').json()
+
+        self.assertEqual(kolom['format'], 'kolom')
+        self.assertEqual(kolom['total'], baris['total'])
+        self.assertEqual(kolom['jumlah'], len(baris['hasil']))
+        hasil = kolom['hasil']
+        self.assertEqual(hasil['ids'], [item['id'] for item in baris['hasil']])
+        self.assertEqual(hasil['nama'], [item['nama'] for item in baris['hasil']])
+        self.assertEqual(hasil['fire_strength'], [item['fire_strength'] for item in baris['hasil']])
+        self.assertEqual(
+            hasil['mu']['sdm_cukup'],
+            [item['membership_values']['sdm_cukup']['membership'] for item in baris['hasil']],
+        )
+        self.assertEqual(list(hasil['mu']), ['kas_baik', 'sdm_cukup'])
+
+    def test_hanya_kolom_yang_diminta(self):
+        hasil = self.post(format='kolom', fields=['ids', 'mu.kas_baik']).json()['hasil']
+        self.assertEqual(set(hasil), {'ids', 'mu'})
+        self.assertEqual(list(hasil['mu']), ['kas_baik'])
+
+        response = self.client.get(
+            reverse('fuzzy:api_seleksi'),
+            {'kriteria': ['kas|baik'], 'format': 'kolom', 'fields': 'nama,fire_strength'},
+        )
+        self.assertEqual(set(response.json()['hasil']), {'nama', 'fire_strength'})
+
+    def test_format_atau_kolom_tidak_valid(self):
+        self.assertEqual(self.post(format='tabel').status_code, 400)
+        self.assertEqual(self.post(format='kolom', fields=['mu.usia_baru']).status_code, 400)
+
+
+# =============================================================================
+# user-041: API SELEKSI BATCH
+# =============================================================================
+
+class SeleksiBatchTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        buat_kelompok()
+        self.query_list = [
+            {'kriteria': [('kas', 'baik'), ('sdm', 'cukup')], 'operator': 'AND', 'alpha': 0.0, 'limit': None},
+            {'kriteria': [('sdm', 'cukup'), ('usia', 'lama')], 'operator': 'OR', 'alpha': 0.3, 'limit': 4},
+            {'kriteria': [('luas_lahan', 'luas')], 'operator': 'OR', 'alpha': 0.0, 'limit': None},
+        ]
+
+    def test_hasil_setiap_query_sama_dengan_seleksi(self):
+        hasil_list, info = seleksi_fuzzy_batch(self.query_list)
+        semua = list(Kelompok.objects.all())
+
+        self.assertEqual(info['jumlah_baris'], 24)
+        # sdm_cukup dipakai dua query tetapi hanya dihitung sekali
+        self.assertEqual(info['jumlah_kolom'], 4)
+        for query, (hasil, _) in zip(self.query_list, hasil_list):
+            seleksi = seleksi_fuzzy(
+                semua, query['kriteria'], query['operator'], alpha=query['alpha'], limit=query['limit']
+            )
+            self.assertEqual(ringkas(hasil), ringkas(seleksi))
+            self.assertEqual(hasil.total, seleksi.total)
+
+    def test_api_batch(self):
+        response = self.client.post(
+            reverse('fuzzy:api_seleksi_batch'),
+            json.dumps({'queries': [
+                {'kriteria': [['kas', 'baik']], 'operator': 'OR'},
+                {'kriteria': [['sdm', 'cukup'], ['usia', 'lama']], 'format': 'kolom', 'fields': ['ids']},
+            ]}),
+            content_type='application/json',
+        )
+
+        data = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([hasil['format'] for hasil in data['hasil']], ['baris', 'kolom'])
+        self.assertEqual(list(data['hasil'][1]['hasil']), ['ids'])
+        self.assertEqual(data['jumlah_kolom'], 3)
+
+    def test_query_tidak_valid_ditolak_dengan_nomornya(self):
+        response = self.client.post(
+            reverse('fuzzy:api_seleksi_batch'),
+            json.dumps({'queries': [{'kriteria': [['kas', 'baik']]}, {'kriteria': [['kas']]}]}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Query #1', response.json()['error'])
+
+        response = self.client.post(
+            reverse('fuzzy:api_seleksi_batch'), json.dumps({'queries': []}), content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_operator_dan_kategori_tidak_dikenal_ditolak(self):
+        for query in ({'kriteria': [['kas', 'baik']], 'operator': 'XOR'}, {'kriteria': [['kas', 'lama']]}):
+            response = self.client.post(
+                reverse('fuzzy:api_seleksi_batch'),
+                json.dumps({'queries': [{'kriteria': [['sdm', 'cukup']]}, query]}),
+                content_type='application/json',
+            )
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('Query #1', response.json()['error'])
+
+
+# =============================================================================
+# user-042: FUZZIFIKASI BULK (NDJSON)
+# =============================================================================
+
+class FuzzifikasiBulkTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.kelompok = buat_kelompok(12)
+        self.url = reverse('fuzzy:api_fuzzifikasi_bulk')
+
+    def baca_ndjson(self, response):
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        return [json.loads(baris) for baris in b''.join(response.streaming_content).splitlines()]
+
+    def test_sama_dengan_fuzzifikasi_per_kelompok(self):
+        hasil = list(fuzzifikasi_bulk(Kelompok.objects.all(), batch=5))
+
+        self.assertEqual([data['id'] for data, _ in hasil], sorted(k.pk for k in self.kelompok))
+        for (data, memberships), kelompok in zip(hasil, sorted(self.kelompok, key=lambda k: k.pk)):
+            lengkap = hitung_fuzzifikasi_lengkap(kelompok)
+            self.assertEqual(memberships, lengkap['memberships'])
+            self.assertEqual(data['kas'], lengkap['data']['kas'])
+
+    def test_api_memilih_kelompok(self):
+        ids = [self.kelompok[3].pk, self.kelompok[1].pk]
+        baris = self.baca_ndjson(self.client.get(self.url, {'ids': ','.join(map(str, ids))}))
+        self.assertEqual([b['data']['id'] for b in baris], sorted(ids))
+
+        tunggal = self.client.get(reverse('fuzzy:api_fuzzifikasi', args=[ids[0]])).json()
+        self.assertEqual(baris[-1]['memberships'], tunggal['memberships'])
+
+        baris = self.baca_ndjson(self.client.get(self.url, {'id_min': self.kelompok[10].pk}))
+        self.assertEqual(len(baris), 2)
+
+        self.assertEqual(len(self.baca_ndjson(self.client.get(self.url, {'semua': '1'}))), 12)
+
+    def test_tanpa_pilihan_ditolak(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'ids': 'a,b'}).status_code, 400)
+
+
+# =============================================================================
+# user-043: FORMAT BINER
+# =============================================================================
+
+class FormatBinerTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        buat_kelompok()
+        self.kriteria = [['sdm', 'cukup'], ['kas', 'baik']]
+
+    def post_seleksi(self, accept=biner.CONTENT_TYPE, **data):
+        return self.client.post(
+            reverse('fuzzy:api_seleksi'),
+            json.dumps(dict({'kriteria': self.kriteria, 'operator': 'OR', 'limit': 10}, **data)),
+            content_type='application/json',
+            HTTP_ACCEPT=accept,
+        )
+
+    def test_seleksi_biner_sama_dengan_json(self):
+        response = self.post_seleksi()
+        self.assertEqual(response['Content-Type'], biner.CONTENT_TYPE)
+        data = biner.baca(response.content)
+        json_hasil = self.post_seleksi(accept='application/json').json()
+
+        self.assertEqual(data['jenis'], biner.JENIS_SELEKSI)
+        self.assertEqual(data['total'], json_hasil['total'])
+        self.assertEqual(data['ids'].tolist(), [item['id'] for item in json_hasil['hasil']])
+        for nilai, item in zip(data['fire_strength'].tolist(), json_hasil['hasil']):
+            self.assertAlmostEqual(nilai, item['fire_strength'], places=5)
+        # Kolom keanggotaan mengikuti urutan kriteria request
+        self.assertEqual(list(data['mu']), ['sdm_cukup', 'kas_baik'])
+        for nilai, item in zip(data['mu']['kas_baik'].tolist(), json_hasil['hasil']):
+            self.assertAlmostEqual(nilai, item['membership_values']['kas_baik']['membership'], places=4)
+
+    def test_seleksi_biner_tanpa_object_kelompok(self):
+        with mock.patch.object(Kelompok, 'from_db', side_effect=AssertionError('object Kelompok dibuat')):
+            response = self.post_seleksi()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(biner.baca(response.content)['ids']), 10)
+
+    def test_biner_hanya_untuk_database_utama(self):
+        self.assertEqual(self.post_seleksi(include_arsip=True).status_code, 406)
+
+    def test_fuzzifikasi_bulk_biner_sama_dengan_ndjson(self):
+        url = reverse('fuzzy:api_fuzzifikasi_bulk')
+        data = biner.baca(self.client.get(url, {'semua': '1'}, HTTP_ACCEPT=biner.CONTENT_TYPE).content)
+        baris_list = [
+            json.loads(baris)
+            for baris in b''.join(self.client.get(url, {'semua': '1'}).streaming_content).splitlines()
+        ]
+
+        self.assertEqual(data['jenis'], biner.JENIS_FUZZIFIKASI)
+        self.assertIsNone(data['fire_strength'])
+        self.assertEqual(len(data['mu']), 27)
+        self.assertEqual(data['ids'].tolist(), [baris['data']['id'] for baris in baris_list])
+        for i, baris in enumerate(baris_list):
+            for variabel, nilai_kategori in baris['memberships'].items():
+                for kategori, nilai in nilai_kategori.items():
+                    self.assertAlmostEqual(data['mu'][f'{variabel}_{kategori}'][i], nilai, places=5)
+
+    def test_buffer_tidak_valid(self):
+        with self.assertRaises(biner.FormatBinerTidakValid):
+            biner.baca(b'FZTB')
+        with self.assertRaises(biner.FormatBinerTidakValid):
+            biner.baca(b'XXXX' + bytes(28))
+
+
+# =============================================================================
+# user-044: EKSPOR CSV HASIL SELEKSI
+# =============================================================================
+
+class EksporCsvTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.kelompok = buat_kelompok()
+        self.kriteria = [('kas', 'baik'), ('sdm', 'cukup')]
+
+    def ekspor(self, **params):
+        params = dict({'kriteria': [f'{v}|{k}' for v, k in self.kriteria], 'operator': 'OR'}, **params)
+        response = self.client.get(reverse('fuzzy:seleksi_export'), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('attachment; filename="seleksi_or_', response['Content-Disposition'])
+        teks = b''.join(response.streaming_content).decode('utf-8')
+        self.assertTrue(teks.startswith('\ufeff'))
+        return list(csv.reader(teks[1:].splitlines()))
+
+    def test_baris_sesuai_urutan_seleksi(self):
+        header, *baris_list = self.ekspor()
+        seleksi = seleksi_fuzzy(list(Kelompok.objects.all()), self.kriteria, 'OR')
+
+        self.assertEqual(header[:3], ['Peringkat', 'ID', 'Nama Kelompok'])
+        self.assertEqual(header[-1], 'Fire Strength')
+        self.assertEqual(len(header), 3 + 2 * len(self.kriteria) + 1)
+        self.assertEqual([int(baris[1]) for baris in baris_list], [pk for pk, _ in ringkas(seleksi)])
+        for baris, item in zip(baris_list, seleksi):
+            self.assertAlmostEqual(float(baris[-1]), item['fire_strength'], places=4)
+
+    def test_alpha_dan_limit(self):
+        _, *baris_list = self.ekspor(alpha='0.5', limit='3')
+        self.assertLessEqual(len(baris_list), 3)
+        self.assertTrue(all(float(baris[-1]) >= 0.5 for baris in baris_list))
+
+    def test_kolom_arsip(self):
+        Kelompok.objects.filter(pk=self.kelompok[0].pk).update(aktif=False)
+        call_command('archive_kelompok', stdout=StringIO())
+        self.kriteria = [('sdm', 'buruk'), ('sdm', 'sangat_baik')]
+
+        header, *baris_list = self.ekspor(include_arsip='1')
+
+        self.assertEqual(header[3], 'Arsip')
+        self.assertEqual({baris[3] for baris in baris_list}, {'', 'ya'})
+
+    def test_kriteria_tidak_valid_ditolak_sebelum_stream(self):
+        response = self.client.get(reverse('fuzzy:seleksi_export'), {'kriteria': 'kas|sedang'})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(reverse('fuzzy:seleksi_export'))
+        self.assertEqual(response.status_code, 400)
+
+
+# =============================================================================
+# user-045: VIEW ASYNC
+# =============================================================================
+
+class ViewAsyncTest(FuzzyTestCase):
+    """
+    View async dipanggil langsung karena urls.py memilih modul view saat
+    import; view sync dipanggil lewat async_client sebagai pembanding
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.kelompok = buat_kelompok()
+        self.factory = AsyncRequestFactory()
+        self.kriteria = [('kas', 'baik'), ('sdm', 'cukup'), ('usia', 'lama')]
+
+    async def test_seleksi_async_sama_dengan_seleksi(self):
+        hasil = await seleksi_fuzzy_async(self.kriteria, 'OR', alpha=0.1, limit=7, batch=5)
+        semua = [kelompok async for kelompok in Kelompok.objects.all()]
+        seleksi = seleksi_fuzzy(semua, self.kriteria, 'OR', alpha=0.1, limit=7)
+
+        self.assertEqual(ringkas(hasil), ringkas(seleksi))
+        self.assertEqual(hasil.total, seleksi.total)
+
+    async def test_api_seleksi_sama_dengan_view_sync(self):
+        body = json.dumps({'kriteria': self.kriteria, 'operator': 'AND', 'limit': 5})
+        response = await views_async.api_seleksi(
+            self.factory.post('/api/seleksi/', body, content_type='application/json')
+        )
+        sync = await self.async_client.post(reverse('fuzzy:api_seleksi'), body, content_type='application/json')
+
+        self.assertEqual(json.loads(response.content), sync.json())
+
+    async def test_api_fuzzifikasi_dengan_etag(self):
+        pk = self.kelompok[0].pk
+        response = await views_async.api_fuzzifikasi(self.factory.get('/'), pk=pk)
+        sync = await self.async_client.get(reverse('fuzzy:api_fuzzifikasi', args=[pk]))
+
+        self.assertEqual(json.loads(response.content), sync.json())
+        self.assertEqual(response['ETag'], sync['ETag'])
+
+        response = await views_async.api_fuzzifikasi(self.factory.get('/', headers={'If-None-Match': sync['ETag']}), pk=pk)
+        self.assertEqual(response.status_code, 304)
+
+    async def test_api_seleksi_kriteria_tidak_valid(self):
+        body = json.dumps({'kriteria': [['kas', 'sedang']]})
+        response = await views_async.api_seleksi(
+            self.factory.post('/api/seleksi/', body, content_type='application/json')
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+# =============================================================================
+# user-046: SELEKSI BACKGROUND (JOB)
+# =============================================================================
+
+@override_settings(FUZZY_JOB_WORKERS=0, FUZZY_JOB_MACET_MENIT=60)
+class SeleksiJobTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.kelompok = buat_kelompok()
+        self.kriteria = [('kas', 'baik'), ('sdm', 'cukup'), ('usia', 'lama')]
+
+    def test_query_sama_memakai_job_yang_sama(self):
+        job = buat_job(self.kriteria, 'OR')
+        self.assertEqual(buat_job(list(reversed(self.kriteria)), 'or').pk, job.pk)
+
+        self.assertTrue(jalankan_job(job.pk))
+        self.assertFalse(jalankan_job(job.pk))
+        self.assertEqual(buat_job(self.kriteria, 'OR').pk, job.pk)
+
+        kelompok = self.kelompok[0]
+        kelompok.kas = 10
+        kelompok.save()
+        self.assertNotEqual(buat_job(self.kriteria, 'OR').pk, job.pk)
+
+    def test_hasil_job_sama_dengan_seleksi(self):
+        job = buat_job(self.kriteria, 'OR', alpha=0.2)
+        jalankan_job(job.pk)
+        job.refresh_from_db()
+        seleksi = seleksi_fuzzy(list(Kelompok.objects.all()), self.kriteria, 'OR', alpha=0.2)
+
+        self.assertEqual(job.status, SeleksiJob.STATUS_SELESAI)
+        self.assertEqual(job.total, seleksi.total)
+        self.assertEqual(
+            list(job.hasil.order_by('peringkat').values_list('kelompok_id', flat=True)),
+            [pk for pk, _ in ringkas(seleksi)],
+        )
+
+    def test_job_macet_diganti_job_baru(self):
+        lama = buat_job(self.kriteria, 'AND')
+        SeleksiJob.objects.filter(pk=lama.pk).update(created_at=timezone.now() - timedelta(minutes=61))
+
+        baru = buat_job(self.kriteria, 'AND')
+
+        self.assertNotEqual(baru.pk, lama.pk)
+        lama.refresh_from_db()
+        self.assertEqual(lama.status, SeleksiJob.STATUS_GAGAL)
+        self.assertIn('macet', lama.error)
+
+    def test_job_berjalan_terlalu_lama_diantrikan_ulang(self):
+        job = buat_job(self.kriteria, 'AND')
+        SeleksiJob.objects.filter(pk=job.pk).update(
+            status=SeleksiJob.STATUS_BERJALAN, mulai_at=timezone.now() - timedelta(minutes=90)
+        )
+
+        self.assertEqual(antrikan_ulang_macet(60), 1)
+        self.assertTrue(jalankan_job(job.pk))
+
+    def test_kriteria_tidak_valid_ditolak_saat_mendaftar(self):
+        with self.assertRaises(ValueError):
+            buat_job([('kas', 'sedang')])
+        self.assertFalse(SeleksiJob.objects.exists())
+
+    def test_api_job(self):
+        response = self.client.post(
+            reverse('fuzzy:api_seleksi'),
+            json.dumps({'kriteria': self.kriteria, 'operator': 'OR', 'async': True}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 202)
+        status = response.json()
+        self.assertEqual(response['Location'], status['status_url'])
+
+        url_hasil = reverse('fuzzy:api_seleksi_job_hasil', args=[status['job_id']])
+        self.assertEqual(self.client.get(url_hasil).status_code, 409)
+
+        jalankan_job(status['job_id'])
+        status = self.client.get(response['Location']).json()
+        self.assertEqual(status['status'], SeleksiJob.STATUS_SELESAI)
+
+        halaman = self.client.get(status['hasil_url'], {'halaman': 2, 'per_halaman': 5}).json()
+        self.assertEqual([item['peringkat'] for item in halaman['hasil']], [6, 7, 8, 9, 10])
+        self.assertEqual(halaman['jumlah_halaman'], -(-status['total'] // 5))
+
+
+# =============================================================================
+# user-047: PROGRES SELEKSI (SERVER-SENT EVENTS)
+# =============================================================================
+
+class SeleksiStreamTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        buat_kelompok()
+        self.kriteria = [('kas', 'baik'), ('sdm', 'cukup'), ('usia', 'lama')]
+
+    def baca_event(self, response):
+        """[(event, data)] dari response text/event-stream"""
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        teks = b''.join(response.streaming_content).decode('utf-8')
+        event_list = []
+        for blok in teks.strip().split('\n\n'):
+            baris = dict(b.split(': ', 1) for b in blok.splitlines())
+            event_list.append((baris['event'], json.loads(baris['data'])))
+        return event_list
+
+    def stream(self, kriteria, operator='OR', **params):
+        return self.client.get(reverse('fuzzy:seleksi_stream'), dict({
+            'kriteria': [f'{v}|{k}' for v, k in kriteria], 'operator': operator,
+        }, **params))
+
+    def test_progres_per_potongan_sama_dengan_hasil_akhir(self):
+        progres_list = list(seleksi_fuzzy_progres(self.kriteria, 'OR', batch=5, top=3))
+        seleksi = seleksi_fuzzy(list(Kelompok.objects.all()), self.kriteria, 'OR')
+
+        # Progres awal mengirim jumlah baris sebelum scan dimulai
+        self.assertEqual([progres['diproses'] for progres in progres_list], [0, 5, 10, 15, 20, 24])
+        self.assertEqual(ringkas(progres_list[-1]['hasil']), ringkas(seleksi))
+        self.assertEqual([item['id'] for item in progres_list[-1]['teratas']], [pk for pk, _ in ringkas(seleksi)[:3]])
+
+    def test_stream_diakhiri_event_selesai_dan_hasil_masuk_cache(self):
+        event_list = self.baca_event(self.stream(self.kriteria))
+
+        self.assertEqual(event_list[-1][0], 'selesai')
+        self.assertTrue(all(event == 'progres' for event, _ in event_list[:-1]))
+        progres = event_list[-2][1]
+        self.assertEqual(progres['diproses'], progres['jumlah_baris'])
+        self.assertEqual(event_list[-1][1]['total'], progres['cocok'])
+
+        hitung = mock.Mock()
+        seleksi_dengan_cache(hitung, self.kriteria, 'OR', databases=[], include_arsip=False)
+        hitung.assert_not_called()
+
+    def test_pasangan_terhitung_dikirim_tanpa_scan(self):
+        refresh_pasangan(semua=True)
+        with mock.patch('fuzzy.views.seleksi_fuzzy_progres') as progres:
+            event_list = self.baca_event(self.stream(self.kriteria[:2]))
+        progres.assert_not_called()
+        self.assertEqual([event for event, _ in event_list], ['progres', 'selesai'])
+
+    def test_request_tidak_valid(self):
+        self.assertEqual(self.stream([('kas', 'sedang')]).status_code, 400)
+        self.assertEqual(self.stream(self.kriteria, include_arsip='1').status_code, 400)
+
+
+# =============================================================================
+# user-048: ADMISSION CONTROL SELEKSI
+# =============================================================================
+
+class PembatasSeleksiTest(TestCase):
+
+    def test_slot_kosong_langsung_diterima(self):
+        pembatas = PembatasSeleksi(2, 0, 1)
+        mulai = [pembatas.masuk(), pembatas.masuk()]
+
+        self.assertEqual(pembatas.statistik()['berjalan'], 2)
+        for nilai in mulai:
+            pembatas.keluar(nilai)
+        statistik = pembatas.statistik()
+        self.assertEqual((statistik['berjalan'], statistik['diterima']), (0, 2))
+        self.assertIsNotNone(statistik['durasi_rata_ms'])
+
+    def test_antrian_penuh_dan_timeout_ditolak(self):
+        pembatas = PembatasSeleksi(1, 0, 1)
+        pembatas.masuk()
+        with self.assertRaises(SeleksiPenuh) as konteks:
+            pembatas.masuk()
+        self.assertEqual(konteks.exception.alasan, 'antrian_penuh')
+        self.assertGreaterEqual(konteks.exception.retry_after, 1)
+
+        pembatas = PembatasSeleksi(1, 1, 0.05)
+        pembatas.masuk()
+        with self.assertRaises(SeleksiPenuh) as konteks:
+            pembatas.masuk()
+        self.assertEqual(konteks.exception.alasan, 'timeout')
+        statistik = pembatas.statistik()
+        self.assertEqual(statistik['menunggu'], 0)
+        self.assertEqual(statistik['ditolak']['timeout'], 1)
+
+    def test_menunggu_sampai_slot_dilepas(self):
+        pembatas = PembatasSeleksi(1, 1, 5)
+        mulai = pembatas.masuk()
+        threading.Timer(0.1, pembatas.keluar, args=(mulai,)).start()
+
+        pembatas.keluar(pembatas.masuk())
+
+        statistik = pembatas.statistik()
+        self.assertEqual(statistik['menunggu_puncak'], 1)
+        self.assertEqual(statistik['diterima'], 2)
+        self.assertGreater(statistik['tunggu_rata_ms'], 0)
+
+    def test_async_timeout_tanpa_memblokir(self):
+        pembatas = PembatasSeleksi(1, 1, 0.05)
+        pembatas.masuk()
+
+        with self.assertRaises(SeleksiPenuh):
+            asyncio.run(pembatas.masuk_async())
+        self.assertEqual(pembatas.statistik()['menunggu'], 0)
+
+    def test_token_bucket(self):
+        cache = get_cache()
+        cache.clear()
+        self.assertEqual([ambil_token(cache, 1, 2, kunci='fuzzy:uji:token') for _ in range(2)], [0.0, 0.0])
+        self.assertGreater(ambil_token(cache, 1, 2, kunci='fuzzy:uji:token'), 0)
+
+
+class AdmisiSeleksiViewTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        buat_kelompok(6)
+        self.pembatas = PembatasSeleksi(1, 0, 0.01)
+        patcher = mock.patch('fuzzy.admisi._pembatas', self.pembatas)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_server_penuh_dijawab_429(self):
+        self.pembatas.masuk()
+        response = self.client.post(
+            reverse('fuzzy:api_seleksi'),
+            json.dumps({'kriteria': [['kas', 'baik'], ['sdm', 'cukup'], ['usia', 'lama']]}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.json()['alasan'], 'antrian_penuh')
+        self.assertEqual(response['Retry-After'], str(response.json()['retry_after']))
+        self.assertEqual(self.client.get(reverse('fuzzy:api_admisi')).json()['ditolak']['antrian_penuh'], 1)
+
+    def test_izin_stream_dilepas_saat_response_ditutup(self):
+        isi = IterasiDenganIzin(iter(['a', 'b']), self.pembatas.masuk())
+        self.assertEqual(next(isi), 'a')
+        isi.close()
+        isi.close()
+        self.assertEqual(self.pembatas.statistik()['berjalan'], 0)
+
+
+# =============================================================================
+# user-049: CHANGE FEED KELOMPOK
+# =============================================================================
+
+class ChangeFeedTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.kelompok = buat_kelompok(6)
+        self.url = reverse('fuzzy:api_perubahan')
+
+    def ambil(self, cursor=None, **params):
+        if cursor:
+            params['cursor'] = cursor
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_request_pertama_resync(self):
+        hasil = self.ambil()
+        self.assertTrue(hasil['resync'])
+        self.assertEqual(hasil['resync_url'], reverse('fuzzy:api_fuzzifikasi_bulk') + '?semua=1')
+        self.assertEqual(hasil['perubahan'], [])
+
+    def test_simpan_dan_hapus_sejak_cursor(self):
+        cursor = self.ambil()['cursor']
+        baru = Kelompok.objects.create(
+            nama='Kelompok Baru', tanggal_berdiri=date.today() - timedelta(days=800),
+            jumlah_anggota=20, luas_lahan=1.5, frekuensi_bantuan=2, sdm=6, unit_usaha=5, kas=7,
+        )
+        self.kelompok[0].kas = 9
+        self.kelompok[0].save()
+        dihapus = self.kelompok[1].pk
+        self.kelompok[1].delete()
+
+        hasil = self.ambil(cursor)
+        self.assertFalse(hasil['resync'])
+        self.assertFalse(hasil['ada_lagi'])
+        self.assertEqual(
+            [(item['jenis'], item['id']) for item in hasil['perubahan']],
+            [('simpan', baru.pk), ('simpan', self.kelompok[0].pk), ('hapus', dihapus)],
+        )
+        simpan = hasil['perubahan'][1]
+        self.assertEqual(simpan['data']['kas'], 9)
+        self.assertEqual(simpan['memberships'], hitung_fuzzifikasi_lengkap(Kelompok.objects.get(pk=simpan['id']))['memberships'])
+        self.assertNotIn('data', hasil['perubahan'][2])
+
+        self.assertEqual(self.ambil(hasil['cursor'])['perubahan'], [])
+
+    def test_kompaksi_satu_entri_per_kelompok(self):
+        cursor = self.ambil()['cursor']
+        kelompok = self.kelompok[2]
+        for kas in (3, 4, 5):
+            kelompok.kas = kas
+            kelompok.save()
+
+        self.assertEqual(PerubahanKelompok.objects.filter(kelompok_id=kelompok.pk).count(), 1)
+        hasil = self.ambil(cursor)
+        self.assertEqual(len(hasil['perubahan']), 1)
+        self.assertEqual(hasil['perubahan'][0]['data']['kas'], 5)
+
+    def test_halaman_dengan_limit(self):
+        cursor = self.ambil()['cursor']
+        for kelompok in self.kelompok:
+            kelompok.sdm = 10
+            kelompok.save()
+
+        diterima = []
+        ada_lagi = True
+        while ada_lagi:
+            hasil = self.ambil(cursor, limit=4)
+            self.assertLessEqual(len(hasil['perubahan']), 4)
+            diterima.extend(item['id'] for item in hasil['perubahan'])
+            cursor, ada_lagi = hasil['cursor'], hasil['ada_lagi']
+        self.assertEqual(diterima, [kelompok.pk for kelompok in self.kelompok])
+
+    def test_update_massal_meminta_resync(self):
+        cursor = self.ambil()['cursor']
+        Kelompok.objects.filter(pk=self.kelompok[0].pk).update(kas=2)
+
+        # Entri sebelum resync tidak diperlukan lagi
+        self.assertEqual(list(PerubahanKelompok.objects.values_list('jenis', flat=True)), ['resync'])
+        hasil = self.ambil(cursor)
+        self.assertTrue(hasil['resync'])
+        self.assertFalse(self.ambil(hasil['cursor'])['resync'])
+
+    def test_parameter_berubah_meminta_resync(self):
+        cursor = self.ambil()['cursor']
+        FuzzyParameter.objects.create(
+            variabel='kas', kategori='uji', tipe_fungsi='bahu_kiri', param_a=1, param_b=2,
+        )
+        self.assertTrue(self.ambil(cursor)['resync'])
+
+    def test_usia_berubah_sejak_tanggal_cursor(self):
+        today = date.today()
+        berulang_tahun = Kelompok.objects.create(
+            nama='Kelompok Ulang Tahun', tanggal_berdiri=today - timedelta(days=366),
+            jumlah_anggota=20, luas_lahan=1.5, frekuensi_bantuan=2, sdm=6, unit_usaha=5, kas=7,
+        )
+        cursor = perubahan.buat_cursor(perubahan.urutan_terakhir(), today - timedelta(days=10))
+
+        hasil = self.ambil(cursor)
+        self.assertEqual(hasil['tanggal'], today.isoformat())
+        self.assertTrue(hasil['ada_lagi'])
+        self.assertEqual([(item['id'], item['urutan']) for item in hasil['perubahan']], [(berulang_tahun.pk, None)])
+
+        cursor_lama = perubahan.buat_cursor(perubahan.urutan_terakhir(), today - timedelta(days=400))
+        self.assertTrue(self.ambil(cursor_lama)['resync'])
+
+    def test_cursor_tidak_valid(self):
+        self.assertEqual(self.client.get(self.url, {'cursor': 'rusak!'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'limit': 'x'}).status_code, 400)
+        with self.assertRaises(CursorTidakValid):
+            perubahan.baca_cursor(perubahan.buat_cursor(1, date.today())[:-2])
+
+
+# =============================================================================
+# user-050: IMPORT KELOMPOK
+# =============================================================================
+
+class ImportKelompokTest(FuzzyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.kelompok = buat_kelompok(3)
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.folder = folder.name
+
+    def tulis_csv(self, baris_list, nama='kelompok.csv'):
+        path = os.path.join(self.folder, nama)
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=KOLOM_IMPOR)
+            writer.writeheader()
+            writer.writerows(baris_list)
+        return path
+
+    def baris(self, nama, **kolom):
+        baris = {
+            'nama': nama,
+            'tanggal_berdiri': '2019-03-01',
+            'jumlah_anggota': 20,
+            'luas_lahan': 1.5,
+            'frekuensi_bantuan': 2,
+            'sdm': 6,
+            'unit_usaha': 5,
+            'kas': 7,
+            'aktif': '',
+        }
+        baris.update(kolom)
+        return baris
+
+    def impor(self, path, *args):
+        stdout = StringIO()
+        call_command('import_kelompok', path, *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_upsert_berdasarkan_nama(self):
+        path = self.tulis_csv([
+            self.baris('Kelompok 00', kas=2),
+            self.baris('Kelompok Baru A'),
+            self.baris('Kelompok Baru B', aktif='tidak'),
+        ])
+
+        keluaran = self.impor(path)
+
+        self.assertIn('Berhasil mengimport 3 kelompok', keluaran)
+        self.assertEqual(Kelompok.objects.count(), 5)
+        self.assertEqual(Kelompok.objects.get(pk=self.kelompok[0].pk).kas, 2)
+        self.assertEqual(Kelompok.objects.get(nama='Kelompok Baru A').tanggal_berdiri, date(2019, 3, 1))
+        self.assertTrue(Kelompok.objects.get(nama='Kelompok Baru A').aktif)
+        self.assertFalse(Kelompok.objects.get(nama='Kelompok Baru B').aktif)
+
+    def test_baris_tidak_valid_dilewati(self):
+        path = self.tulis_csv([
+            self.baris('Kelompok Valid'),
+            self.baris('Kelompok Rusak', kas='banyak'),
+            self.baris('', sdm=4),
+        ])
+
+        keluaran = self.impor(path)
+
+        self.assertIn('Baris 3: kas:', keluaran)
+        self.assertIn('Baris 4: nama:', keluaran)
+        self.assertIn('2 baris tidak valid dilewati', keluaran)
+        self.assertTrue(Kelompok.objects.filter(nama='Kelompok Valid').exists())
+        self.assertFalse(Kelompok.objects.filter(nama='Kelompok Rusak').exists())
+
+    def test_nama_ganda_dalam_batch_baris_terakhir_dipakai(self):
+        path = self.tulis_csv([self.baris('Kelompok Ganda', kas=3), self.baris('Kelompok Ganda', kas=8)])
+        self.impor(path)
+        self.assertEqual(Kelompok.objects.get(nama='Kelompok Ganda').kas, 8)
+
+    def test_dry_run_tidak_menyimpan(self):
+        path = self.tulis_csv([self.baris('Kelompok Baru'), self.baris('Kelompok 01', kas='x')])
+
+        keluaran = self.impor(path, '--dry-run')
+
+        self.assertIn('1 dari 2 baris valid, 1 tidak valid', keluaran)
+        self.assertEqual(Kelompok.objects.count(), 3)
+
+    def test_versi_naik_sekali_untuk_semua_batch(self):
+        path = self.tulis_csv([self.baris(f'Kelompok Impor {i}') for i in range(5)])
+        versi = get_versi()
+
+        self.impor(path, '--batch-size', '2')
+
+        self.assertEqual(Kelompok.objects.count(), 8)
+        self.assertEqual(get_versi()['kelompok'], versi['kelompok'] + 1)
+
+    def test_json_lines(self):
+        path = os.path.join(self.folder, 'kelompok.ndjson')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(self.baris('Kelompok JSON', aktif=False)) + '\n\nbukan json\n')
+
+        hasil = list(validasi_baris(baca_file(path, format_file(path))))
+
+        self.assertEqual([(nomor, error is None) for nomor, _, error in hasil], [(1, True), (3, False)])
+        self.assertFalse(hasil[0][1]['aktif'])
+
+    def test_format_tidak_dikenal(self):
+        path = os.path.join(self.folder, 'kelompok.xlsx')
+        with self.assertRaises(ValueError):
+            format_file(path)
+        with self.assertRaises(CommandError):
+            self.impor(path)
+
+
+class MigrasiNamaUnikTest(TransactionTestCase):
+    sebelum = [('fuzzy', '0011_perubahan_kelompok')]
+
+    def setUp(self):
+        self.terbaru = MigrationExecutor(connection).loader.graph.leaf_nodes('fuzzy')
+        self.addCleanup(self.migrasi, self.terbaru)
+
+    def migrasi(self, target):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(target)
+        return executor.loader.project_state(target).apps
+
+    def test_nama_ganda_diganti_tanpa_bentrok(self):
+        apps = self.migrasi(self.sebelum)
+        Kelompok = apps.get_model('fuzzy', 'Kelompok')
+        data = {
+            'tanggal_berdiri': date(2019, 3, 1), 'jumlah_anggota': 20, 'luas_lahan': 1.5,
+            'frekuensi_bantuan': 2, 'sdm': 6, 'unit_usaha': 5, 'kas': 7,
+        }
+        pertama = Kelompok.objects.create(nama='X', **data)
+        kedua = Kelompok.objects.create(nama='X', **data)
+        Kelompok.objects.create(nama=f'X #{kedua.pk}', **data)
+
+        with self.assertLogs('fuzzy.migrations.0012_kelompok_nama_unik', 'WARNING') as log:
+            self.migrasi(self.terbaru)
+
+        self.assertEqual(Kelompok.objects.get(pk=pertama.pk).nama, 'X')
+        self.assertEqual(Kelompok.objects.get(pk=kedua.pk).nama, f'X #{kedua.pk}-2')
+        self.assertIn(f'X #{kedua.pk}-2', log.output[0])
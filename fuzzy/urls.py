@@ -11,13 +11,29 @@ URL Patterns:
 - /seleksi/and/         : Seleksi fuzzy AND
 - /seleksi/or/          : Seleksi fuzzy OR
 - /seleksi/multi/       : Seleksi fuzzy multi-kriteria
+- /seleksi/export/      : Ekspor hasil seleksi ke CSV (streaming)
+- /seleksi/stream/      : Progres seleksi multi-kriteria (server-sent events)
+- /query/               : Daftar query tersimpan
+- /query/<id>/          : Ranking query tersimpan
+- /api/kelompok/        : API daftar kelompok (keyset pagination)
+- /api/kelompok/perubahan/: API change feed kelompok (sinkronisasi inkremental)
 - /api/kategori/<var>/  : API kategori per variabel
 - /api/fuzzifikasi/<id>/: API fuzzifikasi kelompok
-- /api/seleksi/         : API seleksi fuzzy
+- /api/fuzzifikasi/bulk/: API fuzzifikasi banyak kelompok (stream NDJSON)
+- /api/seleksi/         : API seleksi fuzzy (POST JSON, atau GET dengan ETag)
+- /api/seleksi/batch/   : API banyak query seleksi sekaligus (POST JSON)
+- /api/seleksi/job/<id>/: API status seleksi background (async=true)
+- /api/seleksi/job/<id>/hasil/: API hasil seleksi background per halaman
+- /api/admisi/          : API statistik antrian dan penolakan seleksi
 """
 
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import views, views_async
+
+# Halaman seleksi dan API seleksi/fuzzifikasi/kategori versi async untuk
+# server ASGI (lihat fuzzy/views_async.py)
+views_seleksi = views_async if getattr(settings, 'FUZZY_ASYNC_VIEWS', False) else views
 
 app_name = 'fuzzy'
 
@@ -33,14 +49,29 @@ urlpatterns = [
     path('kelompok/<int:pk>/delete/', views.kelompok_delete, name='kelompok_delete'),
     
     # Seleksi Fuzzy
-    path('seleksi/and/', views.seleksi_and, name='seleksi_and'),
-    path('seleksi/or/', views.seleksi_or, name='seleksi_or'),
-    path('seleksi/multi/', views.seleksi_multi, name='seleksi_multi'),
+    path('seleksi/and/', views_seleksi.seleksi_and, name='seleksi_and'),
+    path('seleksi/or/', views_seleksi.seleksi_or, name='seleksi_or'),
+    path('seleksi/multi/', views_seleksi.seleksi_multi, name='seleksi_multi'),
+    path('seleksi/export/', views.seleksi_export, name='seleksi_export'),
+    path('seleksi/stream/', views.seleksi_stream, name='seleksi_stream'),
+    
+    # Query Tersimpan
+    path('query/', views.query_tersimpan_list, name='query_tersimpan_list'),
+    path('query/simpan/', views.query_tersimpan_add, name='query_tersimpan_add'),
+    path('query/<int:pk>/', views.query_tersimpan_detail, name='query_tersimpan_detail'),
+    path('query/<int:pk>/delete/', views.query_tersimpan_delete, name='query_tersimpan_delete'),
     
     # API Endpoints
-    path('api/kategori/<str:variabel>/', views.api_kategori, name='api_kategori'),
-    path('api/fuzzifikasi/<int:pk>/', views.api_fuzzifikasi, name='api_fuzzifikasi'),
-    path('api/seleksi/', views.api_seleksi, name='api_seleksi'),
+    path('api/kelompok/', views.api_kelompok, name='api_kelompok'),
+    path('api/kelompok/perubahan/', views.api_perubahan, name='api_perubahan'),
+    path('api/kategori/<str:variabel>/', views_seleksi.api_kategori, name='api_kategori'),
+    path('api/fuzzifikasi/<int:pk>/', views_seleksi.api_fuzzifikasi, name='api_fuzzifikasi'),
+    path('api/fuzzifikasi/bulk/', views.api_fuzzifikasi_bulk, name='api_fuzzifikasi_bulk'),
+    path('api/seleksi/', views_seleksi.api_seleksi, name='api_seleksi'),
+    path('api/seleksi/batch/', views.api_seleksi_batch, name='api_seleksi_batch'),
+    path('api/seleksi/job/<int:pk>/', views.api_seleksi_job, name='api_seleksi_job'),
+    path('api/seleksi/job/<int:pk>/hasil/', views.api_seleksi_job_hasil, name='api_seleksi_job_hasil'),
+    path('api/admisi/', views.api_admisi, name='api_admisi'),
     
     # Pengaturan Parameter Fuzzy
     path('parameter/', views.parameter_list, name='parameter_list'),
@@ -15,6 +15,18 @@ Fungsi keanggotaan yang diimplementasikan:
 5. SDM/Unit Usaha/Kas: buruk, kurang, cukup, baik, sangat_baik
 """
 
+import heapq
+import math
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date
+from itertools import islice
+
+from django.conf import settings
+from django.db.models import Avg, Count
+
 
 # =============================================================================
 # FUNGSI UNTUK LOAD PARAMETER DARI DATABASE
@@ -92,6 +104,17 @@ SKOR_PARAMS = {
     'sangat_baik': {'a': 7, 'b': 10}
 }
 
+# Parameter default untuk setiap variabel
+DEFAULT_PARAMS_VARIABEL = {
+    'usia': USIA_PARAMS,
+    'frekuensi_bantuan': FREKUENSI_PARAMS,
+    'luas_lahan': LUAS_LAHAN_PARAMS,
+    'jumlah_anggota': JUMLAH_ANGGOTA_PARAMS,
+    'sdm': SKOR_PARAMS,
+    'unit_usaha': SKOR_PARAMS,
+    'kas': SKOR_PARAMS,
+}
+
 
 # =============================================================================
 # FUNGSI KEANGGOTAAN DASAR
@@ -709,6 +732,189 @@ def get_all_membership_values(kelompok_data):
     return hasil
 
 
+# =============================================================================
+# SNAPSHOT PARAMETER & EVALUATOR
+# =============================================================================
+
+# Kolom Kelompok yang dibaca saat seleksi berbasis baris (values_list)
+KOLOM_KELOMPOK = (
+    'id',
+    'nama',
+    'tanggal_berdiri',
+    'jumlah_anggota',
+    'luas_lahan',
+    'frekuensi_bantuan',
+    'sdm',
+    'unit_usaha',
+    'kas',
+)
+
+
+def get_tipe_fungsi(variabel, kategori):
+    """
+    Menentukan tipe fungsi keanggotaan untuk sebuah kategori
+    
+    Sama dengan fungsi mu_* di atas: kategori pertama memakai bahu kiri,
+    kategori terakhir bahu kanan, dan sisanya segitiga.
+    
+    Args:
+        variabel (str): Nama variabel
+        kategori (str): Nama kategori
+    
+    Returns:
+        str: 'bahu_kiri', 'segitiga' atau 'bahu_kanan'
+    """
+    kategori_list = [k for k, _ in KATEGORI_VARIABEL[variabel]]
+    if kategori == kategori_list[0]:
+        return 'bahu_kiri'
+    if kategori == kategori_list[-1]:
+        return 'bahu_kanan'
+    return 'segitiga'
+
+
+def get_parameter_snapshot():
+    """
+    Mengambil semua parameter membership function sekaligus
+    
+    Berbeda dengan get_parameter_value() yang melakukan satu query per
+    pemanggilan, fungsi ini hanya menjalankan satu query untuk seluruh
+    parameter. Parameter yang belum ada di database memakai nilai default.
+    
+    Returns:
+        dict: {variabel: {kategori: {'a': x, 'b': y, 'c': z (optional)}}}
+    """
+    snapshot = {
+        variabel: {kategori: dict(params) for kategori, params in default_params.items()}
+        for variabel, default_params in DEFAULT_PARAMS_VARIABEL.items()
+    }
+    
+    try:
+        from .models import FuzzyParameter
+        
+        for param in FuzzyParameter.objects.all():
+            if param.variabel in snapshot:
+                snapshot[param.variabel][param.kategori] = param.get_params_dict()
+    except Exception:
+        # Jika error (misal: tabel belum ada), gunakan default
+        pass
+    
+    return snapshot
+
+
+def buat_fungsi_keanggotaan(variabel, kategori, snapshot):
+    """
+    Membuat fungsi keanggotaan dengan parameter yang sudah terikat
+    
+    Args:
+        variabel (str): Nama variabel
+        kategori (str): Nama kategori
+        snapshot (dict): Hasil get_parameter_snapshot()
+    
+    Returns:
+        callable: Fungsi f(nilai_crisp) -> nilai keanggotaan (0-1)
+    """
+    if variabel not in MEMBERSHIP_FUNCTIONS:
+        raise ValueError(f"Variabel '{variabel}' tidak valid")
+    
+    if kategori not in MEMBERSHIP_FUNCTIONS[variabel]:
+        raise ValueError(f"Kategori '{kategori}' tidak valid untuk variabel '{variabel}'")
+    
+    params = snapshot[variabel][kategori]
+    tipe_fungsi = get_tipe_fungsi(variabel, kategori)
+    a, b = params['a'], params['b']
+    
+    if tipe_fungsi == 'bahu_kiri':
+        return lambda x: fungsi_bahu_kiri(x, a, b)
+    if tipe_fungsi == 'bahu_kanan':
+        return lambda x: fungsi_bahu_kanan(x, a, b)
+    
+    c = params['c']
+    return lambda x: fungsi_segitiga(x, a, b, c)
+
+
+def data_dari_baris(baris, today=None):
+    """
+    Mengubah satu baris values_list(*KOLOM_KELOMPOK) menjadi data dict
+    
+    Hasilnya sama dengan Kelompok.get_data_dict() tanpa perlu membuat
+    object model.
+    
+    Args:
+        baris (tuple): Nilai kolom sesuai urutan KOLOM_KELOMPOK
+        today (date): Tanggal acuan untuk menghitung usia
+    
+    Returns:
+        dict: Data kelompok
+    """
+    from .models import hitung_usia
+    
+    data = dict(zip(KOLOM_KELOMPOK, baris))
+    data['usia'] = hitung_usia(data.pop('tanggal_berdiri'), today)
+    return data
+
+
+def evaluasi_baris(baris_list, kriteria, operator='AND', snapshot=None, alpha=0.0):
+    """
+    Menghitung fire strength untuk setiap baris kelompok
+    
+    Args:
+        baris_list (iterable): Baris values_list(*KOLOM_KELOMPOK)
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        snapshot (dict): Snapshot parameter (default: diambil dari database)
+        alpha (float): Batas minimum fire strength (alpha-cut)
+    
+    Yields:
+        tuple: (data, membership_values, fire_strength) untuk fire strength > 0
+               dan >= alpha
+    """
+    if snapshot is None:
+        snapshot = get_parameter_snapshot()
+    
+    evaluator = [
+        (variabel, buat_fungsi_keanggotaan(variabel, kategori, snapshot))
+        for variabel, kategori in kriteria
+    ]
+    gabung = fire_strength_and if operator.upper() == 'AND' else fire_strength_or
+    today = date.today()
+    
+    for baris in baris_list:
+        data = data_dari_baris(baris, today)
+        membership_values = [fungsi(data.get(variabel, 0)) for variabel, fungsi in evaluator]
+        fire_strength = gabung(*membership_values)
+        
+        if fire_strength > 0 and fire_strength >= alpha:
+            yield data, membership_values, fire_strength
+
+
+def buat_item_hasil(kelompok_obj, data, kriteria, membership_values, fire_strength):
+    """
+    Menyusun satu item hasil seleksi dengan format seleksi_fuzzy()
+    
+    Args:
+        kelompok_obj: Object Kelompok (atau dict) yang ditampilkan
+        data (dict): Data crisp kelompok
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        membership_values (list): Nilai keanggotaan sesuai urutan kriteria
+        fire_strength (float): Nilai fire strength
+    
+    Returns:
+        dict: Item hasil seleksi
+    """
+    detail_membership = {}
+    for (variabel, kategori), mu in zip(kriteria, membership_values):
+        detail_membership[f"{variabel}_{kategori}"] = {
+            'nilai_crisp': data.get(variabel, 0),
+            'membership': round(mu, 4)
+        }
+    
+    return {
+        'kelompok': kelompok_obj,
+        'membership_values': detail_membership,
+        'fire_strength': round(fire_strength, 4)
+    }
+
+
 # =============================================================================
 # FUNGSI FIRE STRENGTH (OPERATOR FUZZY)
 # =============================================================================
@@ -771,26 +977,74 @@ def fire_strength_or(*membership_values):
 # FUNGSI SELEKSI FUZZY
 # =============================================================================
 
-def seleksi_fuzzy(kelompok_list, kriteria, operator='AND'):
+class HasilSeleksi(list):
+    """
+    List hasil seleksi fuzzy
+    
+    Sama seperti list biasa, ditambah atribut `total` yang berisi
+    jumlah seluruh kelompok dengan fire strength > 0 (sebelum limit).
+    """
+    
+    def __init__(self, items=(), total=None, statistik_db=None):
+        super().__init__(items)
+        self.total = len(self) if total is None else total
+        self.statistik_db = statistik_db or []
+
+
+class RankingSeleksi(list):
+    """
+    Ranking ringkas hasil seleksi fuzzy
+    
+    List [(id, membership_values, fire_strength), ...] urut berdasarkan
+    fire strength, tanpa object model maupun dict per kelompok. Nilai
+    keanggotaan mengikuti urutan `kriteria` query yang menghitungnya,
+    dan `total` berisi jumlah kelompok yang cocok sebelum limit.
+    """
+    
+    def __init__(self, items=(), total=None, kriteria=()):
+        super().__init__(items)
+        self.total = len(self) if total is None else total
+        self.kriteria = list(kriteria)
+
+
+def seleksi_fuzzy(kelompok_list, kriteria, operator='AND', paralel=None, workers=None, limit=None, alpha=0.0):
     """
     Melakukan seleksi fuzzy terhadap daftar kelompok
     
     Fungsi ini menghitung fire strength untuk setiap kelompok
     berdasarkan kriteria yang diberikan dan operator yang dipilih.
     
+    Jika mode paralel aktif dan kelompok_list berupa QuerySet, seleksi
+    dijalankan oleh seleksi_fuzzy_paralel().
+    
     Args:
         kelompok_list (list): List of Kelompok objects atau dict
         kriteria (list): List of tuples [(variabel, kategori), ...]
         operator (str): 'AND' atau 'OR'
+        paralel (bool): Mode paralel (default: aktif jika
+                        settings.FUZZY_PARALEL_WORKERS > 0)
+        workers (int): Jumlah proses worker untuk mode paralel
+        limit (int): Jumlah maksimum hasil (default: semua)
+        alpha (float): Batas minimum fire strength (alpha-cut, default: 0)
     
     Returns:
-        list: List of dict berisi hasil seleksi dengan fire strength > 0,
-              diurutkan dari terbesar ke terkecil
+        HasilSeleksi: List of dict berisi hasil seleksi dengan fire strength > 0
+                      (dan >= alpha), diurutkan dari terbesar ke terkecil
     
     Example:
         >>> kriteria = [('usia', 'baru'), ('luas_lahan', 'luas')]
         >>> hasil = seleksi_fuzzy(kelompok_list, kriteria, 'AND')
     """
+    from django.db.models import QuerySet
+    
+    if paralel is None:
+        paralel = getattr(settings, 'FUZZY_PARALEL_WORKERS', 0) > 0
+    
+    if paralel and isinstance(kelompok_list, QuerySet):
+        return seleksi_fuzzy_paralel(
+            kelompok_list, kriteria, operator, workers=workers, limit=limit, alpha=alpha
+        )
+    
     hasil = []
     
     for kelompok in kelompok_list:
@@ -821,8 +1075,8 @@ def seleksi_fuzzy(kelompok_list, kriteria, operator='AND'):
         else:
             fire_strength = fire_strength_or(*membership_values)
         
-        # Hanya tambahkan jika fire strength > 0
-        if fire_strength > 0:
+        # Hanya tambahkan jika fire strength > 0 dan memenuhi alpha-cut
+        if fire_strength > 0 and fire_strength >= alpha:
             hasil.append({
                 'kelompok': kelompok_obj,  # Gunakan object asli
                 'membership_values': detail_membership,
@@ -832,7 +1086,240 @@ def seleksi_fuzzy(kelompok_list, kriteria, operator='AND'):
     # Urutkan dari fire strength terbesar ke terkecil
     hasil.sort(key=lambda x: x['fire_strength'], reverse=True)
     
-    return hasil
+    total = len(hasil)
+    if limit is not None:
+        hasil = hasil[:limit]
+    
+    return HasilSeleksi(hasil, total)
+
+
+def gabung_hasil_seleksi(hasil_list, limit=None):
+    """
+    Menggabungkan beberapa hasil seleksi menjadi satu ranking
+    
+    Dipakai untuk menggabungkan hasil dari tabel Kelompok dan arsip,
+    atau dari beberapa database.
+    
+    Args:
+        hasil_list (list): List of HasilSeleksi
+        limit (int): Jumlah maksimum hasil gabungan (default: semua)
+    
+    Returns:
+        HasilSeleksi: Hasil gabungan, diurutkan dari fire strength terbesar
+    """
+    gabungan = [item for hasil in hasil_list for item in hasil]
+    gabungan.sort(key=lambda x: (-x['fire_strength'], x['kelompok'].nama))
+    if limit is not None:
+        gabungan = gabungan[:limit]
+    
+    return HasilSeleksi(
+        gabungan,
+        sum(getattr(hasil, 'total', len(hasil)) for hasil in hasil_list)
+    )
+
+
+# =============================================================================
+# SELEKSI PARALEL (SHARDING BERDASARKAN RENTANG ID)
+# =============================================================================
+
+# Jumlah baris yang diambil per round-trip database saat membaca shard
+BATCH_BARIS_SHARD = 2000
+
+_process_pool = None
+_process_pool_workers = 0
+_process_pool_lock = threading.Lock()
+
+
+def _inisialisasi_worker():
+    """
+    Initializer proses worker
+    
+    Proses worker dibuat dengan metode 'spawn' sehingga tidak mewarisi
+    koneksi database dari proses induk. Django di-setup ulang dan setiap
+    worker membuka koneksi database sendiri saat query pertama.
+    """
+    import django
+    from django.apps import apps
+    
+    if not apps.ready:
+        django.setup()
+
+
+def _get_process_pool(workers):
+    """
+    Mengambil (atau membuat) ProcessPoolExecutor bersama
+    
+    Pool dibuat sekali per proses dan dipakai ulang agar biaya startup
+    worker tidak dibayar di setiap seleksi.
+    """
+    global _process_pool, _process_pool_workers
+    
+    with _process_pool_lock:
+        if _process_pool is None or _process_pool_workers != workers:
+            if _process_pool is not None:
+                _process_pool.shutdown(wait=False)
+            _process_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_inisialisasi_worker,
+            )
+            _process_pool_workers = workers
+        return _process_pool
+
+
+def _bisa_paralel(alias):
+    """
+    Cek apakah database `alias` dapat dibaca dari proses lain
+    
+    Database SQLite in-memory (misalnya saat testing) dan query di dalam
+    transaksi yang belum di-commit tidak terlihat oleh proses worker.
+    """
+    from django.db import connections
+    
+    connection = connections[alias]
+    if connection.in_atomic_block:
+        return False
+    if connection.vendor == 'sqlite':
+        return not connection.is_in_memory_db()
+    return True
+
+
+def _kunci_urutan(entri):
+    """Kunci pengurutan hasil shard: fire strength terbesar, lalu nama"""
+    fire_strength, data, _ = entri
+    return (-fire_strength, data['nama'], data['id'])
+
+
+def _evaluasi_shard(tugas):
+    """
+    Mengevaluasi satu shard (rentang id) kelompok
+    
+    Dijalankan di proses worker (atau in-process untuk data kecil).
+    
+    Args:
+        tugas (tuple): (model_label, alias, query, id_awal, id_akhir,
+                        kriteria, operator, snapshot, limit, alpha)
+    
+    Returns:
+        tuple: (total, top) dengan total = jumlah kelompok dengan fire
+               strength > 0 di shard ini dan top = list terurut berisi
+               (fire_strength, data, membership_values) maksimal `limit` item
+    """
+    from django.apps import apps
+    
+    (model_label, alias, query, id_awal, id_akhir,
+     kriteria, operator, snapshot, limit, alpha) = tugas
+    
+    model = apps.get_model(model_label)
+    queryset = model._default_manager.using(alias).all()
+    queryset.query = query
+    baris_list = (
+        queryset.filter(pk__gte=id_awal, pk__lte=id_akhir)
+        .values_list(*KOLOM_KELOMPOK)
+        .iterator(chunk_size=BATCH_BARIS_SHARD)
+    )
+    
+    total = 0
+    heap = []
+    hasil = evaluasi_baris(baris_list, kriteria, operator, snapshot, alpha)
+    
+    for urutan, (data, membership_values, fire_strength) in enumerate(hasil):
+        total += 1
+        # -urutan: untuk fire strength sama, baris yang lebih dulu menang
+        entri = (round(fire_strength, 4), -urutan, data, membership_values)
+        
+        if limit is None or len(heap) < limit:
+            heapq.heappush(heap, entri)
+        else:
+            heapq.heappushpop(heap, entri)
+    
+    top = [(fire_strength, data, mus) for fire_strength, _, data, mus in heap]
+    top.sort(key=_kunci_urutan)
+    
+    return total, top
+
+
+def seleksi_fuzzy_paralel(queryset, kriteria, operator='AND', workers=None, limit=None, min_baris=None, alpha=0.0):
+    """
+    Seleksi fuzzy paralel untuk tabel Kelompok yang besar
+    
+    Rentang id dibagi menjadi beberapa shard, setiap shard dievaluasi oleh
+    proses worker (ProcessPoolExecutor) yang membuka koneksi database
+    sendiri. Hasil top-k dan jumlah per shard kemudian digabungkan.
+    
+    Jika jumlah baris di bawah `min_baris`, seleksi dijalankan in-process
+    agar query kecil tidak membayar biaya pool.
+    
+    Args:
+        queryset (QuerySet): QuerySet Kelompok yang akan diseleksi
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        workers (int): Jumlah proses worker
+                       (default: settings.FUZZY_PARALEL_WORKERS)
+        limit (int): Jumlah maksimum hasil (default: semua)
+        min_baris (int): Batas minimum baris untuk mode paralel
+                         (default: settings.FUZZY_PARALEL_MIN_BARIS)
+        alpha (float): Batas minimum fire strength (alpha-cut)
+    
+    Returns:
+        HasilSeleksi: Hasil seleksi dengan format yang sama dengan seleksi_fuzzy()
+    """
+    from django.db.models import Count, Max, Min
+    
+    if workers is None:
+        workers = getattr(settings, 'FUZZY_PARALEL_WORKERS', 0) or 1
+    if min_baris is None:
+        min_baris = getattr(settings, 'FUZZY_PARALEL_MIN_BARIS', 50000)
+    
+    snapshot = get_parameter_snapshot()
+    
+    # Validasi kriteria sebelum mengirim tugas ke worker
+    for variabel, kategori in kriteria:
+        buat_fungsi_keanggotaan(variabel, kategori, snapshot)
+    
+    alias = queryset.db
+    rentang = queryset.aggregate(
+        jumlah=Count('pk'), id_awal=Min('pk'), id_akhir=Max('pk')
+    )
+    if not rentang['jumlah']:
+        return HasilSeleksi()
+    
+    id_awal, id_akhir = rentang['id_awal'], rentang['id_akhir']
+    tugas_dasar = (queryset.model._meta.label, alias, queryset.query)
+    tugas_akhir = (kriteria, operator, snapshot, limit, alpha)
+    
+    if workers <= 1 or rentang['jumlah'] < min_baris or not _bisa_paralel(alias):
+        hasil_shard = [_evaluasi_shard(tugas_dasar + (id_awal, id_akhir) + tugas_akhir)]
+    else:
+        # Dua shard per worker agar beban lebih merata
+        jumlah_shard = workers * 2
+        lebar = math.ceil((id_akhir - id_awal + 1) / jumlah_shard)
+        tugas_list = [
+            tugas_dasar + (awal, min(awal + lebar - 1, id_akhir)) + tugas_akhir
+            for awal in range(id_awal, id_akhir + 1, lebar)
+        ]
+        pool = _get_process_pool(workers)
+        hasil_shard = list(pool.map(_evaluasi_shard, tugas_list))
+    
+    # Gabungkan hasil top-k setiap shard (masing-masing sudah terurut)
+    total = sum(jumlah for jumlah, _ in hasil_shard)
+    gabungan = heapq.merge(*(top for _, top in hasil_shard), key=_kunci_urutan)
+    if limit is not None:
+        gabungan = (entri for entri, _ in zip(gabungan, range(limit)))
+    gabungan = list(gabungan)
+    
+    objek = queryset.model._default_manager.using(alias).in_bulk(
+        [data['id'] for _, data, _ in gabungan]
+    )
+    
+    return HasilSeleksi(
+        [
+            buat_item_hasil(objek[data['id']], data, kriteria, mus, fire_strength)
+            for fire_strength, data, mus in gabungan
+            if data['id'] in objek
+        ],
+        total
+    )
 
 
 def hitung_fuzzifikasi_lengkap(kelompok):
@@ -860,3 +1347,655 @@ def hitung_fuzzifikasi_lengkap(kelompok):
         'data': data,
         'memberships': all_memberships
     }
+
+
+# =============================================================================
+# SELEKSI BATCH (SATU MATRIKS KEANGGOTAAN UNTUK BANYAK QUERY)
+# =============================================================================
+
+def seleksi_fuzzy_batch(query_list):
+    """
+    Menjalankan banyak query seleksi atas tabel Kelompok sekaligus
+    
+    Tabel Kelompok dibaca sekali dan nilai keanggotaan dihitung sekali
+    untuk gabungan semua kriteria (variabel, kategori) yang dipakai.
+    Setiap query lalu dievaluasi dari matriks keanggotaan tersebut.
+    Urutan hasil sama dengan seleksi_fuzzy().
+    
+    Args:
+        query_list (list): List of dict {'kriteria': [(variabel, kategori), ...],
+                           'operator': 'AND'/'OR', 'alpha': float, 'limit': int}
+    
+    Returns:
+        tuple: (list of (HasilSeleksi, durasi_ms) sesuai urutan query,
+                dict {'jumlah_baris', 'jumlah_kolom', 'fuzzifikasi_ms'})
+    
+    Raises:
+        ValueError: Jika ada kriteria yang tidak valid
+    """
+    from .models import Kelompok
+    
+    mulai = time.perf_counter()
+    snapshot = get_parameter_snapshot()
+    evaluator = {
+        kriteria: buat_fungsi_keanggotaan(kriteria[0], kriteria[1], snapshot)
+        for kriteria in sorted({tuple(k) for query in query_list for k in query['kriteria']})
+    }
+    
+    # Matriks keanggotaan: satu list nilai per kriteria, urut nama seperti seleksi_fuzzy()
+    ids = []
+    matriks = {kriteria: [] for kriteria in evaluator}
+    today = date.today()
+    baris_list = (
+        Kelompok.objects.order_by('nama', 'id')
+        .values_list(*KOLOM_KELOMPOK)
+        .iterator(chunk_size=BATCH_BARIS_SHARD)
+    )
+    for baris in baris_list:
+        data = data_dari_baris(baris, today)
+        ids.append(data['id'])
+        for (variabel, kategori), fungsi in evaluator.items():
+            matriks[(variabel, kategori)].append(fungsi(data.get(variabel, 0)))
+    
+    info = {
+        'jumlah_baris': len(ids),
+        'jumlah_kolom': len(evaluator),
+        'fuzzifikasi_ms': round((time.perf_counter() - mulai) * 1000, 2),
+    }
+    
+    # Evaluasi setiap query: (indeks baris, membership_values, fire strength)
+    ranking_list = []
+    for query in query_list:
+        mulai = time.perf_counter()
+        kriteria = [tuple(k) for k in query['kriteria']]
+        alpha = query.get('alpha') or 0.0
+        limit = query.get('limit')
+        gabung = fire_strength_and if query.get('operator', 'AND').upper() == 'AND' else fire_strength_or
+        
+        ranking = []
+        for i, membership_values in enumerate(zip(*(matriks[k] for k in kriteria))):
+            fire_strength = gabung(*membership_values)
+            if fire_strength > 0 and fire_strength >= alpha:
+                ranking.append((i, membership_values, fire_strength))
+        ranking.sort(key=lambda entri: round(entri[2], 4), reverse=True)
+        
+        total = len(ranking)
+        if limit is not None:
+            ranking = ranking[:limit]
+        ranking_list.append((kriteria, ranking, total, (time.perf_counter() - mulai) * 1000))
+    
+    # Object Kelompok untuk semua baris hasil diambil dalam satu in_bulk
+    objek = Kelompok.objects.in_bulk({ids[i] for _, ranking, _, _ in ranking_list for i, _, _ in ranking})
+    
+    hasil_list = []
+    for kriteria, ranking, total, durasi_ms in ranking_list:
+        mulai = time.perf_counter()
+        items = []
+        for i, membership_values, fire_strength in ranking:
+            kelompok = objek.get(ids[i])
+            if kelompok is not None:
+                items.append(buat_item_hasil(
+                    kelompok, kelompok.get_data_dict(), kriteria, membership_values, fire_strength
+                ))
+        durasi_ms += (time.perf_counter() - mulai) * 1000
+        hasil_list.append((HasilSeleksi(items, total), round(durasi_ms, 2)))
+    
+    return hasil_list, info
+
+
+# =============================================================================
+# FUZZIFIKASI BULK
+# =============================================================================
+
+def evaluator_lengkap(snapshot):
+    """
+    Fungsi keanggotaan terikat untuk semua variabel dan kategori (27)
+    
+    Args:
+        snapshot (dict): Hasil get_parameter_snapshot()
+    
+    Returns:
+        list: [(variabel, kategori, fungsi), ...]
+    """
+    return [
+        (variabel, kategori, buat_fungsi_keanggotaan(variabel, kategori, snapshot))
+        for variabel, _ in VARIABEL_LIST
+        for kategori, _ in KATEGORI_VARIABEL[variabel]
+    ]
+
+
+def membership_lengkap(data, evaluator):
+    """
+    Semua nilai keanggotaan satu kelompok dari evaluator_lengkap()
+    
+    Returns:
+        dict: {variabel: {kategori: nilai}}, sama seperti get_all_membership_values()
+    """
+    memberships = {variabel: {} for variabel, _ in VARIABEL_LIST}
+    for variabel, kategori, fungsi in evaluator:
+        memberships[variabel][kategori] = fungsi(data.get(variabel, 0))
+    return memberships
+
+
+def fuzzifikasi_bulk(queryset, batch=BATCH_BARIS_SHARD):
+    """
+    Fuzzifikasi lengkap (27 kategori) untuk banyak kelompok
+    
+    Parameter dibaca sekali (satu snapshot) dan baris dibaca per batch
+    berdasarkan id (keyset), sehingga cocok untuk response streaming:
+    tidak ada query parameter per kelompok dan tidak ada seluruh tabel
+    di memori.
+    
+    Args:
+        queryset: QuerySet Kelompok (boleh sudah difilter)
+        batch (int): Jumlah baris per query
+    
+    Yields:
+        tuple: (data, memberships) dengan format yang sama seperti
+               hitung_fuzzifikasi_lengkap()
+    """
+    evaluator = evaluator_lengkap(get_parameter_snapshot())
+    today = date.today()
+    
+    terakhir = None
+    while True:
+        batch_qs = queryset.order_by('id')
+        if terakhir is not None:
+            batch_qs = batch_qs.filter(id__gt=terakhir)
+        baris_list = list(batch_qs.values_list(*KOLOM_KELOMPOK)[:batch])
+        
+        for baris in baris_list:
+            data = data_dari_baris(baris, today)
+            yield data, membership_lengkap(data, evaluator)
+        
+        if len(baris_list) < batch:
+            return
+        terakhir = baris_list[-1][0]
+
+
+# =============================================================================
+# SELEKSI STREAMING (EKSPOR)
+# =============================================================================
+
+def evaluasi_potongan(baris_list, kriteria, operator, snapshot, alpha=0.0):
+    """
+    Ranking ringkas untuk sekumpulan baris kelompok
+    
+    Tidak mengakses database (parameter dari snapshot), sehingga bisa
+    dijalankan di thread atau proses worker.
+    
+    Args:
+        baris_list (iterable): Baris values_list(*KOLOM_KELOMPOK)
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        snapshot (dict): Hasil get_parameter_snapshot()
+        alpha (float): Batas minimum fire strength (alpha-cut)
+    
+    Returns:
+        list: [(id, membership_values, fire_strength dibulatkan 4 desimal), ...]
+              sesuai urutan baris
+    """
+    return [
+        (data['id'], membership_values, round(fire_strength, 4))
+        for data, membership_values, fire_strength in evaluasi_baris(baris_list, kriteria, operator, snapshot, alpha)
+    ]
+
+
+def seleksi_fuzzy_ranking(kriteria, operator='AND', alpha=0.0, limit=None, queryset=None, batch=BATCH_BARIS_SHARD):
+    """
+    Ranking ringkas seleksi fuzzy atas tabel Kelompok
+    
+    Hanya id, nilai keanggotaan dan fire strength yang disimpan per
+    kelompok; urutan sama dengan seleksi_fuzzy().
+    
+    Args:
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        alpha (float): Batas minimum fire strength (alpha-cut)
+        limit (int): Jumlah maksimum hasil
+        queryset: QuerySet Kelompok (default: semua kelompok)
+        batch (int): Jumlah baris per query
+    
+    Returns:
+        RankingSeleksi: Ranking dengan fire strength dibulatkan 4 desimal
+    """
+    from .models import Kelompok
+    
+    if queryset is None:
+        queryset = Kelompok.objects.all()
+    
+    baris_list = (
+        queryset.order_by('nama', 'id')
+        .values_list(*KOLOM_KELOMPOK)
+        .iterator(chunk_size=batch)
+    )
+    ranking = evaluasi_potongan(baris_list, kriteria, operator, get_parameter_snapshot(), alpha)
+    ranking.sort(key=lambda entri: entri[2], reverse=True)
+    total = len(ranking)
+    if limit is not None:
+        ranking = ranking[:limit]
+    return RankingSeleksi(ranking, total, kriteria)
+
+
+def seleksi_fuzzy_stream(kriteria, operator='AND', alpha=0.0, limit=None, queryset=None, batch=BATCH_BARIS_SHARD):
+    """
+    Seleksi fuzzy atas tabel Kelompok yang hasilnya di-yield per baris
+    
+    Untuk ekspor hasil besar. Tahap pertama hanya menyimpan ranking
+    ringkas (id, nilai keanggotaan, fire strength) tanpa object model
+    maupun dict per kelompok; tahap kedua membaca nama dan nilai crisp
+    per batch id sesuai urutan ranking. Urutan hasil sama dengan
+    seleksi_fuzzy().
+    
+    Args:
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        alpha (float): Batas minimum fire strength (alpha-cut)
+        limit (int): Jumlah maksimum hasil
+        queryset: QuerySet Kelompok (default: semua kelompok)
+        batch (int): Jumlah baris per query tahap kedua
+    
+    Yields:
+        tuple: (data, membership_values, fire_strength) dengan nilai
+               keanggotaan dan fire strength dibulatkan 4 desimal
+    """
+    from .models import Kelompok
+    
+    if queryset is None:
+        queryset = Kelompok.objects.all()
+    
+    ranking = seleksi_fuzzy_ranking(kriteria, operator, alpha, limit, queryset, batch)
+    
+    today = date.today()
+    for awal in range(0, len(ranking), batch):
+        potongan = ranking[awal:awal + batch]
+        baris_map = {
+            baris[0]: baris
+            for baris in queryset.filter(id__in=[pk for pk, _, _ in potongan]).values_list(*KOLOM_KELOMPOK)
+        }
+        for pk, membership_values, fire_strength in potongan:
+            # Kelompok yang dihapus di antara kedua tahap dilewati
+            if pk in baris_map:
+                yield (
+                    data_dari_baris(baris_map[pk], today),
+                    [round(mu, 4) for mu in membership_values],
+                    fire_strength,
+                )
+
+
+def seleksi_fuzzy_progres(kriteria, operator='AND', alpha=0.0, queryset=None, batch=BATCH_BARIS_SHARD, top=10):
+    """
+    Seleksi fuzzy atas tabel Kelompok yang melaporkan progres per potongan
+    
+    Untuk menampilkan hasil sementara selama scan tabel penuh (SSE
+    seleksi_stream). Setelah setiap potongan, generator menghasilkan
+    jumlah baris yang sudah dievaluasi, jumlah kelompok yang cocok dan
+    `top` kelompok teratas sejauh ini. Progres terakhir berisi key
+    'hasil' dengan hasil lengkap (sama dengan seleksi_fuzzy()).
+    
+    Args:
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        alpha (float): Batas minimum fire strength (alpha-cut)
+        queryset: QuerySet Kelompok (default: semua kelompok)
+        batch (int): Jumlah baris per potongan
+        top (int): Jumlah kelompok teratas sementara
+    
+    Yields:
+        dict: {'diproses', 'jumlah_baris', 'cocok', 'teratas': [{'id',
+              'nama', 'fire_strength'}, ...]}, ditambah 'hasil'
+              (HasilSeleksi) pada progres terakhir
+    
+    Raises:
+        ValueError: Jika ada kriteria yang tidak valid
+    """
+    from .models import Kelompok
+    
+    if queryset is None:
+        queryset = Kelompok.objects.all()
+    
+    snapshot = get_parameter_snapshot()
+    # Validasi kriteria sebelum membaca tabel
+    for variabel, kategori in kriteria:
+        buat_fungsi_keanggotaan(variabel, kategori, snapshot)
+    
+    jumlah_baris = queryset.count()
+    ranking = []
+    # (fire strength, urutan scan, id, nama); urutan scan menjaga urutan
+    # akhir yang sama dengan sort stabil seleksi_fuzzy()
+    teratas = []
+    diproses = 0
+    
+    def progres():
+        return {
+            'diproses': diproses,
+            'jumlah_baris': jumlah_baris,
+            'cocok': len(ranking),
+            'teratas': [
+                {'id': pk, 'nama': nama, 'fire_strength': fire_strength}
+                for fire_strength, _, pk, nama in teratas
+            ],
+        }
+    
+    yield progres()
+    
+    baris_list = queryset.order_by('nama', 'id').values_list(*KOLOM_KELOMPOK).iterator(chunk_size=batch)
+    while True:
+        potongan = list(islice(baris_list, batch))
+        if not potongan:
+            break
+        
+        awal = len(ranking)
+        ranking.extend(evaluasi_potongan(potongan, kriteria, operator, snapshot, alpha))
+        diproses += len(potongan)
+        
+        kandidat = heapq.nsmallest(
+            top, range(awal, len(ranking)), key=lambda i: (-ranking[i][2], i)
+        )
+        if kandidat:
+            nama = {baris[0]: baris[1] for baris in potongan}
+            teratas = heapq.nsmallest(
+                top,
+                teratas + [(ranking[i][2], i, ranking[i][0], nama[ranking[i][0]]) for i in kandidat],
+                key=lambda entri: (-entri[0], entri[1])
+            )
+        
+        if len(potongan) < batch:
+            break
+        yield progres()
+    
+    ranking.sort(key=lambda entri: entri[2], reverse=True)
+    objek = queryset.in_bulk([pk for pk, _, _ in ranking])
+    hasil = []
+    for pk, membership_values, fire_strength in ranking:
+        kelompok = objek.get(pk)
+        # Kelompok yang dihapus selama scan dilewati
+        if kelompok is not None:
+            hasil.append(buat_item_hasil(
+                kelompok, kelompok.get_data_dict(), kriteria, membership_values, fire_strength
+            ))
+    
+    akhir = progres()
+    akhir['hasil'] = HasilSeleksi(hasil, len(ranking))
+    yield akhir
+
+
+# =============================================================================
+# SELEKSI LINTAS DATABASE (FAN-OUT PER ALIAS)
+# =============================================================================
+
+def get_database_seleksi():
+    """
+    Daftar alias database yang dapat dipilih untuk seleksi
+    
+    Returns:
+        list: Alias database dari settings.FUZZY_SELEKSI_DATABASES
+              (default: semua alias di settings.DATABASES)
+    """
+    return list(getattr(settings, 'FUZZY_SELEKSI_DATABASES', settings.DATABASES))
+
+
+def _seleksi_satu_database(alias, kriteria, operator, limit, alpha, include_arsip):
+    """
+    Menjalankan seleksi pada satu alias database (dipanggil di thread)
+    
+    Returns:
+        tuple: (alias, HasilSeleksi, latensi dalam milidetik)
+    """
+    from django.db import connections
+    from .models import Kelompok, KelompokArsip
+    
+    models_dicari = [Kelompok, KelompokArsip] if include_arsip else [Kelompok]
+    
+    mulai = time.perf_counter()
+    try:
+        hasil = gabung_hasil_seleksi(
+            [
+                seleksi_fuzzy_paralel(
+                    model.objects.using(alias).all(), kriteria, operator,
+                    limit=limit, alpha=alpha
+                )
+                for model in models_dicari
+            ],
+            limit
+        )
+    finally:
+        # Koneksi Django bersifat per-thread, tutup agar tidak bocor
+        connections.close_all()
+    
+    return alias, hasil, (time.perf_counter() - mulai) * 1000
+
+
+def seleksi_fuzzy_multi_database(databases, kriteria, operator='AND', limit=None, alpha=0.0, include_arsip=False):
+    """
+    Seleksi fuzzy secara bersamaan pada beberapa database
+    
+    Setiap alias dijalankan di thread terpisah dengan koneksi database
+    sendiri. Hasil dari semua database digabung dan diurutkan ulang,
+    setiap item dilengkapi key 'db_alias' berisi asal datanya.
+    
+    Args:
+        databases (list): Alias database di settings.DATABASES
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        limit (int): Jumlah maksimum hasil gabungan (default: semua)
+        alpha (float): Batas minimum fire strength (alpha-cut)
+        include_arsip (bool): Ikut mencari di tabel KelompokArsip
+    
+    Returns:
+        HasilSeleksi: Hasil gabungan, dengan `statistik_db` berisi
+                      total dan latensi per database
+    """
+    tersedia = get_database_seleksi()
+    for alias in databases:
+        if alias not in tersedia:
+            raise ValueError(f"Database '{alias}' tidak valid")
+    
+    with ThreadPoolExecutor(max_workers=len(databases)) as executor:
+        hasil_db = list(executor.map(
+            lambda alias: _seleksi_satu_database(
+                alias, kriteria, operator, limit, alpha, include_arsip
+            ),
+            databases
+        ))
+    
+    statistik_db = []
+    for alias, hasil, latensi in hasil_db:
+        for item in hasil:
+            item['db_alias'] = alias
+        statistik_db.append({
+            'alias': alias,
+            'total': hasil.total,
+            'latensi_ms': round(latensi, 2),
+        })
+    
+    hasil = gabung_hasil_seleksi([hasil for _, hasil, _ in hasil_db], limit)
+    hasil.statistik_db = statistik_db
+    return hasil
+
+
+def seleksi_fuzzy_lingkup(kriteria, operator='AND', databases=None, include_arsip=False, alpha=0.0, limit=None):
+    """
+    Seleksi fuzzy sesuai lingkup pencarian yang dipilih user
+    
+    - databases kosong: tabel Kelompok di database default
+      (ditambah KelompokArsip jika include_arsip)
+    - databases diisi: seleksi_fuzzy_multi_database()
+    
+    Args:
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        databases (list): Alias database yang dipilih (opsional)
+        include_arsip (bool): Ikut mencari di tabel KelompokArsip
+        alpha (float): Batas minimum fire strength (alpha-cut)
+        limit (int): Jumlah maksimum hasil
+    
+    Returns:
+        HasilSeleksi: Hasil seleksi
+    """
+    from .models import Kelompok, KelompokArsip
+    
+    if databases:
+        return seleksi_fuzzy_multi_database(
+            databases, kriteria, operator=operator, limit=limit,
+            alpha=alpha, include_arsip=include_arsip
+        )
+    
+    hasil = seleksi_fuzzy(
+        Kelompok.objects.all(), kriteria, operator=operator, limit=limit, alpha=alpha
+    )
+    if include_arsip:
+        hasil_arsip = seleksi_fuzzy(
+            KelompokArsip.objects.all(), kriteria, operator=operator, limit=limit, alpha=alpha
+        )
+        hasil = gabung_hasil_seleksi([hasil, hasil_arsip], limit)
+    
+    return hasil
+
+
+# =============================================================================
+# BARIS TAMPILAN
+# =============================================================================
+
+def kelas_nilai(nilai, kelas_nol='danger'):
+    """
+    Warna Bootstrap untuk nilai keanggotaan atau fire strength
+    
+    Args:
+        nilai (float): Nilai 0-1
+        kelas_nol (str): Warna untuk nilai 0
+    
+    Returns:
+        str: 'success' (>= 0.7), 'warning' (>= 0.3), 'danger' atau kelas_nol
+    """
+    if nilai >= 0.7:
+        return 'success'
+    if nilai >= 0.3:
+        return 'warning'
+    if nilai > 0:
+        return 'danger'
+    return kelas_nol
+
+
+def baris_fuzzifikasi(kelompok):
+    """
+    Menyusun grid nilai keanggotaan (27 kategori) yang siap ditampilkan
+    
+    Template cukup melakukan loop tanpa lookup dictionary per sel.
+    
+    Args:
+        kelompok: Object Kelompok atau dict
+    
+    Returns:
+        list: [{'label', 'nilai_crisp', 'kategori': [{'label', 'mu',
+              'persen', 'kelas_bar', 'kelas_badge'}, ...]}, ...]
+    """
+    fuzzifikasi = hitung_fuzzifikasi_lengkap(kelompok)
+    data, memberships = fuzzifikasi['data'], fuzzifikasi['memberships']
+    
+    baris_list = []
+    for variabel, variabel_label in VARIABEL_LIST:
+        kategori_list = []
+        for kategori, kategori_label in KATEGORI_VARIABEL[variabel]:
+            mu = memberships[variabel][kategori]
+            kategori_list.append({
+                'label': kategori_label,
+                'mu': mu,
+                'persen': round(mu * 100),
+                'kelas_bar': kelas_nilai(mu, 'light'),
+                'kelas_badge': kelas_nilai(mu, 'secondary'),
+            })
+        baris_list.append({
+            'label': variabel_label,
+            'nilai_crisp': data.get(variabel, 0),
+            'kategori': kategori_list,
+        })
+    
+    return baris_list
+
+
+def tabel_hasil_seleksi(hasil):
+    """
+    Menyusun tabel hasil seleksi yang siap ditampilkan
+    
+    Rank, link detail, label kolom dan warna badge dihitung sekali di
+    Python, bukan di template per sel.
+    
+    Args:
+        hasil (list): Hasil seleksi_fuzzy()
+    
+    Returns:
+        dict: {'kolom': [label membership], 'baris': [{'rank', 'kelas_rank',
+              'nama', 'url', 'is_arsip', 'db_alias', 'usia', 'jumlah_anggota',
+              'luas_lahan', 'frekuensi_bantuan', 'membership': [...],
+              'fire_strength', 'kelas_fs'}, ...]}
+    """
+    from django.urls import reverse
+    
+    kolom = [key.replace('_', ' ') for key in hasil[0]['membership_values']] if hasil else []
+    
+    baris_list = []
+    for rank, item in enumerate(hasil, start=1):
+        kelompok = item['kelompok']
+        db_alias = item.get('db_alias')
+        is_arsip = getattr(kelompok, 'is_arsip', False)
+        dapat_dibuka = not is_arsip and (not db_alias or db_alias == 'default')
+        
+        baris_list.append({
+            'rank': rank,
+            'kelas_rank': 'bg-warning text-dark' if rank <= 3 else 'bg-secondary',
+            'nama': kelompok.nama,
+            'url': reverse('fuzzy:kelompok_detail', args=[kelompok.pk]) if dapat_dibuka else None,
+            'is_arsip': is_arsip,
+            'db_alias': db_alias,
+            'usia': kelompok.usia,
+            'jumlah_anggota': kelompok.jumlah_anggota,
+            'luas_lahan': kelompok.luas_lahan,
+            'frekuensi_bantuan': kelompok.frekuensi_bantuan,
+            'membership': [
+                {
+                    'label': key.replace('_', ' '),
+                    'nilai_crisp': val['nilai_crisp'],
+                    'mu': val['membership'],
+                    'kelas': kelas_nilai(val['membership']),
+                }
+                for key, val in item['membership_values'].items()
+            ],
+            'fire_strength': item['fire_strength'],
+            'kelas_fs': kelas_nilai(item['fire_strength']),
+        })
+    
+    return {'kolom': kolom, 'baris': baris_list}
+
+
+# =============================================================================
+# STATISTIK DASHBOARD
+# =============================================================================
+
+def hitung_statistik_dashboard():
+    """
+    Menghitung statistik kelompok untuk halaman dashboard
+    
+    Jumlah dan semua rata-rata dihitung dalam satu query aggregate;
+    kelompok terbaru dibaca lewat index created_at.
+    
+    Returns:
+        dict: Jumlah kelompok, rata-rata anggota, lahan, SDM, unit usaha,
+              kas, dan 'terbaru' (5 kelompok yang terakhir ditambahkan)
+    """
+    from .models import Kelompok
+    
+    statistik = Kelompok.objects.aggregate(
+        total=Count('id'),
+        avg_anggota=Avg('jumlah_anggota'),
+        avg_lahan=Avg('luas_lahan'),
+        avg_sdm=Avg('sdm'),
+        avg_unit_usaha=Avg('unit_usaha'),
+        avg_kas=Avg('kas'),
+    )
+    for nama, nilai in statistik.items():
+        statistik[nama] = nilai or 0
+    
+    statistik['terbaru'] = list(Kelompok.objects.order_by('-created_at')[:5])
+    
+    return statistik
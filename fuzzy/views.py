@@ -9,15 +9,51 @@ File ini berisi semua view untuk:
 5. Fuzzifikasi detail
 """
 
+import csv
+import json
+import time
+from datetime import date
+from functools import partial
+from urllib.parse import urlencode
+
+from django.conf import settings
 from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
 from django.contrib import messages
-from django.http import JsonResponse
-from django.db.models import Count, Avg
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.db.models import Count
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
 
-from .models import Kelompok, FuzzyParameter
-from .forms import KelompokForm, SeleksiFuzzyForm, FuzzyParameterForm
+from .models import Kelompok, FuzzyParameter, QueryTersimpan, SeleksiJob
+from .admisi import IterasiDenganIzin, SeleksiPenuh, get_pembatas, izin_seleksi, masuk_seleksi
+from .biner import CONTENT_TYPE as CONTENT_TYPE_BINER, kemas_fuzzifikasi_bulk, kemas_ranking_seleksi
+from .forms import KelompokForm, SeleksiFuzzyForm, FuzzyParameterForm, QueryTersimpanForm
+from .cache import (
+    VERSI_KELOMPOK,
+    VERSI_PARAMETER,
+    buat_etag,
+    get_statistik_dashboard,
+    get_versi,
+    kunci_query,
+    seleksi_dengan_cache,
+)
+from .jobs import buat_job
+from .materialisasi import catat_query, cari_materialisasi
+from .paginasi import FILTER_RENTANG, URUTAN, CursorTidakValid, ambil_halaman
+from .pasangan import cari_pasangan
+from .perubahan import LIMIT_DEFAULT as PERUBAHAN_LIMIT, LIMIT_MAKS as PERUBAHAN_LIMIT_MAKS, ambil_perubahan
+from .query_tersimpan import ambil_peringkat, hitung_ulang_peringkat
 from .utils import (
-    seleksi_fuzzy,
+    baris_fuzzifikasi,
+    fuzzifikasi_bulk,
+    seleksi_fuzzy_batch,
+    seleksi_fuzzy_lingkup,
+    seleksi_fuzzy_progres,
+    seleksi_fuzzy_ranking,
+    seleksi_fuzzy_stream,
+    tabel_hasil_seleksi,
+    get_database_seleksi,
     hitung_fuzzifikasi_lengkap,
     VARIABEL_LIST,
     KATEGORI_VARIABEL,
@@ -38,26 +74,14 @@ def dashboard(request):
     - Statistik rata-rata
     - Data kelompok terbaru
     """
-    kelompok_list = Kelompok.objects.all()
-    total_kelompok = kelompok_list.count()
-    
-    # Hitung statistik
-    statistik = {
-        'total': total_kelompok,
-        'avg_anggota': kelompok_list.aggregate(Avg('jumlah_anggota'))['jumlah_anggota__avg'] or 0,
-        'avg_lahan': kelompok_list.aggregate(Avg('luas_lahan'))['luas_lahan__avg'] or 0,
-        'avg_sdm': kelompok_list.aggregate(Avg('sdm'))['sdm__avg'] or 0,
-        'avg_unit_usaha': kelompok_list.aggregate(Avg('unit_usaha'))['unit_usaha__avg'] or 0,
-        'avg_kas': kelompok_list.aggregate(Avg('kas'))['kas__avg'] or 0,
-    }
-    
-    # Kelompok terbaru (5 terakhir)
-    kelompok_terbaru = kelompok_list.order_by('-created_at')[:5]
+    # Statistik dan 5 kelompok terbaru dari cache (dihitung ulang jika
+    # data kelompok berubah)
+    statistik = get_statistik_dashboard()
     
     context = {
         'title': 'Dashboard',
         'statistik': statistik,
-        'kelompok_terbaru': kelompok_terbaru,
+        'kelompok_terbaru': statistik['terbaru'],
     }
     
     return render(request, 'fuzzy/dashboard.html', context)
@@ -71,13 +95,41 @@ def kelompok_list(request):
     """
     Halaman Daftar Kelompok
     
-    Menampilkan semua data kelompok dalam bentuk tabel.
+    Menampilkan data kelompok per halaman (keyset pagination) dengan
+    urutan dan filter rentang kriteria dari query string, misalnya
+    ?urut=-kas&sdm_min=7&cursor=...
     """
-    kelompok_list = Kelompok.objects.all().order_by('nama')
+    try:
+        halaman = ambil_halaman(request.GET)
+    except CursorTidakValid as e:
+        messages.error(request, str(e))
+        return redirect('fuzzy:kelompok_list')
+    
+    # Query string tanpa cursor untuk link halaman sebelumnya/berikutnya
+    params = request.GET.copy()
+    params.pop('cursor', None)
+    query_halaman = params.urlencode()
+    
+    # Jumlah total dari statistik dashboard (cache); count() dengan filter
+    # tidak dihitung agar halaman tetap murah pada tabel besar
+    total = None if halaman['filter'] else get_statistik_dashboard()['total']
     
     context = {
         'title': 'Data Kelompok',
-        'kelompok_list': kelompok_list,
+        'kelompok_list': halaman['baris'],
+        'halaman': halaman,
+        'total': total,
+        'query_halaman': query_halaman,
+        'urutan_list': [(kode, dict(VARIABEL_LIST).get(kode, kode.title())) for kode in URUTAN],
+        'filter_list': [
+            (
+                kode,
+                dict(VARIABEL_LIST).get(kode, kode),
+                request.GET.get(f'{kode}_min', ''),
+                request.GET.get(f'{kode}_max', ''),
+            )
+            for kode in FILTER_RENTANG
+        ],
     }
     
     return render(request, 'fuzzy/kelompok_list.html', context)
@@ -177,24 +229,188 @@ def kelompok_detail(request, pk):
     """
     kelompok = get_object_or_404(Kelompok, pk=pk)
     
-    # Hitung fuzzifikasi lengkap
-    fuzzifikasi = hitung_fuzzifikasi_lengkap(kelompok)
-    
     context = {
         'title': f'Detail Kelompok: {kelompok.nama}',
         'kelompok': kelompok,
-        'fuzzifikasi': fuzzifikasi,
-        'variabel_list': VARIABEL_LIST,
-        'kategori_variabel': KATEGORI_VARIABEL,
+        # Dihitung saat grid dirender (tidak dihitung jika fragment ada di cache)
+        'baris_fuzzifikasi': partial(baris_fuzzifikasi, kelompok),
     }
+    context.update(_konteks_fragmen(kelompok.pk, kelompok.updated_at.isoformat()))
     
     return render(request, 'fuzzy/kelompok_detail.html', context)
 
 
+def _konteks_fragmen(*bagian, versi_kelompok=False):
+    """
+    Kunci dan timeout untuk cache fragment template ({% cache %})
+    
+    Kunci memuat versi parameter dan tanggal hari ini (usia), serta versi
+    data Kelompok jika diminta, sehingga fragment lama tidak tampil lagi
+    setelah data berubah.
+    
+    Args:
+        *bagian: Komponen lain kunci (pk, hash query, dll)
+        versi_kelompok (bool): Ikutkan versi data Kelompok
+    
+    Returns:
+        dict: {'fragmen_kunci': str, 'fragmen_timeout': int}
+    """
+    versi = get_versi()
+    if versi_kelompok:
+        bagian = (versi.get(VERSI_KELOMPOK, 0),) + bagian
+    
+    return {
+        'fragmen_kunci': buat_etag(versi.get(VERSI_PARAMETER, 0), date.today(), *bagian),
+        'fragmen_timeout': getattr(settings, 'FUZZY_CACHE_TIMEOUT', 300),
+    }
+
+
+def _konteks_fragmen_seleksi(kriteria, operator, databases, include_arsip):
+    """
+    Kunci cache fragment tabel hasil seleksi
+    
+    Hash query tidak bergantung pada urutan kriteria, tetapi kolom tabel
+    hasil mengikuti urutan yang diminta (lihat _urutkan_membership di
+    fuzzy/cache.py), sehingga urutan kriteria ikut menjadi bagian kunci.
+    
+    Returns:
+        dict: {'fragmen_kunci': str, 'fragmen_timeout': int}
+    """
+    urutan = ','.join(f"{variabel}_{kategori}" for variabel, kategori in kriteria)
+    return _konteks_fragmen(
+        kunci_query(kriteria, operator, databases=databases, include_arsip=include_arsip),
+        urutan,
+        versi_kelompok=True
+    )
+
+
 # =============================================================================
 # SELEKSI FUZZY
 # =============================================================================
 
+def _get_databases(data):
+    """
+    Mengambil alias database yang dipilih user
+    
+    Args:
+        data: request.POST (QueryDict) atau dict dari body JSON
+    
+    Returns:
+        list: Alias database yang valid (kosong = database default saja)
+    """
+    if hasattr(data, 'getlist'):
+        databases = data.getlist('databases')
+    else:
+        databases = data.get('databases') or []
+    
+    tersedia = get_database_seleksi()
+    return [alias for alias in databases if alias in tersedia]
+
+
+def _get_include_arsip(data):
+    """
+    Cek apakah user memilih untuk ikut mencari di arsip kelompok
+    
+    Args:
+        data: request.POST (QueryDict) atau dict dari body JSON
+    
+    Returns:
+        bool: True jika arsip ikut dicari
+    """
+    nilai = data.get('include_arsip', False)
+    if isinstance(nilai, str):
+        return nilai.lower() in ('1', 'true', 'on', 'yes')
+    return bool(nilai)
+
+
+def _get_alpha_limit(data):
+    """
+    Mengambil alpha-cut dan limit hasil dari request
+    
+    Args:
+        data: request.POST (QueryDict) atau dict dari body JSON
+    
+    Returns:
+        tuple: (alpha, limit) dengan limit None jika tidak dibatasi
+    
+    Raises:
+        ValueError: Jika nilai alpha/limit tidak valid
+    """
+    alpha = float(data.get('alpha') or 0)
+    if not 0 <= alpha <= 1:
+        raise ValueError('Alpha harus antara 0 dan 1')
+    
+    limit = data.get('limit')
+    limit = int(limit) if limit not in (None, '') else None
+    if limit is not None and limit < 1:
+        raise ValueError('Limit harus lebih besar dari 0')
+    
+    return alpha, limit
+
+
+def _jalankan_seleksi(kriteria, operator, databases=None, include_arsip=False, alpha=0.0, limit=None):
+    """
+    Menjalankan seleksi fuzzy untuk view seleksi dan API
+    
+    Secara default hanya tabel Kelompok (data aktif) yang dicari.
+    Urutan sumber hasil:
+    1. Pasangan terhitung (seleksi 2 kriteria pada tabel Kelompok)
+    2. Query populer yang dimaterialisasi
+    3. Cache hasil dengan kunci query + versi data/parameter
+    
+    Perhitungan baru (cache miss) harus mendapat izin dari admission
+    control (fuzzy/admisi.py); jika server penuh SeleksiPenuh dilempar
+    dan dijawab 429 oleh AdmisiSeleksiMiddleware.
+    
+    Args:
+        kriteria (list): List of tuples [(variabel, kategori), ...]
+        operator (str): 'AND' atau 'OR'
+        databases (list): Alias database yang dipilih (opsional)
+        include_arsip (bool): Ikut mencari di tabel KelompokArsip
+        alpha (float): Batas minimum fire strength (alpha-cut)
+        limit (int): Jumlah maksimum hasil
+    
+    Returns:
+        HasilSeleksi: Hasil seleksi
+    """
+    if not databases and not include_arsip:
+        hasil = cari_pasangan(kriteria, operator, alpha, limit)
+        if hasil is not None:
+            return hasil
+    
+    hasil = cari_materialisasi(kriteria, operator, databases, include_arsip, alpha, limit)
+    if hasil is not None:
+        return hasil
+    
+    def hitung():
+        with izin_seleksi():
+            return seleksi_fuzzy_lingkup(kriteria, operator, databases, include_arsip, alpha, limit)
+    
+    return seleksi_dengan_cache(
+        hitung, kriteria, operator, alpha, limit,
+        databases=databases or [], include_arsip=include_arsip
+    )
+
+
+def _jalankan_ranking(kriteria, operator, alpha=0.0, limit=None):
+    """
+    Ranking ringkas tabel Kelompok untuk response biner api_seleksi
+    
+    Seperti _jalankan_seleksi(), tetapi tanpa object Kelompok maupun dict
+    keanggotaan per baris. Pasangan terhitung dan query materialisasi
+    berisi HasilSeleksi sehingga tidak dipakai; ranking disimpan di
+    cache hasil dengan kunci tersendiri.
+    
+    Returns:
+        RankingSeleksi: Ranking urut berdasarkan fire strength
+    """
+    def hitung():
+        with izin_seleksi():
+            return seleksi_fuzzy_ranking(kriteria, operator, alpha, limit)
+    
+    return seleksi_dengan_cache(hitung, kriteria, operator, alpha, limit, format='ranking')
+
+
 def seleksi_and(request):
     """
     Halaman Seleksi Fuzzy AND
@@ -204,6 +420,9 @@ def seleksi_and(request):
     """
     hasil = None
     kriteria_teks = []
+    databases = []
+    include_arsip = False
+    fragmen = {}
     form = SeleksiFuzzyForm()
     
     if request.method == 'POST':
@@ -220,11 +439,11 @@ def seleksi_and(request):
                 (variabel_2, kategori_2),
             ]
             
-            # Ambil semua kelompok
-            kelompok_list = Kelompok.objects.all()
-            
             # Lakukan seleksi fuzzy dengan operator AND
-            hasil = seleksi_fuzzy(kelompok_list, kriteria, operator='AND')
+            databases = _get_databases(request.POST)
+            include_arsip = _get_include_arsip(request.POST)
+            hasil = _jalankan_seleksi(kriteria, 'AND', databases, include_arsip)
+            fragmen = _konteks_fragmen_seleksi(kriteria, 'AND', databases, include_arsip)
             
             # Buat teks kriteria untuk ditampilkan
             for var, kat in kriteria:
@@ -239,11 +458,18 @@ def seleksi_and(request):
         'title': 'Seleksi Fuzzy AND',
         'form': form,
         'hasil': hasil,
+        'tabel_hasil': partial(tabel_hasil_seleksi, hasil),
         'kriteria_teks': kriteria_teks,
         'operator': 'AND',
         'kategori_variabel': KATEGORI_VARIABEL,
+        'database_list': get_database_seleksi(),
+        'selected_databases': databases,
+        'include_arsip': include_arsip,
+        'export_query': _query_ekspor(kriteria, 'AND', databases, include_arsip) if hasil else '',
     }
     
+    context.update(fragmen)
+    
     return render(request, 'fuzzy/seleksi_fuzzy.html', context)
 
 
@@ -256,6 +482,9 @@ def seleksi_or(request):
     """
     hasil = None
     kriteria_teks = []
+    databases = []
+    include_arsip = False
+    fragmen = {}
     form = SeleksiFuzzyForm()
     
     if request.method == 'POST':
@@ -272,11 +501,11 @@ def seleksi_or(request):
                 (variabel_2, kategori_2),
             ]
             
-            # Ambil semua kelompok
-            kelompok_list = Kelompok.objects.all()
-            
             # Lakukan seleksi fuzzy dengan operator OR
-            hasil = seleksi_fuzzy(kelompok_list, kriteria, operator='OR')
+            databases = _get_databases(request.POST)
+            include_arsip = _get_include_arsip(request.POST)
+            hasil = _jalankan_seleksi(kriteria, 'OR', databases, include_arsip)
+            fragmen = _konteks_fragmen_seleksi(kriteria, 'OR', databases, include_arsip)
             
             # Buat teks kriteria untuk ditampilkan
             for var, kat in kriteria:
@@ -291,11 +520,18 @@ def seleksi_or(request):
         'title': 'Seleksi Fuzzy OR',
         'form': form,
         'hasil': hasil,
+        'tabel_hasil': partial(tabel_hasil_seleksi, hasil),
         'kriteria_teks': kriteria_teks,
         'operator': 'OR',
         'kategori_variabel': KATEGORI_VARIABEL,
+        'database_list': get_database_seleksi(),
+        'selected_databases': databases,
+        'include_arsip': include_arsip,
+        'export_query': _query_ekspor(kriteria, 'OR', databases, include_arsip) if hasil else '',
     }
     
+    context.update(fragmen)
+    
     return render(request, 'fuzzy/seleksi_fuzzy.html', context)
 
 
@@ -309,7 +545,10 @@ def seleksi_multi(request):
     hasil = None
     kriteria_teks = []
     selected_kriteria = []
+    databases = []
+    include_arsip = False
     operator_used = 'AND'
+    fragmen = {}
     
     if request.method == 'POST':
         # Ambil kriteria dari POST
@@ -326,11 +565,16 @@ def seleksi_multi(request):
                     selected_kriteria.append(k)
             
             if kriteria:
-                # Ambil semua kelompok
-                kelompok_list = Kelompok.objects.all()
-                
                 # Lakukan seleksi fuzzy
-                hasil = seleksi_fuzzy(kelompok_list, kriteria, operator=operator_used)
+                databases = _get_databases(request.POST)
+                include_arsip = _get_include_arsip(request.POST)
+                mulai = time.perf_counter()
+                hasil = _jalankan_seleksi(kriteria, operator_used, databases, include_arsip)
+                catat_query(
+                    kriteria, operator_used, databases, include_arsip, 0.0, None,
+                    (time.perf_counter() - mulai) * 1000
+                )
+                fragmen = _konteks_fragmen_seleksi(kriteria, operator_used, databases, include_arsip)
                 
                 # Buat teks kriteria
                 for var, kat in kriteria:
@@ -343,18 +587,438 @@ def seleksi_multi(request):
         'variabel_list': VARIABEL_LIST,
         'kategori_variabel': KATEGORI_VARIABEL,
         'hasil': hasil,
+        'tabel_hasil': partial(tabel_hasil_seleksi, hasil),
         'kriteria_teks': kriteria_teks,
         'selected_kriteria': selected_kriteria,
         'operator': operator_used,
+        'database_list': get_database_seleksi(),
+        'selected_databases': databases,
+        'include_arsip': include_arsip,
+        'export_query': _query_ekspor(kriteria, operator_used, databases, include_arsip) if hasil else '',
     }
+    context.update(fragmen)
     
     return render(request, 'fuzzy/seleksi_multi.html', context)
 
 
+# =============================================================================
+# EKSPOR CSV
+# =============================================================================
+
+class _Echo:
+    """Buffer untuk csv.writer yang langsung mengembalikan baris yang ditulis"""
+    
+    def write(self, value):
+        return value
+
+
+def _query_ekspor(kriteria, operator, databases, include_arsip):
+    """
+    Query string seleksi_export untuk hasil yang sedang ditampilkan
+    
+    Returns:
+        str: ?kriteria=variabel|kategori&operator=...&databases=...
+    """
+    params = [('kriteria', f"{variabel}|{kategori}") for variabel, kategori in kriteria]
+    params.append(('operator', operator))
+    params.extend(('databases', alias) for alias in databases)
+    if include_arsip:
+        params.append(('include_arsip', '1'))
+    return urlencode(params)
+
+
+def _baris_ekspor(kriteria, operator, databases, include_arsip, alpha, limit, hasil=None):
+    """
+    Baris CSV hasil seleksi (header lebih dulu), di-yield satu per satu
+    
+    Seleksi tabel Kelompok memakai seleksi_fuzzy_stream() sehingga hasil
+    tidak pernah disusun utuh di memori; seleksi lintas database/arsip
+    memakai `hasil` (dihitung dengan _jalankan_seleksi() jika kosong).
+    
+    Yields:
+        list: Nilai kolom satu baris CSV
+    """
+    header = ['Peringkat', 'ID', 'Nama Kelompok']
+    if databases:
+        header.append('Database')
+    if include_arsip:
+        header.append('Arsip')
+    for variabel, kategori in kriteria:
+        var_label = dict(VARIABEL_LIST).get(variabel, variabel)
+        kat_label = dict(KATEGORI_VARIABEL.get(variabel, [])).get(kategori, kategori)
+        header.extend([f"{var_label} (nilai)", f"μ {var_label} = {kat_label}"])
+    header.append('Fire Strength')
+    yield header
+    
+    if not databases and not include_arsip:
+        hasil = seleksi_fuzzy_stream(kriteria, operator, alpha, limit)
+        for rank, (data, membership_values, fire_strength) in enumerate(hasil, 1):
+            baris = [rank, data['id'], data['nama']]
+            for (variabel, _), mu in zip(kriteria, membership_values):
+                baris.extend([data.get(variabel, 0), mu])
+            baris.append(fire_strength)
+            yield baris
+        return
+    
+    if hasil is None:
+        hasil = _jalankan_seleksi(kriteria, operator, databases, include_arsip, alpha, limit)
+    for rank, item in enumerate(hasil, 1):
+        baris = [rank, item['kelompok'].pk, item['kelompok'].nama]
+        if databases:
+            baris.append(item.get('db_alias', ''))
+        if include_arsip:
+            baris.append('ya' if item['kelompok'].is_arsip else '')
+        for variabel, kategori in kriteria:
+            detail = item['membership_values'][f"{variabel}_{kategori}"]
+            baris.extend([detail['nilai_crisp'], detail['membership']])
+        baris.append(item['fire_strength'])
+        yield baris
+
+
+def _validasi_kriteria(kriteria, operator):
+    """
+    Validasi kriteria dan operator sebelum seleksi (atau stream) dimulai
+    
+    Raises:
+        ValueError: Jika kriteria kosong/tidak valid atau operator tidak dikenal
+    """
+    if not kriteria:
+        raise ValueError('Pilih minimal satu kriteria')
+    if operator not in ('AND', 'OR'):
+        raise ValueError("Operator harus 'AND' atau 'OR'")
+    for variabel, kategori in kriteria:
+        if kategori not in dict(KATEGORI_VARIABEL.get(variabel, [])):
+            raise ValueError(f"Kriteria '{variabel}|{kategori}' tidak valid")
+
+
+def seleksi_export(request):
+    """
+    Ekspor hasil seleksi ke CSV (streaming)
+    
+    Request (GET, query string):
+        kriteria: "variabel|kategori", boleh diulang
+        operator: 'AND' atau 'OR'
+        databases, include_arsip, alpha, limit: opsional, seperti api_seleksi
+    
+    Setiap kriteria menghasilkan kolom nilai crisp dan μ, ditambah kolom
+    fire strength. Baris ditulis ke response satu per satu.
+    
+    Returns:
+        StreamingHttpResponse: text/csv
+    """
+    kriteria = [tuple(k.split('|', 1)) for k in request.GET.getlist('kriteria') if '|' in k]
+    operator = request.GET.get('operator', 'AND').upper()
+    databases = _get_databases(request.GET)
+    include_arsip = _get_include_arsip(request.GET)
+    
+    # Validasi sebelum response dimulai (error di tengah stream tidak bisa dilaporkan)
+    try:
+        alpha, limit = _get_alpha_limit(request.GET)
+        _validasi_kriteria(kriteria, operator)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    # Izin seleksi diambil sebelum response dimulai agar server penuh
+    # masih bisa dijawab 429
+    hasil = None
+    if databases or include_arsip:
+        hasil = _jalankan_seleksi(kriteria, operator, databases, include_arsip, alpha, limit)
+    
+    writer = csv.writer(_Echo())
+    
+    def baris_csv():
+        # BOM agar Excel membaca file sebagai UTF-8 (karakter μ)
+        yield '\ufeff'
+        for baris in _baris_ekspor(kriteria, operator, databases, include_arsip, alpha, limit, hasil):
+            yield writer.writerow(baris)
+    
+    isi = baris_csv()
+    if hasil is None:
+        # Seleksi streaming berjalan selama response dikirim
+        isi = IterasiDenganIzin(isi, masuk_seleksi())
+    
+    nama_file = f"seleksi_{operator.lower()}_{date.today():%Y%m%d}.csv"
+    response = StreamingHttpResponse(isi, content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{nama_file}"'
+    return response
+
+
+# =============================================================================
+# PROGRES SELEKSI (SERVER-SENT EVENTS)
+# =============================================================================
+
+# Jumlah kelompok teratas sementara yang dikirim setiap event progres
+TOP_PROGRES = 10
+
+
+def _event_sse(event, data):
+    """Satu event server-sent events dengan data JSON"""
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+def seleksi_stream(request):
+    """
+    Progres seleksi multi-kriteria sebagai server-sent events
+    
+    Dipakai halaman seleksi multi selama scan tabel Kelompok: setiap
+    potongan baris menghasilkan event `progres` berisi jumlah baris yang
+    sudah dievaluasi, jumlah kelompok yang cocok dan TOP_PROGRES kelompok
+    teratas sementara. Setelah selesai, hasil lengkap disimpan di cache
+    seleksi sehingga submit form berikutnya tidak menghitung ulang, lalu
+    event `selesai` dikirim.
+    
+    Request (GET, query string):
+        kriteria: "variabel|kategori", boleh diulang
+        operator: 'AND' atau 'OR'
+    
+    Returns:
+        StreamingHttpResponse: text/event-stream
+    """
+    kriteria = [tuple(k.split('|', 1)) for k in request.GET.getlist('kriteria') if '|' in k]
+    operator = request.GET.get('operator', 'AND').upper()
+    
+    try:
+        _validasi_kriteria(kriteria, operator)
+        if _get_databases(request.GET) or _get_include_arsip(request.GET):
+            raise ValueError('Progres hanya tersedia untuk seleksi database utama tanpa arsip')
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    def event_stream():
+        mulai = time.perf_counter()
+        
+        # Hasil yang sudah tersimpan dikirim langsung tanpa scan tabel
+        hasil = cari_pasangan(kriteria, operator)
+        if hasil is None:
+            hasil = cari_materialisasi(kriteria, operator)
+        if hasil is None:
+            try:
+                with izin_seleksi():
+                    for progres in seleksi_fuzzy_progres(kriteria, operator, top=TOP_PROGRES):
+                        hasil = progres.pop('hasil', None)
+                        yield _event_sse('progres', progres)
+            except SeleksiPenuh as e:
+                yield _event_sse('gagal', {'error': str(e), 'retry_after': e.retry_after})
+                return
+            except Exception as e:
+                yield _event_sse('gagal', {'error': str(e)})
+                return
+            seleksi_dengan_cache(
+                lambda: hasil, kriteria, operator, databases=[], include_arsip=False
+            )
+        else:
+            jumlah_baris = Kelompok.objects.count()
+            yield _event_sse('progres', {
+                'diproses': jumlah_baris,
+                'jumlah_baris': jumlah_baris,
+                'cocok': hasil.total,
+                'teratas': [
+                    {'id': item['kelompok'].pk, 'nama': item['kelompok'].nama, 'fire_strength': item['fire_strength']}
+                    for item in hasil[:TOP_PROGRES]
+                ],
+            })
+        
+        yield _event_sse('selesai', {
+            'total': hasil.total,
+            'durasi_ms': round((time.perf_counter() - mulai) * 1000, 2),
+        })
+    
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Nonaktifkan buffering proxy (nginx) agar event langsung terkirim
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+# =============================================================================
+# QUERY TERSIMPAN
+# =============================================================================
+
+def query_tersimpan_list(request):
+    """
+    Halaman Daftar Query Tersimpan
+    
+    Menampilkan query multi-kriteria yang disimpan user beserta jumlah
+    kelompok dalam rankingnya.
+    """
+    query_list = QueryTersimpan.objects.annotate(jumlah_hasil=Count('peringkat'))
+    
+    context = {
+        'title': 'Query Tersimpan',
+        'query_list': query_list,
+    }
+    
+    return render(request, 'fuzzy/query_tersimpan_list.html', context)
+
+
+def query_tersimpan_add(request):
+    """
+    Simpan Query
+    
+    Menyimpan query dari halaman seleksi multi-kriteria dan langsung
+    menghitung rankingnya.
+    """
+    if request.method != 'POST':
+        return redirect('fuzzy:query_tersimpan_list')
+    
+    form = QueryTersimpanForm(request.POST)
+    if form.is_valid():
+        query = form.save()
+        hitung_ulang_peringkat(query)
+        messages.success(request, f'Query "{query.nama}" berhasil disimpan!')
+        return redirect('fuzzy:query_tersimpan_detail', pk=query.pk)
+    
+    messages.error(request, 'Query gagal disimpan. Isi nama query dan pilih minimal satu kriteria.')
+    return redirect('fuzzy:seleksi_multi')
+
+
+def query_tersimpan_detail(request, pk):
+    """
+    Halaman Detail Query Tersimpan
+    
+    Menampilkan ranking yang tersimpan (dibaca lewat index, tanpa
+    menghitung ulang fuzzifikasi seluruh kelompok).
+    
+    Args:
+        pk (int): Primary key query tersimpan
+    """
+    query = get_object_or_404(QueryTersimpan, pk=pk)
+    hasil = ambil_peringkat(query)
+    
+    kriteria_teks = []
+    for var, kat in query.get_kriteria():
+        var_label = dict(VARIABEL_LIST).get(var, var)
+        kat_label = dict(KATEGORI_VARIABEL.get(var, [])).get(kat, kat)
+        kriteria_teks.append(f"{var_label} = {kat_label}")
+    
+    context = {
+        'title': f'Query Tersimpan: {query.nama}',
+        'query': query,
+        'hasil': hasil,
+        'tabel_hasil': partial(tabel_hasil_seleksi, hasil),
+        'kriteria_teks': kriteria_teks,
+    }
+    context.update(_konteks_fragmen(query.pk, query.updated_at.isoformat(), versi_kelompok=True))
+    
+    return render(request, 'fuzzy/query_tersimpan_detail.html', context)
+
+
+def query_tersimpan_delete(request, pk):
+    """
+    Hapus Query Tersimpan
+    
+    Args:
+        pk (int): Primary key query tersimpan
+    """
+    query = get_object_or_404(QueryTersimpan, pk=pk)
+    
+    if request.method == 'POST':
+        nama = query.nama
+        query.delete()
+        messages.success(request, f'Query "{nama}" berhasil dihapus!')
+        return redirect('fuzzy:query_tersimpan_list')
+    
+    return redirect('fuzzy:query_tersimpan_detail', pk=pk)
+
+
 # =============================================================================
 # API ENDPOINTS
 # =============================================================================
+# Endpoint GET memakai ETag (strong) agar client yang polling mendapat
+# 304 Not Modified tanpa fuzzifikasi ulang jika data tidak berubah.
+
+def _etag_kategori(request, variabel):
+    """ETag api_kategori: kategori hanya bergantung pada variabel"""
+    return buat_etag('kategori', variabel, KATEGORI_VARIABEL.get(variabel))
 
+
+def _etag_fuzzifikasi(request, pk):
+    """
+    ETag api_fuzzifikasi: per baris kelompok
+    
+    Berubah jika kelompok disimpan (updated_at), parameter fuzzy berubah,
+    atau tanggal berganti (usia dihitung dari tanggal hari ini).
+    """
+    updated_at = Kelompok.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+    if updated_at is None:
+        return None
+    versi_parameter = get_versi().get(VERSI_PARAMETER, 0)
+    return buat_etag('fuzzifikasi', pk, updated_at.isoformat(), versi_parameter, date.today())
+
+
+def api_kelompok(request):
+    """
+    API endpoint daftar kelompok dengan keyset pagination
+    
+    Parameter query string sama dengan halaman daftar kelompok: urut,
+    cursor, per_halaman dan <kriteria>_min / <kriteria>_max.
+    
+    Returns:
+        JsonResponse: {'results': [...], 'next': cursor, 'previous': cursor}
+    """
+    try:
+        halaman = ambil_halaman(request.GET)
+    except CursorTidakValid as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    return JsonResponse({
+        'urut': halaman['urut'],
+        'per_halaman': halaman['per_halaman'],
+        'next': halaman['next'],
+        'previous': halaman['previous'],
+        'results': [
+            {
+                'id': baris['pk'],
+                'nama': baris['nama'],
+                'tanggal_berdiri': baris['tanggal_berdiri'].isoformat(),
+                'usia': baris['usia'],
+                'jumlah_anggota': baris['jumlah_anggota'],
+                'luas_lahan': baris['luas_lahan'],
+                'frekuensi_bantuan': baris['frekuensi_bantuan'],
+                'sdm': baris['sdm'],
+                'unit_usaha': baris['unit_usaha'],
+                'kas': baris['kas'],
+            }
+            for baris in halaman['baris']
+        ],
+    })
+
+
+def api_perubahan(request):
+    """
+    API change feed kelompok untuk sinkronisasi inkremental
+    
+    Request (GET, query string):
+        cursor: cursor dari response sebelumnya (kosong untuk mulai)
+        limit: jumlah perubahan maksimum (default 500, maksimum 1000)
+    
+    Jika resync bernilai true (request pertama, FuzzyParameter berubah,
+    operasi massal, atau salinan client terlalu lama), client mengunduh
+    ulang semua kelompok dari resync_url lalu melanjutkan dengan cursor
+    dari response ini. Selama ada_lagi bernilai true, client langsung
+    meminta halaman berikutnya.
+    
+    Returns:
+        JsonResponse: Lihat perubahan.ambil_perubahan()
+    """
+    try:
+        limit = int(request.GET.get('limit') or PERUBAHAN_LIMIT)
+    except ValueError:
+        return JsonResponse({'error': 'limit harus berupa angka'}, status=400)
+    if limit < 1:
+        return JsonResponse({'error': 'limit harus lebih besar dari 0'}, status=400)
+    
+    try:
+        hasil = ambil_perubahan(request.GET.get('cursor') or None, min(limit, PERUBAHAN_LIMIT_MAKS))
+    except CursorTidakValid as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    if hasil['resync']:
+        hasil['resync_url'] = reverse('fuzzy:api_fuzzifikasi_bulk') + '?semua=1'
+    return JsonResponse(hasil)
+
+
+@condition(etag_func=_etag_kategori)
 def api_kategori(request, variabel):
     """
     API endpoint untuk mendapatkan kategori berdasarkan variabel
@@ -374,6 +1038,7 @@ def api_kategori(request, variabel):
     })
 
 
+@condition(etag_func=_etag_fuzzifikasi)
 def api_fuzzifikasi(request, pk):
     """
     API endpoint untuk mendapatkan nilai fuzzifikasi kelompok
@@ -390,35 +1055,581 @@ def api_fuzzifikasi(request, pk):
     return JsonResponse(fuzzifikasi)
 
 
+def _minta_biner(request):
+    """Cek apakah client meminta response biner (Accept: application/octet-stream)"""
+    return CONTENT_TYPE_BINER in request.headers.get('Accept', '')
+
+
+def _get_kelompok_bulk(params):
+    """
+    Kelompok yang diminta endpoint bulk: ?ids=1,2,3, ?id_min=&id_max= atau ?semua=1
+    
+    Returns:
+        QuerySet: Kelompok yang dipilih
+    
+    Raises:
+        ValueError: Jika tidak ada pilihan atau nilai tidak valid
+    """
+    queryset = Kelompok.objects.all()
+    
+    ids = [i for nilai in params.getlist('ids') for i in nilai.split(',') if i.strip()]
+    if ids:
+        return queryset.filter(pk__in=[int(i) for i in ids])
+    
+    if params.get('id_min') or params.get('id_max'):
+        if params.get('id_min'):
+            queryset = queryset.filter(pk__gte=int(params['id_min']))
+        if params.get('id_max'):
+            queryset = queryset.filter(pk__lte=int(params['id_max']))
+        return queryset
+    
+    if params.get('semua', '').lower() in ('1', 'true', 'on', 'ya'):
+        return queryset
+    
+    raise ValueError('Pilih kelompok dengan ids, id_min/id_max atau semua=1')
+
+
+@vary_on_headers('Accept')
+def api_fuzzifikasi_bulk(request):
+    """
+    API endpoint fuzzifikasi lengkap untuk banyak kelompok (NDJSON)
+    
+    Request (GET, query string), salah satu dari:
+        ids: daftar id, dipisah koma dan/atau diulang
+        id_min, id_max: rentang id
+        semua=1: semua kelompok
+    
+    Response di-stream per batch, satu baris JSON per kelompok dengan
+    format yang sama seperti api_fuzzifikasi: {"data": ..., "memberships": ...}.
+    Parameter fuzzy dibaca sekali untuk seluruh response.
+    
+    Dengan header Accept: application/octet-stream, response berupa kolom
+    id dan 27 kolom keanggotaan dalam format biner (lihat fuzzy/biner.py).
+    
+    Returns:
+        StreamingHttpResponse: application/x-ndjson
+    """
+    try:
+        queryset = _get_kelompok_bulk(request.GET)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    if _minta_biner(request):
+        return HttpResponse(kemas_fuzzifikasi_bulk(queryset), content_type=CONTENT_TYPE_BINER)
+    
+    def baris_ndjson():
+        for data, memberships in fuzzifikasi_bulk(queryset):
+            yield json.dumps({'data': data, 'memberships': memberships}, separators=(',', ':')) + '\n'
+    
+    return StreamingHttpResponse(baris_ndjson(), content_type='application/x-ndjson')
+
+
+def _serialisasi_hasil(hasil):
+    """
+    Mengubah hasil seleksi menjadi list dict yang dapat di-serialize JSON
+    
+    Args:
+        hasil (list): Hasil seleksi_fuzzy()
+    
+    Returns:
+        list: Item hasil tanpa object model
+    """
+    data = []
+    for item in hasil:
+        baris = {
+            'id': item['kelompok'].pk,
+            'nama': item['kelompok'].nama,
+            'membership_values': item['membership_values'],
+            'fire_strength': item['fire_strength'],
+        }
+        if 'db_alias' in item:
+            baris['db_alias'] = item['db_alias']
+        if item['kelompok'].is_arsip:
+            baris['arsip'] = True
+        data.append(baris)
+    return data
+
+
+# Kolom yang bisa dipilih untuk format kolom api_seleksi ('mu.<variabel>_<kategori>'
+# untuk satu kolom keanggotaan saja)
+KOLOM_API_SELEKSI = ('ids', 'nama', 'fire_strength', 'mu', 'db_alias', 'arsip')
+KOLOM_API_DEFAULT = ['ids', 'nama', 'fire_strength', 'mu']
+
+
+def _get_format_fields(data, kriteria):
+    """
+    Membaca format response dan kolom yang diminta dari request api_seleksi
+    
+    Args:
+        data: request.GET (QueryDict) atau dict dari body JSON
+        kriteria (list): Kriteria query
+    
+    Returns:
+        tuple: (format, fields) dengan format 'baris' atau 'kolom'
+    
+    Raises:
+        ValueError: Jika format atau nama kolom tidak valid
+    """
+    format_response = data.get('format') or 'baris'
+    if format_response not in ('baris', 'kolom'):
+        raise ValueError("Format harus 'baris' atau 'kolom'")
+    
+    if hasattr(data, 'getlist'):
+        fields = [f for nilai in data.getlist('fields') for f in nilai.split(',') if f]
+    else:
+        fields = data.get('fields') or []
+        if isinstance(fields, str):
+            fields = [f for f in fields.split(',') if f]
+    fields = fields or KOLOM_API_DEFAULT
+    
+    kunci_mu = {f"{variabel}_{kategori}" for variabel, kategori in kriteria}
+    for field in fields:
+        if field not in KOLOM_API_SELEKSI and not (field.startswith('mu.') and field[3:] in kunci_mu):
+            raise ValueError(f"Kolom '{field}' tidak valid")
+    
+    return format_response, fields
+
+
+def _serialisasi_kolom(hasil, kriteria, fields):
+    """
+    Mengubah hasil seleksi menjadi format kolom (satu array per kolom)
+    
+    Nama kunci tidak diulang per baris, dan kolom keanggotaan yang tidak
+    diminta tidak dibuat sama sekali.
+    
+    Args:
+        hasil (list): Hasil seleksi_fuzzy()
+        kriteria (list): Kriteria query
+        fields (list): Kolom yang diminta (lihat KOLOM_API_SELEKSI)
+    
+    Returns:
+        dict: {'ids': [...], 'nama': [...], 'fire_strength': [...],
+              'mu': {'usia_baru': [...], ...}}
+    """
+    if 'mu' in fields:
+        kunci_mu = list(dict.fromkeys(f"{variabel}_{kategori}" for variabel, kategori in kriteria))
+    else:
+        kunci_mu = [field[3:] for field in fields if field.startswith('mu.')]
+    
+    kolom = {}
+    if 'ids' in fields:
+        kolom['ids'] = [item['kelompok'].pk for item in hasil]
+    if 'nama' in fields:
+        kolom['nama'] = [item['kelompok'].nama for item in hasil]
+    if 'fire_strength' in fields:
+        kolom['fire_strength'] = [item['fire_strength'] for item in hasil]
+    if kunci_mu:
+        kolom['mu'] = {
+            kunci: [item['membership_values'][kunci]['membership'] for item in hasil]
+            for kunci in kunci_mu
+        }
+    if 'db_alias' in fields:
+        kolom['db_alias'] = [item.get('db_alias') for item in hasil]
+    if 'arsip' in fields:
+        kolom['arsip'] = [item['kelompok'].is_arsip for item in hasil]
+    return kolom
+
+
+def _get_data_seleksi(request):
+    """
+    Membaca parameter api_seleksi dari body JSON (POST) atau query string (GET)
+    
+    Query string memakai format yang sama dengan form seleksi multi:
+    ?kriteria=usia|baru&kriteria=kas|baik&operator=AND&limit=10
+    
+    Returns:
+        tuple: (data, kriteria, operator, databases, include_arsip)
+    """
+    if request.method == 'POST':
+        data = json.loads(request.body)
+        kriteria = [tuple(k) for k in data.get('kriteria', [])]
+        databases = data.get('databases') or []
+    else:
+        data = request.GET
+        kriteria = [tuple(k.split('|', 1)) for k in data.getlist('kriteria') if '|' in k]
+        databases = data.getlist('databases')
+    
+    operator = data.get('operator', 'AND')
+    return data, kriteria, operator, databases, _get_include_arsip(data)
+
+
+def _etag_seleksi(request):
+    """
+    ETag api_seleksi (GET): hash query + versi data Kelompok dan parameter
+    
+    Tanggal ikut dihitung jika kriteria memakai usia.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    
+    try:
+        data, kriteria, operator, databases, include_arsip = _get_data_seleksi(request)
+        if _minta_job(data):
+            return None
+        alpha, limit = _get_alpha_limit(data)
+        format_response, fields = _get_format_fields(data, kriteria)
+        kunci = kunci_query(
+            kriteria, operator, alpha, limit,
+            databases=databases, include_arsip=include_arsip
+        )
+    except (TypeError, ValueError, AttributeError):
+        return None
+    
+    versi = get_versi()
+    bagian = [kunci, versi.get(VERSI_KELOMPOK, 0), versi.get(VERSI_PARAMETER, 0)]
+    # Representasi berbeda untuk format/kolom berbeda
+    if _minta_biner(request):
+        bagian.append('biner')
+    elif format_response == 'kolom':
+        bagian.append(','.join(fields))
+    if any(variabel == 'usia' for variabel, _ in kriteria):
+        bagian.append(date.today())
+    return buat_etag('seleksi', *bagian)
+
+
+@vary_on_headers('Accept')
+@condition(etag_func=_etag_seleksi)
 def api_seleksi(request):
     """
     API endpoint untuk seleksi fuzzy
     
-    Request (POST):
+    Request (POST, body JSON):
         kriteria: list of [variabel, kategori] pairs
         operator: 'AND' atau 'OR'
+        databases: list alias database (opsional, untuk seleksi lintas database)
+        include_arsip: true untuk ikut mencari di arsip kelompok (opsional)
+        alpha: batas minimum fire strength (opsional, default 0)
+        limit: jumlah maksimum hasil (opsional)
+        format: 'baris' (default, list object per kelompok) atau 'kolom'
+                (satu array per kolom, lebih ringkas untuk hasil besar)
+        fields: kolom untuk format 'kolom' (default ids, nama,
+                fire_strength, mu); 'mu.<variabel>_<kategori>' untuk satu
+                kolom keanggotaan saja
+    
+    Request (GET, query string):
+        Parameter yang sama, kriteria ditulis "variabel|kategori" dan
+        boleh diulang. Response memakai ETag; kirim If-None-Match untuk
+        mendapat 304 jika data tidak berubah.
+    
+    Dengan header Accept: application/octet-stream, ranking dikirim dalam
+    format biner (id int64, fire strength dan keanggotaan float32, lihat
+    fuzzy/biner.py). Format biner hanya untuk database utama tanpa arsip
+    karena id tidak unik lintas sumber.
+    
+    Dengan async=true, seleksi dijalankan di background (fuzzy/jobs.py) dan
+    response 202 berisi id job serta URL status dan hasilnya.
     
     Returns:
         JsonResponse: Hasil seleksi
     """
-    if request.method == 'POST':
-        import json
-        data = json.loads(request.body)
+    if request.method in ('GET', 'HEAD', 'POST'):
+        data, kriteria, operator, databases, include_arsip = _get_data_seleksi(request)
+        if _minta_job(data):
+            return _response_job_baru(data, kriteria, operator, databases, include_arsip)
         
-        kriteria = [tuple(k) for k in data.get('kriteria', [])]
-        operator = data.get('operator', 'AND')
+        biner = _minta_biner(request)
+        if biner and (databases or include_arsip):
+            return JsonResponse(
+                {'error': 'Format biner hanya tersedia untuk seleksi database utama tanpa arsip'},
+                status=406
+            )
         
-        kelompok_list = Kelompok.objects.all()
-        hasil = seleksi_fuzzy(kelompok_list, kriteria, operator=operator)
+        try:
+            alpha, limit = _get_alpha_limit(data)
+            format_response, fields = _get_format_fields(data, kriteria)
+            mulai = time.perf_counter()
+            if biner:
+                hasil = _jalankan_ranking(kriteria, operator, alpha, limit)
+            else:
+                hasil = _jalankan_seleksi(kriteria, operator, databases, include_arsip, alpha, limit)
+        except (TypeError, ValueError) as e:
+            return JsonResponse({'error': str(e)}, status=400)
         
-        return JsonResponse({
+        catat_query(
+            kriteria, operator, databases, include_arsip, alpha, limit,
+            (time.perf_counter() - mulai) * 1000
+        )
+        
+        return _response_seleksi(hasil, kriteria, operator, databases, biner, format_response, fields)
+    
+    return JsonResponse({'error': 'Method not allowed'}, status=405)
+
+
+def _response_seleksi(hasil, kriteria, operator, databases, biner, format_response, fields):
+    """
+    Response api_seleksi sesuai format yang diminta (biner, kolom atau baris)
+    
+    Untuk format biner, `hasil` berupa RankingSeleksi dari _jalankan_ranking().
+    
+    Returns:
+        HttpResponse: Response biner atau JsonResponse
+    """
+    if biner:
+        return HttpResponse(kemas_ranking_seleksi(hasil, kriteria), content_type=CONTENT_TYPE_BINER)
+    
+    if format_response == 'kolom':
+        response = {
             'operator': operator,
             'kriteria': kriteria,
-            'hasil': hasil,
-            'total': len(hasil)
+            'format': 'kolom',
+            'jumlah': len(hasil),
+            'hasil': _serialisasi_kolom(hasil, kriteria, fields),
+            'total': hasil.total
+        }
+        if databases:
+            response['databases'] = hasil.statistik_db
+        return JsonResponse(response, json_dumps_params={'separators': (',', ':')})
+    
+    response = {
+        'operator': operator,
+        'kriteria': kriteria,
+        'hasil': _serialisasi_hasil(hasil),
+        'total': hasil.total
+    }
+    if databases:
+        response['databases'] = hasil.statistik_db
+    
+    return JsonResponse(response)
+
+
+def _minta_job(data):
+    """Cek apakah request api_seleksi meminta seleksi background (async=true)"""
+    nilai = data.get('async', False)
+    if isinstance(nilai, str):
+        return nilai.lower() in ('1', 'true', 'on', 'yes')
+    return bool(nilai)
+
+
+def _status_job(job):
+    """
+    Status SeleksiJob untuk response API
+    
+    Returns:
+        dict: Status, progres dan URL hasil (jika sudah selesai)
+    """
+    status = {
+        'job_id': job.pk,
+        'status': job.status,
+        'progres': round(job.progres, 4),
+        'jumlah_baris': job.jumlah_baris,
+        'diproses': job.diproses,
+        'kriteria': job.kriteria,
+        'operator': job.operator,
+        'alpha': job.alpha,
+        'limit': job.limit,
+        'status_url': reverse('fuzzy:api_seleksi_job', args=[job.pk]),
+        'created_at': job.created_at,
+        'mulai_at': job.mulai_at,
+        'selesai_at': job.selesai_at,
+    }
+    if job.databases:
+        status['databases'] = job.databases
+    if job.include_arsip:
+        status['include_arsip'] = True
+    if job.status == SeleksiJob.STATUS_SELESAI:
+        status['total'] = job.total
+        status['hasil_url'] = reverse('fuzzy:api_seleksi_job_hasil', args=[job.pk])
+        if job.statistik_db:
+            status['statistik_db'] = job.statistik_db
+    elif job.status == SeleksiJob.STATUS_GAGAL:
+        status['error'] = job.error
+    return status
+
+
+def _response_job_baru(data, kriteria, operator, databases, include_arsip):
+    """
+    Mendaftarkan SeleksiJob untuk api_seleksi dengan async=true
+    
+    Returns:
+        JsonResponse: 202 dengan status job, atau 400 jika request tidak valid
+    """
+    try:
+        alpha, limit = _get_alpha_limit(data)
+        job = buat_job(kriteria, operator, databases, include_arsip, alpha, limit)
+    except (TypeError, ValueError) as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    response = JsonResponse(_status_job(job), status=202)
+    response['Location'] = reverse('fuzzy:api_seleksi_job', args=[job.pk])
+    return response
+
+
+def api_seleksi_job(request, pk):
+    """
+    API status seleksi background (lihat api_seleksi dengan async=true)
+    
+    Returns:
+        JsonResponse: Status dan progres job
+    """
+    job = get_object_or_404(SeleksiJob, pk=pk)
+    return JsonResponse(_status_job(job))
+
+
+# Jumlah hasil per halaman api_seleksi_job_hasil
+HASIL_JOB_PER_HALAMAN = 100
+HASIL_JOB_PER_HALAMAN_MAKS = 500
+
+
+def api_seleksi_job_hasil(request, pk):
+    """
+    API hasil seleksi background per halaman
+    
+    Hasil dibaca dari HasilSeleksiJob berdasarkan rentang peringkat
+    sehingga setiap halaman dapat diunduh berulang kali tanpa dihitung
+    ulang.
+    
+    Request (GET, query string):
+        halaman: nomor halaman (default 1)
+        per_halaman: jumlah hasil per halaman (default 100, maksimum 500)
+    
+    Returns:
+        JsonResponse: Hasil satu halaman, atau 409 jika job belum selesai
+    """
+    job = get_object_or_404(SeleksiJob, pk=pk)
+    if job.status != SeleksiJob.STATUS_SELESAI:
+        return JsonResponse(_status_job(job), status=409)
+    
+    try:
+        halaman = int(request.GET.get('halaman') or 1)
+        per_halaman = int(request.GET.get('per_halaman') or HASIL_JOB_PER_HALAMAN)
+    except ValueError:
+        return JsonResponse({'error': 'halaman dan per_halaman harus berupa angka'}, status=400)
+    if halaman < 1 or per_halaman < 1:
+        return JsonResponse({'error': 'halaman dan per_halaman harus lebih besar dari 0'}, status=400)
+    per_halaman = min(per_halaman, HASIL_JOB_PER_HALAMAN_MAKS)
+    
+    awal = (halaman - 1) * per_halaman
+    baris_list = job.hasil.filter(peringkat__gt=awal, peringkat__lte=awal + per_halaman).order_by('peringkat')
+    jumlah = job.hasil.count()
+    
+    hasil = []
+    for baris in baris_list:
+        item = {
+            'peringkat': baris.peringkat,
+            'id': baris.kelompok_id,
+            'nama': baris.nama,
+            'membership_values': baris.membership,
+            'fire_strength': baris.fire_strength,
+        }
+        if baris.db_alias is not None:
+            item['db_alias'] = baris.db_alias
+        if baris.arsip:
+            item['arsip'] = True
+        hasil.append(item)
+    
+    return JsonResponse({
+        'job_id': job.pk,
+        'operator': job.operator,
+        'kriteria': job.kriteria,
+        'halaman': halaman,
+        'per_halaman': per_halaman,
+        'jumlah_halaman': -(-jumlah // per_halaman),
+        'jumlah': jumlah,
+        'total': job.total,
+        'hasil': hasil,
+    })
+
+
+# Jumlah maksimum query dalam satu request api_seleksi_batch
+BATCH_QUERY_MAKS = 100
+
+
+def api_seleksi_batch(request):
+    """
+    API endpoint untuk banyak query seleksi sekaligus
+    
+    Semua query dievaluasi atas tabel Kelompok dari satu matriks
+    keanggotaan: tabel dibaca sekali dan setiap kriteria (variabel,
+    kategori) difuzzifikasi sekali, berapa pun query yang memakainya.
+    
+    Request (POST, body JSON):
+        queries: list query dengan field yang sama seperti api_seleksi
+                 (kriteria, operator, alpha, limit, format, fields)
+    
+    Returns:
+        JsonResponse: Hasil setiap query (urutan sama dengan request)
+                      beserta durasi per query dan durasi fuzzifikasi
+    """
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    mulai = time.perf_counter()
+    try:
+        queries = json.loads(request.body).get('queries')
+        if not isinstance(queries, list) or not queries:
+            raise ValueError('queries harus berupa list yang tidak kosong')
+        if len(queries) > BATCH_QUERY_MAKS:
+            raise ValueError(f'Maksimum {BATCH_QUERY_MAKS} query per request')
+        
+        query_list = []
+        for i, data in enumerate(queries):
+            try:
+                kriteria = [tuple(k) for k in data.get('kriteria', [])]
+                if not kriteria or any(len(k) != 2 for k in kriteria):
+                    raise ValueError('kriteria harus berupa list [variabel, kategori]')
+                operator = str(data.get('operator', 'AND')).upper()
+                _validasi_kriteria(kriteria, operator)
+                alpha, limit = _get_alpha_limit(data)
+                format_response, fields = _get_format_fields(data, kriteria)
+            except (AttributeError, TypeError, ValueError) as e:
+                raise ValueError(f'Query #{i}: {e}')
+            query_list.append({
+                'kriteria': kriteria,
+                'operator': operator,
+                'alpha': alpha,
+                'limit': limit,
+                'format': format_response,
+                'fields': fields,
+            })
+        
+        with izin_seleksi():
+            hasil_list, info = seleksi_fuzzy_batch(query_list)
+    except (AttributeError, TypeError, ValueError) as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    response = []
+    for query, (hasil, durasi_ms) in zip(query_list, hasil_list):
+        if query['format'] == 'kolom':
+            data_hasil = _serialisasi_kolom(hasil, query['kriteria'], query['fields'])
+        else:
+            data_hasil = _serialisasi_hasil(hasil)
+        response.append({
+            'operator': query['operator'],
+            'kriteria': query['kriteria'],
+            'format': query['format'],
+            'hasil': data_hasil,
+            'total': hasil.total,
+            'durasi_ms': durasi_ms,
         })
     
-    return JsonResponse({'error': 'Method not allowed'}, status=405)
+    return JsonResponse({
+        'hasil': response,
+        'jumlah_baris': info['jumlah_baris'],
+        'jumlah_kolom': info['jumlah_kolom'],
+        'fuzzifikasi_ms': info['fuzzifikasi_ms'],
+        'durasi_ms': round((time.perf_counter() - mulai) * 1000, 2),
+    })
+
+
+def api_admisi(request):
+    """
+    API statistik admission control seleksi (proses worker ini)
+    
+    Berisi jumlah seleksi yang berjalan dan menunggu, puncak antrian,
+    jumlah diterima dan ditolak per alasan serta rata-rata waktu tunggu
+    dan durasi, untuk menentukan jumlah worker dan slot seleksi. Nilai
+    dihitung per proses (lihat 'pid').
+    
+    Returns:
+        JsonResponse: Statistik PembatasSeleksi
+    """
+    statistik = get_pembatas().statistik()
+    laju = getattr(settings, 'FUZZY_SELEKSI_TOKEN_PER_DETIK', 0)
+    statistik['token_bucket'] = {
+        'laju': laju,
+        'kapasitas': getattr(settings, 'FUZZY_SELEKSI_TOKEN_BURST', 10),
+    } if laju > 0 else None
+    return JsonResponse(statistik)
 
 
 # =============================================================================
@@ -0,0 +1,290 @@
+"""
+View Async untuk SPK Fuzzy Database Model Tahani
+
+Versi async dari halaman seleksi dan endpoint API untuk server ASGI
+(config/asgi.py), diaktifkan dengan FUZZY_ASYNC_VIEWS=True (lihat
+fuzzy/urls.py). Nama URL, parameter request dan format response sama
+dengan fuzzy/views.py:
+- api_seleksi, api_fuzzifikasi, api_kategori
+- seleksi_and, seleksi_or, seleksi_multi
+
+Scan tabel Kelompok memakai async ORM (aiterator/aget) dan evaluasi
+keanggotaan dijalankan di executor terbatas (fuzzy/seleksi_async.py),
+sehingga satu proses ASGI dapat melayani banyak client lambat sekaligus
+tanpa satu worker per request. Lookup kecil yang sudah ada versi
+sync-nya (pasangan terhitung, materialisasi, log query, render
+template) dijalankan lewat sync_to_async.
+"""
+
+import json
+import time
+from functools import partial, wraps
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, JsonResponse
+from django.shortcuts import render
+from django.utils.cache import get_conditional_response, quote_etag
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
+
+from . import views
+from .admisi import izin_seleksi_async
+from .cache import seleksi_dengan_cache_async
+from .forms import SeleksiFuzzyForm
+from .materialisasi import catat_query, cari_materialisasi
+from .models import Kelompok
+from .pasangan import cari_pasangan
+from .seleksi_async import seleksi_fuzzy_async
+from .utils import (
+    KATEGORI_VARIABEL,
+    VARIABEL_LIST,
+    evaluator_lengkap,
+    get_database_seleksi,
+    get_parameter_snapshot,
+    membership_lengkap,
+    seleksi_fuzzy_lingkup,
+    tabel_hasil_seleksi,
+)
+
+
+def condition_async(etag_func):
+    """
+    Seperti django.views.decorators.http.condition untuk view async
+
+    etag_func dari fuzzy/views.py membaca database secara sync, sehingga
+    dijalankan lewat sync_to_async.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def inner(request, *args, **kwargs):
+            etag = await sync_to_async(etag_func)(request, *args, **kwargs)
+            etag = quote_etag(etag) if etag is not None else None
+
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = await func(request, *args, **kwargs)
+
+            if etag and request.method in ('GET', 'HEAD'):
+                response.headers.setdefault('ETag', etag)
+            return response
+        return inner
+    return decorator
+
+
+def _kriteria_teks(kriteria):
+    """Teks kriteria untuk ditampilkan, misalnya 'Usia Kelompok = Lama'"""
+    teks = []
+    for var, kat in kriteria:
+        var_label = dict(VARIABEL_LIST).get(var, var)
+        kat_label = dict(KATEGORI_VARIABEL.get(var, [])).get(kat, kat)
+        teks.append(f"{var_label} = {kat_label}")
+    return teks
+
+
+async def _jalankan_seleksi(kriteria, operator, databases=None, include_arsip=False, alpha=0.0, limit=None):
+    """
+    Versi async dari views._jalankan_seleksi() dengan urutan sumber yang sama
+
+    Jika tidak ada hasil tersimpan, tabel Kelompok diseleksi dengan
+    seleksi_fuzzy_async(). Seleksi lintas database/arsip memakai fan-out
+    sync yang sudah ada.
+
+    Returns:
+        HasilSeleksi: Hasil seleksi
+    """
+    if not databases and not include_arsip:
+        hasil = await sync_to_async(cari_pasangan)(kriteria, operator, alpha, limit)
+        if hasil is not None:
+            return hasil
+
+    hasil = await sync_to_async(cari_materialisasi)(kriteria, operator, databases, include_arsip, alpha, limit)
+    if hasil is not None:
+        return hasil
+
+    async def hitung():
+        async with izin_seleksi_async():
+            if not databases and not include_arsip:
+                return await seleksi_fuzzy_async(kriteria, operator, alpha, limit)
+            return await sync_to_async(seleksi_fuzzy_lingkup)(
+                kriteria, operator, databases, include_arsip, alpha, limit
+            )
+
+    return await seleksi_dengan_cache_async(
+        hitung, kriteria, operator, alpha, limit,
+        databases=databases or [], include_arsip=include_arsip
+    )
+
+
+# =============================================================================
+# SELEKSI FUZZY
+# =============================================================================
+
+async def _seleksi_dua_kriteria(request, operator):
+    """Halaman seleksi AND/OR dengan 2 kriteria (lihat views.seleksi_and)"""
+    hasil = None
+    kriteria = []
+    databases = []
+    include_arsip = False
+    fragmen = {}
+    form = SeleksiFuzzyForm()
+
+    if request.method == 'POST':
+        form = SeleksiFuzzyForm(request.POST)
+        if form.is_valid():
+            kriteria = [
+                (form.cleaned_data['variabel_1'], form.cleaned_data['kategori_1']),
+                (form.cleaned_data['variabel_2'], form.cleaned_data['kategori_2']),
+            ]
+            databases = views._get_databases(request.POST)
+            include_arsip = views._get_include_arsip(request.POST)
+            hasil = await _jalankan_seleksi(kriteria, operator, databases, include_arsip)
+            fragmen = await sync_to_async(views._konteks_fragmen_seleksi)(kriteria, operator, databases, include_arsip)
+
+    context = {
+        'title': f'Seleksi Fuzzy {operator}',
+        'form': form,
+        'hasil': hasil,
+        'tabel_hasil': partial(tabel_hasil_seleksi, hasil),
+        'kriteria_teks': _kriteria_teks(kriteria) if hasil is not None else [],
+        'operator': operator,
+        'kategori_variabel': KATEGORI_VARIABEL,
+        'database_list': get_database_seleksi(),
+        'selected_databases': databases,
+        'include_arsip': include_arsip,
+        'export_query': views._query_ekspor(kriteria, operator, databases, include_arsip) if hasil else '',
+    }
+    context.update(fragmen)
+
+    return await sync_to_async(render)(request, 'fuzzy/seleksi_fuzzy.html', context)
+
+
+async def seleksi_and(request):
+    """Halaman Seleksi Fuzzy AND (async)"""
+    return await _seleksi_dua_kriteria(request, 'AND')
+
+
+async def seleksi_or(request):
+    """Halaman Seleksi Fuzzy OR (async)"""
+    return await _seleksi_dua_kriteria(request, 'OR')
+
+
+async def seleksi_multi(request):
+    """Halaman Seleksi Fuzzy Multi-Kriteria (async, lihat views.seleksi_multi)"""
+    hasil = None
+    kriteria = []
+    selected_kriteria = []
+    databases = []
+    include_arsip = False
+    operator_used = 'AND'
+    fragmen = {}
+
+    if request.method == 'POST':
+        operator_used = request.POST.get('operator', 'AND')
+        for k in request.POST.getlist('kriteria'):
+            if '|' in k:
+                kriteria.append(tuple(k.split('|')))
+                selected_kriteria.append(k)
+
+        if kriteria:
+            databases = views._get_databases(request.POST)
+            include_arsip = views._get_include_arsip(request.POST)
+            mulai = time.perf_counter()
+            hasil = await _jalankan_seleksi(kriteria, operator_used, databases, include_arsip)
+            await sync_to_async(catat_query)(
+                kriteria, operator_used, databases, include_arsip, 0.0, None,
+                (time.perf_counter() - mulai) * 1000
+            )
+            fragmen = await sync_to_async(views._konteks_fragmen_seleksi)(kriteria, operator_used, databases, include_arsip)
+
+    context = {
+        'title': 'Seleksi Fuzzy Multi-Kriteria',
+        'variabel_list': VARIABEL_LIST,
+        'kategori_variabel': KATEGORI_VARIABEL,
+        'hasil': hasil,
+        'tabel_hasil': partial(tabel_hasil_seleksi, hasil),
+        'kriteria_teks': _kriteria_teks(kriteria) if hasil is not None else [],
+        'selected_kriteria': selected_kriteria,
+        'operator': operator_used,
+        'database_list': get_database_seleksi(),
+        'selected_databases': databases,
+        'include_arsip': include_arsip,
+        'export_query': views._query_ekspor(kriteria, operator_used, databases, include_arsip) if hasil else '',
+    }
+    context.update(fragmen)
+
+    return await sync_to_async(render)(request, 'fuzzy/seleksi_multi.html', context)
+
+
+# =============================================================================
+# API ENDPOINTS
+# =============================================================================
+
+@condition(etag_func=views._etag_kategori)
+async def api_kategori(request, variabel):
+    """API kategori per variabel (async, lihat views.api_kategori)"""
+    kategori = KATEGORI_VARIABEL.get(variabel, [])
+    return JsonResponse({
+        'variabel': variabel,
+        'kategori': [{'value': k[0], 'label': k[1]} for k in kategori]
+    })
+
+
+@condition_async(etag_func=views._etag_fuzzifikasi)
+async def api_fuzzifikasi(request, pk):
+    """
+    API fuzzifikasi kelompok (async, lihat views.api_fuzzifikasi)
+
+    Semua nilai keanggotaan dihitung dari satu snapshot parameter.
+    """
+    try:
+        kelompok = await Kelompok.objects.aget(pk=pk)
+    except Kelompok.DoesNotExist:
+        raise Http404('Kelompok tidak ditemukan')
+
+    snapshot = await sync_to_async(get_parameter_snapshot)()
+    data = kelompok.get_data_dict()
+    return JsonResponse({
+        'data': data,
+        'memberships': membership_lengkap(data, evaluator_lengkap(snapshot)),
+    })
+
+
+@vary_on_headers('Accept')
+@condition_async(etag_func=views._etag_seleksi)
+async def api_seleksi(request):
+    """API seleksi fuzzy (async, lihat views.api_seleksi untuk format request)"""
+    if request.method not in ('GET', 'HEAD', 'POST'):
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+
+    try:
+        data, kriteria, operator, databases, include_arsip = views._get_data_seleksi(request)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Body harus berupa JSON'}, status=400)
+
+    if views._minta_job(data):
+        return await sync_to_async(views._response_job_baru)(data, kriteria, operator, databases, include_arsip)
+
+    biner = views._minta_biner(request)
+    if biner and (databases or include_arsip):
+        return JsonResponse(
+            {'error': 'Format biner hanya tersedia untuk seleksi database utama tanpa arsip'},
+            status=406
+        )
+
+    try:
+        alpha, limit = views._get_alpha_limit(data)
+        format_response, fields = views._get_format_fields(data, kriteria)
+        mulai = time.perf_counter()
+        if biner:
+            hasil = await sync_to_async(views._jalankan_ranking)(kriteria, operator, alpha, limit)
+        else:
+            hasil = await _jalankan_seleksi(kriteria, operator, databases, include_arsip, alpha, limit)
+    except (TypeError, ValueError) as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    await sync_to_async(catat_query)(
+        kriteria, operator, databases, include_arsip, alpha, limit,
+        (time.perf_counter() - mulai) * 1000
+    )
+
+    return views._response_seleksi(hasil, kriteria, operator, databases, biner, format_response, fields)